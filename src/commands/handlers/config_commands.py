@@ -84,7 +84,7 @@ def handle_context(args: List[str]) -> None:
     if not args:
         print(f"\n🎯 Current context mode: {ctx.context_mode}")
         print("Options: auto, on, off")
-        print("- auto: AI decides when to include context")
+        print("- auto: Include relevant context; skip small talk and tool commands")
         print("- on: Always include available context")
         print("- off: Never include context from knowledge base")
         print()
@@ -49,13 +49,20 @@ def handle_help(args: List[str]) -> None:
     print("/vectordb     - Show vector database contents")
     print("/mem0         - Show personalized memory contents")
     print("/model        - Show current model information")
+    print("/tokens       - Show prompt tokens per request and manifest savings")
     print("/space <cmd>  - Space/workspace management (list/create/switch/delete)")
     print("/context <mode> - Control context integration (auto/on/off)")
     print("/learning <mode> - Control learning behavior (normal/strict/off)")
-    print("/populate <path> - Add code files from directory to vector DB")
+    print(
+        "/populate <path> [--workers N] - Add code files from directory to vector DB"
+    )
+    print("/learn-docs <dir> [--workers N] - Convert and learn PDFs/Office documents")
+    print("/watch <cmd>  - Keep directories learned as they change (start/stop/status)")
+    print("/jobs [id]    - Show background jobs; /jobs cancel <id> stops one")
     print("/clear        - Clear conversation history")
     print("/learn <text> - Add information to knowledge base")
     print("/web <url>    - Learn content from a webpage")
+    print("/web crawl <url> [--depth N] [--max-pages M] - Crawl and learn a site")
     print("/export <fmt> - Export conversation (json/markdown)")
     print("/read <file>  - Read file contents")
     print("/write <file> - Write content to file")
@@ -94,4 +101,45 @@ def handle_model_info(args: List[str]) -> None:
     print()
 
 
-__all__ = ["handle_help", "handle_model_info"]
+@CommandRegistry.register(
+    "tokens", "Show prompt token usage per request", category="info"
+)
+def handle_tokens(args: List[str]) -> None:
+    """Show what each request costs in prompt tokens, per tool manifest mode."""
+    import json
+
+    from langchain_core.messages import SystemMessage
+
+    from src.core.constants import TOOL_MANIFEST_MODES
+    from src.core.context import get_context
+    from src.core.utils import estimate_tokens
+    from src.storage.memory import build_system_prompt
+    from src.tools.registry import ToolRegistry
+
+    config = get_config()
+    snapshot = ToolRegistry.get_definitions_snapshot()
+    schema_tokens = estimate_tokens(json.dumps(snapshot))
+    history = [
+        m
+        for m in get_context().conversation_history
+        if not isinstance(m, SystemMessage)
+    ]
+    history_tokens = sum(estimate_tokens(str(m.content)) for m in history)
+
+    def per_request(mode: str) -> int:
+        return estimate_tokens(build_system_prompt(mode)) + schema_tokens
+
+    full = per_request("full")
+    print("\n📊 Prompt tokens per request (estimated, ~4 chars/token)")
+    print(f"   Tool schemas (native binding, {len(snapshot)} tools): {schema_tokens:,}")
+    print(f"   Conversation history ({len(history)} messages): {history_tokens:,}")
+    print("   System prompt + schemas by TOOL_MANIFEST mode:")
+    for mode in TOOL_MANIFEST_MODES:
+        tokens = per_request(mode)
+        marker = " ← current" if mode == config.tool_manifest else ""
+        saved = f", saves {full - tokens:,} vs full" if mode != "full" else ""
+        print(f"     {mode:<8} {tokens:>7,}{saved}{marker}")
+    print()
+
+
+__all__ = ["handle_help", "handle_model_info", "handle_tokens"]
@@ -27,9 +27,7 @@ This module provides command handlers for learning information via
 /learn, bulk importing codebases via /populate, and learning from web pages.
 """
 
-from datetime import datetime
-
-from typing import List
+from typing import List, Optional, Tuple
 from src.commands.registry import CommandRegistry
 from src.core.context import get_context
 from src.core.context_utils import add_to_knowledge_base
@@ -40,6 +38,8 @@ from src.learning.auto_learn import (
     register_content_hash,
     get_content_hash_for_string,
 )
+from src.learning.pipeline import IngestPipeline, IngestUnit, PipelineConfig
+from src.learning.web_crawler import build_page_documents
 
 logger = get_logger()
 _config = get_config()
@@ -48,76 +48,93 @@ _config = get_config()
 _operation_count = 0
 
 
+def _read_web_unit(unit: IngestUnit) -> IngestUnit:
+    """Pipeline read stage for /web: fetch the page and convert it to markdown."""
+    from src.learning.converter_pool import convert_document
+
+    # Docling handles fetching and HTML-to-Markdown conversion
+    document = convert_document(unit.key)
+    content = document.markdown
+
+    # Check for duplicate content
+    content_hash = get_content_hash_for_string(content)
+    if is_content_duplicate(content_hash):
+        unit.status = "duplicate"
+        return unit
+
+    # Docling might expose a title; fall back to a safe default
+    title = document.title or "Web Page"
+    unit.data = {"content": content, "content_hash": content_hash, "title": title}
+    return unit
+
+
+def _chunk_web_unit(unit: IngestUnit) -> IngestUnit:
+    """Pipeline chunk stage for /web: split the page along its headings."""
+    unit.documents = build_page_documents(
+        unit.key, unit.data["title"], unit.data["content"]
+    )
+    return unit
+
+
 def execute_learn_url(url: str) -> dict:
     """
     Fetch and learn content from a URL using Docling.
 
-    This function leverages Docling's ability to fetch and parse web pages
-    into structured markdown, which is then added to the knowledge base.
+    The page goes through the staged ingestion pipeline: Docling fetches
+    and converts it to markdown, the markdown is split along its headings,
+    and only chunks that changed since the page was last learned are
+    embedded and stored.
     """
     global _operation_count
 
     try:
-        from docling.document_converter import DocumentConverter
-        from langchain_core.documents import Document
-
-        # Initialize converter
-        converter = DocumentConverter()
-
-        # Convert web content directly from URL
-        # Docling handles fetching and HTML-to-Markdown conversion
-        result = converter.convert(url)
-        content = result.document.export_to_markdown()
-
-        # Check for duplicate content
-        content_hash = get_content_hash_for_string(content)
-        if is_content_duplicate(content_hash):
-            return {"skipped": True, "reason": "duplicate", "url": url}
-
-        # Create metadata
-        title = "Web Page"  # Docling might expose title, but safe default
-        if hasattr(result.document, "title") and getattr(
-            result.document, "title", None
-        ):
-            title = getattr(result.document, "title")
-
-        doc = Document(
-            page_content=content,
-            metadata={
-                "source": url,
-                "title": title,
-                "type": "web_page",
-                "added_at": datetime.now().isoformat(),
-            },
-        )
-
-        # Add to vector store using context
-        ctx = get_context()
-        if ctx.vectorstore:
-            # Use the existing logic or direct add
-            ctx.vectorstore.add_documents([doc])
-
-            # Register hash to prevent duplicates
-            register_content_hash(content_hash)
-
-            # Periodic cleanup logic from handle_learn_command
-            _operation_count += 1
-            if _operation_count % 50 == 0:
-                cleanup_memory()
-
-            return {"success": True, "title": title, "url": url, "length": len(content)}
-        else:
-            return {"error": "Vector database not initialized"}
-
+        import docling.document_converter  # noqa: F401
     except ImportError:
         return {"error": "docling library not installed"}
+
+    if get_context().vectorstore is None:
+        return {"error": "Vector database not initialized"}
+
+    done: List[IngestUnit] = []
+    try:
+        IngestPipeline(
+            "web",
+            [IngestUnit(key=url)],
+            read=_read_web_unit,
+            chunk=_chunk_web_unit,
+            config=PipelineConfig(read_workers=1, embed_workers=1),
+            on_unit_done=done.append,
+        ).run()
     except Exception as e:
         return {"error": str(e)}
 
+    unit = done[0] if done else IngestUnit(key=url, status="error")
+    if unit.status == "duplicate":
+        return {"skipped": True, "reason": "duplicate", "url": url}
+    if unit.status not in ("ok", "empty"):
+        return {"error": unit.error or "Failed to store web page"}
+
+    # Register hash to prevent duplicates
+    register_content_hash(unit.data["content_hash"])
+
+    # Periodic cleanup logic from handle_learn_command
+    _operation_count += 1
+    if _operation_count % 50 == 0:
+        cleanup_memory()
+
+    return {
+        "success": True,
+        "title": unit.data["title"],
+        "url": url,
+        "length": len(unit.data["content"]),
+        "chunks": len(unit.documents),
+    }
+
 
 __all__ = [
     "handle_learn",
     "handle_populate",
+    "handle_watch",
     "handle_web",
 ]
 
@@ -174,18 +191,59 @@ def handle_learn(args: List[str]) -> None:
         print("❌ Failed to learn information\n")
 
 
-@CommandRegistry.register("populate", "Bulk import codebase", category="learning")
+def _parse_populate_args(args: List[str]) -> Tuple[str, Optional[int]]:
+    """
+    Split /populate arguments into a directory path and worker count.
+
+    Accepts ``--workers N`` and ``--workers=N`` anywhere in the arguments;
+    the remaining arguments are joined into the directory path.
+
+    Raises:
+        ValueError: If the worker count is missing or not a positive integer
+    """
+    path_parts: List[str] = []
+    workers: Optional[int] = None
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--workers" or arg.startswith("--workers="):
+            if "=" in arg:
+                value = arg.split("=", 1)[1]
+            else:
+                i += 1
+                value = args[i] if i < len(args) else ""
+            if not value.isdigit() or int(value) < 1:
+                raise ValueError("--workers requires a positive integer")
+            workers = int(value)
+        else:
+            path_parts.append(arg)
+        i += 1
+    return " ".join(path_parts) or ".", workers
+
+
+@CommandRegistry.register(
+    "populate", "Bulk import codebase", category="learning", background=True
+)
 def handle_populate(args: List[str]) -> None:
-    """Handle the /populate command to bulk import codebases."""
-    import os
-    from src.core.utils import chunk_text
-    from src.core.context_utils import add_to_knowledge_base
-    from langchain_core.documents import Document
+    """
+    Handle the /populate command to bulk import codebases.
+
+    Usage: /populate [dir] [--workers N]
 
-    dir_path = " ".join(args) if args else "."
+    Files are read and chunked in parallel worker processes and stored in
+    embedding batches; see src.learning.populate for the pipeline. An
+    interrupted run resumes where it stopped when repeated.
+    """
+    import os
+    from src.learning.populate import run_populate
+    from src.learning.progress import CLIProgress
 
-    if not dir_path:
-        dir_path = "."
+    try:
+        dir_path, workers = _parse_populate_args(args)
+    except ValueError as e:
+        print(f"\n❌ Error: {e}\n")
+        print("Usage: /populate [dir] [--workers N]\n")
+        return
 
     # Expand path and verify it exists
     dir_path = os.path.expanduser(dir_path)
@@ -197,275 +255,260 @@ def handle_populate(args: List[str]) -> None:
         print(f"\n❌ Error: '{dir_path}' is not a directory\n")
         return
 
-    # Supported file extensions
-    text_extensions = {
-        ".py",
-        ".js",
-        ".ts",
-        ".jsx",
-        ".tsx",
-        ".java",
-        ".cpp",
-        ".c",
-        ".h",
-        ".go",
-        ".rs",
-        ".rb",
-        ".php",
-        ".swift",
-        ".kt",
-        ".scala",
-        ".r",
-        ".m",
-        ".md",
-        ".txt",
-        ".rst",
-        ".adoc",
-        ".tex",
-        ".json",
-        ".yaml",
-        ".yml",
-        ".xml",
-        ".html",
-        ".htm",
-        ".css",
-        ".scss",
-        ".sass",
-        ".less",
-        ".sh",
-        ".bash",
-        ".zsh",
-        ".fish",
-        ".ps1",
-        ".bat",
-        ".cmd",
-        ".sql",
-        ".vim",
-        ".el",
-        ".clj",
-        ".cljs",
-        ".edn",
-        ".erl",
-        ".hrl",
-        ".ex",
-        ".exs",
-        ".ml",
-        ".mli",
-        ".fs",
-        ".fsx",
-        ".fsi",
-        ".hs",
-        ".lhs",
-        ".jl",
-        ".lua",
-        ".moon",
-        ".nims",
-        ".nim",
-        ".cr",
-        ".pony",
-        ".zig",
-        ".v",
-        ".vlt",
-        ".sv",
-        ".svh",
-        ".vhd",
-        ".vhdl",
-    }
-
-    # Binary extensions to skip
-    binary_extensions = {
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".bmp",
-        ".ico",
-        ".svg",
-        ".webp",
-        ".mp3",
-        ".mp4",
-        ".avi",
-        ".mov",
-        ".wmv",
-        ".flv",
-        ".webm",
-        ".pdf",
-        ".doc",
-        ".docx",
-        ".xls",
-        ".xlsx",
-        ".ppt",
-        ".pptx",
-        ".zip",
-        ".tar",
-        ".gz",
-        ".bz2",
-        ".7z",
-        ".rar",
-        ".exe",
-        ".dll",
-        ".so",
-        ".dylib",
-        ".bin",
-        ".dat",
-        ".db",
-        ".sqlite",
-        ".sqlite3",
-    }
-
-    # Directories to skip
-    skip_dirs = {
-        ".git",
-        ".svn",
-        ".hg",
-        "node_modules",
-        "__pycache__",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".tox",
-        ".venv",
-        "venv",
-        "env",
-        ".env",
-        "dist",
-        "build",
-        ".idea",
-        ".vscode",
-        ".vs",
-        "*.egg-info",
-        ".eggs",
-    }
-
     if _config.verbose_logging:
         logger.info(f"📁 Populating from directory: {dir_path}")
 
     print(f"\n📁 Scanning directory: {dir_path}")
 
-    files_processed = 0
-    files_skipped = 0
-    chunks_added = 0
-    errors = 0
-
     try:
-        for root, dirs, files in os.walk(dir_path):
-            # Skip unwanted directories
-            dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith(".")]
-
-            for filename in files:
-                # Skip hidden files
-                if filename.startswith("."):
-                    continue
-
-                file_path = os.path.join(root, filename)
-
-                # Check extension
-                _, ext = os.path.splitext(filename)
-                ext = ext.lower()
-
-                if ext in binary_extensions:
-                    files_skipped += 1
-                    continue
-
-                if ext not in text_extensions and not filename.endswith("Makefile"):
-                    # Try to read as text anyway if no extension
-                    if ext:
-                        files_skipped += 1
-                        continue
-
-                # Try to read and process the file
-                try:
-                    # Check file size (skip files > 10MB)
-                    file_size = os.path.getsize(file_path)
-                    if file_size > 10 * 1024 * 1024:
-                        if _config.verbose_logging:
-                            logger.warning(f"   ⚠️ Skipping large file: {filename}")
-                        files_skipped += 1
-                        continue
-
-                    # Try to read as UTF-8
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                    except UnicodeDecodeError:
-                        # Try with different encoding
-                        try:
-                            with open(file_path, "r", encoding="latin-1") as f:
-                                content = f.read()
-                        except Exception:
-                            files_skipped += 1
-                            continue
-
-                    # Skip empty files
-                    if not content.strip():
-                        continue
-
-                    # Check for duplicate content
-                    content_hash = get_content_hash_for_string(content)
-                    if is_content_duplicate(content_hash):
-                        if _config.verbose_logging:
-                            logger.debug(f"   Skipping duplicate file: {filename}")
-                        files_skipped += 1
-                        continue
-
-                    # Get relative path for metadata
-                    rel_path = os.path.relpath(file_path, dir_path)
-
-                    # Chunk the content
-                    chunks = chunk_text(content)
-
-                    # Create documents from chunks
-                    for i, chunk in enumerate(chunks):
-                        doc = Document(
-                            page_content=chunk,
-                            metadata={
-                                "source": file_path,
-                                "relative_path": rel_path,
-                                "filename": filename,
-                                "chunk_index": i,
-                                "total_chunks": len(chunks),
-                                "type": "code_file",
-                            },
-                        )
-
-                        # Add to knowledge base
-                        if add_to_knowledge_base(doc.page_content, doc.metadata):
-                            chunks_added += 1
-
-                    # Register hash after successful processing
-                    register_content_hash(content_hash)
-                    files_processed += 1
-
-                    if _config.verbose_logging and files_processed % 10 == 0:
-                        logger.info(f"   📄 Processed {files_processed} files...")
-
-                except Exception as e:
-                    if _config.verbose_logging:
-                        logger.warning(f"   ⚠️ Error processing {filename}: {e}")
-                    errors += 1
-
+        stats = run_populate(
+            dir_path,
+            workers=workers,
+            verbose=_config.verbose_logging,
+            progress=CLIProgress(),
+        )
     except Exception as e:
         print(f"\n❌ Error scanning directory: {e}\n")
         return
 
     # Print summary
-    print("\n✅ Population complete!")
-    print(f"   📄 Files processed: {files_processed}")
-    print(f"   📝 Chunks added: {chunks_added}")
-    print(f"   ⏭️ Files skipped: {files_skipped}")
-    if errors > 0:
-        print(f"   ⚠️ Errors: {errors}")
+    if stats.interrupted:
+        print("\n⏸️  Population interrupted — run the same command again to resume")
+    else:
+        print("\n✅ Population complete!")
+    print(f"   📄 Files processed: {stats.files_processed}")
+    if stats.files_resumed:
+        print(f"   ⏩ Files resumed from checkpoint: {stats.files_resumed}")
+    print(f"   📝 Chunks added: {stats.chunks_added}")
+    if stats.chunks_unchanged or stats.chunks_deleted:
+        print(
+            f"   ♻️ Chunks unchanged: {stats.chunks_unchanged}, "
+            f"removed: {stats.chunks_deleted}"
+        )
+    if stats.chunks_suppressed:
+        print(f"   🧬 Near-duplicate chunks skipped: {stats.chunks_suppressed}")
+    print(f"   ⏭️ Files skipped: {stats.files_skipped}")
+    if stats.errors > 0:
+        print(f"   ⚠️ Errors: {stats.errors}")
+    print(
+        f"   ⚡ Throughput: {stats.files_per_second:.1f} files/s, "
+        f"{stats.chunks_per_second:.1f} chunks/s "
+        f"({stats.workers} worker{'s' if stats.workers != 1 else ''}, {stats.elapsed:.1f}s)"
+    )
     print()
 
 
-@CommandRegistry.register("web", "Learn from webpage", category="learning")
+def _pop_mode_arg(args: List[str]) -> Tuple[List[str], str]:
+    """
+    Remove ``--mode M`` / ``--mode=M`` from arguments.
+
+    Raises:
+        ValueError: If the mode is missing or unknown
+    """
+    from src.core.constants import DOC_EXTRACTION_MODE
+    from src.learning.converter_pool import EXTRACTION_MODES
+
+    rest: List[str] = []
+    mode = DOC_EXTRACTION_MODE
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--mode" or arg.startswith("--mode="):
+            if "=" in arg:
+                mode = arg.split("=", 1)[1]
+            else:
+                i += 1
+                mode = args[i] if i < len(args) else ""
+            if mode not in EXTRACTION_MODES:
+                raise ValueError(
+                    f"--mode must be one of: {', '.join(EXTRACTION_MODES)}"
+                )
+        else:
+            rest.append(arg)
+        i += 1
+    return rest, mode
+
+
+@CommandRegistry.register(
+    "learn-docs",
+    "Convert and learn a folder of documents",
+    category="learning",
+    background=True,
+)
+def handle_learn_docs(args: List[str]) -> None:
+    """
+    Handle the /learn-docs command to ingest PDFs and Office documents.
+
+    Usage: /learn-docs [dir] [--workers N] [--mode auto|fast|balanced|accurate]
+
+    Documents are converted in parallel by warm Docling worker processes
+    (src.learning.converter_pool); markdown is cached by file hash, so
+    re-running the command only converts new or changed documents.
+    """
+    import os
+    from src.learning.learn_docs import run_learn_docs
+    from src.learning.progress import CLIProgress
+
+    try:
+        args, mode = _pop_mode_arg(args)
+        dir_path, workers = _parse_populate_args(args)
+    except ValueError as e:
+        print(f"\n❌ Error: {e}\n")
+        print(
+            "Usage: /learn-docs [dir] [--workers N] "
+            "[--mode auto|fast|balanced|accurate]\n"
+        )
+        return
+
+    dir_path = os.path.expanduser(dir_path)
+    if not os.path.isdir(dir_path):
+        print(f"\n❌ Error: '{dir_path}' is not a directory\n")
+        return
+
+    if get_context().vectorstore is None:
+        print("\n❌ Error: Vector database not initialized\n")
+        return
+
+    print(f"\n📚 Converting documents in: {dir_path}")
+
+    try:
+        stats = run_learn_docs(
+            dir_path, workers=workers, progress=CLIProgress(), mode=mode
+        )
+    except ImportError:
+        print("\n❌ Error: docling library not installed\n")
+        return
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+        return
+
+    if stats.interrupted:
+        print("\n⏸️  Interrupted — run the same command again to resume")
+    else:
+        print("\n✅ Documents learned!")
+    print(f"   📄 Documents processed: {stats.documents_processed}")
+    print(
+        f"   🔄 Converted: {stats.documents_converted} "
+        f"({stats.conversion_seconds:.1f}s), from cache: {stats.documents_cached}"
+    )
+    if stats.tiers:
+        tiers = ", ".join(f"{tier}: {count}" for tier, count in stats.tiers.items())
+        print(f"   🎚️ Extraction tiers: {tiers}")
+    if stats.documents_resumed:
+        print(f"   ⏩ Resumed from checkpoint: {stats.documents_resumed}")
+    print(f"   📝 Chunks added: {stats.chunks_added}")
+    if stats.chunks_unchanged or stats.chunks_deleted:
+        print(
+            f"   ♻️ Chunks unchanged: {stats.chunks_unchanged}, "
+            f"removed: {stats.chunks_deleted}"
+        )
+    if stats.chunks_suppressed:
+        print(f"   🧬 Near-duplicate chunks skipped: {stats.chunks_suppressed}")
+    if stats.documents_skipped:
+        print(f"   ⏭️ Skipped: {stats.documents_skipped}")
+    if stats.errors:
+        print(f"   ⚠️ Errors: {stats.errors}")
+    print(
+        f"   ⚡ {stats.workers} converter process"
+        f"{'es' if stats.workers != 1 else ''}, {stats.elapsed:.1f}s"
+    )
+    print()
+
+
+def _parse_crawl_args(args: List[str]) -> Tuple[Optional[str], int, int]:
+    """Parse ``<url> [--depth N] [--max-pages M]``; raises ValueError."""
+    from src.core.constants import WEB_CRAWL_DEFAULT_DEPTH, WEB_CRAWL_DEFAULT_MAX_PAGES
+
+    url = None
+    depth, max_pages = WEB_CRAWL_DEFAULT_DEPTH, WEB_CRAWL_DEFAULT_MAX_PAGES
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ("--depth", "--max-pages"):
+            if i + 1 >= len(args):
+                raise ValueError(f"{arg} requires a number")
+            minimum = 0 if arg == "--depth" else 1
+            if not args[i + 1].isdigit() or int(args[i + 1]) < minimum:
+                raise ValueError(f"{arg} must be a number of at least {minimum}")
+            value = int(args[i + 1])
+            if arg == "--depth":
+                depth = value
+            else:
+                max_pages = value
+            i += 2
+            continue
+        if url is not None:
+            raise ValueError(f"Unexpected argument: {arg}")
+        url = arg
+        i += 1
+    return url, depth, max_pages
+
+
+def _handle_web_crawl(args: List[str]) -> None:
+    """Crawl a site and ingest its pages (see src.learning.web_crawler)."""
+    from src.learning.progress import CLIProgress
+    from src.learning.web_crawler import WebCrawler
+
+    try:
+        url, depth, max_pages = _parse_crawl_args(args)
+    except ValueError as e:
+        print(f"\n❌ Error: {e}\n")
+        return
+    if not url:
+        print("\nUsage: /web crawl <url> [--depth N] [--max-pages M]\n")
+        return
+    if get_context().vectorstore is None:
+        print("\n❌ Error: Vector database not initialized\n")
+        return
+
+    try:
+        crawler = WebCrawler(
+            url, depth=depth, max_pages=max_pages, progress=CLIProgress()
+        )
+    except ValueError as e:
+        print(f"\n❌ Error: {e}\n")
+        return
+
+    print(
+        f"\n🕸️  Crawling {crawler.start_url} (depth {depth}, up to {max_pages} pages)"
+    )
+    stats = crawler.run()
+
+    print(f"\n✅ Crawled {stats.pages_fetched} pages in {stats.elapsed:.1f}s")
+    print(f"   📄 Ingested: {stats.pages_ingested}")
+    print(f"   ♻️  Unchanged: {stats.pages_unchanged}")
+    if stats.pages_removed:
+        print(f"   🗑️  Removed: {stats.pages_removed}")
+    if stats.pages_skipped:
+        print(f"   ⏭️  Skipped: {stats.pages_skipped}")
+    if stats.blocked_by_robots:
+        print(f"   🤖 Blocked by robots.txt: {stats.blocked_by_robots}")
+    if stats.errors:
+        print(f"   ❌ Errors: {stats.errors}")
+    print(f"   🧩 Chunks added: {stats.chunks_added}, deleted: {stats.chunks_deleted}")
+    if stats.interrupted:
+        print("   ⚠️  Interrupted; re-run the crawl to pick up the remaining pages")
+    print()
+
+
+@CommandRegistry.register(
+    "web", "Learn from webpage", category="learning", background=True
+)
 def handle_web(args: List[str]) -> None:
     """
     Handle /web command to learn from a webpage.
+
+    Usage: /web <url> | /web crawl <url> [--depth N] [--max-pages M]
     """
+    if args and args[0].lower() == "crawl":
+        _handle_web_crawl(args[1:])
+        return
+
     url = args[0] if args else ""
 
     if not url:
-        print("\nUsage: /web <url>\n")
+        print("\nUsage: /web <url>")
+        print("       /web crawl <url> [--depth N] [--max-pages M]\n")
         return
 
     if _config.verbose_logging:
@@ -486,4 +529,85 @@ def handle_web(args: List[str]) -> None:
         print(f"\n✅ Successfully learned from {url}\n")
 
 
-__all__ = ["handle_learn", "handle_populate", "handle_web"]
+@CommandRegistry.register(
+    "watch", "Keep directories learned as they change", category="learning"
+)
+def handle_watch(args: List[str]) -> None:
+    """
+    Handle the /watch command.
+
+    Usage: /watch start [dir ...] | /watch stop | /watch status
+
+    Changed files in the watched directories are re-ingested incrementally
+    in the background; see src.learning.watcher.
+    """
+    import os
+    import time
+    from src.learning.watcher import get_watch_service
+
+    service = get_watch_service()
+    action = args[0].lower() if args else "status"
+
+    if action == "start":
+        if service.is_running():
+            print("\n⚠️  Watcher is already running (use /watch stop first)\n")
+            return
+        dirs = [os.path.expanduser(d) for d in args[1:]] or ["."]
+        missing = [d for d in dirs if not os.path.isdir(d)]
+        if missing:
+            print(f"\n❌ Error: Not a directory: {', '.join(missing)}\n")
+            return
+        if get_context().embeddings is None:
+            print(
+                "\nEmbeddings not available. Ollama is required for learning features.\n"
+            )
+            return
+        if not service.start(dirs):
+            print("\n❌ Failed to start watcher\n")
+            return
+        status = service.status()
+        print(f"\n👀 Watching for changes in space '{status.space}' ({status.backend})")
+        for root in status.roots:
+            print(f"   📁 {root}")
+        print()
+
+    elif action == "stop":
+        if not service.is_running():
+            print("\nℹ️  Watcher is not running\n")
+            return
+        service.stop()
+        print("\n⏹️  Watcher stopped\n")
+
+    elif action == "status":
+        status = service.status()
+        if not status.running:
+            print("\nℹ️  Watcher is not running (start with /watch start [dir ...])\n")
+            return
+        state = "paused (another space is active)" if status.paused else "running"
+        print(f"\n👀 Watcher {state} for space '{status.space}' ({status.backend})")
+        for root in status.roots:
+            print(f"   📁 {root}")
+        print(
+            f"   📨 Events: {status.events}, pending: {status.pending}, in progress: {status.in_progress}"
+        )
+        print(
+            f"   📄 Files synced: {status.files_synced}, removed: {status.files_removed}"
+        )
+        print(
+            f"   📝 Chunks added: {status.chunks_added}, removed: {status.chunks_deleted}"
+        )
+        if status.chunks_suppressed:
+            print(f"   🧬 Near-duplicate chunks skipped: {status.chunks_suppressed}")
+        if status.errors:
+            print(f"   ⚠️ Errors: {status.errors}")
+        if status.last_sync:
+            print(
+                f"   🕒 Last sync: {time.strftime('%H:%M:%S', time.localtime(status.last_sync))}"
+            )
+        print()
+
+    else:
+        print("\nUsage: /watch start [dir ...] | /watch stop | /watch status\n")
+
+
+__all__ = ["handle_learn", "handle_populate", "handle_watch", "handle_web"]
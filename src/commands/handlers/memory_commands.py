@@ -33,7 +33,9 @@ from langchain_core.messages import SystemMessage, BaseMessage
 from src.commands.registry import CommandRegistry
 from src.core.context import get_context
 from src.core.config import get_config
+from src.core.summarizer import get_summarizer
 from src.storage.memory import save_memory
+from src.storage.tool_outputs import get_tool_output_store
 
 __all__ = [
     "handle_memory",
@@ -61,6 +63,8 @@ def handle_memory(args: List[str]) -> None:
         content = str(msg.content)
         content_preview = content[:100] + "..." if len(content) > 100 else content
         print(f"{i + 1:2d}. {msg_type}: {content_preview}")
+    if ctx.conversation_summary:
+        print(f"\n🧾 Summary of earlier turns:\n{ctx.conversation_summary}")
     print()
 
 
@@ -81,6 +85,8 @@ def handle_clear(args: List[str]) -> None:
             List[BaseMessage], [SystemMessage(content="Lets get some coding done..")]
         )
         save_memory(ctx.conversation_history)
+        get_summarizer().reset()
+        get_tool_output_store().clear()
     else:
         print("\n❌ Clear cancelled\n")
 
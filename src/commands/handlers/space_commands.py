@@ -40,11 +40,20 @@ from src.vectordb.spaces import (
     list_spaces,
     ensure_space_collection,
     delete_space,
+    space_change_blocker,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _jobs_block_space_change() -> bool:
+    """Print why the space cannot change, if background jobs are running."""
+    blocker = space_change_blocker()
+    if blocker:
+        print(blocker)
+    return bool(blocker)
+
+
 @CommandRegistry.register(
     "space",
     "Manage spaces (workspaces)",
@@ -105,6 +114,8 @@ def handle_space(args: Union[str, List[str]]) -> None:
             return
 
         space_name = parts[1]
+        if _jobs_block_space_change():
+            return
         try:
             ensure_space_collection(space_name)
             ctx.current_space = space_name
@@ -121,6 +132,8 @@ def handle_space(args: Union[str, List[str]]) -> None:
             return
 
         space_name = parts[1]
+        if _jobs_block_space_change():
+            return
         try:
             ctx.current_space = space_name
             print(f"Switched to space: {space_name}")
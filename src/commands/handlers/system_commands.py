@@ -24,7 +24,7 @@
 System Commands - Slash commands for system operations.
 
 This module provides command handlers for system-level operations
-including code search.
+including code search and background jobs.
 """
 
 from typing import List
@@ -32,6 +32,7 @@ from src.commands.registry import CommandRegistry
 from src.tools.executors.system_tools import execute_code_search
 
 __all__ = [
+    "handle_jobs",
     "handle_search",
     "handle_shell",
 ]
@@ -245,4 +246,66 @@ def handle_shell(args: List[str]) -> None:
     print()
 
 
-__all__ = ["handle_search", "handle_shell"]
+@CommandRegistry.register(
+    "jobs", "List or cancel background jobs", category="system", aliases=["job"]
+)
+def handle_jobs(args: List[str]) -> None:
+    """
+    Handle /jobs command for background jobs (see src.core.jobs).
+
+    Usage:
+        /jobs                - List jobs with their progress
+        /jobs <id>           - Show a job's status and output
+        /jobs cancel <id>    - Stop a job (units in flight are finished)
+    """
+    from src.core.jobs import get_job_manager
+
+    manager = get_job_manager()
+    action = args[0].lower() if args else "list"
+
+    if action == "list":
+        jobs = manager.jobs()
+        if not jobs:
+            print("\n📭 No background jobs\n")
+            return
+        print(f"\n🧵 Background jobs ({len(manager.active())} active):")
+        for job in jobs:
+            print(f"   {job.describe()}")
+        print()
+        return
+
+    if action == "cancel":
+        if len(args) < 2 or not args[1].lstrip("#").isdigit():
+            print("\n❌ Usage: /jobs cancel <id>\n")
+            return
+        job_id = int(args[1].lstrip("#"))
+        if manager.cancel(job_id):
+            print(
+                f"\n⏹️  Cancelling job #{job_id}; units in flight are finished first\n"
+            )
+        else:
+            print(f"\n❌ No running or queued job #{job_id}\n")
+        return
+
+    if not action.lstrip("#").isdigit():
+        print("\n❌ Usage: /jobs [<id> | cancel <id>]\n")
+        return
+
+    selected = manager.get(int(action.lstrip("#")))
+    if selected is None:
+        print(f"\n❌ No such job {action}\n")
+        return
+    print(f"\n{selected.describe()}")
+    print(f"   Space: {selected.space}")
+    if selected.error:
+        print(f"   Error: {selected.error}")
+    lines = selected.output_lines()
+    if lines:
+        print("-" * 50)
+        for line in lines:
+            print(line)
+        print("-" * 50)
+    print()
+
+
+__all__ = ["handle_jobs", "handle_search", "handle_shell"]
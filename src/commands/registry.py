@@ -49,7 +49,7 @@ commands to be registered with decorators and dispatched by name.
 """
 
 import logging
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set
 
 logger = logging.getLogger()
 
@@ -88,6 +88,8 @@ class CommandRegistry:
     _commands: Dict[str, Callable] = {}
     _descriptions: Dict[str, str] = {}
     _categories: Dict[str, List[str]] = {}
+    # Commands (and aliases) run as background jobs by dispatch()
+    _background: Set[str] = set()
 
     @classmethod
     def register(
@@ -96,6 +98,7 @@ class CommandRegistry:
         description: str = "",
         category: str = "general",
         aliases: Optional[List[str]] = None,
+        background: bool = False,
     ) -> Callable:
         """
         Decorator to register a command handler.
@@ -105,6 +108,8 @@ class CommandRegistry:
             description: Help text for the command
             category: Category for grouping in help output
             aliases: Alternative names for the command
+            background: Run the command as a background job (see
+                src.core.jobs) instead of blocking the caller
 
         Returns:
             Decorator function
@@ -129,6 +134,9 @@ class CommandRegistry:
                 for alias in aliases:
                     cls._commands[alias] = func
 
+            if background:
+                cls._background.update([name] + list(aliases or []))
+
             cfg = _get_config()
             if cfg and cfg.verbose_logging:
                 alias_str = f" (aliases: {aliases})" if aliases else ""
@@ -143,6 +151,9 @@ class CommandRegistry:
         """
         Execute a registered command.
 
+        Background commands are queued as jobs and return immediately;
+        their output is collected by the job (see /jobs).
+
         Args:
             command: Command name (without leading /)
             args: Command arguments
@@ -164,6 +175,17 @@ class CommandRegistry:
             args_str = " ".join(str(a) for a in args) if args else "(no args)"
             logger.info(f"📋 Dispatching command: /{command} {args_str}")
 
+        if command in cls._background:
+            from src.core.jobs import current_job, get_job_manager
+
+            # Commands issued from within a job run inline
+            if current_job() is None:
+                command_line = " ".join([f"/{command}"] + [str(a) for a in args])
+                job = get_job_manager().submit(command_line, lambda: handler(args))
+                print(f"\n🚀 Started job #{job.id}: {command_line}")
+                print(f"   /jobs to follow it, /jobs cancel {job.id} to stop it\n")
+                return True
+
         try:
             logger.info(f"📋 Executing handler for '{command}'")
             handler(args)
@@ -200,12 +222,18 @@ class CommandRegistry:
         """Check if a command is registered."""
         return name in cls._commands
 
+    @classmethod
+    def is_background(cls, name: str) -> bool:
+        """Check if a command runs as a background job."""
+        return name in cls._background
+
     @classmethod
     def clear(cls) -> None:
         """Clear all registered commands. Useful for testing."""
         cls._commands.clear()
         cls._descriptions.clear()
         cls._categories.clear()
+        cls._background.clear()
 
 
 def register_command(
@@ -213,6 +241,7 @@ def register_command(
     description: str = "",
     category: str = "general",
     aliases: Optional[List[str]] = None,
+    background: bool = False,
 ) -> Callable:
     """
     Convenience function for registering commands.
@@ -225,4 +254,4 @@ def register_command(
         def handle_help(args):
             ...
     """
-    return CommandRegistry.register(name, description, category, aliases)
+    return CommandRegistry.register(name, description, category, aliases, background)
@@ -83,6 +83,7 @@ from src.core.context import (
     get_query_cache,
 )
 from src.core.context_utils import get_relevant_context, add_to_knowledge_base
+from src.core.chunking import Chunk, chunk_document
 from src.core.utils import (
     chunk_text,
     validate_file_path,
@@ -131,6 +132,8 @@ __all__ = [
     "get_relevant_context",
     "add_to_knowledge_base",
     "chunk_text",
+    "Chunk",
+    "chunk_document",
     "validate_file_path",
     "get_file_size_info",
     "truncate_content",
@@ -34,20 +34,77 @@ It correctly respects the 4 logging flags:
 
 import logging
 import json
+import threading
 import time
-from typing import Dict, Any, Optional, Callable
-from langchain_core.messages import HumanMessage, ToolMessage
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Mapping, Optional, Callable, Tuple
+from langchain_core.messages import (
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+    message_chunk_to_message,
+)
 from src.core.context import get_context
 from src.tools.registry import ToolRegistry
+from src.tools.router import (
+    REQUEST_ALL_TOOLS,
+    REQUEST_ALL_TOOLS_DEFINITION,
+    get_tool_router,
+)
 from src.tools.approval import ToolApprovalManager
-from src.storage.memory import save_memory, trim_history
+from src.storage.memory import (
+    HistoryTokenCounter,
+    build_system_prompt,
+    partition_history,
+    save_memory,
+    with_summary,
+)
+from src.storage.tool_outputs import compact_tool_result
 from src.core.config import get_config
+from src.core.context_gate import get_context_gate
+from src.core.summarizer import get_summarizer
 from src.core.constants import (
+    CONTEXT_AUTO_MIN_SIMILARITY,
+    HISTORY_TRIM_TARGET,
     MAX_INPUT_LENGTH,
+    TOOL_PARALLEL_WORKERS,
+    TOOL_ROUTER_BIND_CACHE_SIZE,
+    TOOL_ROUTER_CONTEXT_CHARS,
+    TOOL_ROUTER_CONTEXT_MESSAGES,
 )
 
 logger = logging.getLogger(__name__)
 
+# The LLM with tools bound, shared by every ChatLoop (the GUI creates one per
+# message): (llm instance, ToolRegistry.version(), {tool selection: bound
+# runnable}); the selection is None for the full catalog (see ToolRouter)
+_bound_llm: Optional[Tuple[Any, int, Dict[Optional[Tuple[str, ...]], Any]]] = None
+_bound_llm_lock = threading.Lock()
+
+# Pool for read-only tool calls, shared by every ChatLoop and created on
+# first use (see _get_tool_pool)
+_tool_pool: Optional[ThreadPoolExecutor] = None
+_tool_pool_lock = threading.Lock()
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    """Return the shared read-only tool pool, creating it on first use."""
+    global _tool_pool
+
+    with _tool_pool_lock:
+        if _tool_pool is None:
+            _tool_pool = ThreadPoolExecutor(
+                max_workers=TOOL_PARALLEL_WORKERS, thread_name_prefix="Tool"
+            )
+        return _tool_pool
+
+
+def _resolved(result: Dict[str, Any]) -> Future:
+    """Return a future that is already done with the given result."""
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
 
 # =============================================================================
 # CUSTOM EXCEPTION CLASSES FOR INPUT VALIDATION
@@ -77,18 +134,39 @@ class ChatLoop:
     Orchestrates the conversational agent loop with tool calling support.
     """
 
-    def __init__(self, confirmation_callback: Optional[Callable] = None):
+    def __init__(
+        self,
+        confirmation_callback: Optional[Callable] = None,
+        on_token: Optional[Callable[[str], None]] = None,
+    ):
         """
         Initialize ChatLoop.
 
         Args:
             confirmation_callback: Function(tool_name, args) -> bool
                                   If None, defaults to CLI input.
+            on_token: Function(text) called with each text token as the LLM
+                      streams it. If None, responses are fetched with a
+                      single blocking call.
         """
         self.ctx = get_context()
         self.approval_manager = ToolApprovalManager()
         self.confirmation_callback = confirmation_callback
+        self.on_token = on_token
+        # True when the last run_iteration() answer was already delivered
+        # token by token through on_token
+        self.last_response_streamed = False
         self.config = get_config()
+        # Read-only tool calls run on the shared pool, each tool limited by
+        # its own semaphore (see _submit_read_only)
+        self._tool_slots: Dict[str, threading.BoundedSemaphore] = {}
+        # Tool calls started while the response was still streaming,
+        # keyed by tool call id
+        self._early_calls: Dict[str, Tuple[str, Dict[str, Any], Future]] = {}
+        # Tools bound for the current turn; None binds the full catalog
+        self._turn_tools: Optional[List[str]] = None
+        # Token and exchange counts of the history, updated as it grows
+        self._history_counter = HistoryTokenCounter()
 
     # =============================================================================
     # INPUT VALIDATION AND SANITIZATION METHODS
@@ -163,6 +241,7 @@ class ChatLoop:
         Returns:
             str: The final response from the AI.
         """
+        self.last_response_streamed = False
         try:
             # 1. Input processing
             validated_input = self._validate_and_sanitize_input(user_input)
@@ -183,6 +262,9 @@ class ChatLoop:
 
         except Exception as e:
             return self._handle_iteration_error(e)
+        finally:
+            # Cancel streamed tool calls that the final message dropped
+            self._discard_early_calls()
 
     def _validate_and_sanitize_input(self, user_input: str) -> str:
         """
@@ -206,6 +288,10 @@ class ChatLoop:
         """
         Inject RAG context if enabled.
 
+        In "auto" mode the ContextGate skips retrieval for small talk and
+        tool commands, and only chunks above CONTEXT_AUTO_MIN_SIMILARITY
+        are injected; "on" always retrieves the top results.
+
         Args:
             user_input: The user input to enhance with context
 
@@ -220,7 +306,27 @@ class ChatLoop:
 
         from src.core.context_utils import get_relevant_context
 
-        context = get_relevant_context(user_input)
+        if self.ctx.context_mode == "auto":
+            gate = get_context_gate()
+            decision = gate.decide(user_input)
+            if not decision.retrieve:
+                saved = gate.expected_retrieval_time()
+                saved_note = f", ~{saved * 1000:.0f}ms saved" if saved else ""
+                logger.info(f"📚 Context skipped ({decision.reason}{saved_note})")
+                self._monitor_performance("Context injection (skipped)", start_time)
+                return user_input
+
+            context = get_relevant_context(
+                user_input, min_similarity=CONTEXT_AUTO_MIN_SIMILARITY
+            )
+            elapsed = time.time() - start_time
+            gate.record_retrieval(elapsed)
+            logger.info(
+                f"📚 Context retrieved ({decision.reason}, {elapsed * 1000:.0f}ms, "
+                f"{'relevant' if context else 'nothing relevant'})"
+            )
+        else:
+            context = get_relevant_context(user_input)
 
         if not context:
             self._monitor_performance("Context injection (no context)", start_time)
@@ -247,6 +353,9 @@ class ChatLoop:
         # PHASE 3: Performance monitoring start
         loop_start_time = time.time()
 
+        # Pick the tools to bind for this turn (all of them unless routing)
+        self._turn_tools = self._route_tools()
+
         for _ in range(max_iterations):
             iteration_start = time.time()
 
@@ -267,8 +376,13 @@ class ChatLoop:
                     "Complete tool loop iteration", loop_start_time
                 )
 
+                self.last_response_streamed = self.on_token is not None
                 return response.content
 
+            # Separate streamed preamble text from whatever comes next
+            if self.on_token is not None and response.content:
+                self.on_token("\n\n")
+
             # Add LLM response to history first
             self.ctx.conversation_history.append(response)
 
@@ -279,13 +393,16 @@ class ChatLoop:
             # Execute tools with performance optimization
             tool_start_time = time.time()
 
-            # PHASE 3: Parallel execution (placeholder implementation)
+            # Read-only tools run concurrently; results keep call order
             results = self._execute_parallel_tools_if_safe(tool_calls)
 
             # Add ToolMessages for each result
             for i, (tool_call, result) in enumerate(zip(tool_calls, results)):
+                # Large outputs stay in the session store, history gets a preview
+                result = compact_tool_result(tool_call["name"], result)
                 tool_message = ToolMessage(
-                    content=json.dumps(result), tool_call_id=tool_call.get("id")
+                    content=self._tool_message_content(tool_call["name"], result),
+                    tool_call_id=tool_call.get("id"),
                 )
                 self.ctx.conversation_history.append(tool_message)
 
@@ -319,19 +436,23 @@ class ChatLoop:
 
     def _should_trim_memory(self) -> bool:
         """
-        Check if conversation history should be trimmed based on current size.
+        Check if conversation history exceeds the token budget or pair limit.
+
+        Only messages appended since the last check are measured (see
+        HistoryTokenCounter), so this is cheap to call on every tool call.
 
         Returns:
             bool: True if memory trimming is recommended
         """
-        current_length = len(self.ctx.conversation_history)
-        max_pairs = self.config.max_history_pairs
-
-        # Calculate maximum safe size (pairs * 2 + system messages)
-        max_safe_size = max_pairs * 2 + 5  # 5 system messages buffer
+        counter = self._history_counter.update(self.ctx.conversation_history)
+        return (
+            counter.tokens > self.config.context_token_budget
+            or counter.exchanges > self.config.max_history_pairs
+        )
 
-        # Trim when we're at 150% of safe size to prevent memory bloat
-        return current_length > max_safe_size * 1.5
+    def _trim_budget(self) -> int:
+        """Token budget to trim down to, leaving headroom for the next calls."""
+        return int(self.config.context_token_budget * HISTORY_TRIM_TARGET)
 
     def _trim_conversation_history_incremental(self) -> bool:
         """
@@ -345,11 +466,8 @@ class ChatLoop:
 
         original_length = len(self.ctx.conversation_history)
 
-        # Trim to a safe level (120% of max_pairs instead of 100%)
-        safe_pairs = int(self.config.max_history_pairs * 1.2)
-        self.ctx.conversation_history = trim_history(
-            self.ctx.conversation_history, safe_pairs
-        )
+        # Whole exchanges are dropped; the one in progress is always kept
+        self._trim_and_summarize()
 
         new_length = len(self.ctx.conversation_history)
         trimmed_count = original_length - new_length
@@ -412,12 +530,19 @@ class ChatLoop:
 
         start_time = time.time()
 
-        # Bind tools to the LLM
-        tool_definitions = ToolRegistry.get_definitions()
-        llm_with_tools = self.ctx.llm.bind_tools(tool_definitions)
+        # Bind tools to the LLM (cached until the LLM or the tools change)
+        llm_with_tools = self._bind_tools(self.ctx.llm, self._turn_tools)
 
-        # Invoke LLM
-        response = llm_with_tools.invoke(self.ctx.conversation_history)
+        # Invoke LLM (the rolling summary of trimmed turns rides along
+        # with the system prompt)
+        messages = with_summary(
+            self.ctx.conversation_history, self.ctx.conversation_summary
+        )
+        messages = self._with_routed_manifest(messages)
+        if self.on_token is not None:
+            response = self._stream_llm(llm_with_tools, messages, start_time)
+        else:
+            response = llm_with_tools.invoke(messages)
         elapsed = time.time() - start_time
 
         logger.info(f"🤖 LLM response in {elapsed:.2f}s")
@@ -439,6 +564,189 @@ class ChatLoop:
 
         return response
 
+    def _bind_tools(self, llm: Any, tool_names: Optional[List[str]] = None) -> Any:
+        """
+        Get the LLM with the registered tools bound.
+
+        Binding converts every tool schema, so the result is cached per LLM
+        instance, ToolRegistry.version() and tool selection; registering a
+        tool (e.g. when an MCP server connects) or swapping the LLM rebinds
+        on the next call.
+
+        Args:
+            llm: The chat model
+            tool_names: Routed subset of tools to bind (plus the
+                request_all_tools escape hatch), or None for every tool
+
+        Returns:
+            Any: The LLM with tools bound
+        """
+        global _bound_llm
+
+        version = ToolRegistry.version()
+        key = tuple(tool_names) if tool_names is not None else None
+        with _bound_llm_lock:
+            if not (_bound_llm and _bound_llm[0] is llm and _bound_llm[1] == version):
+                _bound_llm = (llm, version, {})
+            cache = _bound_llm[2]
+            if key in cache:
+                return cache[key]
+
+            definitions: List[Mapping[str, Any]] = list(
+                ToolRegistry.get_definitions_snapshot()
+            )
+            if key is not None:
+                definitions = [
+                    d for d in definitions if d.get("function", d).get("name") in key
+                ]
+                definitions.append(REQUEST_ALL_TOOLS_DEFINITION)
+            bound = llm.bind_tools(definitions)
+            if len(cache) >= TOOL_ROUTER_BIND_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = bound
+            logger.debug(
+                f"🔧 Bound {len(definitions)} tools to LLM (registry version {version})"
+            )
+            return bound
+
+    def _route_tools(self) -> Optional[List[str]]:
+        """
+        Select the tools to bind for this turn when TOOL_ROUTER is enabled.
+
+        The routing query is the latest user message plus the previous
+        TOOL_ROUTER_CONTEXT_MESSAGES messages, each cut to
+        TOOL_ROUTER_CONTEXT_CHARS (injected RAG context is left out).
+
+        Returns:
+            Optional[List[str]]: Tool names, or None to bind every tool
+        """
+        if not self.config.tool_router:
+            return None
+
+        texts: List[str] = []
+        for message in reversed(self.ctx.conversation_history):
+            if len(texts) > TOOL_ROUTER_CONTEXT_MESSAGES:
+                break
+            if message.type not in ("human", "ai") or not isinstance(
+                message.content, str
+            ):
+                continue
+            text = message.content.split("\n\nContext from knowledge base:")[0]
+            if text.strip():
+                texts.append(text[:TOOL_ROUTER_CONTEXT_CHARS])
+
+        try:
+            return get_tool_router().select("\n".join(reversed(texts)))
+        except Exception as e:
+            logger.warning(f"Tool routing failed, binding every tool: {e}")
+            return None
+
+    def _with_routed_manifest(self, messages: List[Any]) -> List[Any]:
+        """
+        List only the bound tools in the system prompt of a routed turn.
+
+        The stored system prompt lists every tool; on a routed turn its
+        manifest is swapped for one of the routed subset, so the prompt
+        never mentions a tool the model cannot call. Custom system prompts
+        (without the generated manifest) are left alone.
+
+        Args:
+            messages: The messages to send, starting with the system prompt
+
+        Returns:
+            List[Any]: The messages with the manifest narrowed
+        """
+        if self._turn_tools is None or not messages:
+            return messages
+        system, full_prompt = messages[0], build_system_prompt()
+        if not (
+            isinstance(system, SystemMessage)
+            and isinstance(system.content, str)
+            and system.content.startswith(full_prompt)
+        ):
+            return messages
+
+        # Whatever follows the prompt (the rolling summary) is kept
+        routed_prompt = build_system_prompt(tool_names=self._turn_tools)
+        content = routed_prompt + system.content.removeprefix(full_prompt)
+        return [SystemMessage(content=content)] + messages[1:]
+
+    def _stream_llm(
+        self, llm_with_tools: Any, messages: List[Any], start_time: float
+    ) -> Any:
+        """
+        Stream the LLM response, forwarding text tokens to on_token.
+
+        Chunks are summed as they arrive; AIMessageChunk addition merges the
+        partial tool-call arguments by index, so the final message carries
+        complete tool calls just like invoke() would return. Read-only tool
+        calls are started as soon as their arguments are complete (see
+        _dispatch_streamed_tool_calls), overlapping tool I/O with the
+        generation of later calls.
+
+        Args:
+            llm_with_tools: LLM with tools bound
+            messages: The messages to send
+            start_time: When the request was sent (for time to first token)
+
+        Returns:
+            Any: The assembled AIMessage
+        """
+        on_token = self.on_token
+        if on_token is None:
+            raise RuntimeError("Streaming requires an on_token callback")
+
+        self._discard_early_calls()
+        aggregate = None
+        for chunk in llm_with_tools.stream(messages):
+            if aggregate is None:
+                logger.info(f"⚡ First token in {time.time() - start_time:.2f}s")
+                aggregate = chunk
+            else:
+                aggregate = aggregate + chunk
+            if isinstance(chunk.content, str) and chunk.content:
+                on_token(chunk.content)
+            if getattr(chunk, "tool_call_chunks", None):
+                self._dispatch_streamed_tool_calls(aggregate.tool_call_chunks)
+
+        if aggregate is None:
+            raise RuntimeError("LLM returned an empty stream")
+        return message_chunk_to_message(aggregate)
+
+    def _dispatch_streamed_tool_calls(self, tool_call_chunks: list) -> None:
+        """
+        Start read-only tool calls whose arguments have finished streaming.
+
+        A call is complete once its accumulated arguments parse as a JSON
+        object. Calls are considered in order and dispatch stops at the first
+        tool that is not read-only, since it is a barrier for everything
+        after it (see _execute_parallel_tools_if_safe).
+
+        Args:
+            tool_call_chunks: Merged tool call chunks streamed so far
+        """
+        for call in sorted(tool_call_chunks, key=lambda c: c.get("index") or 0):
+            name, call_id = call.get("name"), call.get("id")
+            if not name or not ToolRegistry.is_read_only(name):
+                return
+            if not call_id or call_id in self._early_calls:
+                continue
+            try:
+                args = json.loads(call.get("args") or "")
+            except ValueError:
+                continue
+            if isinstance(args, dict):
+                logger.debug(f"🔧 Starting {name} while the response streams")
+                tool_call = {"name": name, "args": args, "id": call_id}
+                future = self._submit_read_only(tool_call, early=True)
+                self._early_calls[call_id] = (name, args, future)
+
+    def _discard_early_calls(self) -> None:
+        """Cancel streamed tool calls that no tool call of the turn claimed."""
+        for _, _, future in self._early_calls.values():
+            future.cancel()
+        self._early_calls = {}
+
     def _extract_tool_calls(self, response: Any) -> list:
         """
         Extract tool calls from LLM response.
@@ -472,12 +780,7 @@ class ChatLoop:
         result = self._handle_tool_execution(name, args)
 
         # Log tool execution result
-        if result.get("success"):
-            logger.info(f"✅ Tool {name} completed successfully")
-        else:
-            logger.warning(
-                f"⚠️ Tool {name} failed: {result.get('error', 'Unknown error')}"
-            )
+        self._log_tool_result(name, result)
 
         # PHASE 3 OPTIMIZATION: Incremental memory management
         # Check if we need to trim memory after each tool execution
@@ -486,6 +789,15 @@ class ChatLoop:
 
         return result
 
+    def _log_tool_result(self, name: str, result: Dict[str, Any]) -> None:
+        """Log whether a tool call succeeded."""
+        if result.get("success"):
+            logger.info(f"✅ Tool {name} completed successfully")
+        else:
+            logger.warning(
+                f"⚠️ Tool {name} failed: {result.get('error', 'Unknown error')}"
+            )
+
     def _get_performance_stats(self) -> Dict[str, Any]:
         """
         Get current performance statistics for monitoring.
@@ -505,22 +817,161 @@ class ChatLoop:
         """
         Execute independent tools in parallel when safe to do so.
 
+        Consecutive calls to read-only tools (see ToolRegistry.register) run
+        concurrently on a bounded pool, each tool limited to its
+        ToolRegistry.concurrency_limit(). Any other tool is a barrier: the
+        read-only calls before it finish first, then it runs alone, so a
+        write or shell command never overlaps with reads of what it changes.
+        Approvals and rate limits still apply to every call; confirmation
+        prompts are asked one at a time, in call order.
+
         Args:
             tool_calls: List of tool call dictionaries
 
         Returns:
-            list: List of tool execution results
+            list: Tool execution results, in the same order as tool_calls
         """
-        # PHASE 3: For now, implement sequential execution with optimization
-        # In a full implementation, this would analyze tool dependencies
-        # and execute independent tools in parallel using asyncio
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+        batch: List[int] = []
+
+        for index, tool_call in enumerate(tool_calls):
+            if ToolRegistry.is_read_only(tool_call["name"]):
+                batch.append(index)
+                continue
+            self._execute_read_only_batch(tool_calls, batch, results)
+            batch = []
+            results[index] = self._execute_single_tool(tool_call)
+
+        self._execute_read_only_batch(tool_calls, batch, results)
+        return results
 
-        results = []
-        for tool_call in tool_calls:
-            result = self._execute_single_tool(tool_call)
-            results.append(result)
+    def _execute_read_only_batch(
+        self,
+        tool_calls: list,
+        batch: List[int],
+        results: List[Optional[Dict[str, Any]]],
+    ) -> None:
+        """
+        Run the read-only tool calls at the given indices concurrently.
 
-        return results
+        Calls already started while the response streamed are reused.
+
+        Args:
+            tool_calls: All tool calls of the turn
+            batch: Indices into tool_calls to execute
+            results: Result list to fill in at the same indices
+        """
+        if not batch:
+            return
+
+        futures = []
+        for index in batch:
+            tool_call = tool_calls[index]
+            early = self._early_calls.pop(tool_call.get("id") or "", None)
+            if early and early[:2] == (tool_call["name"], tool_call["args"]):
+                # The early start skipped the rate limit; count it now
+                limited = ToolRegistry.acquire_rate_limit(tool_call["name"])
+                if limited:
+                    early[2].cancel()
+                    futures.append((index, _resolved(limited)))
+                else:
+                    futures.append((index, early[2]))
+                continue
+            if early:
+                # Arguments changed after the early start; run it again
+                early[2].cancel()
+            if len(batch) == 1:
+                results[index] = self._execute_single_tool(tool_call)
+                return
+            else:
+                futures.append((index, self._submit_read_only(tool_call)))
+
+        start_time = time.time()
+        fetched: Dict[int, Dict[str, Any]] = {}
+        for index, future in futures:
+            try:
+                fetched[index] = future.result()
+            except Exception as e:
+                fetched[index] = {"error": str(e)}
+
+        # Confirmation prompts (and forced execution) happen sequentially
+        for index in batch:
+            name = tool_calls[index]["name"]
+            result = self._confirm_tool_execution(
+                name, tool_calls[index]["args"], fetched[index]
+            )
+            results[index] = result
+            self._log_tool_result(name, result)
+
+        self._monitor_performance(
+            f"Parallel read-only tools ({len(batch)} calls)", start_time
+        )
+        if self._trim_conversation_history_incremental():
+            logger.debug("💾 Memory trimmed after parallel tool execution")
+
+    def _submit_read_only(
+        self, tool_call: Dict[str, Any], early: bool = False
+    ) -> Future:
+        """
+        Start a read-only tool call on the shared tool pool.
+
+        Approval and rate limits are checked by ToolRegistry.execute() as
+        usual; a call that needs confirmation returns without running and is
+        confirmed later, in order. Calls started while the response streams
+        skip the rate limit, which is counted once the final message claims
+        them (see _execute_read_only_batch).
+
+        Args:
+            tool_call: Dictionary containing tool name and args
+            early: Whether the call starts before the response is complete
+
+        Returns:
+            Future: Resolves to the ToolRegistry.execute() result
+        """
+        name = tool_call["name"]
+        if name not in self._tool_slots:
+            self._tool_slots[name] = threading.BoundedSemaphore(
+                ToolRegistry.concurrency_limit(name)
+            )
+        slot = self._tool_slots[name]
+
+        def run() -> Dict[str, Any]:
+            with slot:
+                logger.info(f"🔧 Executing tool: {name} (parallel)")
+                return ToolRegistry.execute(
+                    name, tool_call["args"], rate_limit=not early
+                )
+
+        return _get_tool_pool().submit(run)
+
+    def _tool_message_content(self, tool_name: str, result: Dict[str, Any]) -> str:
+        """
+        Serialize a tool result for its ToolMessage.
+
+        File contents are injected as a HumanMessage right after (see
+        _handle_file_read_injection), so they are left out here rather than
+        sent twice.
+
+        Args:
+            tool_name: The name of the executed tool
+            result: The result dictionary from tool execution
+
+        Returns:
+            str: JSON content for the ToolMessage
+        """
+        if self._injects_file_content(tool_name, result):
+            result = {**result, "content": "(file content follows in the next message)"}
+        return json.dumps(result)
+
+    @staticmethod
+    def _injects_file_content(tool_name: str, result: Dict[str, Any]) -> bool:
+        """Whether a tool result is injected as a file read HumanMessage."""
+        return (
+            tool_name == "read_file_content"
+            and isinstance(result, dict)
+            and bool(result.get("success"))
+            and bool(result.get("content"))
+        )
 
     def _handle_file_read_injection(
         self, tool_name: str, result: Dict[str, Any]
@@ -532,16 +983,11 @@ class ChatLoop:
             tool_name: The name of the executed tool
             result: The result dictionary from tool execution
         """
-        if (
-            tool_name == "read_file_content"
-            and isinstance(result, dict)
-            and result.get("success")
-        ):
-            content = result.get("content", "")
+        if self._injects_file_content(tool_name, result):
+            content = result["content"]
             file_path = result.get("file_path", "unknown")
-            if content:
-                msg = f"Output of reading file {file_path}:\n```\n{content}\n```"
-                self.ctx.conversation_history.append(HumanMessage(content=msg))
+            msg = f"Output of reading file {file_path}:\n```\n{content}\n```"
+            self.ctx.conversation_history.append(HumanMessage(content=msg))
 
     # =============================================================================
     # MEMORY MANAGEMENT DECOMPOSITION METHODS
@@ -551,10 +997,22 @@ class ChatLoop:
         """
         Trim conversation history to prevent memory bloat.
         """
-        max_pairs = self.config.max_history_pairs
-        self.ctx.conversation_history = trim_history(
-            self.ctx.conversation_history, max_pairs
+        if not self._should_trim_memory():
+            return
+        self._trim_and_summarize()
+
+    def _trim_and_summarize(self) -> None:
+        """
+        Trim history to the budget and hand the dropped turns to the summarizer.
+        """
+        kept, evicted = partition_history(
+            self.ctx.conversation_history,
+            self.config.max_history_pairs,
+            self._trim_budget(),
         )
+        self.ctx.conversation_history = kept
+        if evicted:
+            get_summarizer().submit(evicted)
 
     def _save_conversation_memory(self) -> None:
         """
@@ -564,10 +1022,23 @@ class ChatLoop:
 
     def _handle_tool_execution(self, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
         """Handles security validation, approval prompts, and execution."""
+        if name == REQUEST_ALL_TOOLS:
+            # Routed turn: the model found no fitting tool, bind them all
+            self._turn_tools = None
+            count = len(ToolRegistry.get_tool_names())
+            logger.info("🧭 Model requested the full tool catalog")
+            return {"success": True, "message": f"All {count} tools are now available."}
+
         # 1. Initial check via Registry (which calls ApprovalManager.check_approval)
         result = ToolRegistry.execute(name, args)
 
         # 2. If it requires confirmation, handle it based on UI
+        return self._confirm_tool_execution(name, args, result)
+
+    def _confirm_tool_execution(
+        self, name: str, args: Dict[str, Any], result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Ask for confirmation if ToolRegistry.execute() requested it."""
         if isinstance(result, dict) and result.get("requires_confirmation"):
             approved = False
             if self.confirmation_callback:
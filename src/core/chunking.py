@@ -0,0 +1,482 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Structure-aware chunking engine with content-defined boundaries.
+
+Splits documents along their natural boundaries:
+
+- Python: ``ast`` boundaries (top-level statements, functions, classes;
+  oversized classes are split per method). A file's leading comment block
+  (license header) is a chunk of its own.
+- Markdown: heading sections (fenced code blocks are never split on ``#``)
+- Everything else (and any oversized unit): lines
+
+Units are then packed into chunks of at most ``chunk_size`` characters.
+Where a chunk ends is decided by the content itself: after each unit a
+rolling hash over the preceding characters is compared against a threshold
+proportional to the unit's size (paragraph breaks weigh a whole paragraph).
+Because the decision only depends on nearby text, a local edit moves at
+most the chunks around it; later boundaries re-synchronise on the same
+anchors, so their chunk hashes are unchanged and need no re-embedding.
+
+Exact duplicate chunks within a document (repeated boilerplate) are
+emitted once. Every chunk records its 1-based line range and a content
+hash; ``chunk_id`` derives a deterministic vector-store ID from it.
+
+Usage:
+    from src.core.chunking import chunk_document, chunk_id
+
+    for chunk in chunk_document(source, file_path="app.py"):
+        print(chunk_id("app.py", chunk.chunk_hash), chunk.start_line)
+"""
+
+import ast
+import hashlib
+import logging
+import os
+import re
+import zlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.core.constants import CONTENT_CHUNK_SIZE, NEAR_DUP_MIN_WORDS
+
+logger = logging.getLogger(__name__)
+
+# File extension -> chunking strategy
+CHUNK_LANGUAGES: Dict[str, str] = {
+    ".py": "python",
+    ".pyi": "python",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".mdx": "markdown",
+}
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+# Maximum symbol names recorded for a packed chunk
+_MAX_CHUNK_NAMES = 5
+
+# Kind of a Python file's leading comment block, never packed with code
+_HEADER_KIND = "header"
+
+# Content-defined boundary parameters
+_CDC_WINDOW = 64  # Characters hashed before a candidate boundary
+_CDC_MIN_FRACTION = 4  # No content-defined cut below chunk_size / 4
+_CDC_TARGET_FRACTION = 2  # Average chunk size is about chunk_size / 2
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A chunk of a document with its source location."""
+
+    text: str
+    start_line: int
+    end_line: int
+    kind: str = "text"
+    name: Optional[str] = None
+
+    @cached_property
+    def chunk_hash(self) -> str:
+        """Stable hash of the chunk text."""
+        return content_chunk_hash(self.text)
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Metadata fields describing this chunk (ChromaDB-compatible)."""
+        metadata: Dict[str, Any] = {
+            "start_line": self.start_line,
+            "end_line": self.end_line,
+            "chunk_kind": self.kind,
+            "chunk_hash": self.chunk_hash,
+        }
+        if self.name:
+            metadata["section" if self.kind == "section" else "symbol"] = self.name
+        return metadata
+
+
+@dataclass
+class _Segment:
+    """A structural unit of a document, as an inclusive 1-based line range."""
+
+    start: int
+    end: int
+    kind: str
+    name: Optional[str] = None
+    node: Optional[ast.AST] = None
+
+
+def content_chunk_hash(text: str) -> str:
+    """Hash identifying a chunk's text (16 hex chars)."""
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+
+
+@dataclass
+class _Unit:
+    """Smallest piece the packer works with: text plus its line range."""
+
+    start: int
+    end: int
+    text: str
+    kind: str
+    name: Optional[str] = None
+
+
+def chunk_id(source: str, chunk_hash: str) -> str:
+    """
+    Deterministic vector-store ID for a chunk of a source.
+
+    The same text in the same source always maps to the same ID, so
+    re-ingestion can tell unchanged chunks from new ones without embedding.
+    """
+    source_key = hashlib.sha1(source.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+    return f"chunk_{source_key}_{chunk_hash}"
+
+
+def detect_language(file_path: Optional[str]) -> Optional[str]:
+    """Return the chunking strategy for a file path, or None for plain text."""
+    if not file_path:
+        return None
+    _, ext = os.path.splitext(file_path)
+    return CHUNK_LANGUAGES.get(ext.lower())
+
+
+# =============================================================================
+# STRATEGIES
+# =============================================================================
+
+
+def _node_start(node: ast.AST) -> int:
+    """First line of a statement, including decorators."""
+    decorators = getattr(node, "decorator_list", None) or []
+    return min([node.lineno] + [d.lineno for d in decorators])  # type: ignore[attr-defined]
+
+
+def _line_range(lines: Sequence[str], start: int, end: int) -> str:
+    """Join an inclusive 1-based line range."""
+    first = start - 1
+    return "".join(lines[first:end])
+
+
+def _segment_size(segment: _Segment, lines: Sequence[str]) -> int:
+    return len(_line_range(lines, segment.start, segment.end))
+
+
+def _python_segments(
+    nodes: Sequence[ast.stmt],
+    first: int,
+    last: int,
+    lines: Sequence[str],
+    chunk_size: int,
+    parent: Optional[str] = None,
+) -> List[_Segment]:
+    """
+    Turn a statement list into line segments.
+
+    Comments and blank lines preceding a statement belong to it, so a
+    function's leading comment block stays with the function. A comment
+    block at the top of a module long enough for near-duplicate detection
+    (typically a license header) is a segment of its own: it repeats across
+    files and would otherwise take the module docstring with it when its
+    chunk is suppressed as a near-duplicate.
+    """
+    segments: List[_Segment] = []
+    cursor = first
+    if parent is None and nodes:
+        header_end = _node_start(nodes[0]) - 1
+        header = _line_range(lines, first, header_end)
+        if len(header.split()) >= NEAR_DUP_MIN_WORDS:
+            segments.append(_Segment(first, header_end, _HEADER_KIND))
+            cursor = header_end + 1
+    for node in nodes:
+        name: Optional[str]
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            kind = "class" if isinstance(node, ast.ClassDef) else "function"
+            name = f"{parent}.{node.name}" if parent else node.name
+        else:
+            kind = "class" if parent else "module"
+            name = parent
+        end = max(node.end_lineno or node.lineno, cursor)
+        segments.append(_Segment(cursor, end, kind, name, node))
+        cursor = end + 1
+
+    if not segments:
+        return [_Segment(first, last, "class" if parent else "module", parent)]
+    if cursor <= last:
+        segments[-1].end = last
+
+    result: List[_Segment] = []
+    for segment in segments:
+        class_node = segment.node
+        if (
+            isinstance(class_node, ast.ClassDef)
+            and class_node.body
+            and _segment_size(segment, lines) > chunk_size
+        ):
+            # Oversized class: header (signature + leading comments), then members
+            body_start = _node_start(class_node.body[0])
+            header_end = body_start - 1
+            if header_end >= segment.start:
+                result.append(
+                    _Segment(segment.start, header_end, "class", segment.name)
+                )
+            result.extend(
+                _python_segments(
+                    class_node.body,
+                    header_end + 1,
+                    segment.end,
+                    lines,
+                    chunk_size,
+                    segment.name,
+                )
+            )
+        else:
+            result.append(segment)
+    return result
+
+
+def _markdown_segments(lines: Sequence[str]) -> List[_Segment]:
+    """Split markdown into heading sections, ignoring headings inside fences."""
+    segments: List[_Segment] = []
+    headings: List[Tuple[int, str]] = []
+    start = 1
+    name: Optional[str] = None
+    kind = "text"
+    in_fence = False
+
+    for index, line in enumerate(lines, start=1):
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+        match = _HEADING_RE.match(line)
+        if not match:
+            continue
+        if index > start:
+            segments.append(_Segment(start, index - 1, kind, name))
+        level = len(match.group(1))
+        while headings and headings[-1][0] >= level:
+            headings.pop()
+        headings.append((level, match.group(2)))
+        name = " > ".join(title for _, title in headings)
+        kind = "section"
+        start = index
+
+    if start <= len(lines):
+        segments.append(_Segment(start, len(lines), kind, name))
+    return segments
+
+
+# =============================================================================
+# PACKING
+# =============================================================================
+
+
+def _line_units(
+    lines: Sequence[str],
+    start: int,
+    end: int,
+    chunk_size: int,
+    kind: str,
+    name: Optional[str],
+) -> List[_Unit]:
+    """Break a line range into per-line units (hard-splitting huge lines)."""
+    units = []
+    for line_no in range(start, end + 1):
+        line = lines[line_no - 1]
+        if len(line) <= chunk_size:
+            units.append(_Unit(line_no, line_no, line, kind, name))
+            continue
+        for offset in range(0, len(line), chunk_size):
+            piece = line[offset:][:chunk_size]
+            units.append(_Unit(line_no, line_no, piece, kind, name))
+    return units
+
+
+def _segment_units(
+    segments: Sequence[_Segment], lines: Sequence[str], chunk_size: int
+) -> List[_Unit]:
+    """Convert segments to units; oversized segments become line units."""
+    units: List[_Unit] = []
+    for segment in segments:
+        text = _line_range(lines, segment.start, segment.end)
+        if len(text) > chunk_size:
+            units.extend(
+                _line_units(
+                    lines,
+                    segment.start,
+                    segment.end,
+                    chunk_size,
+                    segment.kind,
+                    segment.name,
+                )
+            )
+        else:
+            units.append(
+                _Unit(segment.start, segment.end, text, segment.kind, segment.name)
+            )
+    return units
+
+
+def _is_anchor(window: str, weight: int, target: int) -> bool:
+    """Content-defined cut decision for the text ending at a unit."""
+    fingerprint = zlib.crc32(window.encode("utf-8", "surrogatepass"))
+    return fingerprint < (1 << 32) * min(1.0, weight / target)
+
+
+def _make_chunk(group: List[_Unit]) -> Optional[Chunk]:
+    """Build a chunk from consecutive units, trimming blank edges."""
+    text = "".join(unit.text for unit in group)
+    leading = text[: len(text) - len(text.lstrip())]
+    cut = leading.rfind("\n") + 1
+    body = text[cut:].rstrip()
+    if not body.strip():
+        return None
+    start = group[0].start + leading.count("\n", 0, cut)
+    end = start + body.count("\n")
+
+    kinds = {unit.kind for unit in group}
+    kind = kinds.pop() if len(kinds) == 1 else "mixed"
+    names: List[str] = []
+    for unit in group:
+        if unit.name and unit.name not in names:
+            names.append(unit.name)
+    if not names:
+        name = None
+    elif kind == "section":
+        # Heading paths are long; the first section locates the chunk
+        name = names[0]
+    else:
+        name = ", ".join(names[:_MAX_CHUNK_NAMES])
+    return Chunk(body, start, end, kind, name)
+
+
+def _pack_units(units: Sequence[_Unit], chunk_size: int) -> List[Chunk]:
+    """Pack units into chunks using content-defined boundaries."""
+    min_size = chunk_size // _CDC_MIN_FRACTION
+    target = max(1, chunk_size // _CDC_TARGET_FRACTION)
+    chunks: List[Chunk] = []
+    group: List[_Unit] = []
+    group_size = 0
+    window = ""
+    since_break = 0
+
+    def flush() -> None:
+        nonlocal group, group_size
+        if group:
+            chunk = _make_chunk(group)
+            if chunk:
+                chunks.append(chunk)
+        group = []
+        group_size = 0
+
+    for unit in units:
+        size = len(unit.text)
+        header = unit.kind == _HEADER_KIND
+        if group and (
+            group_size + size > chunk_size or header != (group[-1].kind == _HEADER_KIND)
+        ):
+            flush()
+        group.append(unit)
+        group_size += size
+
+        window = (window + unit.text)[-_CDC_WINDOW:]
+        since_break += size
+        if unit.text.strip():
+            weight = size
+        else:
+            # A blank line closes a paragraph: weigh the whole paragraph
+            weight = since_break
+            since_break = 0
+
+        if group_size >= min_size and _is_anchor(window, weight, target):
+            flush()
+
+    flush()
+    return chunks
+
+
+def _dedupe(chunks: List[Chunk]) -> List[Chunk]:
+    """Drop exact repeats (modulo whitespace) of earlier chunks."""
+    seen = set()
+    unique = []
+    for chunk in chunks:
+        key = " ".join(chunk.text.split())
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(chunk)
+    return unique
+
+
+def chunk_document(
+    content: str,
+    file_path: Optional[str] = None,
+    language: Optional[str] = None,
+    chunk_size: int = CONTENT_CHUNK_SIZE,
+) -> List[Chunk]:
+    """
+    Split a document into structure-aware chunks.
+
+    Args:
+        content: Document text
+        file_path: Optional path used to pick a strategy by extension
+        language: Explicit strategy ("python", "markdown"); overrides file_path
+        chunk_size: Maximum characters per chunk
+
+    Returns:
+        Chunks in document order
+    """
+    if not content or not content.strip():
+        return []
+
+    language = language or detect_language(file_path)
+    lines = content.splitlines(keepends=True)
+    segments: Optional[List[_Segment]] = None
+
+    if language == "python":
+        try:
+            tree = ast.parse(content)
+            segments = _python_segments(tree.body, 1, len(lines), lines, chunk_size)
+        except (SyntaxError, ValueError) as e:
+            logger.debug(f"Python parse failed for {file_path}, splitting lines: {e}")
+    elif language == "markdown":
+        segments = _markdown_segments(lines)
+
+    if segments is None:
+        units = _line_units(lines, 1, len(lines), chunk_size, "text", None)
+    else:
+        units = _segment_units(segments, lines, chunk_size)
+    return _dedupe(_pack_units(units, chunk_size))
+
+
+__all__ = [
+    "CHUNK_LANGUAGES",
+    "Chunk",
+    "chunk_document",
+    "chunk_id",
+    "content_chunk_hash",
+    "detect_language",
+]
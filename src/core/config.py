@@ -152,6 +152,10 @@ class Config:
 
         # Conversation Settings
         max_history_pairs: Max user-assistant pairs to keep
+        context_token_budget: Max estimated tokens of conversation history
+        rolling_summary: Summarize trimmed turns into a running summary
+        summary_model: Model for the summary (empty = no summary)
+        tool_output_inline_chars: Larger tool output fields are stored and previewed (0 = off)
         temperature: LLM creativity (0.0 = deterministic, 1.0 = creative)
         max_input_length: Max user input length
 
@@ -170,6 +174,10 @@ class Config:
         show_llm_reasoning: Show LLM reasoning
         show_token_usage: Show token usage
         show_tool_details: Show tool details
+
+        # Prompt Configuration
+        tool_manifest: Tool list in the system prompt ('compact', 'none', 'full')
+        tool_router: Bind only the tools relevant to each turn (src.tools.router)
     """
 
     # LM Studio Configuration
@@ -192,6 +200,12 @@ class Config:
     ollama_base_url: str
     embedding_model: str
 
+    # Conversation Settings (optional)
+    context_token_budget: int = 24000
+    rolling_summary: bool = True
+    summary_model: str = ""
+    tool_output_inline_chars: int = 4000
+
     # Logging Configuration
     verbose_logging: bool = False
     show_llm_reasoning: bool = True
@@ -203,6 +217,10 @@ class Config:
     auto_learn_timeout_seconds: int = 30
     auto_learn_collection_name: str = "agents_knowledge"
 
+    # Prompt Configuration
+    tool_manifest: str = "compact"
+    tool_router: bool = False
+
     # Cache file paths
     embedding_cache_file: str = "embedding_cache.json"
     query_cache_file: str = "query_cache.json"
@@ -224,6 +242,10 @@ class Config:
             max_history_pairs=_require_int("MAX_HISTORY_PAIRS"),
             temperature=_require_float("TEMPERATURE"),
             max_input_length=_require_int("MAX_INPUT_LENGTH"),
+            context_token_budget=_get_int("CONTEXT_TOKEN_BUDGET", 24000),
+            rolling_summary=_get_bool("ROLLING_SUMMARY", True),
+            summary_model=_get_str("SUMMARY_MODEL", ""),
+            tool_output_inline_chars=_get_int("TOOL_OUTPUT_INLINE_CHARS", 4000),
             # Database Configuration
             db_type=_require_env("DB_TYPE").lower(),
             db_path=_require_env("DB_PATH"),
@@ -242,6 +264,9 @@ class Config:
             auto_learn_max_file_size_mb=_get_int("AUTO_LEARN_MAX_FILE_SIZE_MB", 5),
             auto_learn_timeout_seconds=_get_int("AUTO_LEARN_TIMEOUT_SECONDS", 30),
             auto_learn_collection_name=_get_str("AUTO_LEARN_COLLECTION_NAME", "agents_knowledge"),
+            # Prompt Configuration
+            tool_manifest=_get_str("TOOL_MANIFEST", "compact").lower(),
+            tool_router=_get_bool("TOOL_ROUTER", False),
         )
 
 
@@ -71,10 +71,85 @@ WEB_SEARCH_DEFAULT_MAX_RESULTS = 10  # Default maximum search results
 CODE_SEARCH_DEFAULT_MAX_RESULTS = 50  # Default maximum search results
 CODE_SEARCH_TIMEOUT = 60  # Timeout for code search in seconds
 
+# Parallel tool calls: consecutive read-only tool calls in one model turn run
+# concurrently; any other tool is a barrier and runs alone, in order
+TOOL_PARALLEL_WORKERS = 4  # Read-only tool calls executing at once
+TOOL_CONCURRENCY_LIMITS = {  # Lower per-tool caps (tool name -> max concurrent)
+    "search_web": 2,  # Search providers throttle bursts
+    "search_knowledge": 2,  # Each call embeds the query on the Ollama server
+    "parse_document": 2,  # Matches DOCLING_POOL_WORKERS
+}
+
+# Tool router (TOOL_ROUTER=true): bind only the tools relevant to each turn
+TOOL_ROUTER_TOP_N = 8  # Most similar tools bound per turn
+TOOL_ROUTER_CORE_TOOLS = (  # Always bound when routing
+    "read_file_content",
+    "list_directory",
+    "search_knowledge",
+    "read_tool_output",
+)
+TOOL_ROUTER_MIN_TOOLS = 20  # Smaller catalogs are always bound in full
+TOOL_ROUTER_CONTEXT_MESSAGES = 2  # Earlier messages added to the routing query
+TOOL_ROUTER_CONTEXT_CHARS = 500  # Characters kept per context message
+TOOL_ROUTER_BIND_CACHE_SIZE = 16  # Bound tool selections kept per LLM
+
+# Large tool outputs (over TOOL_OUTPUT_INLINE_CHARS) are kept in a session
+# store; the history holds a head/tail preview and a handle for read_tool_output
+TOOL_OUTPUT_PREVIEW_HEAD = 1500  # Leading characters shown in the preview
+TOOL_OUTPUT_PREVIEW_TAIL = 500  # Trailing characters shown in the preview
+TOOL_OUTPUT_PAGE_CHARS = 4000  # Default read_tool_output page length
+TOOL_OUTPUT_MAX_PAGE_CHARS = 8000  # Largest page read_tool_output returns
+TOOL_OUTPUT_STORE_MAX_CHARS = 16 * 1024 * 1024  # Oldest outputs evicted beyond this
+
 # Content processing limits
 CONTENT_CHUNK_SIZE = 1500  # Default chunk size for content splitting
 CONTENT_TRUNCATE_LENGTH = 100  # Default truncate length for display
 
+# =============================================================================
+# INGESTION CONSTANTS
+# =============================================================================
+
+# Bulk ingestion (/populate) limits
+POPULATE_MAX_FILE_SIZE = 10 * 1024 * 1024  # Skip files larger than 10MB
+POPULATE_DEFAULT_WORKERS = 4  # Default read/chunk worker processes
+POPULATE_QUEUE_FACTOR = 2  # In-flight files per worker before the walk blocks
+EMBED_BATCH_SIZE = 32  # Chunks per embedding request / ChromaDB add call
+EMBED_QUEUE_SIZE = 8  # Pending batches before the chunk stage blocks
+PIPELINE_READ_WORKERS = 4  # Reader threads per ingestion run
+PIPELINE_EMBED_WORKERS = 2  # Concurrent embedding batches per ingestion run
+PIPELINE_PROGRESS_INTERVAL = 2.0  # Seconds between throughput/ETA reports
+
+# Near-duplicate chunk suppression (MinHash + LSH)
+NEAR_DUP_THRESHOLD = 0.8  # Estimated Jaccard similarity that counts as a duplicate
+NEAR_DUP_NUM_PERM = 64  # MinHash signature length
+NEAR_DUP_BANDS = 16  # LSH bands (NEAR_DUP_NUM_PERM / bands rows per band)
+NEAR_DUP_SHINGLE_SIZE = 5  # Words per shingle
+NEAR_DUP_MIN_WORDS = 20  # Shorter chunks are never treated as duplicates
+
+# Web crawl (/web crawl) limits
+WEB_CRAWL_DEFAULT_DEPTH = 1  # Link hops followed from the start URL
+WEB_CRAWL_DEFAULT_MAX_PAGES = 50  # Pages fetched per crawl
+WEB_CRAWL_CONCURRENCY = 4  # Concurrent page fetches
+WEB_CRAWL_TIMEOUT = 15  # Seconds per HTTP request
+WEB_CRAWL_MAX_PAGE_SIZE = 5 * 1024 * 1024  # Skip pages larger than 5MB
+WEB_CRAWL_USER_AGENT = "DevAssist-Crawler/1.0"
+
+# Document conversion (Docling) limits
+DOCLING_POOL_WORKERS = 2  # Warm converter processes (each loads its own models)
+DOCUMENT_MAX_FILE_SIZE = 100 * 1024 * 1024  # /learn-docs skips larger files
+DOC_EXTRACTION_MODE = "auto"  # auto, fast (text layer), balanced (no OCR), accurate
+DOC_FAST_MIN_CHARS_PER_PAGE = 200  # Auto mode escalates below this text density
+DOC_PAGE_WINDOW = 10  # Pages converted (and held in memory) at a time
+DOC_PARSE_MAX_PAGES = 30  # parse_document returns at most this many pages unasked
+DOC_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Compressed conversion cache size limit
+DOC_CACHE_TARGET_BYTES = 384 * 1024 * 1024  # Cache size after LRU eviction
+
+# Filesystem watcher (/watch) limits
+WATCH_DEBOUNCE_SECONDS = 1.0  # Quiet period before a changed file is ingested
+WATCH_POLL_INTERVAL = 2.0  # Seconds between mtime scans (polling backend)
+WATCH_MAX_WORKERS = 2  # Files ingested concurrently by the watcher
+WATCH_NICE_INCREMENT = 10  # Scheduling priority drop for watcher threads
+
 # =============================================================================
 # CHAT LOOP CONSTANTS
 # =============================================================================
@@ -82,6 +157,42 @@ CONTENT_TRUNCATE_LENGTH = 100  # Default truncate length for display
 # Chat loop iteration limits
 MAX_ITERATIONS = 5  # Maximum tool calling iterations per user request
 MAX_INPUT_LENGTH = 10000  # Maximum user input length in characters
+CHARS_PER_TOKEN = 4  # Token estimate for reports and budgets (no local tokenizer)
+MESSAGE_TOKEN_OVERHEAD = 4  # Role and framing tokens added per history message
+HISTORY_TRIM_TARGET = 0.8  # Trim to this share of CONTEXT_TOKEN_BUDGET for headroom
+
+# How tools are described in the system prompt. The schemas are always sent
+# through native tool binding, so "full" pays for them twice per request.
+TOOL_MANIFEST_MODES = ("compact", "none", "full")
+TOOL_MANIFEST_DESCRIPTION_LENGTH = 100  # Characters of description per compact line
+
+# context_mode="auto": skip RAG for small talk and tool commands, and only
+# inject chunks relevant enough to the question
+CONTEXT_AUTO_CHAT_MAX_WORDS = 6  # Longer turns are never treated as small talk
+CONTEXT_AUTO_COMMAND_MAX_WORDS = 8  # Longer imperative turns still retrieve
+CONTEXT_AUTO_MIN_SIMILARITY = 0.5  # Cosine similarity a chunk needs to be injected
+CONTEXT_AUTO_TIMING_SAMPLES = 20  # Recent retrievals averaged for "time saved" logs
+
+# =============================================================================
+# CONVERSATION SUMMARY CONSTANTS
+# =============================================================================
+
+# Turns trimmed from history are folded into a rolling summary in the background
+SUMMARY_MAX_WORDS = 300  # Length the summary is asked to stay within
+SUMMARY_MESSAGE_CHARS = 1000  # Characters kept per trimmed message in the prompt
+SUMMARY_PROMPT = """You maintain the running summary of a conversation between a developer and DevAssist, a local coding agent.
+Update the current summary with the new turns that were trimmed from the conversation.
+Keep facts the developer stated, decisions, file paths, commands, open tasks and unresolved questions.
+Drop greetings, tool output details and anything superseded by later turns.
+Write plain prose or short bullet points, at most {max_words} words. Reply with the updated summary only."""
+
+# =============================================================================
+# BACKGROUND JOB CONSTANTS
+# =============================================================================
+
+JOBS_MAX_CONCURRENT = 2  # Background commands running at once (others queue)
+JOBS_OUTPUT_LINES = 200  # Output lines kept per job for /jobs <id>
+JOBS_HISTORY = 50  # Finished jobs kept for /jobs
 
 # =============================================================================
 # CACHE CONSTANTS
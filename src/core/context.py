@@ -75,6 +75,7 @@ class ApplicationContext:
 
         # Conversation state
         conversation_history: List of chat messages
+        conversation_summary: Rolling summary of turns trimmed from history
 
         # AI behavior modes
         context_mode: "auto", "on", or "off"
@@ -84,6 +85,7 @@ class ApplicationContext:
         # Caches
         embedding_cache: Dict mapping text to embedding vectors
         query_cache: Dict mapping queries to cached results
+        near_duplicate_indexes: Per-space chunk signature indexes (loaded lazily)
         operation_count: Counter for cleanup scheduling
     """
 
@@ -101,6 +103,7 @@ class ApplicationContext:
 
     # Conversation state
     conversation_history: List[Any] = field(default_factory=list)
+    conversation_summary: str = ""
 
     # AI behavior modes (configurable via slash commands)
     context_mode: str = "auto"  # "auto", "on", "off"
@@ -110,16 +113,19 @@ class ApplicationContext:
     # Caches
     embedding_cache: Dict[str, List[float]] = field(default_factory=dict)
     query_cache: Dict[str, List[str]] = field(default_factory=dict)
+    near_duplicate_indexes: Dict[str, Any] = field(default_factory=dict)
     operation_count: int = 0
 
     def reset_caches(self) -> None:
         """Clear all caches."""
         self.embedding_cache.clear()
         self.query_cache.clear()
+        self.near_duplicate_indexes.clear()
 
     def reset_conversation(self) -> None:
         """Clear conversation history."""
         self.conversation_history.clear()
+        self.conversation_summary = ""
 
 
 # Thread-safe singleton
@@ -0,0 +1,149 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Adaptive RAG gating for context_mode="auto".
+
+Retrieval costs an embedding request, a ChromaDB query and the injected
+tokens on every turn. In auto mode a cheap local classifier decides first
+whether a turn can use the knowledge base at all: conversational turns
+("thanks", "ok") and short tool commands ("run the tests", "read
+requirements.txt") skip it. Turns that do retrieve only get chunks above
+CONTEXT_AUTO_MIN_SIMILARITY (see get_relevant_context).
+
+The gate also keeps recent retrieval timings, so a skipped turn can log
+roughly how much time it saved.
+"""
+
+import logging
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from src.core.constants import (
+    CONTEXT_AUTO_CHAT_MAX_WORDS,
+    CONTEXT_AUTO_COMMAND_MAX_WORDS,
+    CONTEXT_AUTO_TIMING_SAMPLES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Words that make up small talk and acknowledgements
+CONVERSATIONAL_WORDS = frozenset("""
+    ok okay k kk yes yeah yep yup no nope nah sure fine alright right cool
+    nice great good perfect awesome excellent wow lol haha thanks thank
+    thx ty you so much very a lot hi hello hey morning bye goodbye cheers
+    please that's that it works worked got understood makes sense np
+    continue go on ahead sounds
+    """.split())
+
+# First words of imperative requests the agent answers with its own tools
+TOOL_COMMAND_VERBS = frozenset("""
+    run execute read open cat list ls cd write create make mkdir
+    delete remove rm rename move mv copy cp edit append commit push pull
+    git diff status install pip npm pytest test build lint format
+    """.split())
+
+_WORD_RE = re.compile(r"[\w'./-]+")
+
+
+@dataclass
+class ContextDecision:
+    """Whether a turn should retrieve knowledge base context, and why."""
+
+    retrieve: bool
+    reason: str
+
+
+def classify_context_need(text: str) -> ContextDecision:
+    """
+    Decide whether a user turn is worth a knowledge base lookup.
+
+    Args:
+        text: The user input
+
+    Returns:
+        ContextDecision: retrieve=False for conversational turns and short
+        tool commands, True otherwise
+    """
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return ContextDecision(False, "empty")
+
+    question = "?" in text
+    if len(words) <= CONTEXT_AUTO_CHAT_MAX_WORDS and all(
+        word.strip(".'") in CONVERSATIONAL_WORDS for word in words
+    ):
+        return ContextDecision(False, "conversational")
+    if (
+        not question
+        and words[0] in TOOL_COMMAND_VERBS
+        and len(words) <= CONTEXT_AUTO_COMMAND_MAX_WORDS
+    ):
+        return ContextDecision(False, "tool command")
+    return ContextDecision(True, "question" if question else "request")
+
+
+class ContextGate:
+    """Apply classify_context_need and track what retrieval costs."""
+
+    def __init__(self, samples: int = CONTEXT_AUTO_TIMING_SAMPLES):
+        self._durations: deque = deque(maxlen=samples)
+        self._lock = threading.Lock()
+
+    def decide(self, text: str) -> ContextDecision:
+        """Classify a turn (see classify_context_need)."""
+        return classify_context_need(text)
+
+    def record_retrieval(self, seconds: float) -> None:
+        """Record how long a retrieval took."""
+        with self._lock:
+            self._durations.append(seconds)
+
+    def expected_retrieval_time(self) -> Optional[float]:
+        """Average recent retrieval time in seconds, or None before the first."""
+        with self._lock:
+            if not self._durations:
+                return None
+            return sum(self._durations) / len(self._durations)
+
+
+_gate: Optional[ContextGate] = None
+_gate_lock = threading.Lock()
+
+
+def get_context_gate() -> ContextGate:
+    """Get the process-wide ContextGate."""
+    global _gate
+    with _gate_lock:
+        if _gate is None:
+            _gate = ContextGate()
+        return _gate
+
+
+__all__ = [
+    "ContextDecision",
+    "ContextGate",
+    "classify_context_need",
+    "get_context_gate",
+]
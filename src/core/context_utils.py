@@ -29,13 +29,24 @@ These functions are used by both command handlers and tool executors.
 """
 
 import logging
-from typing import Optional
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 import requests
 
 from langchain_core.documents import Document
+from src.core.chunking import chunk_id, content_chunk_hash
 from src.core.config import get_config
+from src.core.constants import EMBED_BATCH_SIZE
 from src.core.context import get_context
+from src.core.utils import cosine_similarity
+from src.core.near_duplicates import (
+    Signature,
+    SuppressedChunk,
+    get_near_duplicate_index,
+    minhash_signature,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +54,14 @@ logger = logging.getLogger(__name__)
 # HTTP session for API calls (with retry logic)
 _api_session: Optional[requests.Session] = None
 
+# Metadata that changes on every ingest (e.g. when a chunk was added); not
+# compared when deciding whether an unchanged chunk's metadata needs updating
+VOLATILE_METADATA_KEYS = frozenset({"added_at"})
+
+# Near-duplicate checks and index reservations of concurrently planned
+# syncs (pipeline embed workers) happen one plan at a time
+_near_dup_plan_lock = threading.Lock()
+
 
 def _get_api_session() -> requests.Session:
     """Get or create HTTP session with retry logic."""
@@ -107,7 +126,12 @@ def _find_collection_id(collection_name: str, space_name: str) -> Optional[str]:
     return None
 
 
-def _query_chromadb(collection_id: str, query_embedding: list, k: int) -> list:
+def _query_chromadb(
+    collection_id: str,
+    query_embedding: list,
+    k: int,
+    min_similarity: Optional[float] = None,
+) -> list:
     """
     Query ChromaDB API for similar documents.
 
@@ -115,6 +139,8 @@ def _query_chromadb(collection_id: str, query_embedding: list, k: int) -> list:
         collection_id: ID of the collection to query
         query_embedding: Embedding vector for the query
         k: Number of results to return
+        min_similarity: Drop documents whose cosine similarity to the query
+            is lower (computed locally, so it works for any collection metric)
 
     Returns:
         List of document contents found in ChromaDB
@@ -124,7 +150,12 @@ def _query_chromadb(collection_id: str, query_embedding: list, k: int) -> list:
     try:
         base_url = f"http://{config.chroma_host}:{config.chroma_port}/api/v2"
         query_url = f"{base_url}/tenants/default_tenant/databases/default_database/collections/{collection_id}/query"
-        payload = {"query_embeddings": [query_embedding], "n_results": k}
+        payload: Dict[str, Any] = {
+            "query_embeddings": [query_embedding],
+            "n_results": k,
+        }
+        if min_similarity is not None:
+            payload["include"] = ["documents", "embeddings"]
 
         if config.verbose_logging:
             logger.debug("🌐 Querying ChromaDB API")
@@ -147,6 +178,18 @@ def _query_chromadb(collection_id: str, query_embedding: list, k: int) -> list:
                 documents = data["documents"][0]
                 if config.verbose_logging:
                     logger.debug(f"   Found {len(documents)} document results")
+                if min_similarity is not None and data.get("embeddings"):
+                    scored = zip(documents, data["embeddings"][0])
+                    documents = [
+                        doc
+                        for doc, embedding in scored
+                        if cosine_similarity(query_embedding, embedding)
+                        >= min_similarity
+                    ]
+                    if config.verbose_logging:
+                        logger.debug(
+                            f"   {len(documents)} results above similarity {min_similarity}"
+                        )
                 for i, doc_content in enumerate(documents):
                     docs.append(doc_content)
                     if config.verbose_logging:
@@ -268,7 +311,12 @@ def _generate_query_embedding(query: str) -> Optional[list]:
 
 
 def _retrieve_and_cache_context(
-    query_embedding: list, collection_id: str, k: int, cache_key: str, space_name: str
+    query_embedding: list,
+    collection_id: str,
+    k: int,
+    cache_key: str,
+    space_name: str,
+    min_similarity: Optional[float] = None,
 ) -> str:
     """
     Query ChromaDB and cache results.
@@ -279,6 +327,7 @@ def _retrieve_and_cache_context(
         k: Number of results to return
         cache_key: Cache key for storing results
         space_name: Space name for logging
+        min_similarity: Relevance threshold (see _query_chromadb)
 
     Returns:
         Formatted context string
@@ -286,7 +335,7 @@ def _retrieve_and_cache_context(
     config = get_config()
 
     # Query the database
-    docs = _query_chromadb(collection_id, query_embedding, k)
+    docs = _query_chromadb(collection_id, query_embedding, k, min_similarity)
 
     # Cache and return results
     if docs:
@@ -300,7 +349,10 @@ def _retrieve_and_cache_context(
 
 
 def get_relevant_context(
-    query: str, k: int = 3, space_name: Optional[str] = None
+    query: str,
+    k: int = 3,
+    space_name: Optional[str] = None,
+    min_similarity: Optional[float] = None,
 ) -> str:
     """
     Get relevant context from vector database with caching.
@@ -309,6 +361,8 @@ def get_relevant_context(
         query: Search query string
         k: Number of results to return (default: 3)
         space_name: Space to search in (default: current space)
+        min_similarity: Only return documents at least this similar to the
+            query (cosine; default: no threshold)
 
     Returns:
         Formatted context string with relevant documents, or empty string
@@ -332,6 +386,8 @@ def get_relevant_context(
 
     # Check cache first
     cache_key = f"{space_name}:{query}:{k}"
+    if min_similarity is not None:
+        cache_key += f":{min_similarity}"
     cached_context = _check_cache_for_context(cache_key)
     if cached_context is not None:
         return cached_context
@@ -360,7 +416,7 @@ def get_relevant_context(
 
         # Query and cache results
         return _retrieve_and_cache_context(
-            query_embedding, collection_id, k, cache_key, space_name
+            query_embedding, collection_id, k, cache_key, space_name, min_similarity
         )
 
     except (AttributeError, NameError, Exception) as e:
@@ -748,4 +804,666 @@ def add_to_knowledge_base(content: str, metadata: Optional[dict] = None) -> bool
             return False
 
 
-__all__ = ["get_relevant_context", "add_to_knowledge_base"]
+def _generate_embeddings_batch(contents: List[str]) -> Optional[List[list]]:
+    """
+    Generate embeddings for several documents with a single API call.
+
+    Cached embeddings are reused; only cache misses are sent to the
+    embedding model, in one embed_documents() request.
+
+    Args:
+        contents: Text contents to embed
+
+    Returns:
+        Embedding vectors in the same order as contents, or None on failure
+    """
+    from src.storage.cache import get_cached_embedding, cache_embedding
+
+    ctx = get_context()
+    config = get_config()
+
+    if ctx.embeddings is None:
+        logger.error("Embeddings not available")
+        return None
+
+    vectors: List[Optional[list]] = [get_cached_embedding(c) for c in contents]
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+
+    if missing:
+        if config.verbose_logging:
+            logger.debug(
+                f"🧮 Generating {len(missing)} embeddings in one batch "
+                f"({len(contents) - len(missing)} cached)"
+            )
+        try:
+            generated = ctx.embeddings.embed_documents([contents[i] for i in missing])
+        except Exception as e:
+            logger.error(f"Error generating batch embeddings: {e}")
+            return None
+
+        if not generated or len(generated) != len(missing):
+            logger.error("Embedding batch returned an unexpected number of vectors")
+            return None
+
+        for i, vector in zip(missing, generated):
+            vectors[i] = vector
+            cache_embedding(contents[i], vector)
+
+    return [vector for vector in vectors if vector is not None]
+
+
+def _store_documents_batch_in_chromadb(
+    collection_id: str,
+    documents: Sequence[Document],
+    embedding_vectors: List[list],
+    space_name: str,
+    ids: Optional[Sequence[str]] = None,
+) -> bool:
+    """
+    Store several documents in ChromaDB with one add request.
+
+    Args:
+        collection_id: ID of the target collection
+        documents: Documents to store
+        embedding_vectors: Embedding vectors, one per document
+        space_name: Space name for logging
+        ids: Deterministic IDs; when given the batch is upserted
+
+    Returns:
+        True if successful, False otherwise
+    """
+    config = get_config()
+    api_session = _get_api_session()
+    add_url = (
+        f"http://{config.chroma_host}:{config.chroma_port}/api/v2/"
+        "tenants/default_tenant/databases/default_database/"
+        f"collections/{collection_id}/{'add' if ids is None else 'upsert'}"
+    )
+
+    if ids is None:
+        timestamp = int(datetime.now().timestamp() * 1000000)
+        ids = [
+            f"doc_{len(doc.page_content)}_{timestamp}_{i}"
+            for i, doc in enumerate(documents)
+        ]
+    payload = {
+        "ids": list(ids),
+        "embeddings": embedding_vectors,
+        "documents": [doc.page_content for doc in documents],
+        "metadatas": [doc.metadata or {} for doc in documents],
+    }
+
+    if config.verbose_logging:
+        logger.debug(f"📤 Adding {len(documents)} documents to ChromaDB in one batch")
+
+    headers = {"Content-Type": "application/json"}
+    response = api_session.post(add_url, json=payload, headers=headers, timeout=30)
+
+    if response.status_code in (200, 201):
+        return True
+
+    logger.error(
+        f"Failed to add document batch to space {space_name}: {response.status_code} - {response.text}"
+    )
+    return False
+
+
+def add_documents_to_knowledge_base(documents: Sequence[Document]) -> int:
+    """
+    Add a batch of documents to the current space's knowledge base.
+
+    Embeds every document with one embedding request and stores the batch
+    with one ChromaDB add call, instead of a round trip per document.
+
+    Args:
+        documents: LangChain documents (content + metadata) to store
+
+    Returns:
+        Number of documents stored (0 or len(documents))
+    """
+    ctx = get_context()
+
+    documents = [doc for doc in documents if doc.page_content]
+    if not documents:
+        return 0
+
+    if ctx.embeddings is None:
+        logger.error("Embeddings not available for learning")
+        return 0
+
+    vectors = _generate_embeddings_batch([doc.page_content for doc in documents])
+    if vectors is None:
+        return 0
+
+    try:
+        from src.vectordb.spaces import get_space_collection_name
+
+        collection_name = get_space_collection_name(ctx.current_space)
+        collection_id = _find_or_create_collection(collection_name, ctx.current_space)
+
+        if collection_id:
+            if _store_documents_batch_in_chromadb(
+                collection_id, documents, vectors, ctx.current_space
+            ):
+                return len(documents)
+            return 0
+
+        logger.error(
+            f"Could not find or create collection for space {ctx.current_space}"
+        )
+    except Exception as e:
+        logger.warning(f"Batch API call failed, attempting LangChain fallback: {e}")
+
+    if ctx.vectorstore is not None:
+        try:
+            ctx.vectorstore.add_documents(list(documents))
+            return len(documents)
+        except Exception as fallback_e:
+            logger.error(f"Both API and fallback failed: {fallback_e}")
+    return 0
+
+
+# =============================================================================
+# CHUNK-LEVEL DELTA SYNC
+# =============================================================================
+
+
+@dataclass
+class ChunkSyncResult:
+    """Outcome of synchronising sources' chunks with the knowledge base."""
+
+    added: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    suppressed: int = 0
+
+
+def _collection_endpoint(collection_id: str, action: str) -> str:
+    """Build a collection-level ChromaDB REST URL."""
+    config = get_config()
+    return (
+        f"http://{config.chroma_host}:{config.chroma_port}/api/v2/"
+        "tenants/default_tenant/databases/default_database/"
+        f"collections/{collection_id}/{action}"
+    )
+
+
+def _get_chunks_for_sources(
+    collection_id: str, sources: Sequence[str]
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Fetch IDs and metadata of every stored chunk of the given sources.
+
+    Returns:
+        Mapping of chunk ID to metadata, or None if the request failed
+    """
+    payload: Dict[str, Any] = {
+        "where": {"source": {"$in": list(sources)}},
+        "include": ["metadatas"],
+    }
+    response = _get_api_session().post(
+        _collection_endpoint(collection_id, "get"), json=payload, timeout=30
+    )
+    if response.status_code != 200:
+        logger.error(f"Failed to list chunks: {response.status_code} - {response.text}")
+        return None
+
+    data = response.json()
+    ids = data.get("ids") or []
+    metadatas = data.get("metadatas") or [None] * len(ids)
+    return {i: (m or {}) for i, m in zip(ids, metadatas)}
+
+
+def _delete_chunks(collection_id: str, ids: Sequence[str]) -> bool:
+    """Delete chunks by ID."""
+    response = _get_api_session().post(
+        _collection_endpoint(collection_id, "delete"),
+        json={"ids": list(ids)},
+        timeout=30,
+    )
+    if response.status_code == 200:
+        return True
+    logger.error(f"Failed to delete chunks: {response.status_code} - {response.text}")
+    return False
+
+
+def _update_chunk_metadata(
+    collection_id: str, ids: Sequence[str], metadatas: Sequence[Dict[str, Any]]
+) -> bool:
+    """Update metadata of existing chunks without re-embedding them."""
+    response = _get_api_session().post(
+        _collection_endpoint(collection_id, "update"),
+        json={"ids": list(ids), "metadatas": list(metadatas)},
+        timeout=30,
+    )
+    if response.status_code == 200:
+        return True
+    logger.warning(
+        f"Failed to update chunk metadata: {response.status_code} - {response.text}"
+    )
+    return False
+
+
+@dataclass
+class ChunkSyncPlan:
+    """
+    Changes needed to bring some sources' stored chunks up to date.
+
+    Computed by plan_chunk_sync() before anything is written, so the
+    embedding of new chunks and the writes can run as separate stages.
+    """
+
+    collection_id: str
+    space_name: str
+    new_docs: List[Document] = field(default_factory=list)
+    new_ids: List[str] = field(default_factory=list)
+    moved_ids: List[str] = field(default_factory=list)
+    moved_metadata: List[Dict[str, Any]] = field(default_factory=list)
+    stale_ids: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    vectors: Optional[List[list]] = None
+    # Sources synced in full (their chunks not in new_docs are gone)
+    sources: List[str] = field(default_factory=list)
+    # Near-duplicate suppression: skipped chunk ID -> canonical chunk ID, the
+    # skipped chunks themselves, and (source, signature) of new chunks to
+    # index once they are stored
+    suppressed: Dict[str, str] = field(default_factory=dict)
+    suppressed_docs: Dict[str, Document] = field(default_factory=dict)
+    signatures: Dict[str, Tuple[str, Tuple[int, ...]]] = field(default_factory=dict)
+
+
+def _plan_chunk_delta(
+    collection_id: str,
+    documents: Sequence[Document],
+    ids: Sequence[str],
+    existing: Dict[str, Dict[str, Any]],
+    space_name: str,
+) -> ChunkSyncPlan:
+    """Split documents into new, moved and unchanged chunks; find vanished ones."""
+    plan = ChunkSyncPlan(collection_id, space_name)
+    seen = set()
+
+    for doc_id, doc in zip(ids, documents):
+        if doc_id in seen:
+            continue
+        seen.add(doc_id)
+        if doc_id not in existing:
+            plan.new_docs.append(doc)
+            plan.new_ids.append(doc_id)
+            continue
+        plan.unchanged += 1
+        # Same text, but lines may have shifted around it
+        stored = existing[doc_id]
+        if any(
+            stored.get(k) != v
+            for k, v in (doc.metadata or {}).items()
+            if k not in VOLATILE_METADATA_KEYS
+        ):
+            plan.moved_ids.append(doc_id)
+            plan.moved_metadata.append(doc.metadata)
+
+    plan.stale_ids = [doc_id for doc_id in existing if doc_id not in seen]
+    return plan
+
+
+def _get_existing_chunk_ids(collection_id: str, ids: Sequence[str]) -> Optional[set]:
+    """Return which of the given chunk IDs are stored (None if the request failed)."""
+    payload: Dict[str, Any] = {"ids": list(ids), "include": []}
+    response = _get_api_session().post(
+        _collection_endpoint(collection_id, "get"), json=payload, timeout=30
+    )
+    if response.status_code != 200:
+        logger.error(f"Failed to look up chunks: {response.status_code} - {response.text}")
+        return None
+    return set(response.json().get("ids") or [])
+
+
+def _suppress_near_duplicates(plan: ChunkSyncPlan) -> None:
+    """
+    Drop new chunks that nearly duplicate a stored chunk of another source.
+
+    Duplicates are matched against the space's signature index, which
+    also holds the chunks reserved by syncs planned before this one (and
+    this plan's own earlier chunks), so the first copy is kept even when
+    batches are planned concurrently. Canonical chunks found in the index
+    are confirmed to still be stored; stale index entries are dropped and
+    their would-be duplicates are kept.
+
+    The kept chunks stay reserved in the index until write_chunk_sync_plan
+    stores them or release_chunk_sync_plan drops them. Chunks of other
+    sources that were suppressed as copies of a vanished canonical chunk
+    are stored instead (see _restore_suppressed).
+    """
+    index = get_near_duplicate_index(plan.space_name)
+    stale = set(plan.stale_ids)
+    signatures: Dict[str, Tuple[str, Signature]] = {}
+    orphans: List[SuppressedChunk] = []
+    with _near_dup_plan_lock:
+        for doc, doc_id in zip(plan.new_docs, plan.new_ids):
+            signature = minhash_signature(doc.page_content)
+            if signature is None:
+                continue
+            source = doc.metadata.get("source", "")
+            signatures[doc_id] = (source, signature)
+            canonical = index.find(signature, exclude_source=source, exclude_ids=stale)
+            if canonical is None:
+                index.reserve([(doc_id, source, signature)])
+            else:
+                plan.suppressed[doc_id] = canonical
+
+        # Confirm canonical chunks from earlier runs still exist
+        indexed = {
+            c
+            for c in plan.suppressed.values()
+            if c not in signatures and not index.is_reserved(c)
+        }
+        if indexed:
+            existing = _get_existing_chunk_ids(plan.collection_id, sorted(indexed))
+            missing = indexed if existing is None else indexed - existing
+            if missing:
+                if existing is not None:
+                    orphans = index.remove(missing)
+                restored = [d for d, c in plan.suppressed.items() if c in missing]
+                plan.suppressed = {
+                    d: c for d, c in plan.suppressed.items() if c not in missing
+                }
+                index.reserve(
+                    (doc_id, *signatures[doc_id]) for doc_id in restored
+                )
+
+    if plan.suppressed:
+        kept = []
+        for doc, doc_id in zip(plan.new_docs, plan.new_ids):
+            if doc_id in plan.suppressed:
+                plan.suppressed_docs[doc_id] = doc
+            else:
+                kept.append((doc, doc_id))
+        plan.new_docs = [doc for doc, _ in kept]
+        plan.new_ids = [doc_id for _, doc_id in kept]
+        logger.debug(f"Suppressed {len(plan.suppressed)} near-duplicate chunks")
+    plan.signatures = {
+        doc_id: signatures[doc_id] for doc_id in plan.new_ids if doc_id in signatures
+    }
+    # This plan's own sources record their suppressed chunks afresh
+    sources = set(plan.sources)
+    _restore_suppressed(
+        plan.collection_id,
+        plan.space_name,
+        [chunk for chunk in orphans if chunk.source not in sources],
+    )
+
+
+def _restore_suppressed(
+    collection_id: str, space_name: str, chunks: Sequence[SuppressedChunk]
+) -> None:
+    """
+    Store suppressed chunks whose canonical chunk was deleted.
+
+    They are checked for near-duplicates again, so a chunk that has another
+    stored copy stays suppressed, now as a copy of that one.
+    """
+    if not chunks:
+        return
+    plan = ChunkSyncPlan(collection_id, space_name)
+    for chunk in chunks:
+        plan.new_docs.append(Document(page_content=chunk.text, metadata=chunk.metadata))
+        plan.new_ids.append(chunk.chunk_id)
+    _suppress_near_duplicates(plan)
+    embed_chunk_sync_plan(plan)
+    result = write_chunk_sync_plan(plan)
+    if result.added < len(plan.new_docs):
+        logger.warning(
+            f"Restored {result.added}/{len(plan.new_docs)} chunks whose "
+            "canonical copy was deleted"
+        )
+
+
+def plan_chunk_sync(
+    documents: Sequence[Document], sources: Sequence[str]
+) -> Optional[ChunkSyncPlan]:
+    """
+    Diff a new chunk set against the chunks stored for its sources.
+
+    Args:
+        documents: The complete chunk set of every source (non-empty content)
+        sources: Sources being synced
+
+    Returns:
+        ChunkSyncPlan, or None if the ChromaDB API is unavailable
+    """
+    ctx = get_context()
+    ids = [
+        chunk_id(
+            doc.metadata["source"],
+            doc.metadata.get("chunk_hash") or content_chunk_hash(doc.page_content),
+        )
+        for doc in documents
+    ]
+
+    try:
+        from src.vectordb.spaces import get_space_collection_name
+
+        collection_name = get_space_collection_name(ctx.current_space)
+        collection_id = _find_or_create_collection(collection_name, ctx.current_space)
+        if collection_id:
+            existing = _get_chunks_for_sources(collection_id, sources)
+            if existing is not None:
+                plan = _plan_chunk_delta(
+                    collection_id, documents, ids, existing, ctx.current_space
+                )
+                plan.sources = list(sources)
+                _suppress_near_duplicates(plan)
+                return plan
+    except Exception as e:
+        logger.warning(f"Chunk sync planning via API failed: {e}")
+    return None
+
+
+def embed_chunk_sync_plan(plan: ChunkSyncPlan) -> bool:
+    """
+    Embed the plan's new chunks in batches of EMBED_BATCH_SIZE.
+
+    Returns:
+        True if every new chunk has a vector (plan.vectors is set)
+    """
+    vectors: List[list] = []
+    for start in range(0, len(plan.new_docs), EMBED_BATCH_SIZE):
+        batch = plan.new_docs[start:start + EMBED_BATCH_SIZE]
+        batch_vectors = _generate_embeddings_batch([doc.page_content for doc in batch])
+        if batch_vectors is None:
+            return False
+        vectors.extend(batch_vectors)
+    plan.vectors = vectors
+    return True
+
+
+def write_chunk_sync_plan(plan: ChunkSyncPlan) -> ChunkSyncResult:
+    """
+    Store embedded new chunks, refresh moved ones and delete vanished ones.
+
+    If new chunks were not embedded, nothing is written; if some of them
+    failed to store, the stale chunks are kept. Either way the sources are
+    never left half-empty, and the next sync adds what is missing.
+
+    Suppressed chunks are recorded in the near-duplicate index; those whose
+    canonical chunk is deleted here are stored in its place.
+    """
+    result = ChunkSyncResult(unchanged=plan.unchanged)
+    vectors = plan.vectors
+    if plan.new_docs and vectors is None:
+        release_chunk_sync_plan(plan)
+        return result
+    result.suppressed = len(plan.suppressed)
+    index = get_near_duplicate_index(plan.space_name)
+    stored: List[str] = []
+
+    for start in range(0, len(plan.new_docs), EMBED_BATCH_SIZE):
+        end = start + EMBED_BATCH_SIZE
+        batch = plan.new_docs[start:end]
+        batch_ids = plan.new_ids[start:end]
+        if _store_documents_batch_in_chromadb(
+            plan.collection_id,
+            batch,
+            (vectors or [])[start:end],
+            plan.space_name,
+            ids=batch_ids,
+        ):
+            result.added += len(batch)
+            stored.extend(batch_ids)
+            index.add(
+                (doc_id, *plan.signatures[doc_id])
+                for doc_id in batch_ids
+                if doc_id in plan.signatures
+            )
+    release_chunk_sync_plan(plan, exclude=stored)
+    index.suppress(
+        (
+            SuppressedChunk(
+                doc_id,
+                doc.metadata.get("source", ""),
+                plan.suppressed[doc_id],
+                doc.page_content,
+                dict(doc.metadata),
+            )
+            for doc_id, doc in plan.suppressed_docs.items()
+        ),
+        sources=plan.sources,
+    )
+
+    if plan.moved_ids:
+        _update_chunk_metadata(plan.collection_id, plan.moved_ids, plan.moved_metadata)
+
+    if result.added < len(plan.new_docs):
+        logger.warning(
+            f"Stored {result.added}/{len(plan.new_docs)} new chunks, "
+            f"keeping {len(plan.stale_ids)} stale chunks until the next sync"
+        )
+    elif plan.stale_ids and _delete_chunks(plan.collection_id, plan.stale_ids):
+        result.deleted = len(plan.stale_ids)
+        orphans = index.remove(plan.stale_ids)
+        _restore_suppressed(plan.collection_id, plan.space_name, orphans)
+    return result
+
+
+def release_chunk_sync_plan(plan: ChunkSyncPlan, exclude: Sequence[str] = ()) -> None:
+    """
+    Drop the near-duplicate index reservations of a plan's unstored chunks.
+
+    Call this for plans that are not written (e.g. embedding failed), so
+    their chunks stop counting as canonical copies.
+    """
+    stored = set(exclude)
+    get_near_duplicate_index(plan.space_name).release(
+        doc_id for doc_id in plan.signatures if doc_id not in stored
+    )
+
+
+def sync_documents_to_knowledge_base(
+    documents: Sequence[Document], sources: Optional[Sequence[str]] = None
+) -> ChunkSyncResult:
+    """
+    Bring the stored chunks of some sources in line with a new chunk set.
+
+    Chunk IDs are derived from the source and the chunk's content hash, so
+    chunks whose text did not change keep their ID and are not re-embedded.
+    Only new chunks are embedded (in batches); chunks that disappeared from
+    a source are deleted.
+
+    Args:
+        documents: The complete chunk set of every source being synced; each
+            document needs a "source" metadata entry ("chunk_hash" is
+            computed from the content when missing)
+        sources: Sources to sync (default: those referenced by documents).
+            A source without documents has all its chunks deleted.
+
+    Returns:
+        ChunkSyncResult with added/unchanged/deleted counts
+    """
+    ctx = get_context()
+    documents = [doc for doc in documents if doc.page_content]
+    result = ChunkSyncResult()
+
+    if sources is None:
+        sources = list(dict.fromkeys(doc.metadata["source"] for doc in documents))
+    if not sources:
+        return result
+
+    if ctx.embeddings is None:
+        logger.error("Embeddings not available for learning")
+        return result
+
+    plan = plan_chunk_sync(documents, sources)
+    if plan is not None:
+        embed_chunk_sync_plan(plan)
+        return write_chunk_sync_plan(plan)
+
+    logger.warning("Chunk sync via API failed, attempting LangChain fallback")
+    return add_documents_with_fallback(documents)
+
+
+def add_documents_with_fallback(documents: Sequence[Document]) -> ChunkSyncResult:
+    """
+    Store chunks through the LangChain vectorstore (used when the API is down).
+
+    Chunks keep their deterministic IDs, so re-adding one overwrites it.
+    """
+    ctx = get_context()
+    result = ChunkSyncResult()
+    ids = [
+        chunk_id(
+            doc.metadata["source"],
+            doc.metadata.get("chunk_hash") or content_chunk_hash(doc.page_content),
+        )
+        for doc in documents
+    ]
+    if ctx.vectorstore is not None and documents:
+        try:
+            ctx.vectorstore.add_documents(list(documents), ids=ids)
+            result.added = len(documents)
+        except Exception as fallback_e:
+            logger.error(f"Both API and fallback failed: {fallback_e}")
+    return result
+
+
+def delete_chunks_from_knowledge_base(ids: Sequence[str]) -> bool:
+    """
+    Delete chunks from the current space's collection by ID.
+
+    Args:
+        ids: Chunk IDs to delete
+
+    Returns:
+        True if the chunks were deleted (or there was nothing to delete)
+    """
+    if not ids:
+        return True
+
+    ctx = get_context()
+    try:
+        from src.vectordb.spaces import get_space_collection_name
+
+        collection_name = get_space_collection_name(ctx.current_space)
+        collection_id = _find_or_create_collection(collection_name, ctx.current_space)
+        if collection_id and _delete_chunks(collection_id, ids):
+            orphans = get_near_duplicate_index(ctx.current_space).remove(ids)
+            _restore_suppressed(collection_id, ctx.current_space, orphans)
+            return True
+    except Exception as e:
+        logger.warning(f"Chunk delete via API failed: {e}")
+    return False
+
+
+__all__ = [
+    "get_relevant_context",
+    "add_to_knowledge_base",
+    "add_documents_to_knowledge_base",
+    "sync_documents_to_knowledge_base",
+    "delete_chunks_from_knowledge_base",
+    "add_documents_with_fallback",
+    "plan_chunk_sync",
+    "embed_chunk_sync_plan",
+    "write_chunk_sync_plan",
+    "release_chunk_sync_plan",
+    "ChunkSyncPlan",
+    "ChunkSyncResult",
+]
@@ -0,0 +1,597 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Gitignore-aware repository walker shared by all file scanners.
+
+This module provides a single, lazy directory walker built on ``os.scandir``.
+Directory entries carry cached type information, so classifying entries
+costs no extra ``stat`` calls, and file sizes are read once per entry.
+
+Ignore sources (later sources override earlier ones, like git):
+1. Built-in defaults (VCS metadata, caches, ``node_modules``, build output,
+   virtualenvs, ``*.egg-info``)
+2. Global excludes (``core.excludesFile`` or ``~/.config/git/ignore``)
+3. ``.git/info/exclude`` of the walked repository
+4. ``.gitignore`` and ``.ignore`` files in every visited directory
+
+Usage:
+    from src.core.file_walker import walk_files
+
+    for entry in walk_files("."):
+        print(entry.rel_path, entry.size)
+"""
+
+import configparser
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Directories and files that are never worth scanning
+DEFAULT_IGNORE_PATTERNS: Tuple[str, ...] = (
+    ".git/",
+    ".svn/",
+    ".hg/",
+    "node_modules/",
+    "__pycache__/",
+    ".pytest_cache/",
+    ".mypy_cache/",
+    ".ruff_cache/",
+    ".tox/",
+    ".nox/",
+    ".venv/",
+    "venv/",
+    "env/",
+    "dist/",
+    "build/",
+    ".idea/",
+    ".vscode/",
+    ".vs/",
+    "*.egg-info/",
+    ".eggs/",
+)
+
+# Per-directory ignore files, in precedence order
+IGNORE_FILENAMES: Tuple[str, ...] = (".gitignore", ".ignore")
+
+
+# =============================================================================
+# IGNORE RULES
+# =============================================================================
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob (without anchoring) to a regex body."""
+    i, n = 0, len(pattern)
+    out: List[str] = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                # "**/" matches zero or more directories, trailing "**" anything
+                if pattern.startswith("/", i + 2):
+                    out.append("(?:.*/)?")
+                    i += 3
+                    continue
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = pattern.find("]", i + 1)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                start = i + 1
+                body = pattern[start:j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class _Rule:
+    """One compiled gitignore pattern."""
+
+    __slots__ = ("negated", "dir_only", "anchored", "regex")
+
+    def __init__(self, pattern: str):
+        self.negated = pattern.startswith("!")
+        if self.negated:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        # A slash anywhere but the end anchors the pattern to its base dir
+        self.anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        self.regex = re.compile(_glob_to_regex(pattern) + r"\Z", re.DOTALL)
+
+    def matches(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        if self.dir_only and not is_dir:
+            return False
+        return bool(self.regex.match(rel_path if self.anchored else name))
+
+
+class IgnoreRules:
+    """
+    Gitignore-style patterns that apply below a base directory.
+
+    Patterns follow git semantics: ``!`` negates, a trailing ``/`` matches
+    directories only, a leading or inner ``/`` anchors the pattern to the
+    base directory, and ``**`` spans directory levels.
+    """
+
+    def __init__(self, base: str, patterns: Sequence[str]):
+        """
+        Compile patterns.
+
+        Args:
+            base: Directory the patterns are relative to
+            patterns: Raw pattern lines (comments and blanks are skipped)
+        """
+        self.base = os.path.normpath(base)
+        self._rules: List[_Rule] = []
+        for line in patterns:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("\\#") or line.startswith("\\!"):
+                line = line[1:]
+            self._rules.append(_Rule(line))
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    @classmethod
+    def from_file(cls, base: str, file_path: str) -> Optional["IgnoreRules"]:
+        """Load rules from an ignore file, or None if it is missing/empty."""
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                rules = cls(base, f.readlines())
+        except OSError:
+            return None
+        return rules if len(rules) else None
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Match a path against these rules.
+
+        Args:
+            path: Path to test (absolute or relative to the current directory)
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored, False if explicitly re-included by a negation,
+            None if no rule matched or the path lies outside the base
+        """
+        prefix = self.base.rstrip(os.sep) + os.sep
+        if path.startswith(prefix):
+            # Fast path for absolute walker paths: avoid relpath() per entry
+            rel_path = path.removeprefix(prefix)
+        else:
+            rel_path = os.path.relpath(path, self.base)
+            if rel_path.startswith("..") or rel_path == ".":
+                return None
+        rel_path = rel_path.replace(os.sep, "/")
+        name = rel_path.rsplit("/", 1)[-1]
+        result: Optional[bool] = None
+        for rule in self._rules:
+            if rule.matches(rel_path, name, is_dir):
+                result = not rule.negated
+        return result
+
+
+def _git_global_excludes_path() -> Optional[str]:
+    """Locate the user's global git excludes file."""
+    gitconfig = os.path.expanduser("~/.gitconfig")
+    if os.path.isfile(gitconfig):
+        parser = configparser.ConfigParser(strict=False, interpolation=None)
+        try:
+            parser.read(gitconfig, encoding="utf-8")
+            value = parser.get("core", "excludesfile", fallback=None)
+            if value:
+                return os.path.expanduser(value.strip().strip('"'))
+        except (configparser.Error, UnicodeDecodeError) as e:
+            logger.debug(f"Could not parse {gitconfig}: {e}")
+
+    xdg_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return os.path.join(xdg_home, "git", "ignore")
+
+
+@lru_cache(maxsize=1)
+def _global_rule_patterns() -> Tuple[str, ...]:
+    """Read global exclude patterns once per process."""
+    path = _git_global_excludes_path()
+    if not path or not os.path.isfile(path):
+        return ()
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return tuple(f.readlines())
+    except OSError:
+        return ()
+
+
+def _find_repo_root(start: str) -> Optional[str]:
+    """Return the nearest ancestor of start that contains a .git entry."""
+    current = os.path.abspath(start)
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def build_base_rules(root: str, respect_ignore_files: bool = True) -> List[IgnoreRules]:
+    """
+    Build the rule stack that applies at a walk root.
+
+    Includes the built-in defaults and, when respect_ignore_files is set,
+    global excludes, ``.git/info/exclude`` and the ignore files of every
+    directory between the repository root and ``root``.
+
+    Args:
+        root: Directory where the walk starts
+        respect_ignore_files: Whether to read git/ignore files at all
+
+    Returns:
+        Rule sets ordered from lowest to highest precedence
+    """
+    root = os.path.abspath(root)
+    stack = [IgnoreRules(root, DEFAULT_IGNORE_PATTERNS)]
+    if not respect_ignore_files:
+        return stack
+
+    repo_root = _find_repo_root(root) or root
+    global_patterns = _global_rule_patterns()
+    if global_patterns:
+        stack.append(IgnoreRules(repo_root, global_patterns))
+
+    exclude = IgnoreRules.from_file(
+        repo_root, os.path.join(repo_root, ".git", "info", "exclude")
+    )
+    if exclude:
+        stack.append(exclude)
+
+    # Ignore files of ancestors between the repo root and the walk root
+    ancestors: List[str] = []
+    current = root
+    while True:
+        ancestors.append(current)
+        if current == repo_root:
+            break
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+    for directory in reversed(ancestors[1:]):
+        stack.extend(_load_dir_rules(directory))
+
+    return stack
+
+
+def _load_dir_rules(directory: str) -> List[IgnoreRules]:
+    """Load .gitignore/.ignore rules defined in a directory."""
+    rules = []
+    for filename in IGNORE_FILENAMES:
+        loaded = IgnoreRules.from_file(directory, os.path.join(directory, filename))
+        if loaded:
+            rules.append(loaded)
+    return rules
+
+
+def is_ignored(path: str, is_dir: bool, rules: Sequence[IgnoreRules]) -> bool:
+    """Check a path against a rule stack; the last matching rule wins."""
+    result = False
+    for rule_set in rules:
+        matched = rule_set.match(path, is_dir)
+        if matched is not None:
+            result = matched
+    return result
+
+
+# =============================================================================
+# WALKER
+# =============================================================================
+
+
+class WalkEntry:
+    """
+    A file or directory yielded by the walker.
+
+    Wraps ``os.DirEntry`` so type checks use the cached ``d_type`` and
+    ``stat()`` is issued at most once per entry.
+    """
+
+    __slots__ = ("path", "rel_path", "name", "is_dir", "_entry")
+
+    def __init__(self, entry: os.DirEntry, rel_path: str, is_dir: bool):
+        self.path: str = entry.path
+        self.rel_path: str = rel_path
+        self.name: str = entry.name
+        self.is_dir: bool = is_dir
+        self._entry = entry
+
+    def stat(self) -> os.stat_result:
+        """Return the (cached) stat result of the entry."""
+        return self._entry.stat()
+
+    @property
+    def size(self) -> int:
+        """File size in bytes."""
+        return self.stat().st_size
+
+    @property
+    def mtime(self) -> float:
+        """Modification time."""
+        return self.stat().st_mtime
+
+    def __repr__(self) -> str:
+        kind = "dir" if self.is_dir else "file"
+        return f"WalkEntry({self.rel_path!r}, {kind})"
+
+
+def _is_virtualenv(path: str) -> bool:
+    """Detect virtualenvs regardless of their directory name."""
+    return os.path.isfile(os.path.join(path, "pyvenv.cfg"))
+
+
+def _scan_sorted(path: str) -> List[os.DirEntry]:
+    """List a directory's entries sorted by name."""
+    entries = list(os.scandir(path))
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _entry_is_dir(entry: os.DirEntry, follow_symlinks: bool) -> bool:
+    try:
+        return entry.is_dir(follow_symlinks=follow_symlinks)
+    except OSError:
+        return False
+
+
+def walk_files(
+    root: str,
+    *,
+    include_hidden: bool = False,
+    include_dirs: bool = False,
+    respect_ignore_files: bool = True,
+    follow_symlinks: bool = False,
+    max_depth: Optional[int] = None,
+    extensions: Optional[Sequence[str]] = None,
+) -> Iterator[WalkEntry]:
+    """
+    Lazily walk a directory tree, skipping ignored paths.
+
+    Traversal is depth-first in sorted name order, so repeated walks of an
+    unchanged tree yield entries in the same order. Ignored directories are
+    pruned without being opened.
+
+    Args:
+        root: Directory to walk
+        include_hidden: Include dot-files and dot-directories
+        include_dirs: Also yield directory entries (before their contents)
+        respect_ignore_files: Honor .gitignore/.ignore/global excludes
+            (built-in defaults always apply)
+        follow_symlinks: Descend into symlinked directories
+        max_depth: Maximum directory depth (0 = only root's direct entries)
+        extensions: Only yield files with one of these lowercase extensions
+
+    Yields:
+        WalkEntry objects for files (and directories if include_dirs)
+    """
+    root = os.path.abspath(root)
+    if not os.path.isdir(root):
+        return
+
+    ext_filter = tuple(e.lower() for e in extensions) if extensions else None
+    base_rules = build_base_rules(root, respect_ignore_files)
+
+    # Stack of (directory path, relative path, depth, rule stack)
+    stack: List[Tuple[str, str, int, List[IgnoreRules]]] = [(root, "", 0, base_rules)]
+    while stack:
+        dir_path, dir_rel, depth, rules = stack.pop()
+        if respect_ignore_files:
+            local = _load_dir_rules(dir_path)
+            if local:
+                rules = rules + local
+
+        try:
+            entries = _scan_sorted(dir_path)
+        except OSError as e:
+            logger.debug(f"Cannot scan {dir_path}: {e}")
+            continue
+
+        subdirs: List[Tuple[str, str, int, List[IgnoreRules]]] = []
+        for entry in entries:
+            if not include_hidden and entry.name.startswith("."):
+                continue
+
+            is_dir = _entry_is_dir(entry, follow_symlinks)
+            if is_ignored(entry.path, is_dir, rules):
+                continue
+
+            rel_path = f"{dir_rel}/{entry.name}" if dir_rel else entry.name
+
+            if is_dir:
+                if _is_virtualenv(entry.path):
+                    continue
+                if include_dirs:
+                    yield WalkEntry(entry, rel_path, True)
+                if max_depth is None or depth < max_depth:
+                    subdirs.append((entry.path, rel_path, depth + 1, rules))
+                continue
+
+            if ext_filter is not None:
+                if not entry.name.lower().endswith(ext_filter):
+                    continue
+            yield WalkEntry(entry, rel_path, False)
+
+        # Push in reverse so directories are visited in sorted order
+        stack.extend(reversed(subdirs))
+
+
+def scan_directory(
+    path: str,
+    *,
+    include_hidden: bool = True,
+    respect_ignore_files: bool = True,
+    apply_default_rules: bool = True,
+) -> Tuple[List[WalkEntry], int]:
+    """
+    List one directory level, applying the same ignore rules as walk_files.
+
+    Args:
+        path: Directory to list
+        include_hidden: Include dot-files
+        respect_ignore_files: Honor .gitignore/.ignore/global excludes
+        apply_default_rules: Apply built-in defaults and virtualenv detection
+
+    Returns:
+        (entries sorted by name, number of entries filtered out)
+
+    Raises:
+        OSError: If the directory cannot be scanned
+    """
+    path = os.path.abspath(path)
+    rules: List[IgnoreRules] = []
+    if apply_default_rules or respect_ignore_files:
+        rules = build_base_rules(path, respect_ignore_files)
+        if not apply_default_rules:
+            rules = rules[1:]
+    if respect_ignore_files:
+        rules = rules + _load_dir_rules(path)
+
+    visible: List[WalkEntry] = []
+    filtered = 0
+    for entry in _scan_sorted(path):
+        is_dir = _entry_is_dir(entry, follow_symlinks=True)
+        if not include_hidden and entry.name.startswith("."):
+            filtered += 1
+            continue
+        if rules and is_ignored(entry.path, is_dir, rules):
+            filtered += 1
+            continue
+        if apply_default_rules and is_dir and _is_virtualenv(entry.path):
+            filtered += 1
+            continue
+        visible.append(WalkEntry(entry, entry.name, is_dir))
+    return visible, filtered
+
+
+class IgnoreMatcher:
+    """
+    Answer "would walk_files skip this path?" for individual paths.
+
+    Used where paths arrive one at a time (filesystem events) instead of
+    from a walk. Rule stacks are cached per directory; call invalidate()
+    when an ignore file changes.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        *,
+        include_hidden: bool = False,
+        respect_ignore_files: bool = True,
+    ):
+        self.root = os.path.abspath(root)
+        self.include_hidden = include_hidden
+        self.respect_ignore_files = respect_ignore_files
+        self._rules: Dict[str, Optional[List[IgnoreRules]]] = {}
+
+    def invalidate(self) -> None:
+        """Forget cached rules (e.g. after a .gitignore was edited)."""
+        self._rules.clear()
+
+    def _dir_rules(self, directory: str) -> Optional[List[IgnoreRules]]:
+        """Rule stack inside directory, or None if the directory is skipped."""
+        if directory in self._rules:
+            return self._rules[directory]
+
+        if directory == self.root:
+            rules: Optional[List[IgnoreRules]] = build_base_rules(
+                self.root, self.respect_ignore_files
+            )
+        else:
+            parent = self._dir_rules(os.path.dirname(directory))
+            name = os.path.basename(directory)
+            if (
+                parent is None
+                or (not self.include_hidden and name.startswith("."))
+                or is_ignored(directory, True, parent)
+                or _is_virtualenv(directory)
+            ):
+                rules = None
+            else:
+                rules = parent
+        if rules is not None and self.respect_ignore_files:
+            local = _load_dir_rules(directory)
+            if local:
+                rules = rules + local
+
+        self._rules[directory] = rules
+        return rules
+
+    def is_ignored(self, path: str) -> bool:
+        """
+        Check whether a file below root is excluded by the walker's rules.
+
+        Args:
+            path: File path (need not exist any more)
+
+        Returns:
+            True for ignored files and for paths outside root
+        """
+        path = os.path.abspath(path)
+        if not path.startswith(os.path.join(self.root, "")):
+            return True
+        if not self.include_hidden and os.path.basename(path).startswith("."):
+            return True
+        rules = self._dir_rules(os.path.dirname(path))
+        return rules is None or is_ignored(path, False, rules)
+
+
+__all__ = [
+    "DEFAULT_IGNORE_PATTERNS",
+    "IgnoreMatcher",
+    "IgnoreRules",
+    "WalkEntry",
+    "build_base_rules",
+    "is_ignored",
+    "scan_directory",
+    "walk_files",
+]
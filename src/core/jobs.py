@@ -0,0 +1,431 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Background jobs for long-running slash commands.
+
+Commands registered with ``background=True`` (/populate, /learn-docs, /web)
+are not run on the caller's thread by CommandRegistry.dispatch: the
+JobManager runs them on worker threads, so the CLI prompt and the GUI event
+loop stay responsive while a large tree is ingested. Threads are enough
+here; the ingestion pipeline already spreads the heavy work over its own
+thread and process pools.
+
+- Output: everything a job prints is captured per job and shown by
+  ``/jobs <id>`` (while jobs run or output is captured, sys.stdout is
+  routed per thread, see capture_output()).
+- Progress: IngestPipeline publishes its throughput/ETA summary to the job
+  it runs in (see current_job()).
+- Cancellation is cooperative: ``/jobs cancel <id>`` sets the job's cancel
+  flag, pipelines stop feeding new units and finish the ones in flight
+  (completed units stay checkpointed, so re-running the command resumes).
+  Queued jobs are cancelled before they start.
+- Notifications: listeners are called when a job finishes, and finished
+  jobs queue up for the CLI to print before its next prompt.
+
+Usage:
+    from src.core.jobs import get_job_manager
+
+    job = get_job_manager().submit("/populate ./src", lambda: populate("./src"))
+    print(job.describe())
+    get_job_manager().cancel(job.id)
+"""
+
+import io
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Iterator, List, Optional
+
+from src.core.constants import JOBS_HISTORY, JOBS_MAX_CONCURRENT, JOBS_OUTPUT_LINES
+
+logger = logging.getLogger(__name__)
+
+# Job states; the last three are final
+JOB_STATES = ("queued", "running", "done", "failed", "cancelled")
+
+_STATUS_ICONS = {
+    "queued": "⏳",
+    "running": "🔄",
+    "done": "✅",
+    "failed": "❌",
+    "cancelled": "⏹️",
+}
+
+
+@dataclass
+class Job:
+    """A slash command running (or queued) in the background."""
+
+    id: int
+    command: str
+    # Space the job ingests into; switching is refused until it finishes
+    space: str = ""
+    status: str = "queued"
+    # Latest progress line published by the running command
+    progress: str = ""
+    error: str = ""
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    output: Deque[str] = field(default_factory=lambda: deque(maxlen=JOBS_OUTPUT_LINES))
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+    _partial: str = field(default="", repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """True once the job is done, failed or cancelled."""
+        return self.status in ("done", "failed", "cancelled")
+
+    @property
+    def cancel_requested(self) -> bool:
+        """True once /jobs cancel was issued; running code should wind down."""
+        return self._cancel.is_set()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the job has been running (0 while queued)."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def write(self, text: str) -> None:
+        """Append printed text to the job's output, line by line."""
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            # Keep only the final state of carriage-return progress lines
+            self.output.append(line.rsplit("\r", 1)[-1])
+
+    def output_lines(self) -> List[str]:
+        """Captured output, including a trailing unterminated line."""
+        lines = list(self.output)
+        if self._partial:
+            lines.append(self._partial.rsplit("\r", 1)[-1])
+        return lines
+
+    def summary(self) -> str:
+        """The job's last non-empty output line."""
+        for line in reversed(self.output_lines()):
+            if line.strip():
+                return line.strip()
+        return ""
+
+    def describe(self) -> str:
+        """One line for /jobs listings."""
+        icon = _STATUS_ICONS.get(self.status, "•")
+        line = (
+            f"{icon} #{self.id} {self.status:<9} {self.elapsed:6.0f}s  {self.command}"
+        )
+        if self.space:
+            line += f"  [{self.space}]"
+        if self.status == "running" and self.progress:
+            line += f"\n      {self.progress}"
+        return line
+
+    def notification(self) -> str:
+        """Completion message shown when the job finishes."""
+        icon = _STATUS_ICONS.get(self.status, "•")
+        message = f"{icon} Job #{self.id} {self.status} after {self.elapsed:.0f}s: {self.command}"
+        detail = self.error if self.status == "failed" else self.summary()
+        if detail:
+            message += f"\n   {detail}"
+        return message
+
+
+# =============================================================================
+# PER-THREAD OUTPUT ROUTING
+# =============================================================================
+
+_local = threading.local()
+
+
+def current_job() -> Optional[Job]:
+    """The job the calling thread works for, if any."""
+    return getattr(_local, "job", None)
+
+
+@contextmanager
+def bind_job(job: Optional[Job]) -> Iterator[None]:
+    """Attribute the calling thread's work (and output) to a job."""
+    previous = current_job()
+    _local.job = job
+    try:
+        yield
+    finally:
+        _local.job = previous
+
+
+def propagate_job(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap fn so that it runs for the calling thread's job on whichever
+    thread executes it (for threads a job starts, e.g. pipeline stages).
+    """
+    job = current_job()
+    if job is None:
+        return fn
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        with bind_job(job):
+            return fn(*args, **kwargs)
+
+    return run
+
+
+class _ThreadRoutedOutput(io.TextIOBase):
+    """sys.stdout replacement sending each thread's writes to its own sink."""
+
+    def __init__(self, stream: Any):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        sink = getattr(_local, "capture", None)
+        if sink is not None:
+            return sink.write(text)
+        job = current_job()
+        if job is not None:
+            job.write(text)
+            return len(text)
+        return self._stream.write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+# The router replaces sys.stdout only while someone needs it (a job is
+# queued or running, or a capture_output() block is open)
+_router_lock = threading.Lock()
+_router_users = 0
+
+
+def _acquire_output_router() -> None:
+    global _router_users
+    with _router_lock:
+        _router_users += 1
+        if not isinstance(sys.stdout, _ThreadRoutedOutput):
+            sys.stdout = _ThreadRoutedOutput(sys.stdout)
+
+
+def _release_output_router() -> None:
+    global _router_users
+    with _router_lock:
+        _router_users = max(0, _router_users - 1)
+        # Left alone if something else replaced sys.stdout in the meantime
+        if _router_users == 0 and isinstance(sys.stdout, _ThreadRoutedOutput):
+            sys.stdout = sys.stdout._stream
+
+
+@contextmanager
+def capture_output(buffer: Any) -> Iterator[Any]:
+    """
+    Capture what the calling thread prints into buffer.
+
+    Unlike swapping sys.stdout, output of background jobs running at the
+    same time is not captured along with it.
+    """
+    _acquire_output_router()
+    previous = getattr(_local, "capture", None)
+    _local.capture = buffer
+    try:
+        yield buffer
+    finally:
+        _local.capture = previous
+        _release_output_router()
+
+
+# =============================================================================
+# JOB MANAGER
+# =============================================================================
+
+
+class JobManager:
+    """
+    Runs background jobs on a small thread pool and keeps their history.
+
+    Args:
+        max_workers: Jobs running at once; further jobs queue
+    """
+
+    def __init__(self, max_workers: int = JOBS_MAX_CONCURRENT):
+        self.max_workers = max(1, max_workers)
+        self._jobs: "OrderedDict[int, Job]" = OrderedDict()
+        self._next_id = 1
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._listeners: List[Callable[[Job], None]] = []
+        self._notifications: Deque[Job] = deque(maxlen=JOBS_HISTORY)
+        self._lock = threading.Lock()
+
+    def submit(self, command: str, fn: Callable[[], Any]) -> Job:
+        """
+        Queue fn as a background job.
+
+        Args:
+            command: Command line shown in listings and notifications
+            fn: Work to run; it may poll current_job().cancel_requested
+
+        Returns:
+            The queued Job
+        """
+        from src.core.context import get_context
+
+        _acquire_output_router()
+        with self._lock:
+            job = Job(self._next_id, command, space=get_context().current_space)
+            self._next_id += 1
+            self._jobs[job.id] = job
+            self._prune()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="Job"
+                )
+            executor = self._executor
+        executor.submit(self._run, job, fn)
+        return job
+
+    def _run(self, job: Job, fn: Callable[[], Any]) -> None:
+        try:
+            if job.cancel_requested:
+                job.status = "cancelled"
+            else:
+                job.status = "running"
+                job.started_at = time.time()
+                with bind_job(job):
+                    try:
+                        fn()
+                        job.status = "cancelled" if job.cancel_requested else "done"
+                    except Exception as e:
+                        logger.error(f"Job #{job.id} ({job.command}) failed: {e}")
+                        job.error = str(e)
+                        job.status = "failed"
+        finally:
+            _release_output_router()
+        job.finished_at = time.time()
+        self._notify(job)
+
+    def _notify(self, job: Job) -> None:
+        with self._lock:
+            self._notifications.append(job)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(job)
+            except Exception as e:
+                logger.warning(f"Job listener failed: {e}")
+
+    def _prune(self) -> None:
+        """Forget the oldest finished jobs beyond JOBS_HISTORY."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - JOBS_HISTORY)]:
+            del self._jobs[job_id]
+
+    def jobs(self) -> List[Job]:
+        """All known jobs, oldest first."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def active(self) -> List[Job]:
+        """Jobs queued or running."""
+        return [job for job in self.jobs() if not job.finished]
+
+    def get(self, job_id: int) -> Optional[Job]:
+        """Look up a job by id."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Request cancellation of a queued or running job.
+
+        Returns:
+            False if the job is unknown or already finished
+        """
+        job = self.get(job_id)
+        if job is None or job.finished:
+            return False
+        job._cancel.set()
+        return True
+
+    def add_listener(self, listener: Callable[[Job], None]) -> None:
+        """Call listener (on the job's thread) whenever a job finishes."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Job], None]) -> None:
+        """Stop calling a listener added with add_listener()."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def pop_notifications(self) -> List[Job]:
+        """Jobs finished since the last call."""
+        with self._lock:
+            finished = list(self._notifications)
+            self._notifications.clear()
+        return finished
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel every unfinished job and stop the worker threads."""
+        for job in self.active():
+            job._cancel.set()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Module-level singleton
+_job_manager: Optional[JobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    Get the global JobManager singleton.
+
+    Returns:
+        JobManager: The shared job manager
+    """
+    global _job_manager
+    with _manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager()
+        return _job_manager
+
+
+__all__ = [
+    "JOB_STATES",
+    "Job",
+    "JobManager",
+    "bind_job",
+    "capture_output",
+    "current_job",
+    "get_job_manager",
+    "propagate_job",
+]
@@ -0,0 +1,496 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Near-duplicate chunk detection with MinHash signatures and LSH.
+
+Boilerplate such as license headers, generated banners and vendored copies
+repeats across many files of a tree. Embedding every copy wastes embedding
+calls and storage and crowds out useful hits in top-k retrieval, so chunks
+that nearly duplicate an already stored chunk of another source are not
+stored again.
+
+- A chunk's word shingles (NEAR_DUP_SHINGLE_SIZE words, case- and
+  punctuation-insensitive, so ``#`` and ``//`` comment markers do not
+  matter) are reduced to a MinHash signature of NEAR_DUP_NUM_PERM values.
+- Signatures are split into NEAR_DUP_BANDS bands (locality-sensitive
+  hashing); chunks sharing a band are candidates, and a candidate is a
+  duplicate if the estimated Jaccard similarity reaches NEAR_DUP_THRESHOLD.
+- Signatures of stored chunks are persisted per space in the
+  ``chunk_signatures`` SQLite table (schema v4) and loaded lazily into an
+  in-memory index. Without a database the index lives for the process.
+- Suppressed chunks are recorded with their canonical chunk (table
+  ``suppressed_chunks``, schema v9). When a canonical chunk is removed,
+  remove() hands its suppressed copies back so they can be stored instead.
+
+Usage:
+    index = get_near_duplicate_index("default")
+    signature = minhash_signature(text)
+    canonical_id = index.find(signature, exclude_source="b.py")
+"""
+
+import hashlib
+import json
+import logging
+import re
+import struct
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.constants import (
+    NEAR_DUP_BANDS,
+    NEAR_DUP_MIN_WORDS,
+    NEAR_DUP_NUM_PERM,
+    NEAR_DUP_SHINGLE_SIZE,
+    NEAR_DUP_THRESHOLD,
+)
+from src.core.context import get_context
+
+logger = logging.getLogger(__name__)
+
+Signature = Tuple[int, ...]
+
+_WORD_RE = re.compile(r"\w+")
+_MASK_64 = (1 << 64) - 1
+_ROTATION = 1 << 58  # Offset separating borrowed values from a bin's own
+
+
+def _shingle_hashes(text: str) -> Set[int]:
+    """64-bit hashes of the text's word shingles (empty if too short)."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < NEAR_DUP_MIN_WORDS:
+        return set()
+    shingles = zip(*(words[i:] for i in range(NEAR_DUP_SHINGLE_SIZE)))
+    return {
+        int.from_bytes(
+            hashlib.blake2b(" ".join(shingle).encode(), digest_size=8).digest(),
+            "little",
+        )
+        for shingle in shingles
+    }
+
+
+def minhash_signature(text: str) -> Optional[Signature]:
+    """
+    Compute the MinHash signature of a chunk.
+
+    Uses one-permutation hashing: each shingle hash is assigned to one of
+    NEAR_DUP_NUM_PERM bins, which keep their minimum, so a signature costs
+    a single pass over the shingles. Empty bins borrow from the next
+    non-empty bin (rotation densification).
+
+    Returns:
+        Tuple of NEAR_DUP_NUM_PERM integers, or None for chunks shorter
+        than NEAR_DUP_MIN_WORDS words (too short to judge)
+    """
+    hashes = _shingle_hashes(text)
+    if not hashes:
+        return None
+
+    bins: List[Optional[int]] = [None] * NEAR_DUP_NUM_PERM
+    for value in hashes:
+        index, rank = value % NEAR_DUP_NUM_PERM, value // NEAR_DUP_NUM_PERM
+        current = bins[index]
+        if current is None or rank < current:
+            bins[index] = rank
+
+    signature = []
+    for i in range(NEAR_DUP_NUM_PERM):
+        offset = 0
+        filled = bins[i]
+        while filled is None:
+            offset += 1
+            filled = bins[(i + offset) % NEAR_DUP_NUM_PERM]
+        signature.append(filled + offset * _ROTATION)
+    return tuple(signature)
+
+
+def estimate_similarity(a: Signature, b: Signature) -> float:
+    """Estimated Jaccard similarity of two chunks from their signatures."""
+    if not a or len(a) != len(b):
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def pack_signature(signature: Signature) -> bytes:
+    """Serialize a signature for storage."""
+    return struct.pack(f"<{len(signature)}Q", *(v & _MASK_64 for v in signature))
+
+
+def unpack_signature(blob: bytes) -> Signature:
+    """Inverse of pack_signature()."""
+    return struct.unpack(f"<{len(blob) // 8}Q", blob)
+
+
+@dataclass
+class SuppressedChunk:
+    """A chunk that was not stored because it nearly duplicates another."""
+
+    chunk_id: str
+    source: str
+    canonical_id: str
+    text: str
+    metadata: Dict[str, Any]
+
+
+class NearDuplicateIndex:
+    """
+    LSH index of chunk signatures.
+
+    Args:
+        space: Space whose signatures are persisted; None keeps the index
+            in memory only (e.g. for the chunks of a single sync)
+    """
+
+    def __init__(self, space: Optional[str] = None):
+        self.space = space
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[str, Signature]] = {}
+        # Reserved while their sync is planned, not yet stored or persisted
+        self._reserved: Set[str] = set()
+        self._suppressed: Dict[str, SuppressedChunk] = {}
+        self._buckets: List[Dict[Signature, Set[str]]] = [
+            {} for _ in range(NEAR_DUP_BANDS)
+        ]
+        self._rows = NEAR_DUP_NUM_PERM // NEAR_DUP_BANDS
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _bands(self, signature: Signature) -> Iterable[Tuple[int, Signature]]:
+        for band in range(NEAR_DUP_BANDS):
+            start, end = band * self._rows, (band + 1) * self._rows
+            yield band, signature[start:end]
+
+    def find(
+        self,
+        signature: Signature,
+        exclude_source: Optional[str] = None,
+        exclude_ids: Iterable[str] = (),
+    ) -> Optional[str]:
+        """
+        Return the ID of the most similar indexed chunk above the threshold.
+
+        Args:
+            signature: Signature of the chunk being checked
+            exclude_source: Chunks of this source are ignored (a file's own
+                repeated blocks are not duplicates of each other)
+            exclude_ids: Chunk IDs to ignore (e.g. about to be deleted)
+        """
+        excluded = set(exclude_ids)
+        best_id, best_score = None, NEAR_DUP_THRESHOLD
+        with self._lock:
+            candidates: Set[str] = set()
+            for band, key in self._bands(signature):
+                candidates |= self._buckets[band].get(key, set())
+            for candidate in candidates - excluded:
+                source, other = self._entries[candidate]
+                if exclude_source is not None and source == exclude_source:
+                    continue
+                score = estimate_similarity(signature, other)
+                if score >= best_score:
+                    best_id, best_score = candidate, score
+        return best_id
+
+    def add(self, entries: Iterable[Tuple[str, str, Signature]]) -> None:
+        """Index (chunk_id, source, signature) entries and persist them."""
+        entries = list(entries)
+        if not entries:
+            return
+        with self._lock:
+            self._index(entries)
+            self._reserved.difference_update(chunk_id for chunk_id, _, _ in entries)
+        self._persist(entries)
+
+    def reserve(self, entries: Iterable[Tuple[str, str, Signature]]) -> None:
+        """
+        Index chunks that are about to be stored, without persisting them.
+
+        Concurrent syncs planned afterwards see them as canonical copies;
+        add() confirms them once stored, release() drops them otherwise.
+        """
+        entries = list(entries)
+        with self._lock:
+            self._index(entries)
+            self._reserved.update(chunk_id for chunk_id, _, _ in entries)
+
+    def release(self, chunk_ids: Iterable[str]) -> None:
+        """Drop reservations whose chunks were not stored."""
+        with self._lock:
+            for chunk_id in chunk_ids:
+                if chunk_id in self._reserved:
+                    self._reserved.discard(chunk_id)
+                    self._discard(chunk_id)
+
+    def is_reserved(self, chunk_id: str) -> bool:
+        """Whether a chunk is reserved but not stored yet."""
+        with self._lock:
+            return chunk_id in self._reserved
+
+    def _index(self, entries: List[Tuple[str, str, Signature]]) -> None:
+        for chunk_id, source, signature in entries:
+            self._discard(chunk_id)
+            self._entries[chunk_id] = (source, signature)
+            for band, key in self._bands(signature):
+                self._buckets[band].setdefault(key, set()).add(chunk_id)
+
+    def remove(self, chunk_ids: Iterable[str]) -> List[SuppressedChunk]:
+        """
+        Drop chunks from the index (and from the database).
+
+        Suppressed copies recorded under the given IDs are dropped as well.
+
+        Returns:
+            Suppressed copies of the removed chunks, which no longer have a
+            stored canonical chunk and should be stored themselves
+        """
+        removed = set(chunk_ids)
+        with self._lock:
+            indexed = [i for i in removed if i in self._entries]
+            for chunk_id in indexed:
+                self._discard(chunk_id)
+                self._reserved.discard(chunk_id)
+            orphans = [
+                chunk
+                for chunk in self._suppressed.values()
+                if chunk.canonical_id in removed
+            ]
+            dropped = [i for i in removed if i in self._suppressed]
+            dropped.extend(chunk.chunk_id for chunk in orphans)
+            for chunk_id in dropped:
+                self._suppressed.pop(chunk_id, None)
+        if indexed:
+            self._unpersist(indexed)
+        if dropped:
+            self._unpersist_suppressed(dropped)
+        return orphans
+
+    def suppress(
+        self, chunks: Iterable[SuppressedChunk], sources: Iterable[str] = ()
+    ) -> None:
+        """
+        Record suppressed chunks.
+
+        Args:
+            chunks: Chunks that were not stored
+            sources: Sources that were synced in full; their earlier records
+                are replaced by chunks
+        """
+        chunks = list(chunks)
+        sources = set(sources)
+        with self._lock:
+            stale = [
+                chunk.chunk_id
+                for chunk in self._suppressed.values()
+                if chunk.source in sources
+            ]
+            for chunk_id in stale:
+                del self._suppressed[chunk_id]
+            for chunk in chunks:
+                self._suppressed[chunk.chunk_id] = chunk
+        if stale:
+            self._unpersist_suppressed(stale)
+        if chunks:
+            self._persist_suppressed(chunks)
+
+    def suppressed(self) -> List[SuppressedChunk]:
+        """Recorded suppressed chunks."""
+        with self._lock:
+            return list(self._suppressed.values())
+
+    def _discard(self, chunk_id: str) -> None:
+        entry = self._entries.pop(chunk_id, None)
+        if entry is None:
+            return
+        for band, key in self._bands(entry[1]):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(chunk_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def load(self) -> None:
+        """Load the space's persisted signatures (no-op without a database)."""
+        ctx = get_context()
+        if self.space is None or not ctx.db_conn or not ctx.db_lock:
+            return
+        try:
+            with ctx.db_lock:
+                cursor = ctx.db_conn.cursor()
+                cursor.execute(
+                    "SELECT chunk_id, source, signature FROM chunk_signatures WHERE space = ?",
+                    (self.space,),
+                )
+                rows = cursor.fetchall()
+                cursor.execute(
+                    """
+                    SELECT chunk_id, source, canonical_id, content, metadata
+                    FROM suppressed_chunks WHERE space = ?
+                    """,
+                    (self.space,),
+                )
+                suppressed_rows = cursor.fetchall()
+        except Exception as e:
+            logger.warning(f"Failed to load chunk signatures for {self.space}: {e}")
+            return
+
+        with self._lock:
+            for chunk_id, source, blob in rows:
+                signature = unpack_signature(blob)
+                if len(signature) != NEAR_DUP_NUM_PERM:
+                    continue  # Stored with different settings
+                self._entries[chunk_id] = (source, signature)
+                for band, key in self._bands(signature):
+                    self._buckets[band].setdefault(key, set()).add(chunk_id)
+            for chunk_id, source, canonical_id, content, metadata in suppressed_rows:
+                self._suppressed[chunk_id] = SuppressedChunk(
+                    chunk_id, source, canonical_id, content, json.loads(metadata)
+                )
+
+    def _persist(self, entries: List[Tuple[str, str, Signature]]) -> None:
+        ctx = get_context()
+        if self.space is None or not ctx.db_conn or not ctx.db_lock:
+            return
+        try:
+            with ctx.db_lock:
+                ctx.db_conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO chunk_signatures (space, chunk_id, source, signature)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    [
+                        (self.space, i, source, pack_signature(sig))
+                        for i, source, sig in entries
+                    ],
+                )
+                ctx.db_conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist {len(entries)} chunk signatures: {e}")
+
+    def _unpersist(self, chunk_ids: List[str]) -> None:
+        ctx = get_context()
+        if self.space is None or not ctx.db_conn or not ctx.db_lock:
+            return
+        try:
+            with ctx.db_lock:
+                ctx.db_conn.executemany(
+                    "DELETE FROM chunk_signatures WHERE space = ? AND chunk_id = ?",
+                    [(self.space, chunk_id) for chunk_id in chunk_ids],
+                )
+                ctx.db_conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to delete {len(chunk_ids)} chunk signatures: {e}")
+
+    def _persist_suppressed(self, chunks: List[SuppressedChunk]) -> None:
+        ctx = get_context()
+        if self.space is None or not ctx.db_conn or not ctx.db_lock:
+            return
+        try:
+            with ctx.db_lock:
+                ctx.db_conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO suppressed_chunks
+                        (space, chunk_id, source, canonical_id, content, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            self.space,
+                            chunk.chunk_id,
+                            chunk.source,
+                            chunk.canonical_id,
+                            chunk.text,
+                            json.dumps(chunk.metadata),
+                        )
+                        for chunk in chunks
+                    ],
+                )
+                ctx.db_conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist {len(chunks)} suppressed chunks: {e}")
+
+    def _unpersist_suppressed(self, chunk_ids: List[str]) -> None:
+        ctx = get_context()
+        if self.space is None or not ctx.db_conn or not ctx.db_lock:
+            return
+        try:
+            with ctx.db_lock:
+                ctx.db_conn.executemany(
+                    "DELETE FROM suppressed_chunks WHERE space = ? AND chunk_id = ?",
+                    [(self.space, chunk_id) for chunk_id in chunk_ids],
+                )
+                ctx.db_conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to delete {len(chunk_ids)} suppressed chunks: {e}")
+
+
+_indexes_lock = threading.Lock()
+
+
+def get_near_duplicate_index(space: str) -> NearDuplicateIndex:
+    """Get the space's signature index, loading it on first use."""
+    ctx = get_context()
+    with _indexes_lock:
+        index = ctx.near_duplicate_indexes.get(space)
+        if index is None:
+            index = NearDuplicateIndex(space)
+            index.load()
+            ctx.near_duplicate_indexes[space] = index
+        return index
+
+
+def forget_space_signatures(space: str) -> None:
+    """Drop every signature of a space (e.g. when the space is deleted)."""
+    ctx = get_context()
+    with _indexes_lock:
+        ctx.near_duplicate_indexes.pop(space, None)
+    if not ctx.db_conn or not ctx.db_lock:
+        return
+    try:
+        with ctx.db_lock:
+            ctx.db_conn.execute(
+                "DELETE FROM chunk_signatures WHERE space = ?", (space,)
+            )
+            ctx.db_conn.execute(
+                "DELETE FROM suppressed_chunks WHERE space = ?", (space,)
+            )
+            ctx.db_conn.commit()
+    except Exception as e:
+        logger.warning(f"Failed to delete chunk signatures of {space}: {e}")
+
+
+__all__ = [
+    "NearDuplicateIndex",
+    "Signature",
+    "SuppressedChunk",
+    "estimate_similarity",
+    "forget_space_signatures",
+    "get_near_duplicate_index",
+    "minhash_signature",
+    "pack_signature",
+    "unpack_signature",
+]
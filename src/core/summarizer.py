@@ -0,0 +1,237 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Rolling summary of conversation turns trimmed from history.
+
+trim_history drops the oldest exchanges to keep each request within the
+token budget. Instead of losing them, the ChatLoop hands them to the
+ConversationSummarizer, which folds them into a running summary on a
+background thread (off the critical path: the next request never waits for
+it). The summary is stored in SQLite (conversation_summary table), kept on
+ApplicationContext.conversation_summary and appended to the system prompt
+of every request (see with_summary).
+
+Summaries are only made when SUMMARY_MODEL names the model to use,
+ideally a small one loaded next to the chat model. Setting it to the chat
+model itself works too, but every update then competes with foreground
+requests for the same model (LM Studio serves them one at a time).
+
+Usage:
+    from src.core.summarizer import get_summarizer
+
+    get_summarizer().submit(evicted_messages)
+    get_summarizer().reset()  # /clear
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional, Sequence
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+
+from src.core.config import get_config
+from src.core.constants import (
+    SUMMARY_MAX_WORDS,
+    SUMMARY_MESSAGE_CHARS,
+    SUMMARY_PROMPT,
+)
+from src.core.context import get_context
+from src.core.utils import estimate_tokens, truncate_content
+from src.storage.memory import save_summary
+
+logger = logging.getLogger(__name__)
+
+_ROLES = {
+    HumanMessage: "User",
+    AIMessage: "Assistant",
+    ToolMessage: "Tool result",
+    SystemMessage: "System",
+}
+
+
+def format_transcript(messages: Sequence[BaseMessage]) -> str:
+    """
+    Render trimmed messages as a compact transcript for the summary prompt.
+
+    Args:
+        messages: The trimmed messages, oldest first
+
+    Returns:
+        One block per message, each cut to SUMMARY_MESSAGE_CHARS
+    """
+    lines = []
+    for message in messages:
+        role = _ROLES.get(type(message), type(message).__name__)
+        content = (
+            message.content
+            if isinstance(message.content, str)
+            else str(message.content)
+        )
+        if content.strip():
+            lines.append(
+                f"{role}: {truncate_content(content.strip(), SUMMARY_MESSAGE_CHARS)}"
+            )
+        for tool_call in getattr(message, "tool_calls", None) or ():
+            lines.append(
+                f"Assistant called {tool_call.get('name')}({tool_call.get('args', {})})"
+            )
+    return "\n".join(lines)
+
+
+class ConversationSummarizer:
+    """Fold trimmed turns into the rolling summary on a background thread."""
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Bumped by reset(); summaries started before a reset are discarded
+        self._epoch = 0
+        self._llm: Optional[Any] = None
+        self._llm_model: Optional[str] = None
+
+    def submit(self, messages: Sequence[BaseMessage]) -> Optional[Future]:
+        """
+        Queue trimmed messages to be folded into the summary.
+
+        Summaries run one at a time, in submission order, so each update
+        builds on the previous one.
+
+        Args:
+            messages: The messages trimmed from history
+
+        Returns:
+            Optional[Future]: The queued update, or None when disabled or empty
+        """
+        config = get_config()
+        if not messages or not config.rolling_summary or not config.summary_model:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="summary"
+                )
+            return self._executor.submit(self._summarize, list(messages), self._epoch)
+
+    def reset(self) -> None:
+        """Forget the summary (e.g. on /clear), including updates in flight."""
+        with self._lock:
+            self._epoch += 1
+            get_context().conversation_summary = ""
+        save_summary("")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker thread, optionally finishing queued updates."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _get_llm(self) -> Any:
+        """A client for SUMMARY_MODEL; the chat LLM when it names the chat model."""
+        config = get_config()
+        model = config.summary_model
+        if model == config.model_name:
+            return get_context().llm
+        if self._llm is None or self._llm_model != model:
+            from langchain_openai import ChatOpenAI
+            from pydantic import SecretStr
+
+            self._llm = ChatOpenAI(
+                base_url=config.lm_studio_url,
+                api_key=SecretStr(config.lm_studio_key),
+                model=model,
+                temperature=0,
+            )
+            self._llm_model = model
+        return self._llm
+
+    def _summarize(self, messages: List[BaseMessage], epoch: int) -> None:
+        """Update the summary with messages (runs on the worker thread)."""
+        ctx = get_context()
+        start_time = time.time()
+
+        llm = self._get_llm()
+        if llm is None:
+            logger.warning("No LLM available, trimmed turns were not summarized")
+            return
+
+        prompt = [
+            SystemMessage(content=SUMMARY_PROMPT.format(max_words=SUMMARY_MAX_WORDS)),
+            HumanMessage(
+                content=f"Current summary:\n{ctx.conversation_summary or '(none)'}\n\n"
+                f"New turns:\n{format_transcript(messages)}"
+            ),
+        ]
+        try:
+            response = llm.invoke(prompt)
+        except Exception as e:
+            logger.warning(
+                f"Conversation summary failed, keeping the previous one: {e}"
+            )
+            return
+
+        summary = str(response.content).strip()
+        if not summary:
+            return
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            ctx.conversation_summary = summary
+            save_summary(summary)
+        logger.info(
+            f"📝 Summarized {len(messages)} trimmed messages "
+            f"(~{estimate_tokens(summary)} tokens, {time.time() - start_time:.1f}s)"
+        )
+
+
+# Module-level singleton
+_summarizer: Optional[ConversationSummarizer] = None
+_summarizer_lock = threading.Lock()
+
+
+def get_summarizer() -> ConversationSummarizer:
+    """
+    Get the global ConversationSummarizer singleton.
+
+    Returns:
+        ConversationSummarizer: The shared summarizer
+    """
+    global _summarizer
+    with _summarizer_lock:
+        if _summarizer is None:
+            _summarizer = ConversationSummarizer()
+        return _summarizer
+
+
+__all__ = [
+    "ConversationSummarizer",
+    "format_transcript",
+    "get_summarizer",
+]
@@ -47,65 +47,30 @@ This module contains utility functions that don't depend on global state
 and can be safely imported by other modules.
 """
 
-from typing import List, Dict, Any, Optional
-from src.core.constants import CONTENT_CHUNK_SIZE, CONTENT_TRUNCATE_LENGTH
+import math
+from typing import List, Dict, Any, Optional, Sequence
+from src.core.chunking import chunk_document
+from src.core.constants import CHARS_PER_TOKEN, CONTENT_TRUNCATE_LENGTH
 
 
-def chunk_text(content: str) -> List[str]:
+def chunk_text(content: str, file_path: Optional[str] = None) -> List[str]:
     """
     Intelligently split text content into manageable chunks for vector storage.
 
-    Uses intelligent chunking to preserve semantic meaning and code structure.
-    This is crucial for effective retrieval-augmented generation (RAG).
+    Delegates to the structure-aware chunking engine (src/core/chunking.py):
+    Python files split on ast boundaries (statements, functions, classes),
+    markdown on heading sections and everything else on lines. The units are
+    packed into chunks whose boundaries are picked by the content itself, so
+    an edit only changes the chunks around it.
 
     Args:
         content: The text content to be chunked (typically code or documentation)
+        file_path: Optional source path used to pick the chunking strategy
 
     Returns:
-        List of text chunks, each ~1500 characters with overlap for continuity
-    """
-    try:
-        # Try to use LangChain's RecursiveCharacterTextSplitter if available
-        from langchain_text_splitters import RecursiveCharacterTextSplitter
-
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=CONTENT_CHUNK_SIZE,  # Optimal size for context retention
-            chunk_overlap=200,  # Ensures semantic continuity
-            separators=[
-                "\n\n",
-                "\n",
-                " ",
-                "",
-            ],  # Split hierarchy: paragraphs > lines > words > chars
-            keep_separator=True,  # Preserve code formatting
-        )
-
-        return text_splitter.split_text(content)
-    except ImportError:
-        # Fallback to simple chunking if langchain is not available
-        chunk_size = CONTENT_CHUNK_SIZE
-        chunks = []
-
-        # Split by paragraphs first to maintain coherence
-        paragraphs = content.split("\n\n")
-
-        current_chunk = ""
-        for paragraph in paragraphs:
-            # If adding this paragraph would exceed chunk size, save current chunk
-            if len(current_chunk) + len(paragraph) > chunk_size and current_chunk:
-                chunks.append(current_chunk.strip())
-                current_chunk = paragraph
-            else:
-                if current_chunk:
-                    current_chunk += "\n\n" + paragraph
-                else:
-                    current_chunk = paragraph
-
-        # Add the last chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-
-        return chunks
+        List of text chunks of at most ~1500 characters
+    """
+    return [chunk.text for chunk in chunk_document(content, file_path=file_path)]
 
 
 def validate_file_path(file_path: str, current_dir: str) -> bool:
@@ -166,6 +131,39 @@ def truncate_content(content: str, max_length: int = CONTENT_TRUNCATE_LENGTH) ->
     return content[: max_length - 3] + "..."
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate how many tokens a text costs the model.
+
+    Uses the common ~4 characters per token approximation; the local models
+    do not expose their tokenizers, and the figure is only used for reports
+    and budgets.
+
+    Args:
+        text: The text to measure
+
+    Returns:
+        Estimated token count, rounded up
+    """
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Cosine similarity of two embedding vectors.
+
+    Args:
+        a: First vector
+        b: Second vector
+
+    Returns:
+        Similarity in [-1, 1], or 0.0 if either vector is all zeros
+    """
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
 def standard_error(
     message: str, details: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
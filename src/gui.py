@@ -102,6 +102,7 @@ BACKEND_AVAILABLE = False
 
 class AIWorker(QThread):
     response_ready = pyqtSignal(str)
+    token_received = pyqtSignal(str)  # streamed text, emitted as generated
     error_occurred = pyqtSignal(str)
     finished = pyqtSignal()
     confirmation_required = pyqtSignal(str, dict)  # tool_name, args
@@ -142,10 +143,15 @@ class AIWorker(QThread):
                 self.error_occurred.emit("❌ LLM not available.")
                 return
 
-            orchestrator = ChatLoop(confirmation_callback=self.ask_confirmation)
+            orchestrator = ChatLoop(
+                confirmation_callback=self.ask_confirmation,
+                on_token=self.token_received.emit,
+            )
             response_content = orchestrator.run_iteration(self.user_input)
 
-            self.response_ready.emit(response_content)
+            # Streamed answers already reached the display token by token
+            if not orchestrator.last_response_streamed:
+                self.response_ready.emit(response_content)
 
             # MEM0 TEACHING (Background Thread)
             from src.main import user_memory
@@ -220,6 +226,10 @@ class AIAssistantGUI(QMainWindow):
     an intuitive, modern experience for AI-assisted development and research.
     """
 
+    # Background job notifications arrive on job threads; the signal hands
+    # them to the GUI thread
+    job_finished = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
 
@@ -244,6 +254,15 @@ class AIAssistantGUI(QMainWindow):
         self.init_ui()
         self.load_conversation()
 
+        # Long-running commands (/populate, /web, /learn-docs) run as
+        # background jobs; announce them in the chat when they finish
+        from src.core.jobs import get_job_manager
+
+        self.job_finished.connect(self.show_job_notification)
+        get_job_manager().add_listener(
+            lambda job: self.job_finished.emit(job.notification())
+        )
+
         # Load the last used space
         global CURRENT_SPACE
         CURRENT_SPACE = load_current_space()
@@ -896,6 +915,7 @@ class AIAssistantGUI(QMainWindow):
             # Start AI worker thread
             self.worker = AIWorker(message)
             self.worker.response_ready.connect(self.on_response_chunk)
+            self.worker.token_received.connect(self.on_response_chunk)
             self.worker.error_occurred.connect(self.on_error)
             self.worker.finished.connect(self.on_processing_finished)
             self.worker.confirmation_required.connect(self.handle_confirmation)
@@ -940,10 +960,21 @@ class AIAssistantGUI(QMainWindow):
         """Handle incoming response chunk for streaming display."""
         if not hasattr(self, "_current_response"):
             self._current_response = ""
+            self._render_pending = False
             self.chat_display.append("<b>AI Assistant:</b><br>")
 
         self._current_response += chunk
-        # Update the display with the current accumulated response
+        # Re-rendering the whole display per token is quadratic in the answer
+        # length, so coalesce tokens into at most one update per 50ms
+        if not self._render_pending:
+            self._render_pending = True
+            QTimer.singleShot(50, self._render_streaming_response)
+
+    def _render_streaming_response(self):
+        """Show the response accumulated since the last render."""
+        if not hasattr(self, "_current_response"):
+            return
+        self._render_pending = False
         self.update_streaming_response(self._current_response)
 
     def update_streaming_response(self, content):
@@ -990,8 +1021,9 @@ class AIAssistantGUI(QMainWindow):
         self.send_button.setEnabled(True)
         self.status_label.setText("Ready")
 
-        # Clear streaming state
+        # Flush tokens still waiting for a render, then clear streaming state
         if hasattr(self, "_current_response"):
+            self.update_streaming_response(self._current_response)
             delattr(self, "_current_response")
 
         # Refresh conversation display
@@ -1016,10 +1048,14 @@ class AIAssistantGUI(QMainWindow):
 
     def change_space(self, space_name):
         """Change current workspace/space."""
-        from src.vectordb.spaces import switch_space, list_spaces
+        from src.vectordb.spaces import space_change_blocker, switch_space, list_spaces
 
         global CURRENT_SPACE
-        if switch_space(space_name):
+        blocker = space_change_blocker()
+        if blocker:
+            self.status_label.setText(blocker)
+            self.space_combo.setCurrentText(CURRENT_SPACE)
+        elif switch_space(space_name):
             CURRENT_SPACE = space_name
             self.status_label.setText(f"Space: {space_name}")
             # Update the combo box to reflect current spaces
@@ -1100,8 +1136,8 @@ class AIAssistantGUI(QMainWindow):
 
         try:
             import io
-            import sys
             from src.commands.registry import CommandRegistry
+            from src.core.jobs import capture_output
 
             # Parse command: remove leading '/', split into name and args
             cmd_text = command_text.lstrip("/").strip()
@@ -1112,14 +1148,11 @@ class AIAssistantGUI(QMainWindow):
             cmd_name = parts[0]
             cmd_args = parts[1].split() if len(parts) > 1 else []
 
-            # Capture stdout from command handlers
+            # Capture stdout from command handlers (this thread only, so
+            # output of background jobs is not mixed in)
             captured_output = io.StringIO()
-            old_stdout = sys.stdout
-            try:
-                sys.stdout = captured_output
+            with capture_output(captured_output):
                 handled = CommandRegistry.dispatch(cmd_name, cmd_args)
-            finally:
-                sys.stdout = old_stdout
 
             # Get output from command handler
             output = captured_output.getvalue()
@@ -1155,10 +1188,30 @@ class AIAssistantGUI(QMainWindow):
         cursor.movePosition(QTextCursor.MoveOperation.End)
         self.chat_display.setTextCursor(cursor)
 
+    def show_job_notification(self, message):
+        """Show a finished background job in the chat."""
+        message_html = (
+            message.replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace("\n", "<br>")
+        )
+        self.chat_display.append(f"<b>AI Assistant:</b><br>{message_html}<br>")
+        cursor = self.chat_display.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        self.chat_display.setTextCursor(cursor)
+
     def closeEvent(self, a0):
         """Handle application close."""
+        from src.core.jobs import get_job_manager
+        from src.core.summarizer import get_summarizer
         from src.storage.memory import save_memory
 
+        # Cancelled jobs finish the units in flight and keep their checkpoints
+        get_job_manager().shutdown(wait=True)
+        # Let a pending summary update land before the process exits
+        get_summarizer().shutdown(wait=True)
+
         try:
             if BACKEND_AVAILABLE:
                 save_memory(conversation_history)
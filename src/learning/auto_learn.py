@@ -28,17 +28,34 @@ handles all aspects of processing markdown content into the knowledge base.
 """
 
 import logging
+from functools import partial
 from pathlib import Path
 import threading
 import time
-from typing import Dict, List, Optional, Callable
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 import os
 import re
 
-from src.core.context_utils import add_to_knowledge_base
+from langchain_core.documents import Document
+
+from src.core.chunking import chunk_document, chunk_id
+from src.core.context import get_context
+from src.core.context_utils import (
+    delete_chunks_from_knowledge_base,
+    sync_documents_to_knowledge_base,
+)
 from src.learning.config import get_auto_learn_config
 from src.learning.file_discovery import discover_markdown_files
 from src.learning.content_hash import compute_content_hash
+from src.learning.ledger import (
+    LedgerEntry,
+    forget_learned_file,
+    get_ledger_entry,
+    load_ledger,
+    record_learned_file,
+    touch_learned_file,
+)
+from src.learning.pipeline import IngestPipeline, IngestUnit
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -61,6 +78,7 @@ class AutoLearnManager:
         self._processed_hashes: set = set()  # Track processed hashes for deduplication
         self._error_count = 0
         self._success_count = 0
+        self._unchanged_count = 0
 
     def initialize_auto_learning(
         self, progress_callback: Optional[Callable[[str], None]] = None
@@ -85,6 +103,7 @@ class AutoLearnManager:
         self._progress_callback = progress_callback
         self._error_count = 0
         self._success_count = 0
+        self._unchanged_count = 0
         self._processed_hashes.clear()
 
         # Start background thread
@@ -104,9 +123,10 @@ class AutoLearnManager:
 
         This method runs in a separate thread and handles the complete workflow:
         1. Discover markdown files
-        2. Process each file
-        3. Check deduplication
-        4. Store in knowledge base
+        2. Skip files whose mtime/size match the learned file ledger
+        3. Read, chunk, embed and store new or changed files through the
+           staged ingestion pipeline
+        4. Remove chunks of learned files that no longer exist
         5. Handle errors gracefully
         """
         try:
@@ -114,12 +134,15 @@ class AutoLearnManager:
 
             # Start from current working directory
             start_dir = os.getcwd()
+            space = get_context().current_space
+            ledger = load_ledger(space)
             markdown_files = discover_markdown_files(
                 start_dir, max_size_mb=self._config.auto_learn_max_file_size_mb
             )
 
             if not markdown_files:
                 self._log_progress("📝 No markdown files found for auto-learning")
+                self._remove_deleted_files(space, start_dir, ledger.values())
                 self._running = False
                 return
 
@@ -127,29 +150,27 @@ class AutoLearnManager:
                 f"📚 Found {len(markdown_files)} markdown files to process"
             )
 
-            # Process each file
-            for file_path in markdown_files:
-                if not self._running:
-                    self._log_progress("⏹️  Auto-learning stopped")
-                    break
+            # The ledger already makes restarts incremental, so no checkpoints
+            pipeline = IngestPipeline(
+                "auto-learn",
+                self._markdown_units(markdown_files, ledger),
+                read=self._read_markdown_unit,
+                chunk=self._chunk_markdown_unit,
+                on_chunked=self._claim_unit_hash,
+                on_unit_done=partial(self._on_markdown_unit_done, space),
+            )
+            metrics = pipeline.run()
+            logger.debug(f"Auto-learn pipeline: {metrics.summary()}")
 
-                try:
-                    result = self.process_markdown_file(file_path)
-                    if result:
-                        self._success_count += 1
-                    else:
-                        self._error_count += 1
-
-                except Exception as e:
-                    self._error_count += 1
-                    self._log_progress(f"❌ Error processing {file_path}: {str(e)}")
-                    logger.error(
-                        f"Error processing file {file_path}: {e}", exc_info=True
-                    )
+            if self._running:
+                self._remove_deleted_files(space, start_dir, ledger.values())
+            else:
+                self._log_progress("⏹️  Auto-learning stopped")
 
             # Log summary
             self._log_progress(
-                f"✅ Auto-learning completed: {self._success_count} success, {self._error_count} errors"
+                f"✅ Auto-learning completed: {self._success_count} success, "
+                f"{self._unchanged_count} unchanged, {self._error_count} errors"
             )
 
         except Exception as e:
@@ -160,19 +181,105 @@ class AutoLearnManager:
             self._running = False
             self._thread = None
 
-    def process_markdown_file(self, file_path: Path) -> Dict:
+    def _markdown_units(
+        self, markdown_files: List[Path], ledger: Dict[str, LedgerEntry]
+    ) -> Iterator[IngestUnit]:
         """
-        Process a single markdown file for auto-learning.
+        Yield pipeline units for files that may have changed.
+
+        Files whose mtime/size match their ledger entry cost only a stat.
+        Every file seen is popped from the ledger, so the entries left over
+        afterwards belong to files that no longer exist.
+        """
+        for file_path in markdown_files:
+            if not self._running:
+                return
+
+            entry = ledger.pop(str(file_path), None)
+            if entry is not None:
+                try:
+                    stat = file_path.stat()
+                    if entry.matches_stat(stat.st_mtime, stat.st_size):
+                        self._unchanged_count += 1
+                        continue
+                except OSError:
+                    pass
+
+            yield IngestUnit(key=str(file_path), data=entry)
+
+    def _read_markdown_unit(self, unit: IngestUnit) -> IngestUnit:
+        """Pipeline read stage: load a file, skipping unchanged or duplicate ones."""
+        result = self.read_markdown_file(Path(unit.key), ledger_entry=unit.data)
+        if result["status"] != "ready":
+            unit.status = result["reason"]
+        unit.data = result
+        return unit
+
+    def _chunk_markdown_unit(self, unit: IngestUnit) -> IngestUnit:
+        """Pipeline chunk stage: split the file along its headings."""
+        unit.documents = self.build_chunk_documents(
+            unit.data["content"], unit.data["metadata"]
+        )
+        return unit
+
+    def _claim_unit_hash(self, unit: IngestUnit) -> bool:
+        """Drop a file whose content another file of this run already holds."""
+        content_hash = unit.data["content_hash"]
+        if self.check_deduplication(content_hash):
+            self._log_progress(f"🔄 Skipping duplicate: {unit.key}")
+            return False
+        self._processed_hashes.add(content_hash)
+        return True
+
+    def _on_markdown_unit_done(self, space: str, unit: IngestUnit) -> None:
+        """Record a file leaving the pipeline in the ledger and the counters."""
+        if unit.status in ("ok", "empty"):
+            self._record_learned(space, Path(unit.key), unit.data, unit.documents)
+            self._success_count += 1
+        elif unit.status == "unchanged":
+            self._unchanged_count += 1
+        elif unit.status == "error":
+            self._error_count += 1
+            if isinstance(unit.data, dict):
+                self._processed_hashes.discard(unit.data.get("content_hash"))
+            self._log_progress(f"❌ Error processing {unit.key}: {unit.error}")
+
+    def _remove_deleted_files(
+        self, space: str, start_dir: str, entries: Iterable[LedgerEntry]
+    ) -> None:
+        """
+        Drop learned files under start_dir that no longer exist.
 
         Args:
-            file_path: Path to the markdown file to process
+            space: Space the ledger entries belong to
+            start_dir: Directory auto-learning ran from
+            entries: Ledger entries that were not seen during discovery
+        """
+        root = os.path.join(os.path.abspath(start_dir), "")
+        for entry in entries:
+            if not entry.path.startswith(root) or os.path.exists(entry.path):
+                continue
+            if delete_chunks_from_knowledge_base(entry.chunk_ids):
+                forget_learned_file(space, entry.path)
+                self._log_progress(f"🗑️  Forgot deleted file: {entry.path}")
+
+    def read_markdown_file(
+        self, file_path: Path, ledger_entry: Optional[LedgerEntry] = None
+    ) -> Dict:
+        """
+        Read a markdown file and decide whether it needs (re-)learning.
+
+        Args:
+            file_path: Path to the markdown file
+            ledger_entry: Ledger entry of the file (looked up when omitted)
 
         Returns:
-            Dictionary with processing results including metadata and status
+            Result dictionary: status "ready" with content, content_hash and
+            chunk metadata, or status "skipped" with a reason
 
         Raises:
             IOError: If file cannot be read
-            ValueError: If content is invalid
+            ValueError: If the path is not a file
         """
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
@@ -180,6 +287,11 @@ class AutoLearnManager:
         if not file_path.is_file():
             raise ValueError(f"Path is not a file: {file_path}")
 
+        space = get_context().current_space
+        if ledger_entry is None:
+            ledger_entry = get_ledger_entry(space, str(file_path))
+        stat = file_path.stat()
+
         # Read file content
         try:
             with open(file_path, "r", encoding="utf-8") as f:
@@ -211,6 +323,15 @@ class AutoLearnManager:
                 "reason": "hash_computation_failed",
             }
 
+        # Content unchanged since it was learned (only the mtime moved)
+        if ledger_entry is not None and ledger_entry.content_hash == content_hash:
+            touch_learned_file(space, str(file_path), stat.st_mtime, stat.st_size)
+            return {
+                "file_path": str(file_path),
+                "status": "skipped",
+                "reason": "unchanged",
+            }
+
         # Check if already processed (deduplication)
         if self.check_deduplication(content_hash):
             self._log_progress(f"🔄 Skipping duplicate: {file_path}")
@@ -220,30 +341,69 @@ class AutoLearnManager:
                 "reason": "duplicate_content",
             }
 
-        # Extract insights from markdown content
-        insights = self.extract_insights(content)
-
-        # Prepare metadata
-        metadata = {
-            "source": str(file_path),
-            "type": "markdown",
-            "auto_learned": True,
+        return {
+            "file_path": str(file_path),
+            "status": "ready",
+            "content": content,
             "content_hash": content_hash,
-            "file_size": os.path.getsize(file_path),
-            "modification_time": os.path.getmtime(file_path),
-            "insights": insights,
+            # Metadata shared by every chunk of the file
+            "metadata": {
+                "source": str(file_path),
+                "type": "markdown",
+                "auto_learned": True,
+                "content_hash": content_hash,
+                "file_size": stat.st_size,
+                "modification_time": stat.st_mtime,
+            },
         }
 
-        # Store in knowledge base
-        storage_success = self.store_in_knowledge_base(content, metadata)
+    def process_markdown_file(
+        self, file_path: Path, ledger_entry: Optional[LedgerEntry] = None
+    ) -> Dict:
+        """
+        Process a single markdown file for auto-learning.
+
+        Files whose full content hash matches their ledger entry are skipped;
+        changed files replace the chunks previously stored for them.
+
+        Args:
+            file_path: Path to the markdown file to process
+            ledger_entry: Ledger entry of the file (looked up when omitted)
+
+        Returns:
+            Dictionary with processing results including metadata and status
+
+        Raises:
+            IOError: If file cannot be read
+            ValueError: If content is invalid
+        """
+        read = self.read_markdown_file(file_path, ledger_entry=ledger_entry)
+        if read["status"] != "ready":
+            return read
+
+        content = read["content"]
+        content_hash = read["content_hash"]
+        metadata = read["metadata"]
+
+        # Extract insights from markdown content (reported, not stored)
+        insights = self.extract_insights(content)
+
+        # Split along headings and store the chunks in knowledge base
+        documents = self.build_chunk_documents(content, metadata)
+        storage_success = self.store_in_knowledge_base(
+            content, metadata, documents=documents
+        )
 
         if storage_success:
             self._processed_hashes.add(content_hash)
-            self._log_progress(f"📚 Learned from: {file_path}")
+            self._record_learned(
+                get_context().current_space, file_path, read, documents, notepad=False
+            )
             return {
                 "file_path": str(file_path),
                 "status": "success",
                 "content_hash": content_hash,
+                "chunks": len(documents),
                 "insights": insights,
             }
         else:
@@ -254,6 +414,33 @@ class AutoLearnManager:
                 "reason": "storage_failed",
             }
 
+    def _record_learned(
+        self,
+        space: str,
+        file_path: Path,
+        read: Dict,
+        documents: List[Document],
+        notepad: bool = True,
+    ) -> None:
+        """Record a stored file in the ledger (and the notepad)."""
+        metadata = read["metadata"]
+        record_learned_file(
+            space,
+            LedgerEntry(
+                path=str(file_path),
+                mtime=metadata["modification_time"],
+                size=metadata["file_size"],
+                content_hash=read["content_hash"],
+                chunk_ids=[
+                    chunk_id(str(file_path), doc.metadata["chunk_hash"])
+                    for doc in documents
+                ],
+            ),
+        )
+        if notepad:
+            self._append_to_notepad(str(file_path), read["content_hash"])
+        self._log_progress(f"📚 Learned from: {file_path}")
+
     def check_deduplication(self, content_hash: str) -> bool:
         """
         Check if content with this hash has already been processed.
@@ -266,24 +453,63 @@ class AutoLearnManager:
         """
         return content_hash in self._processed_hashes
 
-    def store_in_knowledge_base(self, content: str, metadata: Dict) -> bool:
+    def build_chunk_documents(self, content: str, metadata: Dict) -> List[Document]:
         """
-        Store content in the knowledge base using the existing add_to_knowledge_base function.
+        Split markdown content into section chunks ready for ingestion.
+
+        Uses the same structure-aware chunker as /populate, so every chunk
+        carries its heading path ("section") and line range.
+
+        Args:
+            content: Markdown content to split
+            metadata: Metadata shared by all chunks (must include "source")
+
+        Returns:
+            One Document per chunk
+        """
+        source = metadata.get("source", "unknown")
+        chunks = chunk_document(content, file_path=source, language="markdown")
+        return [
+            Document(
+                page_content=chunk.text,
+                metadata={
+                    **metadata,
+                    "chunk_index": i,
+                    "total_chunks": len(chunks),
+                    **chunk.to_metadata(),
+                },
+            )
+            for i, chunk in enumerate(chunks)
+        ]
+
+    def store_in_knowledge_base(
+        self,
+        content: str,
+        metadata: Dict,
+        documents: Optional[List[Document]] = None,
+    ) -> bool:
+        """
+        Store content in the knowledge base, replacing chunks previously stored for its source.
 
         Args:
             content: Text content to store
             metadata: Metadata dictionary with source information
+            documents: Pre-built chunk documents (chunked from content when omitted)
 
         Returns:
             True if storage successful, False otherwise
         """
         try:
-            # Ensure we're using the agents_knowledge collection
-            # The add_to_knowledge_base function will handle the actual storage
-            # based on the current space and collection configuration
-            success = add_to_knowledge_base(content, metadata)
+            if documents is None:
+                documents = self.build_chunk_documents(content, metadata)
+
+            # Syncing by source replaces the previous version of a changed file
+            # instead of adding a duplicate next to it; only new chunks are
+            # embedded, in bounded batches
+            source = metadata.get("source", "unknown")
+            result = sync_documents_to_knowledge_base(documents, sources=[source])
 
-            if not success:
+            if not (result.added or result.unchanged):
                 logger.warning(
                     f"Failed to store content in knowledge base: {metadata.get('source', 'unknown')}"
                 )
@@ -424,6 +650,7 @@ class AutoLearnManager:
         """
         return {
             "success_count": self._success_count,
+            "unchanged_count": self._unchanged_count,
             "error_count": self._error_count,
             "processed_files": len(self._processed_hashes),
             "running": self._running,
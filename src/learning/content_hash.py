@@ -52,39 +52,45 @@ from pathlib import Path
 from typing import Optional
 
 
-def compute_content_hash(file_path: Path, sample_size: int = 1024) -> Optional[str]:
+HASH_BLOCK_SIZE = 1024 * 1024  # Bytes read per block when streaming a file
+
+
+def compute_content_hash(
+    file_path: Path, sample_size: Optional[int] = None
+) -> Optional[str]:
     """
     Compute a content-based hash for file deduplication.
 
-    This function hashes the first N bytes of a file combined with its file size
-    to create a robust fingerprint for deduplication purposes. The hash is
-    truncated to 16 characters for storage efficiency while maintaining good
-    collision resistance.
+    The file is streamed through SHA-256 in fixed-size blocks, so every byte
+    contributes to the fingerprint (an edit anywhere in the file changes the
+    hash) while memory use stays constant. The file size is mixed in as well.
+    The hash is truncated to 16 characters for storage efficiency while
+    maintaining good collision resistance.
 
     Args:
         file_path: Path to the file to hash
-        sample_size: Number of bytes to read from the beginning of the file (default: 1024)
+        sample_size: Only hash the first N bytes (default: None, the whole file)
 
     Returns:
         Truncated SHA-256 hash (16 characters) as a string, or None if file cannot be read
-
-    Raises:
-        FileNotFoundError: If the file does not exist
-        IOError: If there are permission issues or other file access problems
     """
     try:
         # Get file size for inclusion in hash
         file_size = file_path.stat().st_size
 
-        # Read first sample_size bytes from the file
-        with open(file_path, "rb") as file:
-            file_content = file.read(sample_size)
-
         # Create SHA-256 hash object
         sha256_hash = hashlib.sha256()
 
-        # Update hash with file content and size
-        sha256_hash.update(file_content)
+        # Stream the file (or its first sample_size bytes) block by block
+        remaining = sample_size if sample_size is not None else file_size
+        with open(file_path, "rb") as file:
+            while remaining > 0:
+                block = file.read(min(HASH_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                sha256_hash.update(block)
+                remaining -= len(block)
+
         sha256_hash.update(str(file_size).encode("utf-8"))
 
         # Get full hash and truncate to 16 characters for efficiency
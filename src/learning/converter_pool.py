@@ -0,0 +1,702 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Pool of long-lived Docling converters.
+
+Building a ``DocumentConverter`` loads Docling's layout and OCR pipelines,
+which takes seconds before any parsing starts. The pool keeps converters
+warm in worker processes, each built once when its process starts, so
+``parse_document``, ``/web`` and ``/learn-docs`` only pay for the
+conversion itself, and several documents convert in parallel across cores.
+
+Conversions run in one of four modes:
+
+- fast: read the embedded text layer directly (src.learning.fast_extract)
+- balanced: Docling without OCR and table structure models
+- accurate: Docling's full pipeline
+- auto (default): fast, escalating to accurate only when a document has
+  too little text per page (e.g. scans)
+
+The tier that produced the markdown and the time spent in each tier tried
+are reported on the ConvertedDocument.
+
+Conversions of local files are cached in the ``conversion_cache`` table
+(schema v7), keyed by the file's content hash, the converter version, the
+mode and the page range, so an unchanged document is never converted twice
+by any caller. The markdown is stored zlib-compressed and the cache is kept
+under DOC_CACHE_MAX_BYTES by evicting the least recently used entries.
+
+Usage:
+    pool = get_converter_pool()
+    doc = pool.convert("samples/whitepaper.pdf", mode="auto")
+    print(doc.tier, doc.timings, len(doc.markdown))
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from src.core.constants import (
+    DOC_CACHE_MAX_BYTES,
+    DOC_CACHE_TARGET_BYTES,
+    DOC_EXTRACTION_MODE,
+    DOC_FAST_MIN_CHARS_PER_PAGE,
+    DOC_PAGE_WINDOW,
+    DOCLING_POOL_WORKERS,
+)
+from src.core.context import get_context
+from src.learning.content_hash import compute_content_hash
+from src.learning.fast_extract import count_pages, extract_text, has_fast_extractor
+
+logger = logging.getLogger(__name__)
+
+# Formats that carry no text layer and always need OCR
+_IMAGE_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp", ".gif"}
+)
+
+
+# Extraction tiers, cheapest first
+EXTRACTION_TIERS = ("fast", "balanced", "accurate")
+EXTRACTION_MODES = ("auto",) + EXTRACTION_TIERS
+
+
+@dataclass
+class ConvertedDocument:
+    """Markdown export of one converted document."""
+
+    source: str
+    markdown: str
+    title: str = ""
+    elapsed: float = 0.0
+    # Served from the conversion cache rather than converted
+    cached: bool = False
+    tier: str = "accurate"
+    pages: int = 0
+    # Number of the first page in markdown (page ranges start mid-document)
+    first_page: int = 1
+    # Character offset in markdown where each page starts (if known)
+    page_offsets: List[int] = field(default_factory=list)
+    # Seconds spent in each tier tried (auto mode may try two)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+# =============================================================================
+# CONVERSION (runs in worker processes)
+# =============================================================================
+
+
+def create_docling_converter(tier: str = "accurate") -> Any:
+    """
+    Build a Docling DocumentConverter (the pool's default factory).
+
+    "balanced" skips OCR and table structure recognition for PDFs;
+    "accurate" runs Docling's full pipeline.
+    """
+    from docling.document_converter import DocumentConverter
+
+    if tier != "balanced":
+        return DocumentConverter()
+
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import PdfFormatOption
+
+    options = PdfPipelineOptions()
+    options.do_ocr = False
+    options.do_table_structure = False
+    return DocumentConverter(
+        format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=options)}
+    )
+
+
+# Converters of the current worker process (or of an in-process pool), by tier
+_converters: Dict[str, Any] = {}
+_converter_lock = threading.Lock()
+
+
+def _init_worker(factory: Callable[[str], Any]) -> None:
+    """Process initializer: build the worker's full-pipeline converter once."""
+    try:
+        _converters["accurate"] = factory("accurate")
+    except Exception as e:
+        # Surfaces again (with the real error) on the first conversion
+        logger.warning(f"Converter initialization failed: {e}")
+
+
+def parse_page_range(spec: str, total: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Parse a 1-based inclusive page range such as "10-20", "7" or "5-".
+
+    Args:
+        spec: Page range specification
+        total: Page count, used for open-ended ranges and clamping
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    text = spec.replace(" ", "")
+    first_text, sep, last_text = text.partition("-")
+    try:
+        first = int(first_text) if first_text else 1
+        if not sep:
+            last = first
+        elif last_text:
+            last = int(last_text)
+        elif total is not None:
+            last = total
+        else:
+            raise ValueError("open-ended range needs a known page count")
+    except ValueError as e:
+        raise ValueError(f"Invalid page range '{spec}' (expected e.g. 10-20): {e}")
+    if first < 1 or last < first:
+        raise ValueError(f"Invalid page range '{spec}'")
+    if total is not None:
+        if first > total:
+            raise ValueError(f"Page range '{spec}' is beyond the last page ({total})")
+        last = min(last, total)
+    return first, last
+
+
+def _docling_convert(
+    source: str,
+    tier: str,
+    factory: Callable[[str], Any],
+    page_range: Optional[Tuple[int, int]] = None,
+) -> ConvertedDocument:
+    """Convert with this process's converter for a Docling tier."""
+    with _converter_lock:
+        converter = _converters.get(tier)
+        if converter is None:
+            converter = _converters[tier] = factory(tier)
+        start = time.time()
+        if page_range is not None:
+            result = converter.convert(source, page_range=page_range)
+        else:
+            result = converter.convert(source)
+        document = result.document
+        markdown = document.export_to_markdown()
+    title = getattr(document, "title", None) or ""
+    pages = getattr(document, "pages", None)
+    return ConvertedDocument(
+        source,
+        markdown,
+        str(title),
+        time.time() - start,
+        tier=tier,
+        pages=len(pages) if isinstance(pages, (dict, list)) else 0,
+        first_page=page_range[0] if page_range else 1,
+    )
+
+
+def _convert_source(
+    source: str,
+    mode: str,
+    factory: Callable[[str], Any],
+    page_range: Optional[Tuple[int, int]] = None,
+) -> ConvertedDocument:
+    """
+    Convert a file path or URL in the requested mode.
+
+    "fast" reads the embedded text layer (src.learning.fast_extract) and
+    falls back to "balanced" for formats without one. "auto" starts with
+    the fast tier and escalates to the full pipeline only when a document
+    yields less than DOC_FAST_MIN_CHARS_PER_PAGE characters per page (e.g.
+    scanned pages that need OCR); formats without a fast extractor go
+    straight to "balanced", images to "accurate".
+
+    With a page_range only those pages are converted; the escalation
+    decision is then made for that range alone.
+    """
+    timings: Dict[str, float] = {}
+    tier = "accurate" if mode == "auto" else mode
+    is_local = os.path.isfile(source)
+
+    if mode in ("auto", "fast") and is_local and has_fast_extractor(source):
+        start = time.time()
+        extracted = extract_text(source, page_range)
+        timings["fast"] = time.time() - start
+        if extracted is not None and (
+            mode == "fast" or extracted.chars_per_page >= DOC_FAST_MIN_CHARS_PER_PAGE
+        ):
+            return ConvertedDocument(
+                source,
+                extracted.markdown,
+                os.path.basename(source),
+                timings["fast"],
+                tier="fast",
+                pages=extracted.pages,
+                first_page=page_range[0] if page_range else 1,
+                page_offsets=extracted.page_offsets,
+                timings=timings,
+            )
+        if extracted is None:
+            tier = "balanced"
+    elif mode == "fast" or (mode == "auto" and not _is_image(source)):
+        tier = "balanced"
+
+    document = _docling_convert(source, tier, factory, page_range)
+    timings[tier] = document.elapsed
+    document.timings = timings
+    document.elapsed = sum(timings.values())
+    return document
+
+
+def _is_image(source: str) -> bool:
+    return os.path.splitext(source)[1].lower() in _IMAGE_EXTENSIONS
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+
+class ConverterPool:
+    """
+    Converter processes that stay alive between conversions.
+
+    Args:
+        workers: Worker processes; 0 converts on the calling thread with a
+            single in-process converter (still built only once)
+        factory: Picklable module-level function taking a Docling tier
+            ("balanced" or "accurate") and returning a converter with
+            Docling's ``convert(source)`` interface
+        cache: Serve and store local file conversions through the
+            conversion cache
+    """
+
+    def __init__(
+        self,
+        workers: int = DOCLING_POOL_WORKERS,
+        factory: Callable[[str], Any] = create_docling_converter,
+        cache: bool = True,
+    ):
+        self.factory = factory
+        self.cache = cache
+        self._workers = max(0, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes (0 = in-process)."""
+        return self._workers
+
+    def ensure_available(self, mode: str = "auto") -> None:
+        """
+        Fail fast when a mode's converter cannot be built.
+
+        Raises:
+            ValueError: If the mode is unknown
+            ImportError: If the mode needs the default Docling factory and
+                Docling is not installed
+        """
+        if mode not in EXTRACTION_MODES:
+            raise ValueError(
+                f"Unknown extraction mode '{mode}' "
+                f"(expected one of: {', '.join(EXTRACTION_MODES)})"
+            )
+        if mode != "fast" and self.factory is create_docling_converter:
+            from docling.document_converter import DocumentConverter  # noqa: F401
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawned, not forked: Docling/torch are not fork-safe, and
+                # this process already runs job and tool threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.factory,),
+                )
+                logger.debug(f"Started {self._workers} converter processes")
+            return self._executor
+
+    def submit(
+        self,
+        source: str,
+        mode: str = DOC_EXTRACTION_MODE,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Future:
+        """
+        Queue a conversion (optionally of a 1-based inclusive page range).
+
+        Local files converted before with the same content, converter
+        version, mode and range complete immediately from the cache.
+
+        Raises:
+            ValueError: If the mode is unknown
+            ImportError: If the mode needs Docling and it is unavailable
+        """
+        content_hash = source_content_hash(source) if self.cache else None
+        future: Future
+        if content_hash:
+            cached = load_cached_conversion(source, content_hash, mode, page_range)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+                return future
+
+        self.ensure_available(mode)
+
+        if self._workers == 0:
+            future = Future()
+            try:
+                future.set_result(
+                    _convert_source(source, mode, self.factory, page_range)
+                )
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            future = self._get_executor().submit(
+                _convert_source, source, mode, self.factory, page_range
+            )
+
+        if content_hash:
+
+            def store(done: Future) -> None:
+                if not done.cancelled() and done.exception() is None:
+                    store_conversion(content_hash, mode, page_range, done.result())
+
+            future.add_done_callback(store)
+        return future
+
+    def convert(
+        self,
+        source: str,
+        mode: str = DOC_EXTRACTION_MODE,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> ConvertedDocument:
+        """
+        Convert a file path or URL to markdown, blocking until done.
+
+        Args:
+            source: File path or URL
+            mode: "auto", "fast", "balanced" or "accurate" (see
+                _convert_source for the escalation policy)
+            page_range: Only convert these 1-based pages (inclusive)
+
+        A worker that crashed (e.g. killed by the OS) fails its conversion
+        and the pool is rebuilt for the next one.
+
+        Raises:
+            ValueError: If the mode is unknown
+            ImportError: If the mode needs Docling and it is unavailable
+            Exception: Whatever the converter raised
+        """
+        return self._result(self.submit(source, mode, page_range))
+
+    def iter_pages(
+        self,
+        source: str,
+        mode: str = DOC_EXTRACTION_MODE,
+        window: int = DOC_PAGE_WINDOW,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[ConvertedDocument]:
+        """
+        Convert a document in windows of pages, yielding each in order.
+
+        Windows are converted concurrently by the worker processes, but at
+        most one window per worker is in flight, so only a bounded number
+        of pages is held in memory however long the document is. Documents
+        without pages (or that fit in one window) are yielded whole.
+
+        Args:
+            source: File path or URL
+            mode: Extraction mode, decided per window in "auto" mode
+            window: Pages per conversion
+            page_range: Only convert these 1-based pages (inclusive)
+        """
+        total = count_pages(source) if os.path.isfile(source) else None
+        first, last = page_range or (1, total or 1)
+        if total is None or last - first + 1 <= window:
+            yield self.convert(source, mode, page_range)
+            return
+
+        in_flight: Deque[Future] = deque()
+        for start in range(first, last + 1, max(1, window)):
+            end = min(start + window - 1, last)
+            in_flight.append(self.submit(source, mode, (start, end)))
+            if len(in_flight) > max(0, self._workers - 1):
+                yield self._result(in_flight.popleft())
+        while in_flight:
+            yield self._result(in_flight.popleft())
+
+    def _result(self, future: Future) -> ConvertedDocument:
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            logger.warning("Converter process died, restarting the pool")
+            self.shutdown(wait=False)
+            raise
+
+    def resize(self, workers: int) -> None:
+        """Change the number of worker processes (restarts them if needed)."""
+        workers = max(0, workers)
+        if workers != self._workers:
+            self.shutdown()
+            self._workers = workers
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes; the next conversion starts new ones."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Module-level singleton
+_converter_pool: Optional[ConverterPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_converter_pool() -> ConverterPool:
+    """
+    Get the global ConverterPool singleton.
+
+    Returns:
+        ConverterPool: The shared converter pool
+    """
+    global _converter_pool
+    with _pool_lock:
+        if _converter_pool is None:
+            _converter_pool = ConverterPool()
+        return _converter_pool
+
+
+def convert_document(
+    source: str,
+    mode: str = DOC_EXTRACTION_MODE,
+    page_range: Optional[Tuple[int, int]] = None,
+) -> ConvertedDocument:
+    """Convert a file path or URL (or a page range of it) with the shared pool."""
+    return get_converter_pool().convert(source, mode, page_range)
+
+
+# =============================================================================
+# CONVERSION CACHE
+# =============================================================================
+
+# Bump when the markdown produced for the same input and libraries changes
+_CACHE_FORMAT = 1
+
+# Libraries whose version shapes the markdown
+_CONVERTER_DISTRIBUTIONS = ("docling", "pypdfium2", "python-docx", "python-pptx")
+
+# Content hashes of local files by path, valid while mtime and size match
+_source_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_source_hash_lock = threading.Lock()
+_SOURCE_HASH_MEMO_SIZE = 1024
+
+
+@lru_cache(maxsize=1)
+def converter_version() -> str:
+    """Version stamp of the converters, part of every cache key."""
+    parts = [f"format={_CACHE_FORMAT}"]
+    for dist in _CONVERTER_DISTRIBUTIONS:
+        try:
+            parts.append(f"{dist}={metadata.version(dist)}")
+        except metadata.PackageNotFoundError:
+            continue
+    return ";".join(parts)
+
+
+def source_content_hash(source: str) -> Optional[str]:
+    """
+    Content hash of a local file (None for URLs and unreadable paths).
+
+    Hashes are remembered per path while the file's mtime and size are
+    unchanged, so the windows of one document hash the file only once.
+    """
+    try:
+        stat = os.stat(source)
+    except (OSError, ValueError):
+        return None
+    if not os.path.isfile(source):
+        return None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _source_hash_lock:
+        known = _source_hashes.get(source)
+        if known is not None and known[0] == stamp:
+            return known[1]
+
+    content_hash = compute_content_hash(Path(source))
+    if content_hash is not None:
+        with _source_hash_lock:
+            if len(_source_hashes) >= _SOURCE_HASH_MEMO_SIZE:
+                _source_hashes.clear()
+            _source_hashes[source] = (stamp, content_hash)
+    return content_hash
+
+
+def _cache_key(
+    content_hash: str, mode: str, page_range: Optional[Tuple[int, int]]
+) -> str:
+    pages = f"{page_range[0]}-{page_range[1]}" if page_range else "all"
+    return f"{content_hash}|{converter_version()}|{mode}|{pages}"
+
+
+def load_cached_conversion(
+    source: str,
+    content_hash: str,
+    mode: str,
+    page_range: Optional[Tuple[int, int]] = None,
+) -> Optional[ConvertedDocument]:
+    """
+    Return an earlier conversion of identical content, marking it as used.
+
+    Args:
+        source: Path the result is reported for
+        content_hash: Content hash of the file
+        mode: Extraction mode the conversion was requested with
+        page_range: Page range the conversion was requested for
+    """
+    ctx = get_context()
+    if not content_hash or not ctx.db_conn or not ctx.db_lock:
+        return None
+    start = time.time()
+    key = _cache_key(content_hash, mode, page_range)
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                """
+                SELECT title, tier, pages, first_page, page_offsets, markdown
+                FROM conversion_cache WHERE cache_key = ?
+                """,
+                (key,),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            cursor.execute(
+                "UPDATE conversion_cache SET last_used = ? WHERE cache_key = ?",
+                (time.time(), key),
+            )
+            ctx.db_conn.commit()
+        title, tier, pages, first_page, page_offsets, markdown = row
+        return ConvertedDocument(
+            source,
+            zlib.decompress(markdown).decode("utf-8"),
+            title,
+            time.time() - start,
+            cached=True,
+            tier=tier,
+            pages=pages,
+            first_page=first_page,
+            page_offsets=json.loads(page_offsets),
+        )
+    except Exception as e:
+        logger.warning(f"Failed to read conversion cache: {e}")
+        return None
+
+
+def store_conversion(
+    content_hash: str,
+    mode: str,
+    page_range: Optional[Tuple[int, int]],
+    document: ConvertedDocument,
+) -> bool:
+    """
+    Cache a conversion, evicting the least recently used entries when the
+    cache outgrows DOC_CACHE_MAX_BYTES (down to DOC_CACHE_TARGET_BYTES).
+    """
+    ctx = get_context()
+    if not content_hash or not ctx.db_conn or not ctx.db_lock:
+        return False
+    markdown = zlib.compress(document.markdown.encode("utf-8"))
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO conversion_cache
+                    (cache_key, content_hash, title, tier, pages, first_page,
+                     page_offsets, markdown, size, last_used)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    _cache_key(content_hash, mode, page_range),
+                    content_hash,
+                    document.title,
+                    document.tier,
+                    document.pages,
+                    document.first_page,
+                    json.dumps(document.page_offsets),
+                    markdown,
+                    len(markdown),
+                    time.time(),
+                ),
+            )
+            _evict_conversions(cursor)
+            ctx.db_conn.commit()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to cache converted document: {e}")
+        return False
+
+
+def _evict_conversions(cursor: Any) -> None:
+    """Drop least recently used conversions while the cache is over budget."""
+    cursor.execute("SELECT COALESCE(SUM(size), 0) FROM conversion_cache")
+    total = cursor.fetchone()[0]
+    if total <= DOC_CACHE_MAX_BYTES:
+        return
+    cursor.execute("SELECT cache_key, size FROM conversion_cache ORDER BY last_used")
+    evicted = []
+    for key, size in cursor.fetchall():
+        if total <= DOC_CACHE_TARGET_BYTES:
+            break
+        evicted.append((key,))
+        total -= size
+    cursor.executemany("DELETE FROM conversion_cache WHERE cache_key = ?", evicted)
+    logger.debug(f"Evicted {len(evicted)} cached conversions")
+
+
+__all__ = [
+    "EXTRACTION_MODES",
+    "EXTRACTION_TIERS",
+    "ConvertedDocument",
+    "ConverterPool",
+    "convert_document",
+    "create_docling_converter",
+    "get_converter_pool",
+    "converter_version",
+    "load_cached_conversion",
+    "parse_page_range",
+    "source_content_hash",
+    "store_conversion",
+]
@@ -0,0 +1,319 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Fast-path text extraction for documents with an embedded text layer.
+
+Most PDFs and Office files already carry their text; reading it directly
+takes milliseconds per page, while Docling's layout, table and OCR models
+take seconds. This module implements the "fast" extraction tier used by
+the converter pool (src/learning/converter_pool.py):
+
+- PDF: the text layer of each page via pypdfium2
+- DOCX: paragraphs (headings become markdown headings) and tables
+- PPTX: the text of every shape, one section per slide
+- XLSX: cell values, one section per sheet
+
+Slides and sheets count as pages, so a page range selects them as it
+selects PDF pages; a DOCX file is a single page.
+
+It also counts PDF pages and builds document outlines (PDF bookmarks, or
+the headings found in the text layer), so callers can look at a large
+document's structure and request page ranges before converting it.
+
+The libraries are Docling's own dependencies, so the fast tier is available
+whenever Docling is. Each extractor is imported lazily; a missing library
+makes extract_text() return None, and callers fall back to Docling.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExtractedText:
+    """Text pulled directly from a document's text layer."""
+
+    markdown: str
+    pages: int = 1
+    # Character offset in markdown where each page (slide, sheet) starts
+    page_offsets: List[int] = field(default_factory=list)
+
+    @property
+    def chars_per_page(self) -> float:
+        """Average non-whitespace characters per page."""
+        chars = sum(1 for c in self.markdown if not c.isspace())
+        return chars / max(1, self.pages)
+
+
+# Formats whose pages (PDF pages, slides, sheets) a page range can select
+PAGED_EXTENSIONS = frozenset({".pdf", ".pptx", ".xlsx"})
+
+
+def _in_range(number: int, page_range: Optional[Tuple[int, int]]) -> bool:
+    """Whether a 1-based page number falls inside an optional page range."""
+    return page_range is None or page_range[0] <= number <= page_range[1]
+
+
+def _join_pages(pages: List[str]) -> ExtractedText:
+    offsets, parts, position = [], [], 0
+    for text in pages:
+        offsets.append(position)
+        parts.append(text)
+        position += len(text) + 2
+    return ExtractedText("\n\n".join(parts), pages=len(pages), page_offsets=offsets)
+
+
+def _extract_pdf(path: str, page_range: Optional[Tuple[int, int]]) -> ExtractedText:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    try:
+        first, last = page_range or (1, len(pdf))
+        pages = []
+        for index in range(max(0, first - 1), min(last, len(pdf))):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            pages.append(text.replace("\r\n", "\n").strip())
+    finally:
+        pdf.close()
+    return _join_pages(pages)
+
+
+def _extract_docx(path: str, page_range: Optional[Tuple[int, int]]) -> ExtractedText:
+    import docx
+
+    document = docx.Document(path)
+    lines = []
+    for paragraph in document.paragraphs:
+        text = paragraph.text.strip()
+        if not text:
+            continue
+        style = paragraph.style.name if paragraph.style is not None else ""
+        level = style.rsplit(" ", 1)[-1] if style.startswith("Heading") else ""
+        if level.isdigit():
+            lines.append(f"{'#' * min(int(level), 6)} {text}")
+        else:
+            lines.append(text)
+    for table in document.tables:
+        for row in table.rows:
+            lines.append(
+                "| " + " | ".join(cell.text.strip() for cell in row.cells) + " |"
+            )
+    # The whole document is page 1
+    return _join_pages(["\n\n".join(lines)] if _in_range(1, page_range) else [])
+
+
+def _extract_pptx(path: str, page_range: Optional[Tuple[int, int]]) -> ExtractedText:
+    from pptx import Presentation
+
+    slides = []
+    for number, slide in enumerate(Presentation(path).slides, start=1):
+        if not _in_range(number, page_range):
+            continue
+        texts = [
+            shape.text_frame.text.strip()
+            for shape in slide.shapes
+            if shape.has_text_frame and shape.text_frame.text.strip()
+        ]
+        slides.append("\n\n".join([f"## Slide {number}"] + texts))
+    return _join_pages(slides)
+
+
+def _extract_xlsx(path: str, page_range: Optional[Tuple[int, int]]) -> ExtractedText:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheets = []
+        for number, sheet in enumerate(workbook.worksheets, start=1):
+            if not _in_range(number, page_range):
+                continue
+            rows = [
+                "| " + " | ".join("" if v is None else str(v) for v in row) + " |"
+                for row in sheet.iter_rows(values_only=True)
+                if any(v is not None for v in row)
+            ]
+            sheets.append("\n".join([f"## {sheet.title}", ""] + rows))
+    finally:
+        workbook.close()
+    return _join_pages(sheets)
+
+
+# Extractors receive an optional (first, last) 1-based page range and only
+# extract the pages (slides, sheets) inside it
+_EXTRACTORS: Dict[str, Callable[[str, Optional[Tuple[int, int]]], ExtractedText]] = {
+    ".pdf": _extract_pdf,
+    ".docx": _extract_docx,
+    ".pptx": _extract_pptx,
+    ".xlsx": _extract_xlsx,
+}
+
+
+def has_fast_extractor(path: str) -> bool:
+    """True if the file's format has a fast-path extractor."""
+    return os.path.splitext(path)[1].lower() in _EXTRACTORS
+
+
+def has_pages(path: str) -> bool:
+    """True if a page range can select parts of the file (see PAGED_EXTENSIONS)."""
+    return os.path.splitext(path)[1].lower() in PAGED_EXTENSIONS
+
+
+def extract_text(
+    path: str, page_range: Optional[Tuple[int, int]] = None
+) -> Optional[ExtractedText]:
+    """
+    Extract a document's embedded text without Docling.
+
+    Args:
+        path: Local file path
+        page_range: Only extract these 1-based pages, slides or sheets
+            (inclusive)
+
+    Returns:
+        ExtractedText, or None if the format is unsupported, its library is
+        missing or the file cannot be parsed
+    """
+    extractor = _EXTRACTORS.get(os.path.splitext(path)[1].lower())
+    if extractor is None:
+        return None
+    try:
+        return extractor(path, page_range)
+    except ImportError as e:
+        logger.debug(f"Fast extraction unavailable for {path}: {e}")
+    except Exception as e:
+        logger.debug(f"Fast extraction failed for {path}: {e}")
+    return None
+
+
+def count_pages(path: str) -> Optional[int]:
+    """Number of pages of a local PDF (None for other formats or on error)."""
+    if os.path.splitext(path)[1].lower() != ".pdf":
+        return None
+    try:
+        import pypdfium2 as pdfium
+
+        pdf = pdfium.PdfDocument(path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    except ImportError:
+        return None
+    except Exception as e:
+        logger.debug(f"Could not count pages of {path}: {e}")
+        return None
+
+
+@dataclass
+class OutlineEntry:
+    """One heading of a document outline."""
+
+    level: int
+    title: str
+    page: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"level": self.level, "title": self.title, "page": self.page}
+
+
+def _pdf_bookmarks(path: str) -> List[OutlineEntry]:
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    try:
+        return [
+            OutlineEntry(
+                item.level + 1,
+                item.title.strip(),
+                item.page_index + 1 if item.page_index is not None else None,
+            )
+            for item in pdf.get_toc()
+            if item.title and item.title.strip()
+        ]
+    finally:
+        pdf.close()
+
+
+def document_outline(path: str) -> Optional[List[OutlineEntry]]:
+    """
+    Outline of a local document from its text layer, without Docling.
+
+    PDF bookmarks are used when present; otherwise the outline lists the
+    markdown headings of the fast extraction with the page they start on.
+
+    Returns:
+        Outline entries, or None if no fast extractor can read the file
+    """
+    if os.path.splitext(path)[1].lower() == ".pdf":
+        try:
+            bookmarks = _pdf_bookmarks(path)
+            if bookmarks:
+                return bookmarks
+        except ImportError:
+            return None
+        except Exception as e:
+            logger.debug(f"Could not read bookmarks of {path}: {e}")
+
+    extracted = extract_text(path)
+    if extracted is None:
+        return None
+    return markdown_outline(extracted.markdown, extracted.page_offsets)
+
+
+def markdown_outline(
+    markdown: str, page_offsets: Optional[List[int]] = None
+) -> List[OutlineEntry]:
+    """Outline of the markdown headings, with pages when offsets are known."""
+    entries = []
+    offset = 0
+    for line in markdown.split("\n"):
+        stripped = line.lstrip("#")
+        level = len(line) - len(stripped)
+        if 0 < level <= 6 and stripped.startswith(" ") and stripped.strip():
+            page = sum(1 for start in page_offsets or [] if start <= offset)
+            entries.append(OutlineEntry(level, stripped.strip(), page or None))
+        offset += len(line) + 1
+    return entries
+
+
+__all__ = [
+    "ExtractedText",
+    "OutlineEntry",
+    "PAGED_EXTENSIONS",
+    "count_pages",
+    "document_outline",
+    "extract_text",
+    "has_fast_extractor",
+    "has_pages",
+    "markdown_outline",
+]
@@ -26,10 +26,13 @@ import os
 from pathlib import Path
 from typing import Optional
 
+from src.core.file_walker import walk_files
 from src.learning.config import AutoLearnConfig
 
 logger = logging.getLogger(__name__)
 
+MARKDOWN_EXTENSIONS = (".md", ".markdown")
+
 
 def discover_markdown_files(
     start_dir: str, max_size_mb: int = 5, include_dirs: Optional[list[str]] = None
@@ -75,36 +78,24 @@ def discover_markdown_files(
             logger.debug(f"Include directory does not exist: {target_dir}")
             continue
 
-        if include_dir == ".":
-            # Root folder: only get *.md files directly in root (not subdirectories)
-            for filename in os.listdir(target_dir):
-                if filename.lower().endswith((".md", ".markdown")):
-                    file_path = os.path.join(target_dir, filename)
-                    if os.path.isfile(file_path):
-                        try:
-                            file_size = os.path.getsize(file_path)
-                            if file_size <= max_size_bytes:
-                                discovered_files.append(Path(file_path).resolve())
-                                logger.debug(f"Found markdown file: {file_path}")
-                            else:
-                                logger.debug(f"Skipping large file: {file_path}")
-                        except (OSError, PermissionError) as e:
-                            logger.warning(f"Error accessing file {file_path}: {e}")
-        else:
-            # Other folders: scan recursively
-            for root, dirs, files in os.walk(target_dir):
-                for filename in files:
-                    if filename.lower().endswith((".md", ".markdown")):
-                        file_path = os.path.join(root, filename)
-                        try:
-                            file_size = os.path.getsize(file_path)
-                            if file_size <= max_size_bytes:
-                                discovered_files.append(Path(file_path).resolve())
-                                logger.debug(f"Found markdown file: {file_path}")
-                            else:
-                                logger.debug(f"Skipping large file: {file_path}")
-                        except (OSError, PermissionError) as e:
-                            logger.warning(f"Error accessing file {file_path}: {e}")
+        # Root folder: only *.md files directly in root (not subdirectories);
+        # other folders are scanned recursively. The shared walker skips
+        # gitignored paths, build output and virtualenvs.
+        max_depth = 0 if include_dir == "." else None
+        for entry in walk_files(
+            target_dir,
+            include_hidden=True,
+            max_depth=max_depth,
+            extensions=MARKDOWN_EXTENSIONS,
+        ):
+            try:
+                if entry.size <= max_size_bytes:
+                    discovered_files.append(Path(entry.path).resolve())
+                    logger.debug(f"Found markdown file: {entry.path}")
+                else:
+                    logger.debug(f"Skipping large file: {entry.path}")
+            except (OSError, PermissionError) as e:
+                logger.warning(f"Error accessing file {entry.path}: {e}")
 
     logger.info(f"Discovered {len(discovered_files)} markdown files from {start_dir}")
     return discovered_files
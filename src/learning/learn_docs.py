@@ -0,0 +1,376 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Parallel document ingestion for the /learn-docs command.
+
+Runs the shared staged pipeline (src.learning.pipeline) over a folder of
+PDFs, Office files, HTML pages and images:
+
+1. Source: the shared walker lists documents; files completed by an
+   interrupted earlier run (unchanged mtime and size) are resumed.
+2. Read: each file is hashed; conversions of identical content (same
+   converter version and extraction mode) come from the conversion cache,
+   everything else is converted by the warm converter pool
+   (src.learning.converter_pool) with one reader
+   thread per worker process, so documents convert in parallel across
+   cores. In the default "auto" mode, documents with a clean text layer
+   skip Docling's models entirely. Long PDFs are converted DOC_PAGE_WINDOW
+   pages at a time, and each window's markdown is split along its headings
+   as soon as it arrives, so only a few windows of markdown are held at
+   once. Chunks carry the page span they came from.
+3. Chunk: the chunks are turned into knowledge base documents.
+4. Embed + write: batches are diffed against stored chunks; only new
+   chunks are embedded.
+
+A document's chunks stay in memory until its batch is written, because
+the sync compares all of a source's chunks with the stored ones (chunks
+that disappeared are deleted). Memory therefore grows with the text of the
+documents in flight, not with their page images or converter state.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.core.chunking import Chunk, chunk_document
+from src.core.constants import DOC_EXTRACTION_MODE, DOCUMENT_MAX_FILE_SIZE
+from src.core.file_walker import walk_files
+from src.learning.converter_pool import (
+    EXTRACTION_TIERS,
+    ConverterPool,
+    get_converter_pool,
+    source_content_hash,
+)
+from src.learning.pipeline import IngestPipeline, IngestUnit, PipelineConfig
+
+logger = logging.getLogger(__name__)
+
+# Formats converted by Docling (plain text and code are left to /populate)
+DOCUMENT_EXTENSIONS = frozenset(
+    {
+        ".pdf",
+        ".docx",
+        ".pptx",
+        ".xlsx",
+        ".html",
+        ".htm",
+        ".xhtml",
+        ".adoc",
+        ".asciidoc",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".tif",
+        ".tiff",
+        ".bmp",
+        ".webp",
+    }
+)
+
+
+@dataclass
+class LearnDocsStats:
+    """Counters for one /learn-docs run."""
+
+    documents_processed: int = 0
+    documents_converted: int = 0
+    documents_cached: int = 0
+    documents_skipped: int = 0
+    documents_resumed: int = 0
+    chunks_added: int = 0
+    chunks_unchanged: int = 0
+    chunks_deleted: int = 0
+    chunks_suppressed: int = 0
+    errors: int = 0
+    workers: int = 1
+    conversion_seconds: float = 0.0
+    # Converted documents per extraction tier that produced them
+    tiers: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+    interrupted: bool = False
+
+
+def is_document(file_path: str) -> bool:
+    """True if the file is in a format /learn-docs converts."""
+    return os.path.splitext(file_path)[1].lower() in DOCUMENT_EXTENSIONS
+
+
+# Chunks of one converted window of a document with their page metadata
+# (page_start/page_end; empty for formats without pages)
+WindowChunks = Tuple[List[Chunk], Dict[str, int]]
+
+
+def chunk_window(
+    file_path: str,
+    markdown: str,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+) -> WindowChunks:
+    """Split one converted window of a document along its headings."""
+    pages: Dict[str, int] = {}
+    if first_page is not None:
+        pages = {"page_start": first_page, "page_end": last_page or first_page}
+    return chunk_document(markdown, file_path=file_path, language="markdown"), pages
+
+
+def build_document_chunks(
+    file_path: str,
+    title: str,
+    content_hash: str,
+    base_dir: str,
+    windows: Sequence[WindowChunks],
+) -> List[Any]:
+    """Turn the chunks of a converted document into knowledge base documents."""
+    from langchain_core.documents import Document
+
+    pieces = [(chunk, pages) for chunks, pages in windows for chunk in chunks]
+
+    filename = os.path.basename(file_path)
+    added_at = datetime.now().isoformat()
+    return [
+        Document(
+            page_content=chunk.text,
+            metadata={
+                "source": file_path,
+                "relative_path": os.path.relpath(file_path, base_dir),
+                "filename": filename,
+                "title": title or filename,
+                "type": "document",
+                "content_hash": content_hash,
+                "added_at": added_at,
+                "chunk_index": i,
+                "total_chunks": len(pieces),
+                **pages,
+                **chunk.to_metadata(),
+            },
+        )
+        for i, (chunk, pages) in enumerate(pieces)
+    ]
+
+
+class DocumentIngestPipeline:
+    """
+    Convert and ingest every document under a directory.
+
+    Usage:
+        stats = DocumentIngestPipeline("./samples", workers=4).run()
+        print(stats.documents_converted, stats.documents_cached)
+    """
+
+    def __init__(
+        self,
+        dir_path: str,
+        workers: Optional[int] = None,
+        progress: Optional[Any] = None,
+        resume: bool = True,
+        pool: Optional[ConverterPool] = None,
+        mode: str = DOC_EXTRACTION_MODE,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            dir_path: Directory to ingest
+            workers: Converter processes (default: the shared pool's size)
+            progress: Receives throughput/ETA reports (see IngestPipeline)
+            resume: Checkpoint the run so an interrupted run can resume
+            pool: Converter pool to use (default: the shared pool)
+            mode: Extraction mode ("auto", "fast", "balanced", "accurate")
+        """
+        self.dir_path = dir_path
+        self.pool = pool or get_converter_pool()
+        if workers is not None:
+            self.pool.resize(workers)
+        self.progress = progress
+        self.resume = resume
+        self.mode = mode
+        self.stats = LearnDocsStats(workers=max(1, self.pool.workers))
+        self._lock = threading.Lock()
+
+    def run_id(self) -> str:
+        """Checkpoint identifier: one resumable run per space and directory."""
+        from src.core.context import get_context
+
+        space = get_context().current_space
+        return f"learn-docs:{space}:{self.mode}:{os.path.abspath(self.dir_path)}"
+
+    def run(self) -> LearnDocsStats:
+        """
+        Execute the pipeline and return its statistics.
+
+        Raises:
+            ValueError: If the extraction mode is unknown
+            ImportError: If the mode needs Docling and it is not installed
+        """
+        self.pool.ensure_available(self.mode)
+        pipeline = IngestPipeline(
+            "learn-docs",
+            self._units(),
+            read=self._read,
+            chunk=self._chunk,
+            # One reader per converter keeps every worker process busy
+            config=PipelineConfig(read_workers=self.stats.workers, embed_workers=1),
+            run_id=self.run_id() if self.resume else None,
+            progress=self.progress,
+            on_unit_done=self._on_unit_done,
+        )
+        metrics = pipeline.run()
+
+        self.stats.chunks_added = metrics.chunks_added
+        self.stats.chunks_unchanged = metrics.chunks_unchanged
+        self.stats.chunks_deleted = metrics.chunks_deleted
+        self.stats.chunks_suppressed = metrics.chunks_suppressed
+        self.stats.elapsed = metrics.elapsed
+        self.stats.interrupted = metrics.interrupted
+        return self.stats
+
+    def _units(self) -> Iterator[IngestUnit]:
+        """Source stage: walk the tree and yield documents."""
+        for entry in walk_files(self.dir_path):
+            if not is_document(entry.path):
+                continue
+            try:
+                size = entry.size
+                mtime_ns = os.stat(entry.path).st_mtime_ns
+            except OSError:
+                size = None
+            if size is None or size > DOCUMENT_MAX_FILE_SIZE:
+                with self._lock:
+                    self.stats.documents_skipped += 1
+                continue
+            yield IngestUnit(entry.path, fingerprint=f"{mtime_ns}:{size}")
+
+    def _read(self, unit: IngestUnit) -> IngestUnit:
+        """Read stage: convert the document (or fetch it from the cache)."""
+        # Memoized by the pool, so the cache lookups below do not rehash
+        content_hash = source_content_hash(unit.key)
+        if content_hash is None:
+            unit.status = "unreadable"
+            return unit
+
+        windows: List[WindowChunks] = []
+        title = self._convert(unit.key, windows)
+        if not any(chunks for chunks, _ in windows):
+            unit.status = "empty"
+        unit.data = {"content_hash": content_hash, "title": title, "windows": windows}
+        return unit
+
+    def _convert(self, file_path: str, windows: List[WindowChunks]) -> str:
+        """
+        Convert a document window by window, chunking each as it arrives.
+
+        Returns:
+            The document's title
+        """
+        title = ""
+        seconds = 0.0
+        cached = True
+        tier = EXTRACTION_TIERS[0]
+        for document in self.pool.iter_pages(file_path, self.mode):
+            title = title or document.title
+            cached = cached and document.cached
+            seconds += 0.0 if document.cached else document.elapsed
+            # Report the most thorough tier any window needed
+            tier = max(tier, document.tier, key=EXTRACTION_TIERS.index)
+            if document.pages:
+                last_page = document.first_page + document.pages - 1
+                windows.append(
+                    chunk_window(
+                        file_path, document.markdown, document.first_page, last_page
+                    )
+                )
+            else:
+                windows.append(chunk_window(file_path, document.markdown))
+
+        with self._lock:
+            if cached:
+                self.stats.documents_cached += 1
+            else:
+                self.stats.documents_converted += 1
+                self.stats.conversion_seconds += seconds
+                self.stats.tiers[tier] = self.stats.tiers.get(tier, 0) + 1
+        return title
+
+    def _chunk(self, unit: IngestUnit) -> IngestUnit:
+        """Chunk stage: build the documents from the windows' chunks."""
+        data = unit.data
+        unit.documents = build_document_chunks(
+            unit.key,
+            data["title"],
+            data["content_hash"],
+            self.dir_path,
+            data["windows"],
+        )
+        # The chunks now live in the documents
+        unit.data = None
+        return unit
+
+    def _on_unit_done(self, unit: IngestUnit) -> None:
+        """Update statistics for a document leaving the pipeline."""
+        with self._lock:
+            if unit.status == "ok":
+                self.stats.documents_processed += 1
+            elif unit.status == "resumed":
+                self.stats.documents_resumed += 1
+            elif unit.status == "error":
+                logger.warning(f"   ⚠️ Error converting {unit.key}: {unit.error}")
+                self.stats.errors += 1
+            elif unit.status != "empty":
+                self.stats.documents_skipped += 1
+
+
+def run_learn_docs(
+    dir_path: str,
+    workers: Optional[int] = None,
+    progress: Optional[Any] = None,
+    mode: str = DOC_EXTRACTION_MODE,
+) -> LearnDocsStats:
+    """
+    Convert and ingest a directory of documents into the current space.
+
+    Args:
+        dir_path: Directory to ingest
+        workers: Converter processes (default: the shared pool's size)
+        progress: Receives throughput/ETA reports
+        mode: Extraction mode ("auto", "fast", "balanced", "accurate")
+
+    Returns:
+        LearnDocsStats for the run
+    """
+    return DocumentIngestPipeline(
+        dir_path, workers=workers, progress=progress, mode=mode
+    ).run()
+
+
+__all__ = [
+    "DOCUMENT_EXTENSIONS",
+    "DocumentIngestPipeline",
+    "LearnDocsStats",
+    "build_document_chunks",
+    "chunk_window",
+    "is_document",
+    "run_learn_docs",
+]
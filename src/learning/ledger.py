@@ -0,0 +1,214 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Persistent ledger of learned files.
+
+Records, per space, which files have been ingested together with their
+mtime, size, full content hash and the IDs of the chunks stored for them.
+On startup auto-learn compares a ``stat`` of each file against the ledger
+and only reads, hashes and re-embeds files that are new or changed; the
+recorded chunk IDs let removed files be cleaned out of the knowledge base.
+
+The ledger lives in the ``learned_files`` SQLite table (schema v2). When no
+database connection is available every function degrades to a no-op.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from src.core.context import get_context
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LedgerEntry:
+    """One learned file as recorded in the ledger."""
+
+    path: str
+    mtime: float
+    size: int
+    content_hash: str
+    chunk_ids: List[str] = field(default_factory=list)
+
+    def matches_stat(self, mtime: float, size: int) -> bool:
+        """True if a file's stat result says it is unchanged since learning."""
+        return self.mtime == mtime and self.size == size
+
+
+def load_ledger(space: str) -> Dict[str, LedgerEntry]:
+    """
+    Load every ledger entry of a space with a single query.
+
+    Args:
+        space: Space name
+
+    Returns:
+        Mapping of file path to LedgerEntry (empty without a database)
+    """
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return {}
+
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                """
+                SELECT path, mtime, size, content_hash, chunk_ids
+                FROM learned_files WHERE space = ?
+                """,
+                (space,),
+            )
+            rows = cursor.fetchall()
+    except Exception as e:
+        logger.warning(f"Failed to load learned file ledger: {e}")
+        return {}
+
+    entries = {}
+    for path, mtime, size, content_hash, chunk_ids in rows:
+        try:
+            ids = json.loads(chunk_ids or "[]")
+        except json.JSONDecodeError:
+            ids = []
+        entries[path] = LedgerEntry(path, mtime, size, content_hash, ids)
+    return entries
+
+
+def get_ledger_entry(space: str, path: str) -> Optional[LedgerEntry]:
+    """Look up a single file's ledger entry."""
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return None
+
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                """
+                SELECT mtime, size, content_hash, chunk_ids
+                FROM learned_files WHERE space = ? AND path = ?
+                """,
+                (space, path),
+            )
+            row = cursor.fetchone()
+    except Exception as e:
+        logger.warning(f"Failed to read ledger entry for {path}: {e}")
+        return None
+
+    if not row:
+        return None
+    mtime, size, content_hash, chunk_ids = row
+    try:
+        ids = json.loads(chunk_ids or "[]")
+    except json.JSONDecodeError:
+        ids = []
+    return LedgerEntry(path, mtime, size, content_hash, ids)
+
+
+def record_learned_file(space: str, entry: LedgerEntry) -> bool:
+    """
+    Insert or replace a file's ledger entry.
+
+    Args:
+        space: Space name
+        entry: Entry to store
+
+    Returns:
+        True if the entry was written
+    """
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return False
+
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO learned_files
+                    (space, path, mtime, size, content_hash, chunk_ids, learned_at)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                (
+                    space,
+                    entry.path,
+                    entry.mtime,
+                    entry.size,
+                    entry.content_hash,
+                    json.dumps(entry.chunk_ids),
+                ),
+            )
+            ctx.db_conn.commit()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to record {entry.path} in ledger: {e}")
+        return False
+
+
+def touch_learned_file(space: str, path: str, mtime: float, size: int) -> None:
+    """Refresh stat data of an entry whose content turned out unchanged."""
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return
+
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                "UPDATE learned_files SET mtime = ?, size = ? WHERE space = ? AND path = ?",
+                (mtime, size, space, path),
+            )
+            ctx.db_conn.commit()
+    except Exception as e:
+        logger.warning(f"Failed to refresh ledger entry for {path}: {e}")
+
+
+def forget_learned_file(space: str, path: str) -> None:
+    """Remove a file from the ledger."""
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return
+
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                "DELETE FROM learned_files WHERE space = ? AND path = ?",
+                (space, path),
+            )
+            ctx.db_conn.commit()
+    except Exception as e:
+        logger.warning(f"Failed to remove {path} from ledger: {e}")
+
+
+__all__ = [
+    "LedgerEntry",
+    "forget_learned_file",
+    "get_ledger_entry",
+    "load_ledger",
+    "record_learned_file",
+    "touch_learned_file",
+]
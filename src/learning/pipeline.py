@@ -0,0 +1,745 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Staged, resumable ingestion pipeline shared by /populate, auto-learn and /web.
+
+Work flows through five stages connected by bounded queues:
+
+    source → read → chunk → embed → write
+
+- source: the caller's iterable of IngestUnit (files, URLs, ...). Units
+  completed by an interrupted earlier run are skipped (see checkpoints).
+- read / chunk: caller-supplied functions applied per unit, each stage with
+  its own worker count; the chunk stage can use worker processes.
+- embed: whole units are grouped into batches of about ``batch_size`` chunks,
+  diffed against the stored chunks and only new chunks are embedded.
+- write: stores new chunks, refreshes moved ones, deletes vanished ones and
+  checkpoints the batch's units in SQLite.
+
+Every stage keeps the order of its input, so a run writes the same batches
+regardless of worker counts. Bounded queues provide backpressure: a slow
+embedder stalls chunking and reading instead of buffering the whole tree.
+
+Checkpoints: with a run_id, every written unit is recorded in the
+``ingest_checkpoints`` table together with its fingerprint (e.g. mtime and
+size). A run that stops early keeps them, and the next run with the same
+run_id skips units whose fingerprint is unchanged. A run that finishes
+clears its checkpoints.
+
+Usage:
+    pipeline = IngestPipeline(
+        "populate",
+        units,
+        read=read_unit,
+        chunk=chunk_unit,
+        run_id="populate:default:/path",
+        progress=CLIProgress(),
+    )
+    metrics = pipeline.run()
+    print(metrics.summary())
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from src.core.constants import (
+    EMBED_BATCH_SIZE,
+    EMBED_QUEUE_SIZE,
+    PIPELINE_EMBED_WORKERS,
+    PIPELINE_PROGRESS_INTERVAL,
+    PIPELINE_READ_WORKERS,
+    POPULATE_QUEUE_FACTOR,
+)
+from src.core.context import get_context
+from src.core.context_utils import (
+    ChunkSyncPlan,
+    ChunkSyncResult,
+    add_documents_with_fallback,
+    embed_chunk_sync_plan,
+    plan_chunk_sync,
+    release_chunk_sync_plan,
+    write_chunk_sync_plan,
+)
+from src.core.jobs import current_job, propagate_job
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+# =============================================================================
+# DATA TYPES
+# =============================================================================
+
+
+@dataclass
+class IngestUnit:
+    """
+    One unit of ingestion work (a file, a web page, ...).
+
+    Attributes:
+        key: Stable identifier, also used as the checkpoint key
+        fingerprint: Changes when the unit's content changes (mtime/size,
+            ETag, ...); a checkpointed unit is only skipped if it matches
+        data: Free-form payload handed from stage to stage
+        documents: Chunk documents produced by the chunk stage
+        status: "ok", "empty" (stored chunks are removed), "error", or any
+            other skip reason set by a stage
+        error: Error message for status "error"
+    """
+
+    key: str
+    fingerprint: str = ""
+    data: Any = None
+    documents: List[Any] = field(default_factory=list)
+    status: str = "ok"
+    error: str = ""
+
+
+@dataclass
+class PipelineConfig:
+    """Per-stage concurrency and batching for an IngestPipeline."""
+
+    read_workers: int = PIPELINE_READ_WORKERS
+    chunk_workers: int = 1
+    chunk_processes: bool = False
+    embed_workers: int = PIPELINE_EMBED_WORKERS
+    batch_size: int = EMBED_BATCH_SIZE
+    queue_size: int = EMBED_QUEUE_SIZE
+
+
+@dataclass
+class StageMetrics:
+    """Counters of one pipeline stage."""
+
+    name: str
+    workers: int
+    processed: int = 0
+    chunks: int = 0
+    queue_depth: int = 0
+
+    def rate(self, elapsed: float) -> float:
+        """Units (read/chunk) or batches (embed/write) per second."""
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    def chunk_rate(self, elapsed: float) -> float:
+        """Chunks per second."""
+        return self.chunks / elapsed if elapsed > 0 else 0.0
+
+
+@dataclass
+class PipelineMetrics:
+    """Throughput, queue depth and progress of a pipeline run."""
+
+    name: str
+    stages: List[StageMetrics] = field(default_factory=list)
+    units_discovered: int = 0
+    units_written: int = 0
+    units_skipped: int = 0
+    units_failed: int = 0
+    units_resumed: int = 0
+    chunks_added: int = 0
+    chunks_unchanged: int = 0
+    chunks_deleted: int = 0
+    chunks_suppressed: int = 0
+    discovery_complete: bool = False
+    interrupted: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def units_finished(self) -> int:
+        """Units that left the pipeline (written, skipped or failed)."""
+        return self.units_written + self.units_skipped + self.units_failed
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until all discovered units are finished."""
+        finished = self.units_finished
+        if finished == 0 or self.elapsed <= 0:
+            return None
+        remaining = self.units_discovered - finished
+        return max(0.0, remaining / (finished / self.elapsed))
+
+    def summary(self) -> str:
+        """One-line progress report: per-stage rate and queue depth, ETA."""
+        parts = []
+        for stage in self.stages:
+            if stage.name in ("embed", "write"):
+                rate = f"{stage.chunk_rate(self.elapsed):.1f} chunks/s"
+            else:
+                rate = f"{stage.rate(self.elapsed):.1f}/s"
+            parts.append(f"{stage.name} {rate} (q{stage.queue_depth})")
+
+        total = f"{self.units_discovered}{'' if self.discovery_complete else '+'}"
+        progress = f"{self.units_finished}/{total} units"
+        eta = self.eta_seconds
+        if eta is not None and not self.interrupted:
+            progress += f", ETA {_format_duration(eta)}"
+        return " | ".join(parts + [progress])
+
+
+def _format_duration(seconds: float) -> str:
+    """Format seconds as e.g. "45s", "3m05s" or "1h12m"."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m{seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m"
+
+
+@dataclass
+class _Batch:
+    """Whole units grouped for one embed/write round."""
+
+    units: List[IngestUnit]
+    documents: List[Any] = field(default_factory=list)
+    plan: Optional[ChunkSyncPlan] = None
+    result: Optional[ChunkSyncResult] = None
+    failed: bool = False
+
+    @property
+    def sources(self) -> List[str]:
+        return [unit.key for unit in self.units]
+
+
+# =============================================================================
+# CHECKPOINTS
+# =============================================================================
+
+
+class CheckpointStore:
+    """
+    Completed units of a run, persisted in the ``ingest_checkpoints`` table.
+
+    Every method is a no-op when no database connection is available.
+    """
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+
+    def load(self) -> Dict[str, str]:
+        """Return completed unit keys mapped to their fingerprints."""
+        ctx = get_context()
+        if not ctx.db_conn or not ctx.db_lock:
+            return {}
+        try:
+            with ctx.db_lock:
+                cursor = ctx.db_conn.cursor()
+                cursor.execute(
+                    "SELECT unit_key, fingerprint FROM ingest_checkpoints WHERE run_id = ?",
+                    (self.run_id,),
+                )
+                return dict(cursor.fetchall())
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoints for {self.run_id}: {e}")
+            return {}
+
+    def mark(self, units: Sequence[IngestUnit]) -> None:
+        """Record units as completed (one transaction)."""
+        ctx = get_context()
+        if not units or not ctx.db_conn or not ctx.db_lock:
+            return
+        try:
+            with ctx.db_lock:
+                ctx.db_conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO ingest_checkpoints (run_id, unit_key, fingerprint)
+                    VALUES (?, ?, ?)
+                    """,
+                    [(self.run_id, unit.key, unit.fingerprint) for unit in units],
+                )
+                ctx.db_conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint {len(units)} units: {e}")
+
+    def clear(self) -> None:
+        """Forget the run's checkpoints (after it finished)."""
+        ctx = get_context()
+        if not ctx.db_conn or not ctx.db_lock:
+            return
+        try:
+            with ctx.db_lock:
+                ctx.db_conn.execute(
+                    "DELETE FROM ingest_checkpoints WHERE run_id = ?", (self.run_id,)
+                )
+                ctx.db_conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to clear checkpoints for {self.run_id}: {e}")
+
+
+# =============================================================================
+# STAGES
+# =============================================================================
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs work immediately on the calling thread."""
+
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def _apply_step(fn: Callable[[IngestUnit], IngestUnit], unit: IngestUnit) -> IngestUnit:
+    """Run a read/chunk function on a unit that is still "ok"."""
+    if unit.status != "ok":
+        return unit
+    try:
+        return fn(unit)
+    except Exception as e:
+        unit.status = "error"
+        unit.error = str(e)
+        return unit
+
+
+class _Stage:
+    """
+    Order-preserving stage: pulls from its inbox, runs fn on a pool of
+    workers and emits results in input order.
+    """
+
+    def __init__(
+        self,
+        metrics: StageMetrics,
+        fn: Callable[[Any], Any],
+        emit: Callable[[Any], None],
+        queue_size: int,
+        processes: bool = False,
+        chunks_of: Optional[Callable[[Any], int]] = None,
+    ):
+        self.metrics = metrics
+        self.fn = fn
+        self.emit = emit
+        self.processes = processes
+        self.chunks_of = chunks_of
+        self.inbox: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, queue_size))
+        # Stage threads work for the background job (if any) creating them
+        self.thread = threading.Thread(
+            target=propagate_job(self._run), name=f"Ingest-{metrics.name}", daemon=True
+        )
+
+    def _create_executor(self) -> Any:
+        workers = self.metrics.workers
+        if self.processes and workers > 1:
+            try:
+                # Spawned, not forked: this process already runs job, tool and
+                # watcher threads whose locks (logging, db_lock) a fork copies
+                return ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            except (OSError, NotImplementedError, ValueError) as e:
+                logger.warning(f"Process pool unavailable, using threads: {e}")
+        if workers > 1:
+            return ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix=f"Ingest-{self.metrics.name}"
+            )
+        return _InlineExecutor()
+
+    def _run(self) -> None:
+        executor = self._create_executor()
+        in_flight: Deque[Tuple[Any, Future]] = deque()
+        limit = self.metrics.workers * POPULATE_QUEUE_FACTOR
+        try:
+            while True:
+                item = self.inbox.get()
+                if item is _DONE:
+                    break
+                try:
+                    future = executor.submit(self.fn, item)
+                except Exception as e:
+                    # e.g. a broken process pool: fail the item, keep draining
+                    future = Future()
+                    future.set_exception(e)
+                in_flight.append((item, future))
+                while in_flight and (len(in_flight) >= limit or in_flight[0][1].done()):
+                    self._finish(*in_flight.popleft())
+            while in_flight:
+                self._finish(*in_flight.popleft())
+        finally:
+            executor.shutdown(wait=True)
+            self._emit(_DONE)
+
+    def _finish(self, item: Any, future: Future) -> None:
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.warning(f"Ingest {self.metrics.name} stage failed: {e}")
+            result = item
+            if isinstance(item, IngestUnit):
+                item.status = "error"
+                item.error = str(e)
+            elif isinstance(item, _Batch):
+                item.failed = True
+        self.metrics.processed += 1
+        if self.chunks_of is not None:
+            self.metrics.chunks += self.chunks_of(result)
+        self._emit(result)
+
+    def _emit(self, item: Any) -> None:
+        try:
+            self.emit(item)
+        except Exception as e:
+            logger.error(f"Ingest {self.metrics.name} stage could not hand off: {e}")
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+
+class IngestPipeline:
+    """
+    source → read → chunk → embed → write, with checkpoints and metrics.
+
+    Args:
+        name: Label used in progress output
+        units: Iterable of IngestUnit (consumed lazily by the source stage)
+        read: Function filling unit.data (or setting a skip status)
+        chunk: Function filling unit.documents; must be picklable when
+            config.chunk_processes is set
+        config: Stage concurrency and batching
+        run_id: Enables checkpoints under this identifier
+        progress: Receives PipelineMetrics via report_stage_metrics(), or a
+            callable receiving the summary line
+        on_chunked: Optional filter run in the pipeline after chunking;
+            returning False drops the unit as skipped
+        on_unit_done: Called with every unit that leaves the pipeline
+            (status "ok"/"empty" once written, "resumed", or a skip/error)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        units: Iterable[IngestUnit],
+        read: Callable[[IngestUnit], IngestUnit],
+        chunk: Callable[[IngestUnit], IngestUnit],
+        config: Optional[PipelineConfig] = None,
+        run_id: Optional[str] = None,
+        progress: Optional[Any] = None,
+        on_chunked: Optional[Callable[[IngestUnit], bool]] = None,
+        on_unit_done: Optional[Callable[[IngestUnit], None]] = None,
+    ):
+        self.name = name
+        self.units = units
+        self.config = config or PipelineConfig()
+        self.progress = progress
+        self.on_chunked = on_chunked
+        self.on_unit_done = on_unit_done
+        self.checkpoints = CheckpointStore(run_id) if run_id else None
+
+        self.metrics = PipelineMetrics(name)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Raised by run() once the units in flight are finished
+        self._source_error: Optional[BaseException] = None
+        self._batch: List[IngestUnit] = []
+        self._batch_chunks = 0
+
+        cfg = self.config
+        queue_size = max(1, cfg.queue_size)
+        self._write = _Stage(
+            StageMetrics("write", 1),
+            self._write_batch,
+            self._on_written,
+            queue_size,
+            chunks_of=lambda batch: len(batch.documents),
+        )
+        self._embed = _Stage(
+            StageMetrics("embed", max(1, cfg.embed_workers)),
+            self._embed_batch,
+            self._write.inbox.put,
+            queue_size,
+            chunks_of=lambda batch: len(batch.plan.new_docs) if batch.plan else 0,
+        )
+        chunk_workers = max(1, cfg.chunk_workers)
+        self._chunk = _Stage(
+            StageMetrics("chunk", chunk_workers),
+            partial(_apply_step, chunk),
+            self._collect,
+            chunk_workers * POPULATE_QUEUE_FACTOR,
+            processes=cfg.chunk_processes,
+        )
+        read_workers = max(1, cfg.read_workers)
+        self._read = _Stage(
+            StageMetrics("read", read_workers),
+            partial(_apply_step, read),
+            self._chunk.inbox.put,
+            read_workers * POPULATE_QUEUE_FACTOR,
+        )
+        self._stages = [self._read, self._chunk, self._embed, self._write]
+        self.metrics.stages = [stage.metrics for stage in self._stages]
+
+    def stop(self) -> None:
+        """Stop feeding new units; units already in flight are finished."""
+        self._stop_event.set()
+
+    def run(self) -> PipelineMetrics:
+        """
+        Run to completion (or until stopped) and return the final metrics.
+
+        Ctrl+C stops the source, drains the units in flight and returns
+        with ``interrupted`` set; completed units stay checkpointed. Inside
+        a background job, the job's progress line is kept current and
+        cancelling the job stops the run the same way.
+
+        Raises:
+            Exception: Whatever iterating the units raised, once the units
+                already fed in are finished (they stay checkpointed)
+        """
+        job = current_job()
+        start = time.time()
+        completed = self.checkpoints.load() if self.checkpoints else {}
+        if completed:
+            self._report_message(
+                f"Resuming {self.name}: {len(completed)} units already done"
+            )
+
+        source = threading.Thread(
+            target=propagate_job(self._source),
+            args=(completed,),
+            name="Ingest-source",
+            daemon=True,
+        )
+        for stage in self._stages:
+            stage.thread.start()
+        source.start()
+
+        try:
+            while self._write.thread.is_alive():
+                self._write.thread.join(timeout=PIPELINE_PROGRESS_INTERVAL)
+                self._refresh(start)
+                if job is not None:
+                    job.progress = self.metrics.summary()
+                    if job.cancel_requested and not self._stop_event.is_set():
+                        logger.info(f"{self.name} cancelled, finishing units in flight")
+                        self.stop()
+                if self._write.thread.is_alive():
+                    self._report_metrics()
+        except KeyboardInterrupt:
+            logger.info(f"{self.name} interrupted, finishing units in flight")
+            self.stop()
+            self._write.thread.join()
+
+        source.join()
+        self._refresh(start)
+        self.metrics.interrupted = self._stop_event.is_set()
+        if self._source_error is not None:
+            self._report_metrics()
+            raise self._source_error
+        if self.checkpoints and not self.metrics.interrupted:
+            self.checkpoints.clear()
+        self._report_metrics()
+        return self.metrics
+
+    # -------------------------------------------------------------------------
+    # Source and batching
+    # -------------------------------------------------------------------------
+
+    def _source(self, completed: Dict[str, str]) -> None:
+        """Feed units into the read stage, skipping checkpointed ones."""
+        try:
+            for unit in self.units:
+                if self._stop_event.is_set():
+                    break
+                if completed.get(unit.key, None) == unit.fingerprint:
+                    unit.status = "resumed"
+                    with self._lock:
+                        self.metrics.units_resumed += 1
+                    self._unit_done(unit)
+                    continue
+                with self._lock:
+                    self.metrics.units_discovered += 1
+                self._read.inbox.put(unit)
+        except Exception as e:
+            logger.error(f"{self.name} source failed: {e}")
+            self._source_error = e
+        finally:
+            self.metrics.discovery_complete = True
+            self._read.inbox.put(_DONE)
+
+    def _collect(self, unit: Any) -> None:
+        """Group chunked units into embed batches of whole units."""
+        if unit is _DONE:
+            self._flush_batch()
+            self._embed.inbox.put(_DONE)
+            return
+
+        if unit.status == "ok" and not unit.documents:
+            unit.status = "empty"
+        if unit.status == "ok" and self.on_chunked and not self.on_chunked(unit):
+            unit.status = "skipped"
+        if unit.status not in ("ok", "empty"):
+            self._settle(unit)
+            return
+
+        self._batch.append(unit)
+        self._batch_chunks += len(unit.documents)
+        if self._batch_chunks >= self.config.batch_size:
+            self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        if self._batch:
+            self._embed.inbox.put(_Batch(self._batch))
+            self._batch = []
+            self._batch_chunks = 0
+
+    # -------------------------------------------------------------------------
+    # Embed and write
+    # -------------------------------------------------------------------------
+
+    def _embed_batch(self, batch: _Batch) -> _Batch:
+        """Diff the batch against stored chunks and embed only new ones."""
+        batch.documents = [
+            doc for unit in batch.units for doc in unit.documents if doc.page_content
+        ]
+        batch.plan = plan_chunk_sync(batch.documents, batch.sources)
+        if batch.plan is not None and not embed_chunk_sync_plan(batch.plan):
+            batch.failed = True
+        return batch
+
+    def _write_batch(self, batch: _Batch) -> _Batch:
+        """Persist the batch (falling back to LangChain without the API)."""
+        if batch.failed:
+            if batch.plan is not None:
+                release_chunk_sync_plan(batch.plan)
+            return batch
+        if batch.plan is None:
+            batch.result = add_documents_with_fallback(batch.documents)
+            batch.failed = batch.result.added < len(batch.documents)
+        else:
+            # Any shortfall fails the batch so its units are not checkpointed
+            # and the next run retries them
+            batch.result = write_chunk_sync_plan(batch.plan)
+            batch.failed = batch.result.added < len(batch.plan.new_docs)
+        return batch
+
+    def _on_written(self, batch: Any) -> None:
+        """Account for a written batch and checkpoint its units."""
+        if batch is _DONE:
+            return
+        if batch.failed:
+            for unit in batch.units:
+                unit.status = "error"
+                unit.error = unit.error or "storage failed"
+                self._settle(unit)
+            return
+
+        result = batch.result or ChunkSyncResult()
+        with self._lock:
+            self.metrics.chunks_added += result.added
+            self.metrics.chunks_unchanged += result.unchanged
+            self.metrics.chunks_deleted += result.deleted
+            self.metrics.chunks_suppressed += result.suppressed
+        if self.checkpoints:
+            self.checkpoints.mark(batch.units)
+        for unit in batch.units:
+            self._settle(unit)
+
+    # -------------------------------------------------------------------------
+    # Accounting and reporting
+    # -------------------------------------------------------------------------
+
+    def _settle(self, unit: IngestUnit) -> None:
+        """Count a unit leaving the pipeline."""
+        with self._lock:
+            if unit.status in ("ok", "empty"):
+                self.metrics.units_written += 1
+            elif unit.status == "error":
+                self.metrics.units_failed += 1
+            else:
+                self.metrics.units_skipped += 1
+        self._unit_done(unit)
+
+    def _unit_done(self, unit: IngestUnit) -> None:
+        if self.on_unit_done is None:
+            return
+        try:
+            self.on_unit_done(unit)
+        except Exception as e:
+            logger.warning(f"{self.name} unit callback failed: {e}")
+
+    def _refresh(self, start: float) -> None:
+        self.metrics.elapsed = time.time() - start
+        for stage in self._stages:
+            stage.metrics.queue_depth = stage.inbox.qsize()
+
+    def _report_metrics(self) -> None:
+        if self.progress is None:
+            return
+        try:
+            if hasattr(self.progress, "report_stage_metrics"):
+                self.progress.report_stage_metrics(self.metrics)
+            elif callable(self.progress):
+                self.progress(self.metrics.summary())
+        except Exception:
+            logger.warning("Progress callback failed")
+
+    def _report_message(self, message: str) -> None:
+        if self.progress is None:
+            return
+        try:
+            if hasattr(self.progress, "report_progress"):
+                self.progress.report_progress(message)
+            elif callable(self.progress):
+                self.progress(message)
+        except Exception:
+            logger.warning("Progress callback failed")
+
+
+__all__ = [
+    "CheckpointStore",
+    "IngestPipeline",
+    "IngestUnit",
+    "PipelineConfig",
+    "PipelineMetrics",
+    "StageMetrics",
+]
@@ -0,0 +1,522 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Bulk codebase ingestion for the /populate command.
+
+Runs the shared staged pipeline (src.learning.pipeline) over a directory:
+
+1. Source: the shared walker lists candidate files; binary, unsupported and
+   oversized files are skipped, and files completed by an interrupted
+   earlier run (unchanged mtime and size) are resumed from checkpoints.
+2. Read: threads load and decode files (UTF-8, falling back to latin-1).
+3. Chunk: a process pool chunks files (``--workers``).
+4. Embed + write: batches of whole files are diffed against the stored
+   chunks; only new chunks are embedded, vanished ones are deleted.
+
+Every stage preserves walk order, so a parallel run adds exactly the same
+chunks, in the same order, as a serial (``workers=1``) run.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Iterator, List, Optional, Tuple
+
+from src.core.chunking import Chunk, chunk_document
+from src.core.constants import (
+    EMBED_BATCH_SIZE,
+    PIPELINE_READ_WORKERS,
+    POPULATE_DEFAULT_WORKERS,
+    POPULATE_MAX_FILE_SIZE,
+)
+from src.core.file_walker import walk_files
+from src.learning.pipeline import IngestPipeline, IngestUnit, PipelineConfig
+
+logger = logging.getLogger(__name__)
+
+# Supported file extensions
+TEXT_EXTENSIONS = frozenset(
+    {
+        ".py",
+        ".js",
+        ".ts",
+        ".jsx",
+        ".tsx",
+        ".java",
+        ".cpp",
+        ".c",
+        ".h",
+        ".go",
+        ".rs",
+        ".rb",
+        ".php",
+        ".swift",
+        ".kt",
+        ".scala",
+        ".r",
+        ".m",
+        ".md",
+        ".txt",
+        ".rst",
+        ".adoc",
+        ".tex",
+        ".json",
+        ".yaml",
+        ".yml",
+        ".xml",
+        ".html",
+        ".htm",
+        ".css",
+        ".scss",
+        ".sass",
+        ".less",
+        ".sh",
+        ".bash",
+        ".zsh",
+        ".fish",
+        ".ps1",
+        ".bat",
+        ".cmd",
+        ".sql",
+        ".vim",
+        ".el",
+        ".clj",
+        ".cljs",
+        ".edn",
+        ".erl",
+        ".hrl",
+        ".ex",
+        ".exs",
+        ".ml",
+        ".mli",
+        ".fs",
+        ".fsx",
+        ".fsi",
+        ".hs",
+        ".lhs",
+        ".jl",
+        ".lua",
+        ".moon",
+        ".nims",
+        ".nim",
+        ".cr",
+        ".pony",
+        ".zig",
+        ".v",
+        ".vlt",
+        ".sv",
+        ".svh",
+        ".vhd",
+        ".vhdl",
+    }
+)
+
+# Binary extensions to skip
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".ico",
+        ".svg",
+        ".webp",
+        ".mp3",
+        ".mp4",
+        ".avi",
+        ".mov",
+        ".wmv",
+        ".flv",
+        ".webm",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".ppt",
+        ".pptx",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".7z",
+        ".rar",
+        ".exe",
+        ".dll",
+        ".so",
+        ".dylib",
+        ".bin",
+        ".dat",
+        ".db",
+        ".sqlite",
+        ".sqlite3",
+    }
+)
+
+
+# =============================================================================
+# READ
+# =============================================================================
+
+
+def read_text_file(file_path: str) -> Optional[str]:
+    """
+    Read a file as text, falling back from UTF-8 to latin-1.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        File content, or None if the file cannot be decoded
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+    except UnicodeDecodeError:
+        try:
+            with open(file_path, "r", encoding="latin-1") as f:
+                return f.read()
+        except Exception:
+            return None
+
+
+# =============================================================================
+# WALK STAGE
+# =============================================================================
+
+
+def iter_candidate_files(dir_path: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Walk a directory and classify files for ingestion.
+
+    Args:
+        dir_path: Root directory to scan
+
+    Yields:
+        (file_path, skip_reason) tuples; skip_reason is None for files
+        that should be read and chunked
+    """
+    # Ignored directories (.gitignore, node_modules, build output,
+    # virtualenvs, ...) are pruned by the shared walker
+    for entry in walk_files(dir_path):
+        try:
+            size: Optional[int] = entry.size
+        except OSError:
+            size = None
+        yield entry.path, classify_file(entry.path, size)
+
+
+def classify_file(file_path: str, size: Optional[int]) -> Optional[str]:
+    """
+    Decide whether a file is ingested.
+
+    Args:
+        file_path: Path to the file
+        size: File size in bytes (None if it could not be determined)
+
+    Returns:
+        A skip reason ("binary", "unsupported", "too_large", "unreadable"),
+        or None if the file should be read and chunked
+    """
+    filename = os.path.basename(file_path)
+    _, ext = os.path.splitext(filename)
+    ext = ext.lower()
+
+    if ext in BINARY_EXTENSIONS:
+        return "binary"
+
+    # Files without an extension are tried as text
+    if ext and ext not in TEXT_EXTENSIONS and not filename.endswith("Makefile"):
+        return "unsupported"
+
+    if size is None:
+        return "unreadable"
+    if size > POPULATE_MAX_FILE_SIZE:
+        return "too_large"
+    return None
+
+
+def build_file_documents(
+    file_path: str, chunks: List[Chunk], base_dir: str
+) -> List[Any]:
+    """
+    Turn a chunked file into knowledge base documents.
+
+    Args:
+        file_path: Path of the chunked file
+        chunks: The file's chunks
+        base_dir: Directory relative paths are computed against
+
+    Returns:
+        One langchain Document per chunk
+    """
+    from langchain_core.documents import Document
+
+    rel_path = os.path.relpath(file_path, base_dir)
+    filename = os.path.basename(file_path)
+    return [
+        Document(
+            page_content=chunk.text,
+            metadata={
+                "source": file_path,
+                "relative_path": rel_path,
+                "filename": filename,
+                "chunk_index": i,
+                "total_chunks": len(chunks),
+                "type": "code_file",
+                **chunk.to_metadata(),
+            },
+        )
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+
+@dataclass
+class PopulateStats:
+    """Counters and throughput for one populate run."""
+
+    files_processed: int = 0
+    files_skipped: int = 0
+    files_resumed: int = 0
+    chunks_added: int = 0
+    chunks_unchanged: int = 0
+    chunks_deleted: int = 0
+    chunks_suppressed: int = 0
+    errors: int = 0
+    workers: int = 1
+    elapsed: float = 0.0
+    interrupted: bool = False
+
+    @property
+    def files_per_second(self) -> float:
+        """Files processed per second of wall time."""
+        return self.files_processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def chunks_per_second(self) -> float:
+        """Chunks stored per second of wall time."""
+        return self.chunks_added / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def default_worker_count() -> int:
+    """Return the default number of read/chunk workers for this machine."""
+    return max(1, min(POPULATE_DEFAULT_WORKERS, os.cpu_count() or 1))
+
+
+def read_unit(unit: IngestUnit) -> IngestUnit:
+    """Read stage: load a file's text into unit.data."""
+    content = read_text_file(unit.key)
+    if content is None:
+        unit.status = "unreadable"
+    elif not content.strip():
+        unit.status = "empty"
+    else:
+        unit.data = content
+    return unit
+
+
+def chunk_unit(unit: IngestUnit, base_dir: str) -> IngestUnit:
+    """
+    Chunk stage: turn a file's text into documents.
+
+    Runs in worker processes, so it must stay a picklable module-level
+    function. Replaces unit.data with the content hash so the text is not
+    shipped back to the parent process.
+    """
+    from src.learning.content_hash import compute_string_hash
+
+    content = unit.data
+    chunks = chunk_document(content, file_path=unit.key)
+    unit.data = compute_string_hash(content)
+    unit.documents = build_file_documents(unit.key, chunks, base_dir)
+    return unit
+
+
+class PopulatePipeline:
+    """
+    Bulk codebase ingestion on top of the shared IngestPipeline.
+
+    Usage:
+        pipeline = PopulatePipeline("./my-project", workers=4)
+        stats = pipeline.run()
+        print(stats.files_per_second, stats.chunks_per_second)
+    """
+
+    def __init__(
+        self,
+        dir_path: str,
+        workers: Optional[int] = None,
+        batch_size: int = EMBED_BATCH_SIZE,
+        verbose: bool = False,
+        progress: Optional[Any] = None,
+        resume: bool = True,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            dir_path: Directory to ingest
+            workers: Chunk worker processes (1 = run serially in-process)
+            batch_size: Chunks per embedding/write batch
+            verbose: Log per-file progress
+            progress: Receives throughput/ETA reports (see IngestPipeline)
+            resume: Checkpoint the run so an interrupted run can resume
+        """
+        self.dir_path = dir_path
+        self.workers = max(
+            1, workers if workers is not None else default_worker_count()
+        )
+        self.batch_size = max(1, batch_size)
+        self.verbose = verbose
+        self.progress = progress
+        self.resume = resume
+        self.stats = PopulateStats(workers=self.workers)
+        self._lock = threading.Lock()
+
+    def run_id(self) -> str:
+        """Checkpoint identifier: one resumable run per space and directory."""
+        from src.core.context import get_context
+
+        space = get_context().current_space
+        return f"populate:{space}:{os.path.abspath(self.dir_path)}"
+
+    def run(self) -> PopulateStats:
+        """
+        Execute the pipeline and return its statistics.
+
+        Unreadable directories are skipped by the walk; any other failure
+        while walking is raised once the files already found are finished
+        (they stay checkpointed, so a re-run resumes).
+        """
+        parallel = self.workers > 1
+        # Copies of a file are synced like any other file, so chunks stored
+        # for them stay in step; their content is stored once, the copies'
+        # chunks being suppressed as near-duplicates (see plan_chunk_sync)
+        pipeline = IngestPipeline(
+            "populate",
+            self._units(),
+            read=read_unit,
+            chunk=partial(chunk_unit, base_dir=self.dir_path),
+            config=PipelineConfig(
+                read_workers=PIPELINE_READ_WORKERS if parallel else 1,
+                chunk_workers=self.workers,
+                chunk_processes=parallel,
+                batch_size=self.batch_size,
+            ),
+            run_id=self.run_id() if self.resume else None,
+            progress=self.progress,
+            on_unit_done=self._on_unit_done,
+        )
+        metrics = pipeline.run()
+
+        self.stats.chunks_added = metrics.chunks_added
+        self.stats.chunks_unchanged = metrics.chunks_unchanged
+        self.stats.chunks_deleted = metrics.chunks_deleted
+        self.stats.chunks_suppressed = metrics.chunks_suppressed
+        self.stats.elapsed = metrics.elapsed
+        self.stats.interrupted = metrics.interrupted
+        return self.stats
+
+    def _units(self) -> Iterator[IngestUnit]:
+        """Source stage: walk the tree and yield candidate files."""
+        for file_path, skip_reason in iter_candidate_files(self.dir_path):
+            if skip_reason is None:
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    skip_reason = "unreadable"
+            if skip_reason is not None:
+                if skip_reason == "too_large" and self.verbose:
+                    logger.warning(f"   ⚠️ Skipping large file: {file_path}")
+                with self._lock:
+                    self.stats.files_skipped += 1
+                continue
+            yield IngestUnit(
+                file_path, fingerprint=f"{stat.st_mtime_ns}:{stat.st_size}"
+            )
+
+    def _on_unit_done(self, unit: IngestUnit) -> None:
+        """Update statistics for a file leaving the pipeline."""
+        from src.learning.auto_learn import register_content_hash
+
+        with self._lock:
+            if unit.status == "ok":
+                register_content_hash(unit.data)
+                self.stats.files_processed += 1
+                if self.verbose and self.stats.files_processed % 10 == 0:
+                    logger.info(
+                        f"   📄 Processed {self.stats.files_processed} files..."
+                    )
+            elif unit.status == "resumed":
+                self.stats.files_resumed += 1
+            elif unit.status == "error":
+                if self.verbose:
+                    logger.warning(f"   ⚠️ Error processing {unit.key}: {unit.error}")
+                self.stats.errors += 1
+            elif unit.status != "empty":
+                self.stats.files_skipped += 1
+
+
+def run_populate(
+    dir_path: str,
+    workers: Optional[int] = None,
+    verbose: bool = False,
+    progress: Optional[Any] = None,
+) -> PopulateStats:
+    """
+    Ingest a directory tree into the current space's knowledge base.
+
+    Args:
+        dir_path: Directory to ingest
+        workers: Chunk worker processes (default: CPU count, capped)
+        verbose: Log per-file progress
+        progress: Receives throughput/ETA reports
+
+    Returns:
+        PopulateStats for the run
+    """
+    return PopulatePipeline(
+        dir_path, workers=workers, verbose=verbose, progress=progress
+    ).run()
+
+
+__all__ = [
+    "PopulatePipeline",
+    "PopulateStats",
+    "build_file_documents",
+    "chunk_unit",
+    "classify_file",
+    "default_worker_count",
+    "iter_candidate_files",
+    "read_text_file",
+    "read_unit",
+    "run_populate",
+]
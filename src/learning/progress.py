@@ -26,7 +26,7 @@ This module provides progress callback implementations for different display mod
 including CLI output, GUI integration, and silent operation for testing.
 """
 
-from typing import Protocol, runtime_checkable
+from typing import Any, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -54,6 +54,10 @@ class ProgressCallback(Protocol):
         """Report an error that occurred during processing."""
         ...
 
+    def report_stage_metrics(self, metrics: Any) -> None:
+        """Report throughput, queue depth and ETA of an ingestion pipeline."""
+        ...
+
     def report_complete(self, stats: dict) -> None:
         """Report that the entire operation has completed."""
         ...
@@ -97,6 +101,11 @@ class CLIProgress:
         """Report an error that occurred during processing."""
         print(f"❌ Error: {message}", flush=True)
 
+    def report_stage_metrics(self, metrics: Any) -> None:
+        """Report throughput, queue depth and ETA of an ingestion pipeline."""
+        if self.verbose:
+            print(f"📊 {metrics.summary()}", flush=True)
+
     def report_complete(self, stats: dict) -> None:
         """Report that the entire operation has completed."""
         success_count = stats.get("success_count", 0)
@@ -169,6 +178,16 @@ class GUIProgress:
             # Fallback to console
             print(f"[GUI ERROR] {message}", flush=True)
 
+    def report_stage_metrics(self, metrics: Any) -> None:
+        """Report throughput, queue depth and ETA of an ingestion pipeline."""
+        if self.gui_reference:
+            # Would call GUI method like:
+            # self.gui_reference.update_progress(metrics.summary())
+            pass
+        else:
+            # Fallback to console
+            print(f"[GUI] {metrics.summary()}", flush=True)
+
     def report_complete(self, stats: dict) -> None:
         """Report that the entire operation has completed."""
         if self.gui_reference:
@@ -209,6 +228,10 @@ class NoOpProgress:
         """Silently ignore error reports."""
         pass
 
+    def report_stage_metrics(self, metrics: Any) -> None:
+        """Silently ignore pipeline metrics."""
+        pass
+
     def report_complete(self, stats: dict) -> None:
         """Silently ignore completion reports."""
         pass
@@ -0,0 +1,476 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Filesystem watcher for continuous incremental learning.
+
+Watches the directories of a space and keeps their chunks in the knowledge
+base current without full /populate rescans:
+
+1. Detect: ``watchfiles`` (inotify/FSEvents/ReadDirectoryChangesW) when it
+   is installed, otherwise a polling backend that compares the mtime and
+   size of every file from one cached-stat walk to the next.
+2. Debounce: events are coalesced per path and a path is only ingested once
+   it has been quiet for ``WATCH_DEBOUNCE_SECONDS``, so an editor's burst of
+   writes costs a single re-ingest.
+3. Ingest: a small pool of low-priority threads reads and chunks each path
+   like /populate and syncs its chunks (only changed chunks are embedded;
+   chunks of deleted files are removed).
+
+Paths are filtered with the same ignore rules as the shared walker, and
+changes are held while a different space is active.
+
+Usage:
+    from src.learning.watcher import get_watch_service
+
+    service = get_watch_service()
+    service.start(["./docs", "./src"])
+    print(service.status())
+    service.stop()
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.core.constants import (
+    POPULATE_QUEUE_FACTOR,
+    WATCH_DEBOUNCE_SECONDS,
+    WATCH_MAX_WORKERS,
+    WATCH_NICE_INCREMENT,
+    WATCH_POLL_INTERVAL,
+)
+from src.core.context import get_context
+from src.core.file_walker import IGNORE_FILENAMES, IgnoreMatcher, walk_files
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WatchStatus:
+    """Snapshot of the watcher's state and counters."""
+
+    running: bool = False
+    backend: str = ""
+    space: str = ""
+    roots: List[str] = field(default_factory=list)
+    paused: bool = False
+    pending: int = 0
+    in_progress: int = 0
+    events: int = 0
+    files_synced: int = 0
+    files_removed: int = 0
+    chunks_added: int = 0
+    chunks_deleted: int = 0
+    chunks_suppressed: int = 0
+    errors: int = 0
+    last_sync: Optional[float] = None
+
+
+def _watchfiles_available() -> bool:
+    """Check whether the native watchfiles backend can be used."""
+    try:
+        import watchfiles  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def _lower_thread_priority() -> None:
+    """Run the calling (ingest) thread at a lower scheduling priority."""
+    if not hasattr(os, "setpriority"):
+        return
+    try:
+        # On Linux the native thread ID addresses a single thread
+        tid = threading.get_native_id()
+        current = os.getpriority(os.PRIO_PROCESS, tid)
+        os.setpriority(os.PRIO_PROCESS, tid, current + WATCH_NICE_INCREMENT)
+    except OSError:
+        pass
+
+
+def snapshot_tree(root: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Record (mtime_ns, size) of every walkable file below root.
+
+    Uses the stat cached by ``os.scandir``, so a snapshot costs one
+    directory listing per directory plus one stat per file.
+    """
+    snapshot: Dict[str, Tuple[int, int]] = {}
+    for entry in walk_files(root):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def diff_snapshots(
+    old: Dict[str, Tuple[int, int]], new: Dict[str, Tuple[int, int]]
+) -> Set[str]:
+    """Paths that were added, removed or modified between two snapshots."""
+    changed = {path for path, sig in new.items() if old.get(path) != sig}
+    changed.update(path for path in old if path not in new)
+    return changed
+
+
+class WatchService:
+    """
+    Debounced filesystem watcher feeding changed files into ingestion.
+
+    Backends call notify(); a dispatcher thread hands quiet paths to the
+    ingest pool, at most ``max_workers * POPULATE_QUEUE_FACTOR`` at a time
+    and never the same path twice concurrently.
+    """
+
+    def __init__(
+        self,
+        debounce: float = WATCH_DEBOUNCE_SECONDS,
+        poll_interval: float = WATCH_POLL_INTERVAL,
+        max_workers: int = WATCH_MAX_WORKERS,
+    ):
+        """
+        Initialize the service (nothing is watched until start()).
+
+        Args:
+            debounce: Quiet period in seconds before a path is ingested
+            poll_interval: Seconds between scans of the polling backend
+            max_workers: Paths ingested concurrently
+        """
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.max_workers = max(1, max_workers)
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, float] = {}
+        self._in_progress: Set[str] = set()
+        self._matchers: List[IgnoreMatcher] = []
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._status = WatchStatus()
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(
+        self,
+        paths: Iterable[str],
+        space: Optional[str] = None,
+        backend: Optional[str] = None,
+    ) -> bool:
+        """
+        Start watching directories.
+
+        Args:
+            paths: Directories to watch
+            space: Space to ingest into (default: the current space)
+            backend: "watchfiles" or "polling" (default: best available)
+
+        Returns:
+            False if already running or no valid directory was given
+        """
+        if self.is_running():
+            return False
+
+        roots = sorted(
+            {os.path.abspath(os.path.expanduser(p)) for p in paths if os.path.isdir(p)}
+        )
+        if not roots:
+            return False
+
+        if backend is None:
+            backend = "watchfiles" if _watchfiles_available() else "polling"
+
+        self._stop_event.clear()
+        with self._lock:
+            self._pending.clear()
+            self._in_progress.clear()
+        self._matchers = [IgnoreMatcher(root) for root in roots]
+        self._status = WatchStatus(
+            running=True,
+            backend=backend,
+            space=space or get_context().current_space,
+            roots=roots,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="WatchIngest",
+            initializer=_lower_thread_priority,
+        )
+
+        detect = self._run_watchfiles if backend == "watchfiles" else self._run_polling
+        self._threads = [
+            threading.Thread(target=detect, name="WatchDetect", daemon=True),
+            threading.Thread(
+                target=self._run_dispatcher, name="WatchDispatch", daemon=True
+            ),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+        logger.info(f"Watching {', '.join(roots)} ({backend})")
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop watching; in-flight ingestion is allowed to finish."""
+        if not self._status.running:
+            return
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._status.running = False
+        logger.info("Watcher stopped")
+
+    def is_running(self) -> bool:
+        """Check whether the watcher is active."""
+        return self._status.running
+
+    def status(self) -> WatchStatus:
+        """Return a snapshot of the watcher's state."""
+        with self._lock:
+            pending = len(self._pending)
+            in_progress = len(self._in_progress)
+        snapshot = replace(
+            self._status,
+            roots=list(self._status.roots),
+            pending=pending,
+            in_progress=in_progress,
+        )
+        snapshot.paused = snapshot.running and self._is_paused()
+        return snapshot
+
+    # -------------------------------------------------------------------------
+    # Event intake and debouncing
+    # -------------------------------------------------------------------------
+
+    def notify(self, paths: Iterable[str]) -> int:
+        """
+        Record changed paths (called by the backends).
+
+        Args:
+            paths: Paths reported as added, modified or deleted
+
+        Returns:
+            Number of paths accepted after ignore filtering
+        """
+        now = time.monotonic()
+        accepted = 0
+        with self._lock:
+            for path in paths:
+                path = os.path.abspath(path)
+                if os.path.basename(path) in IGNORE_FILENAMES:
+                    for matcher in self._matchers:
+                        matcher.invalidate()
+                if not self._is_watched(path):
+                    continue
+                self._pending[path] = now
+                accepted += 1
+            self._status.events += accepted
+        return accepted
+
+    def _is_watched(self, path: str) -> bool:
+        """True if some root contains path and its rules don't ignore it."""
+        return any(not matcher.is_ignored(path) for matcher in self._matchers)
+
+    def _is_paused(self) -> bool:
+        """Changes are held while another space is active."""
+        return get_context().current_space != self._status.space
+
+    def dispatch_ready(self, now: Optional[float] = None) -> List[str]:
+        """
+        Submit paths that have been quiet for the debounce period.
+
+        Args:
+            now: Monotonic timestamp to evaluate against (default: now)
+
+        Returns:
+            Paths submitted for ingestion
+        """
+        if self._executor is None or self._is_paused():
+            return []
+
+        now = time.monotonic() if now is None else now
+        limit = self.max_workers * POPULATE_QUEUE_FACTOR
+        ready: List[str] = []
+        with self._lock:
+            for path, last_event in sorted(self._pending.items(), key=lambda i: i[1]):
+                if len(self._in_progress) >= limit:
+                    break
+                if now - last_event < self.debounce or path in self._in_progress:
+                    continue
+                ready.append(path)
+                self._in_progress.add(path)
+            for path in ready:
+                del self._pending[path]
+
+        for path in ready:
+            self._executor.submit(self._ingest_path, path)
+        return ready
+
+    # -------------------------------------------------------------------------
+    # Ingestion
+    # -------------------------------------------------------------------------
+
+    def _find_root(self, path: str) -> str:
+        """Return the most specific watched root containing path."""
+        containing = [
+            root
+            for root in self._status.roots
+            if path.startswith(os.path.join(root, ""))
+        ]
+        return max(containing, key=len) if containing else os.path.dirname(path)
+
+    def _ingest_path(self, path: str) -> None:
+        """Bring one path's chunks in line with the file on disk."""
+        from src.core.context_utils import sync_documents_to_knowledge_base
+        from src.learning.pipeline import IngestUnit
+        from src.learning.populate import chunk_unit, classify_file, read_unit
+
+        try:
+            documents = []
+            removed = not os.path.isfile(path)
+            if not removed:
+                skip_reason = classify_file(path, os.path.getsize(path))
+                if skip_reason is not None:
+                    logger.debug(f"Watcher skipping {path}: {skip_reason}")
+                    return
+                try:
+                    unit = read_unit(IngestUnit(path))
+                except OSError as e:
+                    # Gone or locked since the event; a later event resyncs it
+                    logger.debug(f"Watcher could not read {path}: {e}")
+                    return
+                if unit.status == "ok":
+                    unit = chunk_unit(unit, self._find_root(path))
+                    documents = unit.documents
+                elif unit.status != "empty":
+                    logger.debug(f"Watcher could not read {path}: {unit.status}")
+                    return
+
+            # The space may have been switched since dispatch; hold the path
+            # until it is active again rather than syncing it into another one
+            if self._is_paused():
+                with self._lock:
+                    self._pending.setdefault(path, time.monotonic())
+                return
+
+            # An empty chunk set deletes whatever is stored for the path
+            synced = sync_documents_to_knowledge_base(documents, sources=[path])
+            with self._lock:
+                if removed:
+                    self._status.files_removed += 1
+                else:
+                    self._status.files_synced += 1
+                self._status.chunks_added += synced.added
+                self._status.chunks_deleted += synced.deleted
+                self._status.chunks_suppressed += synced.suppressed
+                self._status.last_sync = time.time()
+        except Exception as e:
+            logger.warning(f"Watcher failed to ingest {path}: {e}")
+            with self._lock:
+                self._status.errors += 1
+        finally:
+            with self._lock:
+                self._in_progress.discard(path)
+
+    # -------------------------------------------------------------------------
+    # Threads
+    # -------------------------------------------------------------------------
+
+    def _run_dispatcher(self) -> None:
+        """Periodically submit debounced paths until stopped."""
+        interval = max(0.05, min(self.debounce / 4, 0.5))
+        while not self._stop_event.wait(interval):
+            try:
+                self.dispatch_ready()
+            except Exception as e:
+                logger.warning(f"Watcher dispatch failed: {e}")
+
+    def _run_watchfiles(self) -> None:
+        """Native change notifications via watchfiles."""
+        import watchfiles
+
+        try:
+            for changes in watchfiles.watch(
+                *self._status.roots,
+                stop_event=self._stop_event,
+                debounce=int(self.debounce * 1000),
+                raise_interrupt=False,
+            ):
+                self.notify(path for _, path in changes)
+        except Exception as e:
+            logger.warning(f"Native file watching failed, falling back to polling: {e}")
+            self._status.backend = "polling"
+            self._run_polling()
+
+    def _run_polling(self) -> None:
+        """Detect changes by comparing mtime/size snapshots."""
+        snapshots = {root: snapshot_tree(root) for root in self._status.roots}
+        while not self._stop_event.wait(self.poll_interval):
+            for root in self._status.roots:
+                try:
+                    current = snapshot_tree(root)
+                except Exception as e:
+                    logger.debug(f"Polling {root} failed: {e}")
+                    continue
+                changed = diff_snapshots(snapshots[root], current)
+                snapshots[root] = current
+                if changed:
+                    self.notify(changed)
+
+
+# Module-level singleton
+_watch_service: Optional[WatchService] = None
+
+
+def get_watch_service() -> WatchService:
+    """
+    Get the global WatchService singleton.
+
+    Returns:
+        WatchService: The global watcher instance
+    """
+    global _watch_service
+    if _watch_service is None:
+        _watch_service = WatchService()
+    return _watch_service
+
+
+__all__ = [
+    "WatchService",
+    "WatchStatus",
+    "diff_snapshots",
+    "get_watch_service",
+    "snapshot_tree",
+]
@@ -0,0 +1,687 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Concurrent web crawl ingestion with conditional-GET caching.
+
+``/web crawl <url>`` follows links breadth-first from a start page and
+feeds every fetched page into the staged ingestion pipeline
+(src/learning/pipeline.py), where it is split into heading-aware chunks
+and batch-synced into the current space's collection.
+
+- Fetching: up to WEB_CRAWL_CONCURRENCY requests in flight, at most
+  ``max_pages`` pages and ``depth`` link hops from the start URL.
+- Scope: only URLs on the start URL's origin (scheme + host + port) are
+  followed, and robots.txt rules for WEB_CRAWL_USER_AGENT are honoured.
+  URLs listed in the origin's sitemap(s) are crawled as if linked from the
+  start page.
+- Caching: each page's ETag, Last-Modified, content hash and outgoing
+  links are stored per space in the ``web_pages`` table (schema v5).
+  Re-crawls send If-None-Match / If-Modified-Since; pages answering
+  304 (or with unchanged content) are not re-processed, and their cached
+  links keep the crawl going. Pages that now return 404/410 have their
+  chunks removed.
+
+HTML is converted to markdown-like text with the standard library's
+HTMLParser, so crawling needs no optional dependencies.
+
+Usage:
+    stats = WebCrawler("https://docs.example.com/", depth=2, max_pages=100).run()
+    print(stats.pages_ingested, stats.pages_unchanged)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urldefrag, urljoin, urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from src.core.chunking import chunk_document
+from src.core.constants import (
+    WEB_CRAWL_CONCURRENCY,
+    WEB_CRAWL_DEFAULT_DEPTH,
+    WEB_CRAWL_DEFAULT_MAX_PAGES,
+    WEB_CRAWL_MAX_PAGE_SIZE,
+    WEB_CRAWL_TIMEOUT,
+    WEB_CRAWL_USER_AGENT,
+)
+from src.core.context import get_context
+from src.learning.pipeline import IngestPipeline, IngestUnit, PipelineConfig
+
+logger = logging.getLogger(__name__)
+
+# Content types whose body is ingested
+_TEXT_TYPES = ("text/html", "application/xhtml+xml", "text/plain", "text/markdown")
+
+
+# =============================================================================
+# HTML CONVERSION
+# =============================================================================
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collect a page's title, links and markdown-like text."""
+
+    _BLOCK_TAGS = {"p", "div", "section", "article", "br", "tr", "table", "blockquote"}
+    _SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "head"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.links: List[str] = []
+        self._parts: List[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+        self._in_pre = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "title":
+            self._in_title = True
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.links.append(href)
+        if len(tag) == 2 and tag[0] == "h" and tag[1] in "123456":
+            self._parts.append("\n\n" + "#" * int(tag[1]) + " ")
+        elif tag == "li":
+            self._parts.append("\n- ")
+        elif tag == "pre":
+            self._in_pre = True
+            self._parts.append("\n\n```\n")
+        elif tag in self._BLOCK_TAGS:
+            self._parts.append("\n\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        if tag in self._SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        if tag == "pre":
+            self._in_pre = False
+            self._parts.append("\n```\n\n")
+        elif (len(tag) == 2 and tag[0] == "h") or tag in self._BLOCK_TAGS:
+            self._parts.append("\n\n")
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data.strip()
+        if self._skip_depth:
+            return
+        if self._in_pre:
+            self._parts.append(data)
+            return
+        words = " ".join(data.split())
+        lead = " " if data[:1].isspace() else ""
+        trail = " " if data[-1:].isspace() and words else ""
+        self._parts.append(lead + words + trail)
+
+    def text(self) -> str:
+        lines = [line.rstrip() for line in "".join(self._parts).splitlines()]
+        text, blank = [], 0
+        for line in lines:
+            blank = blank + 1 if not line.strip() else 0
+            if blank <= 1:
+                text.append(line.strip() if not line.startswith(" ") else line)
+        return "\n".join(text).strip()
+
+
+def html_to_text(html: str) -> Tuple[str, str, List[str]]:
+    """
+    Convert HTML into markdown-like text.
+
+    Returns:
+        (title, text, raw hrefs of the page's links)
+    """
+    parser = _HTMLTextExtractor()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception as e:
+        logger.debug(f"HTML parsing stopped early: {e}")
+    return parser.title, parser.text(), parser.links
+
+
+def build_page_documents(url: str, title: str, text: str) -> List[Any]:
+    """Split a page's markdown along its headings into knowledge base documents."""
+    from langchain_core.documents import Document
+
+    chunks = chunk_document(text, file_path=url, language="markdown")
+    added_at = datetime.now().isoformat()
+    return [
+        Document(
+            page_content=chunk.text,
+            metadata={
+                "source": url,
+                "title": title or "Web Page",
+                "type": "web_page",
+                "added_at": added_at,
+                "chunk_index": i,
+                "total_chunks": len(chunks),
+                **chunk.to_metadata(),
+            },
+        )
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+# =============================================================================
+# PAGE CACHE
+# =============================================================================
+
+
+@dataclass
+class PageCacheEntry:
+    """Conditional-GET validators and links of a crawled page."""
+
+    url: str
+    etag: str = ""
+    last_modified: str = ""
+    content_hash: str = ""
+    links: List[str] = field(default_factory=list)
+
+
+def load_page_cache(space: str) -> Dict[str, PageCacheEntry]:
+    """Load every cached page of a space (empty without a database)."""
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return {}
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                "SELECT url, etag, last_modified, content_hash, links FROM web_pages WHERE space = ?",
+                (space,),
+            )
+            rows = cursor.fetchall()
+    except Exception as e:
+        logger.warning(f"Failed to load web page cache: {e}")
+        return {}
+
+    entries = {}
+    for url, etag, last_modified, content_hash, links in rows:
+        try:
+            link_list = json.loads(links or "[]")
+        except json.JSONDecodeError:
+            link_list = []
+        entries[url] = PageCacheEntry(url, etag, last_modified, content_hash, link_list)
+    return entries
+
+
+def record_page(space: str, entry: PageCacheEntry) -> bool:
+    """Insert or replace a page's cache entry."""
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return False
+    try:
+        with ctx.db_lock:
+            ctx.db_conn.execute(
+                """
+                INSERT OR REPLACE INTO web_pages
+                    (space, url, etag, last_modified, content_hash, links, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                (
+                    space,
+                    entry.url,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.content_hash,
+                    json.dumps(entry.links),
+                ),
+            )
+            ctx.db_conn.commit()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to cache web page {entry.url}: {e}")
+        return False
+
+
+def forget_page(space: str, url: str) -> None:
+    """Remove a page's cache entry."""
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return
+    try:
+        with ctx.db_lock:
+            ctx.db_conn.execute(
+                "DELETE FROM web_pages WHERE space = ? AND url = ?", (space, url)
+            )
+            ctx.db_conn.commit()
+    except Exception as e:
+        logger.warning(f"Failed to forget web page {url}: {e}")
+
+
+def forget_space_pages(space: str) -> None:
+    """Drop every cached page of a space (e.g. when the space is deleted)."""
+    ctx = get_context()
+    if not ctx.db_conn or not ctx.db_lock:
+        return
+    try:
+        with ctx.db_lock:
+            ctx.db_conn.execute("DELETE FROM web_pages WHERE space = ?", (space,))
+            ctx.db_conn.commit()
+    except Exception as e:
+        logger.warning(f"Failed to delete cached web pages of {space}: {e}")
+
+
+# =============================================================================
+# CRAWLER
+# =============================================================================
+
+
+@dataclass
+class CrawledPage:
+    """Result of fetching one URL."""
+
+    url: str
+    depth: int
+    status: str = "ok"  # ok, not_modified, unchanged, gone, skipped, error
+    title: str = ""
+    text: str = ""
+    links: List[str] = field(default_factory=list)
+    etag: str = ""
+    last_modified: str = ""
+    content_hash: str = ""
+    error: str = ""
+
+
+@dataclass
+class CrawlStats:
+    """Counters of one crawl."""
+
+    pages_fetched: int = 0
+    pages_ingested: int = 0
+    pages_unchanged: int = 0
+    pages_removed: int = 0
+    pages_skipped: int = 0
+    errors: int = 0
+    chunks_added: int = 0
+    chunks_deleted: int = 0
+    blocked_by_robots: int = 0
+    elapsed: float = 0.0
+    interrupted: bool = False
+
+
+def normalize_url(url: str, base: Optional[str] = None) -> Optional[str]:
+    """Resolve a link against its page and drop the fragment (None if not http)."""
+    absolute = urldefrag(urljoin(base, url) if base else url)[0]
+    parts = urlsplit(absolute)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    if not parts.path:
+        absolute = (
+            absolute.replace(parts.netloc, parts.netloc + "/", 1)
+            if not parts.query
+            else absolute
+        )
+    return absolute
+
+
+def _origin(url: str) -> Tuple[str, str]:
+    parts = urlsplit(url)
+    return parts.scheme, parts.netloc.lower()
+
+
+class WebCrawler:
+    """
+    Crawl a site from a start URL and ingest its pages.
+
+    Args:
+        start_url: First page to fetch (defines the allowed origin)
+        depth: Link hops followed from the start page
+        max_pages: Maximum pages fetched (including unchanged ones)
+        concurrency: Concurrent requests
+        respect_robots: Honour the origin's robots.txt
+        use_sitemap: Also crawl URLs listed in the origin's sitemap(s)
+        progress: Forwarded to the ingestion pipeline
+        session: requests session to fetch with (a new one by default)
+    """
+
+    def __init__(
+        self,
+        start_url: str,
+        depth: int = WEB_CRAWL_DEFAULT_DEPTH,
+        max_pages: int = WEB_CRAWL_DEFAULT_MAX_PAGES,
+        concurrency: int = WEB_CRAWL_CONCURRENCY,
+        respect_robots: bool = True,
+        use_sitemap: bool = True,
+        progress: Optional[Any] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        normalized = normalize_url(start_url)
+        if normalized is None:
+            raise ValueError(f"Not an http(s) URL: {start_url}")
+        self.start_url = normalized
+        self.depth = max(0, depth)
+        self.max_pages = max(1, max_pages)
+        self.concurrency = max(1, concurrency)
+        self.respect_robots = respect_robots
+        self.use_sitemap = use_sitemap
+        self.progress = progress
+        self.session = session or requests.Session()
+        self.session.headers.setdefault("User-Agent", WEB_CRAWL_USER_AGENT)
+        self.space = get_context().current_space
+        self.stats = CrawlStats()
+        self._origin = _origin(self.start_url)
+        # None allows everything (no robots.txt); _robots_denied blocks the
+        # whole origin (robots.txt behind 401/403)
+        self._robots: Optional[RobotFileParser] = None
+        self._robots_denied = False
+        self._cache: Dict[str, PageCacheEntry] = {}
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def stop(self) -> None:
+        """Stop scheduling new fetches."""
+        self._stop_event.set()
+
+    # -------------------------------------------------------------------------
+    # Scope
+    # -------------------------------------------------------------------------
+
+    def _load_robots(self) -> None:
+        scheme, netloc = self._origin
+        robots_url = f"{scheme}://{netloc}/robots.txt"
+        try:
+            response = self.session.get(robots_url, timeout=WEB_CRAWL_TIMEOUT)
+        except requests.RequestException as e:
+            logger.debug(f"No robots.txt for {netloc}: {e}")
+            return
+        if response.status_code in (401, 403):
+            self._robots_denied = True
+        elif response.status_code == 200:
+            parser = RobotFileParser(robots_url)
+            parser.parse(response.text.splitlines())
+            self._robots = parser
+
+    def allowed(self, url: str) -> bool:
+        """True if the URL is on the start origin and robots.txt permits it."""
+        if _origin(url) != self._origin:
+            return False
+        if self._robots_denied or (
+            self._robots is not None
+            and not self._robots.can_fetch(WEB_CRAWL_USER_AGENT, url)
+        ):
+            with self._lock:
+                self.stats.blocked_by_robots += 1
+            return False
+        return True
+
+    def sitemap_urls(self) -> List[str]:
+        """URLs listed in the origin's sitemap(s) (robots.txt entries or /sitemap.xml)."""
+        scheme, netloc = self._origin
+        sitemaps = list((self._robots.site_maps() if self._robots else None) or [])
+        if not sitemaps:
+            sitemaps = [f"{scheme}://{netloc}/sitemap.xml"]
+
+        urls: List[str] = []
+        seen_maps: Set[str] = set()
+        while sitemaps and len(urls) < self.max_pages:
+            sitemap = sitemaps.pop(0)
+            if sitemap in seen_maps or _origin(sitemap) != self._origin:
+                continue
+            seen_maps.add(sitemap)
+            try:
+                response = self.session.get(sitemap, timeout=WEB_CRAWL_TIMEOUT)
+                if response.status_code != 200:
+                    continue
+                root = ET.fromstring(response.content)
+            except (requests.RequestException, ET.ParseError) as e:
+                logger.debug(f"Skipping sitemap {sitemap}: {e}")
+                continue
+            is_index = root.tag.endswith("sitemapindex")
+            for loc in root.iter():
+                if not loc.tag.endswith("loc") or not loc.text:
+                    continue
+                target = normalize_url(loc.text.strip())
+                if target is None:
+                    continue
+                if is_index:
+                    sitemaps.append(target)
+                else:
+                    urls.append(target)
+        return urls
+
+    # -------------------------------------------------------------------------
+    # Fetching
+    # -------------------------------------------------------------------------
+
+    def fetch(self, url: str, depth: int) -> CrawledPage:
+        """Fetch one page, conditionally if it was crawled before."""
+        page = CrawledPage(url, depth)
+        cached = self._cache.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            response = self.session.get(
+                url, headers=headers, timeout=WEB_CRAWL_TIMEOUT, stream=True
+            )
+        except requests.RequestException as e:
+            page.status, page.error = "error", str(e)
+            return page
+
+        with response:
+            if response.status_code == 304 and cached is not None:
+                page.status = "not_modified"
+                page.links = list(cached.links)
+                return page
+            if response.status_code in (404, 410):
+                page.status = "gone" if cached is not None else "skipped"
+                return page
+            if response.status_code != 200:
+                page.status, page.error = "error", f"HTTP {response.status_code}"
+                return page
+
+            content_type = (
+                response.headers.get("Content-Type", "text/html")
+                .split(";")[0]
+                .strip()
+                .lower()
+            )
+            if content_type not in _TEXT_TYPES:
+                page.status = "skipped"
+                return page
+            body = response.raw.read(WEB_CRAWL_MAX_PAGE_SIZE + 1, decode_content=True)
+            if len(body) > WEB_CRAWL_MAX_PAGE_SIZE:
+                page.status = "skipped"
+                return page
+
+            page.etag = response.headers.get("ETag", "")
+            page.last_modified = response.headers.get("Last-Modified", "")
+            has_charset = "charset" in response.headers.get("Content-Type", "").lower()
+            text = body.decode(
+                response.encoding if has_charset else "utf-8", errors="replace"
+            )
+
+        page.content_hash = hashlib.sha256(body).hexdigest()
+        if content_type in ("text/html", "application/xhtml+xml"):
+            page.title, page.text, hrefs = html_to_text(text)
+            page.links = list(
+                dict.fromkeys(filter(None, (normalize_url(h, url) for h in hrefs)))
+            )
+        else:
+            page.text = text
+        if cached is not None and cached.content_hash == page.content_hash:
+            page.status = "unchanged"
+        return page
+
+    def pages(self) -> Iterator[CrawledPage]:
+        """Fetch pages breadth-first with bounded concurrency, yielding each as it completes."""
+        if self.respect_robots:
+            self._load_robots()
+
+        frontier: Deque[Tuple[str, int]] = deque([(self.start_url, 0)])
+        seen: Set[str] = {self.start_url}
+        if self.use_sitemap and self.depth > 0:
+            for url in self.sitemap_urls():
+                if url not in seen:
+                    seen.add(url)
+                    frontier.append((url, 1))
+
+        scheduled = 0
+        in_flight: Dict[Future, str] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="WebCrawl"
+        ) as pool:
+            while frontier or in_flight:
+                while (
+                    frontier
+                    and len(in_flight) < self.concurrency
+                    and scheduled < self.max_pages
+                    and not self._stop_event.is_set()
+                ):
+                    url, depth = frontier.popleft()
+                    if not self.allowed(url):
+                        continue
+                    in_flight[pool.submit(self.fetch, url, depth)] = url
+                    scheduled += 1
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.pop(future)
+                    page = future.result()
+                    with self._lock:
+                        self.stats.pages_fetched += 1
+                    if page.depth < self.depth:
+                        for link in page.links:
+                            if link not in seen:
+                                seen.add(link)
+                                frontier.append((link, page.depth + 1))
+                    yield page
+
+    # -------------------------------------------------------------------------
+    # Ingestion
+    # -------------------------------------------------------------------------
+
+    def _units(self) -> Iterator[IngestUnit]:
+        for page in self.pages():
+            status = "ok" if page.status in ("ok", "gone") else page.status
+            yield IngestUnit(
+                key=page.url,
+                fingerprint=page.content_hash,
+                data=page,
+                status=status,
+                error=page.error,
+            )
+
+    @staticmethod
+    def _read(unit: IngestUnit) -> IngestUnit:
+        """Pages arrive fetched and converted; empty ones are skipped."""
+        page = unit.data
+        if page.status == "ok" and not page.text.strip():
+            unit.status = "empty_page"
+        return unit
+
+    @staticmethod
+    def _chunk(unit: IngestUnit) -> IngestUnit:
+        page = unit.data
+        if page.status == "gone":
+            unit.documents = []  # Syncing nothing removes the stored chunks
+        else:
+            unit.documents = build_page_documents(page.url, page.title, page.text)
+        return unit
+
+    def _on_unit_done(self, unit: IngestUnit) -> None:
+        page: CrawledPage = unit.data
+        with self._lock:
+            if unit.status == "error":
+                self.stats.errors += 1
+            elif unit.status == "empty" and page.status == "gone":
+                self.stats.pages_removed += 1
+            elif unit.status in ("ok", "empty"):
+                self.stats.pages_ingested += 1
+            elif unit.status in ("not_modified", "unchanged"):
+                self.stats.pages_unchanged += 1
+            else:
+                self.stats.pages_skipped += 1
+
+        if page.status == "gone" and unit.status == "empty":
+            forget_page(self.space, page.url)
+        elif unit.status in ("ok", "empty") or unit.status == "unchanged":
+            # New validators are recorded only once the content is stored
+            record_page(
+                self.space,
+                PageCacheEntry(
+                    page.url,
+                    page.etag,
+                    page.last_modified,
+                    page.content_hash,
+                    page.links,
+                ),
+            )
+
+    def run(self) -> CrawlStats:
+        """Crawl and ingest; returns the crawl's statistics."""
+        start = time.time()
+        self._cache = load_page_cache(self.space)
+        pipeline = IngestPipeline(
+            "web crawl",
+            self._units(),
+            read=self._read,
+            chunk=self._chunk,
+            config=PipelineConfig(read_workers=1),
+            progress=self.progress,
+            on_unit_done=self._on_unit_done,
+        )
+        metrics = pipeline.run()
+        self.stats.chunks_added = metrics.chunks_added
+        self.stats.chunks_deleted = metrics.chunks_deleted
+        self.stats.interrupted = metrics.interrupted
+        self.stats.elapsed = time.time() - start
+        return self.stats
+
+
+__all__ = [
+    "CrawlStats",
+    "CrawledPage",
+    "PageCacheEntry",
+    "WebCrawler",
+    "build_page_documents",
+    "forget_page",
+    "forget_space_pages",
+    "html_to_text",
+    "load_page_cache",
+    "normalize_url",
+    "record_page",
+]
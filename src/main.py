@@ -44,6 +44,8 @@ from src.core.config import get_config, get_logger
 from src.core.context import get_context, set_mcp_client
 from src.mcp.client import MCPClient
 from src.core.chat_loop import ChatLoop
+from src.core.jobs import get_job_manager
+from src.core.summarizer import get_summarizer
 from src.commands import CommandRegistry
 
 # Import all command handler modules to trigger auto-registration
@@ -420,15 +422,10 @@ def initialize_user_memory():
 
         # Fallback: Construct system prompt manually if DB fails
         from langchain_core.messages import SystemMessage
-        from src.tools.registry import ToolRegistry
-        from src.core.constants import SYSTEM_PROMPT
-        import json
-
-        tool_defs = ToolRegistry.get_definitions()
-        tool_json = json.dumps(tool_defs, indent=2)
+        from src.storage.memory import build_system_prompt
 
         # Verify we are using the authoritative prompt
-        fallback_content = SYSTEM_PROMPT + f"\n\nAVAILABLE TOOLS:\n{tool_json}\n"
+        fallback_content = build_system_prompt()
         ctx = get_context()
         ctx.conversation_history = [SystemMessage(content=fallback_content)]
         return True
@@ -500,10 +497,17 @@ def run_main_chat_loop() -> bool:
     print("\nHello! I'm ready to help you. Type /help for commands.")
     print("Type 'quit', 'exit', or 'q' to exit.\n")
 
-    chat_orchestrator = ChatLoop()
+    chat_orchestrator = ChatLoop(
+        on_token=lambda token: print(token, end="", flush=True)
+    )
+    jobs = get_job_manager()
 
     while True:
         try:
+            # Report background jobs that finished since the last prompt
+            for job in jobs.pop_notifications():
+                print(f"\n{job.notification()}\n")
+
             # Get user input
             user_input = input("You: ").strip()
 
@@ -525,7 +529,10 @@ def run_main_chat_loop() -> bool:
             # Process regular message through agentic loop
             print("\n🤖 AI Assistant: ", end="", flush=True)
             response = chat_orchestrator.run_iteration(user_input)
-            print(f"{response}\n")
+            if chat_orchestrator.last_response_streamed:
+                print("\n")
+            else:
+                print(f"{response}\n")
 
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted. Goodbye!\n")
@@ -537,6 +544,12 @@ def run_main_chat_loop() -> bool:
             logger.error(f"Error in chat loop: {e}")
             print(f"\n❌ Error: {e}\n")
 
+    # Cancelled jobs finish the units in flight and keep their checkpoints
+    if jobs.active():
+        print(f"⏹️  Stopping {len(jobs.active())} background job(s)...")
+    jobs.shutdown(wait=True)
+    # Let a pending summary update land before the process exits
+    get_summarizer().shutdown(wait=True)
     return True
 
 
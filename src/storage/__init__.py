@@ -58,6 +58,7 @@ from src.storage.database import (
     get_database_connection,
 )
 from src.storage.memory import (
+    build_system_prompt,
     load_memory,
     save_memory,
     trim_history,
@@ -80,6 +81,7 @@ __all__ = [
     "initialize_database",
     "get_database_connection",
     # Memory
+    "build_system_prompt",
     "load_memory",
     "save_memory",
     "trim_history",
@@ -59,7 +59,7 @@ from src.core.context import get_context, set_db_conn, set_db_lock
 logger = logging.getLogger(__name__)
 
 # Current schema version - increment when making schema changes
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 9
 
 
 def _get_schema_version(cursor: sqlite3.Cursor) -> int:
@@ -147,11 +147,164 @@ def _run_migrations(cursor: sqlite3.Cursor, current_version: int) -> int:
         _set_schema_version(cursor, 1)
         logger.info("Applied migration: v0 -> v1 (initial schema)")
 
+    # Migration from v1 to v2: learned file ledger for incremental auto-learn
+    if current_version < 2:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS learned_files (
+                space TEXT NOT NULL,
+                path TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                chunk_ids TEXT NOT NULL DEFAULT '[]',
+                learned_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (space, path)
+            )
+            """
+        )
+
+        _set_schema_version(cursor, 2)
+        logger.info("Applied migration: v1 -> v2 (learned_files ledger)")
+
+    # Migration from v2 to v3: checkpoints for resumable ingestion runs
+    if current_version < 3:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+                run_id TEXT NOT NULL,
+                unit_key TEXT NOT NULL,
+                fingerprint TEXT NOT NULL DEFAULT '',
+                completed_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (run_id, unit_key)
+            )
+            """
+        )
+
+        _set_schema_version(cursor, 3)
+        logger.info("Applied migration: v2 -> v3 (ingest_checkpoints)")
+
+    # Migration from v3 to v4: MinHash signatures for near-duplicate detection
+    if current_version < 4:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chunk_signatures (
+                space TEXT NOT NULL,
+                chunk_id TEXT NOT NULL,
+                source TEXT NOT NULL DEFAULT '',
+                signature BLOB NOT NULL,
+                PRIMARY KEY (space, chunk_id)
+            )
+            """
+        )
+
+        _set_schema_version(cursor, 4)
+        logger.info("Applied migration: v3 -> v4 (chunk_signatures)")
+
+    # Migration from v4 to v5: conditional-GET cache for crawled web pages
+    if current_version < 5:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS web_pages (
+                space TEXT NOT NULL,
+                url TEXT NOT NULL,
+                etag TEXT NOT NULL DEFAULT '',
+                last_modified TEXT NOT NULL DEFAULT '',
+                content_hash TEXT NOT NULL DEFAULT '',
+                links TEXT NOT NULL DEFAULT '[]',
+                fetched_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (space, url)
+            )
+            """
+        )
+
+        _set_schema_version(cursor, 5)
+        logger.info("Applied migration: v4 -> v5 (web_pages)")
+
+    # Migration from v5 to v6: markdown of converted documents by file hash
+    if current_version < 6:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS converted_documents (
+                content_hash TEXT PRIMARY KEY,
+                title TEXT NOT NULL DEFAULT '',
+                markdown TEXT NOT NULL,
+                converted_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+
+        _set_schema_version(cursor, 6)
+        logger.info("Applied migration: v5 -> v6 (converted_documents)")
+
+    # Migration from v6 to v7: compressed, size-bounded conversion cache keyed
+    # by content hash, converter version, mode and page range
+    if current_version < 7:
+        cursor.execute("DROP TABLE IF EXISTS converted_documents")
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS conversion_cache (
+                cache_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                title TEXT NOT NULL DEFAULT '',
+                tier TEXT NOT NULL DEFAULT '',
+                pages INTEGER NOT NULL DEFAULT 0,
+                first_page INTEGER NOT NULL DEFAULT 1,
+                page_offsets TEXT NOT NULL DEFAULT '[]',
+                markdown BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_conversion_cache_last_used "
+            "ON conversion_cache(last_used)"
+        )
+
+        _set_schema_version(cursor, 7)
+        logger.info("Applied migration: v6 -> v7 (conversion_cache)")
+
+    # Migration from v7 to v8: rolling summary of turns evicted from history
+    if current_version < 8:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS conversation_summary (
+                session_id TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+
+        _set_schema_version(cursor, 8)
+        logger.info("Applied migration: v7 -> v8 (conversation_summary)")
+
+    # Migration from v8 to v9: chunks skipped as near-duplicates, kept so they
+    # can be stored once their canonical chunk is deleted
+    if current_version < 9:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS suppressed_chunks (
+                space TEXT NOT NULL,
+                chunk_id TEXT NOT NULL,
+                source TEXT NOT NULL DEFAULT '',
+                canonical_id TEXT NOT NULL,
+                content TEXT NOT NULL,
+                metadata TEXT NOT NULL DEFAULT '{}',
+                PRIMARY KEY (space, chunk_id)
+            )
+            """
+        )
+
+        _set_schema_version(cursor, 9)
+        logger.info("Applied migration: v8 -> v9 (suppressed_chunks)")
+
     # Future migrations go here:
-    # if current_version < 2:
+    # if current_version < 10:
     #     cursor.execute("ALTER TABLE conversations ADD COLUMN tool_call_id TEXT")
-    #     _set_schema_version(cursor, 2)
-    #     logger.info("Applied migration: v1 -> v2 (added tool_call_id)")
+    #     _set_schema_version(cursor, 10)
+    #     logger.info("Applied migration: v9 -> v10 (added tool_call_id)")
 
     return SCHEMA_VERSION
 
@@ -48,17 +48,57 @@ This module provides functions for loading and saving conversation history
 to the SQLite database, as well as history trimming to prevent memory bloat.
 """
 
+import json
 import logging
-from typing import List, Optional, Sequence
+from typing import List, Optional, Sequence, Tuple
 
 from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage, AIMessage, ToolMessage
 
 from src.core.config import get_config
-from src.core.constants import SYSTEM_PROMPT
+from src.core.constants import MESSAGE_TOKEN_OVERHEAD, SYSTEM_PROMPT, TOOL_MANIFEST_MODES
 from src.core.context import get_context
+from src.core.utils import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
+# Introduces the rolling summary appended to the system prompt
+SUMMARY_HEADER = "Summary of the earlier conversation (older turns were trimmed):"
+
+
+def build_system_prompt(mode: Optional[str] = None, tool_names: Optional[Sequence[str]] = None) -> str:
+    """
+    Build the system prompt with the tool manifest for the given mode.
+
+    Tool schemas are always sent through native tool binding (bind_tools),
+    so by default the prompt only lists each tool on one line instead of
+    repeating the pretty-printed schemas.
+
+    Args:
+        mode: "compact", "none" or "full" (default: the TOOL_MANIFEST setting)
+        tool_names: Only list these tools, e.g. the routed subset bound for a
+            turn (default: every registered tool)
+
+    Returns:
+        The system prompt text
+    """
+    from src.tools.registry import ToolRegistry
+
+    mode = mode or get_config().tool_manifest
+    if mode not in TOOL_MANIFEST_MODES:
+        logger.warning(f"Unknown TOOL_MANIFEST '{mode}', using 'compact'")
+        mode = "compact"
+
+    manifest = ToolRegistry.get_manifest(mode, tool_names)
+    if not manifest:
+        return SYSTEM_PROMPT
+    if mode == "full":
+        return SYSTEM_PROMPT + f"\n\nAVAILABLE TOOLS:\n{manifest}\n"
+    return (
+        SYSTEM_PROMPT
+        + "\n\nAVAILABLE TOOLS (call them with native tool calls; their full "
+        + f"parameter schemas are attached to every request):\n{manifest}\n"
+    )
+
 
 def load_memory() -> List[BaseMessage]:
     """
@@ -93,6 +133,13 @@ def load_memory() -> List[BaseMessage]:
                 """
                 )
                 rows = cursor.fetchall()
+                cursor.execute(
+                    "SELECT summary FROM conversation_summary WHERE session_id = 'default'"
+                )
+                summary_row = cursor.fetchone()
+
+            # Turns trimmed in earlier sessions live on in the rolling summary
+            ctx.conversation_summary = summary_row[0] if summary_row else ""
 
             if not rows and config.verbose_logging:
                 logger.debug(
@@ -126,14 +173,7 @@ def load_memory() -> List[BaseMessage]:
                 )
 
             # Prepend the authoritative system prompt
-            import json
-            from src.tools.registry import ToolRegistry
-
-            tool_json = json.dumps(ToolRegistry.get_definitions(), indent=2)
-
-            system_prompt = SystemMessage(
-                content=SYSTEM_PROMPT + f"\n\nAVAILABLE TOOLS:\n{tool_json}\n"
-            )
+            system_prompt = SystemMessage(content=build_system_prompt())
             return [system_prompt] + user_ai_history
 
         else:
@@ -209,40 +249,239 @@ def save_memory(history: Sequence[BaseMessage]) -> None:
         raise  # Re-raise to ensure the error is not silently ignored
 
 
+def save_summary(summary: str) -> None:
+    """
+    Save the rolling conversation summary to SQLite database.
+
+    Called from the background summarizer, so failures are logged rather
+    than raised; the summary is kept in memory either way.
+
+    Args:
+        summary: The running summary ("" clears it)
+    """
+    ctx = get_context()
+
+    if not (ctx.db_conn and ctx.db_lock):
+        logger.warning("SQLite database not available for saving the conversation summary")
+        return
+
+    try:
+        with ctx.db_lock:
+            cursor = ctx.db_conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO conversation_summary (session_id, summary, updated_at)
+                VALUES ('default', ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    summary = excluded.summary, updated_at = excluded.updated_at
+                """,
+                (summary,),
+            )
+            ctx.db_conn.commit()
+    except Exception as e:
+        logger.warning(f"Failed to save conversation summary: {e}")
+
+
+def with_summary(history: Sequence[BaseMessage], summary: str) -> List[BaseMessage]:
+    """
+    Get the messages to send with the rolling summary after the system prompt.
+
+    The summary is appended to the system message rather than sent as a
+    second one, since some chat templates only accept a leading system
+    message. The history itself is left unchanged.
+
+    Args:
+        history: Conversation history starting with the system prompt
+        summary: The rolling summary
+
+    Returns:
+        The messages to send to the model
+    """
+    if not summary or not history or not isinstance(history[0], SystemMessage):
+        return list(history)
+    system = SystemMessage(content=f"{history[0].content}\n\n{SUMMARY_HEADER}\n{summary}")
+    return [system] + list(history[1:])
+
+
+def message_tokens(message: BaseMessage) -> int:
+    """
+    Estimate what a message costs in the prompt.
+
+    Counts the content, the arguments of any tool calls and a small fixed
+    overhead for the role and message framing.
+
+    Args:
+        message: The message to measure
+
+    Returns:
+        Estimated token count
+    """
+    content = message.content if isinstance(message.content, str) else json.dumps(message.content)
+    tokens = estimate_tokens(content) + MESSAGE_TOKEN_OVERHEAD
+    for tool_call in getattr(message, "tool_calls", None) or ():
+        tokens += estimate_tokens(tool_call.get("name", "") + json.dumps(tool_call.get("args", {})))
+    return tokens
+
+
+def _starts_exchange(message: BaseMessage, tool_calls_open: bool) -> bool:
+    """A user message starts an exchange unless it answers a pending tool call (file read injection)."""
+    return isinstance(message, HumanMessage) and not tool_calls_open
+
+
+def _tool_calls_open(message: BaseMessage, tool_calls_open: bool) -> bool:
+    """Whether tool calls are pending after this message."""
+    if isinstance(message, AIMessage):
+        return bool(message.tool_calls)
+    return tool_calls_open
+
+
+def split_exchanges(messages: Sequence[BaseMessage]) -> List[List[BaseMessage]]:
+    """
+    Group messages into exchanges that must be kept or dropped together.
+
+    An exchange is a user message, the AI messages with their tool calls,
+    the matching tool results (and file read injections) and the final
+    answer. Messages before the first user message form their own group.
+
+    Args:
+        messages: Conversation messages, without the system prompt
+
+    Returns:
+        The exchanges, oldest first
+    """
+    exchanges: List[List[BaseMessage]] = []
+    tool_calls_open = False
+    for message in messages:
+        if not exchanges or _starts_exchange(message, tool_calls_open):
+            exchanges.append([])
+        exchanges[-1].append(message)
+        tool_calls_open = _tool_calls_open(message, tool_calls_open)
+    return exchanges
+
+
+class HistoryTokenCounter:
+    """
+    Running token and exchange counts for the conversation history.
+
+    The history only grows between trims, so each update only measures the
+    messages appended since the last one; a different (trimmed) list or a
+    shorter one is recounted from scratch.
+    """
+
+    def __init__(self) -> None:
+        self._reset(None)
+
+    def _reset(self, history: Optional[Sequence[BaseMessage]]) -> None:
+        self._history = history
+        self._counted = 0
+        self._tool_calls_open = False
+        self.tokens = 0
+        self.exchanges = 0
+
+    def update(self, history: Sequence[BaseMessage]) -> "HistoryTokenCounter":
+        """
+        Count the messages added since the last update.
+
+        Args:
+            history: The conversation history, including the system prompt
+
+        Returns:
+            HistoryTokenCounter: self, with tokens and exchanges up to date
+        """
+        if history is not self._history or len(history) < self._counted:
+            self._reset(history)
+        for index in range(self._counted, len(history)):
+            message = history[index]
+            if not isinstance(message, BaseMessage):
+                continue
+            self.tokens += message_tokens(message)
+            if index > 0 and _starts_exchange(message, self._tool_calls_open):
+                self.exchanges += 1
+            self._tool_calls_open = _tool_calls_open(message, self._tool_calls_open)
+        self._counted = len(history)
+        return self
+
+
 def trim_history(
-    history: Sequence[BaseMessage], max_pairs: Optional[int] = None
+    history: Sequence[BaseMessage],
+    max_pairs: Optional[int] = None,
+    token_budget: Optional[int] = None,
 ) -> List[BaseMessage]:
     """
     Trim conversation history to prevent memory bloat and API token limits.
 
+    See partition_history; this returns only the kept messages.
+
+    Args:
+        history: Complete list of conversation messages
+        max_pairs: Maximum number of exchanges to keep (default: MAX_HISTORY_PAIRS)
+        token_budget: Maximum estimated tokens to keep (default: CONTEXT_TOKEN_BUDGET)
+
+    Returns:
+        Trimmed history list containing system message + recent exchanges
+    """
+    return partition_history(history, max_pairs, token_budget)[0]
+
+
+def partition_history(
+    history: Sequence[BaseMessage],
+    max_pairs: Optional[int] = None,
+    token_budget: Optional[int] = None,
+) -> Tuple[List[BaseMessage], List[BaseMessage]]:
+    """
+    Split conversation history into the messages to keep and those trimmed.
+
     LangChain sends full conversation history with each API call. Long conversations
-    can exceed token limits and slow down responses. This function maintains recent
-    context while preventing excessive memory usage.
+    can exceed the model's context window and slow down responses. This function
+    maintains recent context while keeping the history within a token budget.
 
     Args:
         history: Complete list of conversation messages
-        max_pairs: Maximum number of user-assistant exchange pairs to keep.
+        max_pairs: Maximum number of exchanges to keep.
                    If None, uses MAX_HISTORY_PAIRS from config.
+        token_budget: Maximum estimated tokens for the kept history.
+                      If None, uses CONTEXT_TOKEN_BUDGET from config.
 
     Returns:
-        Trimmed history list containing system message + recent exchanges
+        (kept, evicted): the system message + recent exchanges, and the
+        older messages that were dropped (for the rolling summary)
 
     Trimming Logic:
     - Always keep the first message (system prompt)
-    - Keep the last (max_pairs * 2) messages (user + AI pairs)
-    - Total length = 1 + (max_pairs * 2)
-    - Example: max_pairs=10 -> keep system + 20 recent messages
+    - Group the rest into exchanges (see split_exchanges) so a tool result is
+      never kept without the AI message that called it, or an answer without
+      its question
+    - Keep the most recent exchanges while they fit max_pairs and token_budget
+    - The latest exchange is always kept, even if it alone exceeds the budget
     """
-    if max_pairs is None:
-        max_pairs = get_config().max_history_pairs
-
-    # Calculate maximum allowed length: system message + (pairs * 2 messages per pair)
-    max_length = max_pairs * 2 + 1
+    if not history:
+        return [], []
 
-    # Only trim if history exceeds the limit
-    if len(history) > max_length:
-        # Keep system message (index 0) + most recent messages
-        return [history[0]] + list(history[-(max_pairs * 2):])
+    config = get_config()
+    if max_pairs is None:
+        max_pairs = config.max_history_pairs
+    if token_budget is None:
+        token_budget = config.context_token_budget
+
+    exchanges = split_exchanges(history[1:])
+    used = message_tokens(history[0])
+    kept = 0
+    for exchange in reversed(exchanges):
+        cost = sum(message_tokens(message) for message in exchange)
+        if kept >= max_pairs or (kept and used + cost > token_budget):
+            break
+        used += cost
+        kept += 1
 
     # Return unchanged if within limits
-    return list(history)
+    if kept == len(exchanges):
+        return list(history), []
+
+    trimmed = [history[0]]
+    for exchange in exchanges[len(exchanges) - kept:]:
+        trimmed.extend(exchange)
+    evicted = [message for exchange in exchanges[:len(exchanges) - kept] for message in exchange]
+    logger.debug(
+        f"💾 Trimmed history to {kept}/{len(exchanges)} exchanges (~{used} tokens, budget {token_budget})"
+    )
+    return trimmed, evicted
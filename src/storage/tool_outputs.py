@@ -0,0 +1,213 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Session store for large tool outputs.
+
+File reads, diffs, shell output and parsed documents can run to tens of
+kilobytes. Kept in the conversation history, they are re-sent with every
+later request until trimmed. Instead, any string field of a tool result
+longer than TOOL_OUTPUT_INLINE_CHARS is stored here under a handle, and the
+result keeps a head/tail preview naming the handle. The model pages through
+the rest with the read_tool_output tool (src.tools.executors.output_tools).
+
+The store lives in memory for the session and is bounded by
+TOOL_OUTPUT_STORE_MAX_CHARS (oldest outputs are evicted first); /clear
+empties it. Handles in a history restored from an earlier session no longer
+resolve, and read_tool_output asks the model to re-run the tool.
+
+Usage:
+    from src.storage.tool_outputs import compact_tool_result
+
+    result = compact_tool_result("git_diff", result)
+"""
+
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.config import get_config
+from src.core.constants import (
+    TOOL_OUTPUT_MAX_PAGE_CHARS,
+    TOOL_OUTPUT_PAGE_CHARS,
+    TOOL_OUTPUT_PREVIEW_HEAD,
+    TOOL_OUTPUT_PREVIEW_TAIL,
+    TOOL_OUTPUT_STORE_MAX_CHARS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Results of these tools are never stored (paging must not page itself)
+_INLINE_TOOLS = {"read_tool_output"}
+
+
+def preview(text: str, handle: str, max_chars: Optional[int] = None) -> str:
+    """
+    Build the head/tail preview that replaces a stored output.
+
+    Args:
+        text: The full output
+        handle: Handle the output is stored under
+        max_chars: Shrink head and tail proportionally to fit this many
+            characters (default: TOOL_OUTPUT_PREVIEW_HEAD + _TAIL)
+
+    Returns:
+        The first and last characters with a note on how to read the rest
+    """
+    head_chars, tail_chars = TOOL_OUTPUT_PREVIEW_HEAD, TOOL_OUTPUT_PREVIEW_TAIL
+    budget = head_chars + tail_chars
+    if max_chars is not None and max_chars < budget:
+        head_chars = max_chars * head_chars // budget
+        tail_chars = max_chars - head_chars
+    # Head and tail never overlap, even for outputs shorter than both
+    head_chars = min(head_chars, len(text))
+    tail_chars = min(tail_chars, len(text) - head_chars)
+
+    tail_start = len(text) - tail_chars
+    head = text[:head_chars]
+    tail = text[tail_start:] if tail_chars else ""
+    omitted = len(text) - len(head) - len(tail)
+    return (
+        f"{head}\n\n[... {omitted} of {len(text)} characters omitted. "
+        f"Call read_tool_output(handle='{handle}', offset={len(head)}) to read more ...]\n\n"
+        f"{tail}"
+    )
+
+
+class ToolOutputStore:
+    """Thread-safe, size-bounded map of handles to full tool outputs."""
+
+    def __init__(self, max_chars: int = TOOL_OUTPUT_STORE_MAX_CHARS):
+        self.max_chars = max_chars
+        self._outputs: "OrderedDict[str, str]" = OrderedDict()
+        self._size = 0
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def put(self, text: str, tool_name: str = "tool") -> str:
+        """
+        Store an output and return its handle.
+
+        Args:
+            text: The full output
+            tool_name: Tool that produced it (part of the handle)
+
+        Returns:
+            str: Handle for read()
+        """
+        with self._lock:
+            handle = f"{tool_name}-{next(self._ids)}"
+            self._outputs[handle] = text
+            self._size += len(text)
+            # Evict the oldest outputs, but always keep the one just stored
+            while self._size > self.max_chars and len(self._outputs) > 1:
+                _, evicted = self._outputs.popitem(last=False)
+                self._size -= len(evicted)
+            return handle
+
+    def read(
+        self, handle: str, offset: int = 0, length: int = TOOL_OUTPUT_PAGE_CHARS
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Read a page of a stored output.
+
+        Args:
+            handle: Handle returned by put()
+            offset: First character to return
+            length: Characters to return (capped at TOOL_OUTPUT_MAX_PAGE_CHARS)
+
+        Returns:
+            (page, total_chars), or None if the handle is unknown or evicted
+        """
+        with self._lock:
+            text = self._outputs.get(handle)
+        if text is None:
+            return None
+        offset = max(0, offset)
+        end = offset + min(max(1, length), TOOL_OUTPUT_MAX_PAGE_CHARS)
+        return text[offset:end], len(text)
+
+    def clear(self) -> None:
+        """Drop every stored output (e.g. on /clear)."""
+        with self._lock:
+            self._outputs.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Number of stored outputs and their total size in characters."""
+        with self._lock:
+            return {"outputs": len(self._outputs), "chars": self._size}
+
+
+def compact_tool_result(tool_name: str, result: Any) -> Any:
+    """
+    Move the large string fields of a tool result into the store.
+
+    Args:
+        tool_name: Tool that produced the result
+        result: The ToolRegistry.execute() result
+
+    Returns:
+        The result, or a copy whose large fields are previews with handles
+    """
+    limit = get_config().tool_output_inline_chars
+    if limit <= 0 or tool_name in _INLINE_TOOLS or not isinstance(result, dict):
+        return result
+
+    compacted = None
+    for key, value in result.items():
+        if not isinstance(value, str) or len(value) <= limit:
+            continue
+        handle = get_tool_output_store().put(value, tool_name)
+        if compacted is None:
+            compacted = dict(result)
+        compacted[key] = preview(value, handle, limit)
+        logger.info(f"📦 Stored {tool_name} {key} ({len(value)} chars) as '{handle}'")
+    return compacted if compacted is not None else result
+
+
+# Module-level singleton
+_store: Optional[ToolOutputStore] = None
+_store_lock = threading.Lock()
+
+
+def get_tool_output_store() -> ToolOutputStore:
+    """
+    Get the global ToolOutputStore singleton.
+
+    Returns:
+        ToolOutputStore: The session's tool output store
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ToolOutputStore()
+        return _store
+
+
+__all__ = [
+    "ToolOutputStore",
+    "compact_tool_result",
+    "get_tool_output_store",
+    "preview",
+]
@@ -58,6 +58,7 @@ from src.tools.executors import web_tools
 from src.tools.executors import shell_tools
 from src.tools.executors import git_tools
 from src.tools.executors import system_tools
+from src.tools.executors import output_tools
 
 __all__ = [
     "file_tools",
@@ -67,4 +68,5 @@ __all__ = [
     "shell_tools",
     "git_tools",
     "system_tools",
+    "output_tools",
 ]
@@ -30,11 +30,24 @@ using Docling's unified pipeline for high-fidelity extraction.
 import os
 import logging
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from src.tools.registry import ToolRegistry
 from src.core.config import get_config
 from src.core.utils import standard_error, standard_success
+from src.core.constants import DOC_EXTRACTION_MODE, DOC_PARSE_MAX_PAGES
+from src.learning.converter_pool import (
+    EXTRACTION_MODES,
+    ConvertedDocument,
+    convert_document,
+    parse_page_range,
+)
+from src.learning.fast_extract import (
+    count_pages,
+    document_outline,
+    has_pages,
+    markdown_outline,
+)
 
 logger = logging.getLogger(__name__)
 _config = get_config()
@@ -60,6 +73,21 @@ PARSE_DOCUMENT_DEFINITION = {
                     "enum": ["text", "tables", "forms", "layout"],
                     "description": "Compatibility parameter (Docling extracts all content as structured Markdown)",
                 },
+                "mode": {
+                    "type": "string",
+                    "enum": list(EXTRACTION_MODES),
+                    "description": "Extraction tier: 'fast' reads the embedded text layer, 'balanced' uses Docling without OCR/tables, "
+                    "'accurate' runs the full pipeline, 'auto' (default) escalates from fast only for scanned or text-poor pages",
+                },
+                "pages": {
+                    "type": "string",
+                    "description": "1-based range of PDF pages, PPTX slides or XLSX sheets to extract, e.g. '10-20', '7' or '40-' "
+                    "(large PDFs otherwise return only the first pages)",
+                },
+                "outline": {
+                    "type": "boolean",
+                    "description": "Return only the document outline (headings with page numbers) and page count, to pick pages to read",
+                },
             },
             "required": ["file_path"],
         },
@@ -72,9 +100,92 @@ PARSE_DOCUMENT_DEFINITION = {
 # =============================================================================
 
 
-@ToolRegistry.register("parse_document", PARSE_DOCUMENT_DEFINITION)
+def _tier_details(
+    document: ConvertedDocument, mode: str, elapsed: float
+) -> Dict[str, Any]:
+    """Result fields describing which extraction tier ran and how long it took."""
+    return {
+        "mode": mode,
+        "tier": document.tier,
+        "from_cache": document.cached,
+        "pages": document.pages,
+        "elapsed_seconds": round(elapsed, 3),
+        "tier_timings": {
+            tier: round(seconds, 3) for tier, seconds in document.timings.items()
+        },
+    }
+
+
+def _outline_entries(full_path: str, mode: str) -> list:
+    """Outline from bookmarks or the text layer, converting only as a fallback."""
+    entries = document_outline(full_path)
+    if entries is None:
+        document = convert_document(full_path, mode)
+        entries = markdown_outline(document.markdown, document.page_offsets)
+    return [entry.to_dict() for entry in entries]
+
+
+def _parse(full_path: str, mode: str, pages: str, outline: bool) -> Dict[str, Any]:
+    """
+    Convert a document (or the requested part of it) into result fields.
+
+    Large PDFs are not converted whole unless asked: without a page range
+    only the first DOC_PARSE_MAX_PAGES pages are returned, together with
+    the outline so the caller can request the pages it needs.
+    """
+    start_time = time.time()
+    total = count_pages(full_path)
+    if outline:
+        return {
+            "outline": _outline_entries(full_path, mode),
+            "total_pages": total,
+        }
+
+    page_range: Optional[Tuple[int, int]] = None
+    if pages:
+        if not has_pages(full_path):
+            ext = os.path.splitext(full_path)[1].lower() or "these"
+            raise ValueError(
+                f"pages is not supported for {ext} files; only PDF pages, PPTX "
+                "slides and XLSX sheets can be selected"
+            )
+        page_range = parse_page_range(pages, total)
+    truncated = page_range is None and bool(total and total > DOC_PARSE_MAX_PAGES)
+    if truncated:
+        page_range = (1, DOC_PARSE_MAX_PAGES)
+
+    document = convert_document(full_path, mode, page_range)
+    elapsed = time.time() - start_time
+
+    fields: Dict[str, Any] = {
+        "content": document.markdown,
+        "analysis": document.markdown,  # Content is the analysis in this case
+        "total_pages": total or document.pages,
+        **_tier_details(document, mode, elapsed),
+    }
+    if page_range is not None:
+        # Slide and sheet counts are only known after conversion
+        last = page_range[1]
+        if document.pages:
+            last = min(last, document.first_page + document.pages - 1)
+        fields["page_range"] = f"{page_range[0]}-{last}"
+    if truncated:
+        fields["truncated"] = True
+        fields["outline"] = _outline_entries(full_path, "fast")
+        fields["note"] = (
+            f"Showing pages 1-{DOC_PARSE_MAX_PAGES} of {total}; use the outline "
+            f"and pass pages (e.g. '{DOC_PARSE_MAX_PAGES + 1}-{total}') for the rest"
+        )
+    return fields
+
+
+@ToolRegistry.register("parse_document", PARSE_DOCUMENT_DEFINITION, read_only=True)
 def execute_parse_document(
-    file_path: str, extract_type: str = "text"
+    file_path: str,
+    extract_type: str = "text",
+    mode: str = DOC_EXTRACTION_MODE,
+    pages: str = "",
+    outline: bool = False,
 ) -> Dict[str, Any]:
     """
     Execute document parsing tool using Docling's unified pipeline.
@@ -99,9 +210,29 @@ def execute_parse_document(
     Note: Docling extracts all content types in a single pass, so extract_type
     is primarily for API compatibility.
 
+    EXTRACTION MODES (tiers, see src.learning.converter_pool):
+    - "fast": Read the embedded text layer directly (no models)
+    - "balanced": Docling without OCR and table structure models
+    - "accurate": Docling's full pipeline
+    - "auto": Fast, escalating only when pages yield too little text
+
+    LARGE DOCUMENTS:
+    - pages="10-20" converts only that page range
+    - outline=True returns the headings and page count without content
+    - PDFs over DOC_PARSE_MAX_PAGES pages return their first pages, the
+      outline and truncated=True unless a page range is given
+
+    CACHING:
+    - Conversions of unchanged files are served from the conversion cache
+      (keyed by content hash, converter version, mode and page range) and
+      reported with from_cache=True
+
     Args:
         file_path: Path to document file relative to current directory
         extract_type: Type of extraction (default: "text")
+        mode: Extraction mode (default: DOC_EXTRACTION_MODE)
+        pages: 1-based page range to convert (default: whole document)
+        outline: Return only the outline and page count
 
     Returns:
         Dict with success status and extracted content
@@ -130,32 +261,24 @@ def execute_parse_document(
 
         # Process document using Docling unified pipeline
         try:
-            from docling.document_converter import DocumentConverter
+            # Convert with a warm converter from the shared pool and export
+            # to markdown (excellent for LLM consumption)
+            fields = _parse(full_path, mode, pages, outline)
 
-            start_time = time.time()
-
-            # Initialize converter
-            converter = DocumentConverter()
-
-            # Convert document
-            result = converter.convert(full_path)
-
-            # Export to markdown (excellent for LLM consumption)
-            content = result.document.export_to_markdown()
-
-            elapsed = time.time() - start_time
-
-            if _config.show_tool_details:
-                logger.info(f"   ✅ Extracted {len(content)} chars in {elapsed:.2f}s")
+            if _config.show_tool_details and "content" in fields:
+                source = "from cache" if fields["from_cache"] else "tier"
+                logger.info(
+                    f"   ✅ Extracted {len(fields['content'])} chars in "
+                    f"{fields['elapsed_seconds']:.2f}s ({fields['tier']} {source})"
+                )
 
             return standard_success(
                 {
                     "file_path": file_path,
                     "extract_type": extract_type,  # Kept for API compatibility
                     "file_type": file_ext,
-                    "content": content,
-                    "analysis": content,  # Content is the analysis in this case
                     "note": "Processed via Docling Unified Pipeline",
+                    **fields,
                 }
             )
 
@@ -163,6 +286,8 @@ def execute_parse_document(
             return standard_error(
                 "docling library not installed. Please install with: pip install docling"
             )
+        except ValueError as e:
+            return standard_error(str(e))
         except Exception as e:
             logger.error(f"Docling processing failed for {file_path}: {e}")
             return standard_error(f"Docling processing failed: {str(e)}")
@@ -173,7 +298,11 @@ def execute_parse_document(
 
 
 async def execute_parse_document_async(
-    file_path: str, extract_type: str = "text"
+    file_path: str,
+    extract_type: str = "text",
+    mode: str = DOC_EXTRACTION_MODE,
+    pages: str = "",
+    outline: bool = False,
 ) -> Dict[str, Any]:
     """Execute document parsing asynchronously using Docling."""
     import asyncio
@@ -191,24 +320,16 @@ async def execute_parse_document_async(
 
         file_ext = os.path.splitext(full_path)[1].lower()
 
-        def _do_parse():
-            from docling.document_converter import DocumentConverter
-
-            converter = DocumentConverter()
-            result = converter.convert(full_path)
-            return result.document.export_to_markdown()
-
-        # Run Docling processing in thread to avoid blocking
-        content = await asyncio.to_thread(_do_parse)
+        # Wait for the converter pool in a thread to avoid blocking
+        fields = await asyncio.to_thread(_parse, full_path, mode, pages, outline)
 
         return standard_success(
             {
                 "file_path": file_path,
                 "extract_type": extract_type,
                 "file_type": file_ext,
-                "content": content,
-                "analysis": content,
                 "note": "Processed via Docling Unified Pipeline (async)",
+                **fields,
             }
         )
 
@@ -216,6 +337,8 @@ async def execute_parse_document_async(
         return standard_error(
             "docling library not installed. Please install with: pip install docling"
         )
+    except ValueError as e:
+        return standard_error(str(e))
     except Exception as e:
         logger.error(f"Document parsing failed for {file_path}: {e}")
         return standard_error(f"Document parsing failed: {str(e)}")
@@ -34,6 +34,7 @@ from typing import Dict, Any
 
 from src.tools.registry import ToolRegistry
 from src.core.utils import standard_error, standard_success
+from src.core.file_walker import scan_directory
 from src.core.security_utils import validate_path, sanitize_path
 from src.security.audit_logger import get_audit_logger
 
@@ -88,7 +89,7 @@ LIST_DIRECTORY_DEFINITION = {
     "type": "function",
     "function": {
         "name": "list_directory",
-        "description": "List contents of a directory in the current workspace",
+        "description": "List contents of a directory in the current workspace (gitignored entries, build output and virtualenvs are hidden unless show_ignored is true)",
         "parameters": {
             "type": "object",
             "properties": {
@@ -96,7 +97,12 @@ LIST_DIRECTORY_DEFINITION = {
                     "type": "string",
                     "description": "Path to directory to list (optional, defaults to current directory)",
                     "default": ".",
-                }
+                },
+                "show_ignored": {
+                    "type": "boolean",
+                    "description": "Include entries excluded by .gitignore/.ignore and default skip rules",
+                    "default": False,
+                },
             },
         },
     },
@@ -117,7 +123,7 @@ GET_CURRENT_DIRECTORY_DEFINITION = {
 # =============================================================================
 
 
-@ToolRegistry.register("read_file_content", READ_FILE_DEFINITION)
+@ToolRegistry.register("read_file_content", READ_FILE_DEFINITION, read_only=True)
 def execute_read_file(file_path: str) -> Dict[str, Any]:
     """
     Execute file reading tool with security checks.
@@ -226,13 +232,16 @@ def execute_write_file(file_path: str, content: str) -> Dict[str, Any]:
         return standard_error(str(e))
 
 
-@ToolRegistry.register("list_directory", LIST_DIRECTORY_DEFINITION)
-def execute_list_directory(directory_path: str = ".") -> Dict[str, Any]:
+@ToolRegistry.register("list_directory", LIST_DIRECTORY_DEFINITION, read_only=True)
+def execute_list_directory(
+    directory_path: str = ".", show_ignored: bool = False
+) -> Dict[str, Any]:
     """
     Execute directory listing tool with security checks.
 
     Args:
         directory_path: Path to directory (default: current directory)
+        show_ignored: Include entries hidden by ignore rules
 
     Returns:
         Dict with success status and directory contents
@@ -255,30 +264,38 @@ def execute_list_directory(directory_path: str = ".") -> Dict[str, Any]:
         if not os.path.isdir(full_path):
             return {"error": f"Not a directory: {directory_path}"}
 
-        items = os.listdir(full_path)
+        entries, ignored = scan_directory(
+            full_path,
+            respect_ignore_files=not show_ignored,
+            apply_default_rules=not show_ignored,
+        )
         dirs = []
         files = []
 
-        for item in sorted(items):
-            full_item_path = os.path.join(full_path, item)
-            if os.path.isdir(full_item_path):
-                dirs.append(item + "/")
+        for entry in entries:
+            if entry.is_dir:
+                dirs.append(entry.name + "/")
             else:
-                files.append(item)
+                files.append(entry.name)
 
-        return {
+        result = {
             "success": True,
             "directory": os.path.relpath(full_path, os.getcwd()) or ".",
             "contents": dirs + files,
-            "total_items": len(items),
+            "total_items": len(entries),
         }
+        if ignored:
+            result["ignored_items"] = ignored
+        return result
 
     except Exception as e:
         logger.error(f"Error listing directory {directory_path}: {e}")
         return standard_error(str(e))
 
 
-@ToolRegistry.register("get_current_directory", GET_CURRENT_DIRECTORY_DEFINITION)
+@ToolRegistry.register(
+    "get_current_directory", GET_CURRENT_DIRECTORY_DEFINITION, read_only=True
+)
 def execute_get_current_directory() -> Dict[str, Any]:
     """
     Execute current directory tool.
@@ -243,7 +243,7 @@ def _parse_log_output(output: str) -> List[Dict[str, str]]:
 # =============================================================================
 
 
-@ToolRegistry.register("git_status", GIT_STATUS_DEFINITION)
+@ToolRegistry.register("git_status", GIT_STATUS_DEFINITION, read_only=True)
 def execute_git_status() -> Dict[str, Any]:
     """
     Execute git status and return structured results.
@@ -286,7 +286,7 @@ def execute_git_status() -> Dict[str, Any]:
     }
 
 
-@ToolRegistry.register("git_diff", GIT_DIFF_DEFINITION)
+@ToolRegistry.register("git_diff", GIT_DIFF_DEFINITION, read_only=True)
 def execute_git_diff(
     file_path: Optional[str] = None, staged: bool = False
 ) -> Dict[str, Any]:
@@ -350,7 +350,7 @@ def execute_git_diff(
     }
 
 
-@ToolRegistry.register("git_log", GIT_LOG_DEFINITION)
+@ToolRegistry.register("git_log", GIT_LOG_DEFINITION, read_only=True)
 def execute_git_log(limit: int = 10, file_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Execute git log and return structured commit history.
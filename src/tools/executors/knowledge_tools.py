@@ -158,7 +158,7 @@ def execute_learn_information(
         return standard_error(str(e))
 
 
-@ToolRegistry.register("search_knowledge", SEARCH_KNOWLEDGE_DEFINITION)
+@ToolRegistry.register("search_knowledge", SEARCH_KNOWLEDGE_DEFINITION, read_only=True)
 def execute_search_knowledge(query: str, limit: int = 5) -> Dict[str, Any]:
     """
     Execute knowledge search tool - search the learned knowledge base.
@@ -0,0 +1,123 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Tool Output Tools - Executor for paging through stored tool outputs.
+
+Large tool output fields are kept out of the conversation history (see
+src.storage.tool_outputs); the history holds a preview with a handle, and
+this tool reads the rest.
+"""
+
+import logging
+from typing import Any, Dict
+
+from src.core.constants import TOOL_OUTPUT_MAX_PAGE_CHARS, TOOL_OUTPUT_PAGE_CHARS
+from src.core.utils import standard_error
+from src.storage.tool_outputs import get_tool_output_store
+from src.tools.registry import ToolRegistry
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# TOOL DEFINITIONS (OpenAI Function Calling Format)
+# =============================================================================
+
+READ_TOOL_OUTPUT_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": "read_tool_output",
+        "description": (
+            "Read part of a large tool output that was shortened to a preview. "
+            "Use the handle named in the preview and page with offset/length."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "handle": {
+                    "type": "string",
+                    "description": "Handle from the preview (e.g. 'git_diff-3')",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "First character to read (default: 0)",
+                    "default": 0,
+                },
+                "length": {
+                    "type": "integer",
+                    "description": (
+                        f"Characters to read (default: {TOOL_OUTPUT_PAGE_CHARS}, "
+                        f"max: {TOOL_OUTPUT_MAX_PAGE_CHARS})"
+                    ),
+                    "default": TOOL_OUTPUT_PAGE_CHARS,
+                },
+            },
+            "required": ["handle"],
+        },
+    },
+}
+
+
+# =============================================================================
+# TOOL EXECUTORS
+# =============================================================================
+
+
+@ToolRegistry.register("read_tool_output", READ_TOOL_OUTPUT_DEFINITION, read_only=True)
+def execute_read_tool_output(
+    handle: str, offset: int = 0, length: int = TOOL_OUTPUT_PAGE_CHARS
+) -> Dict[str, Any]:
+    """
+    Read a page of a stored tool output.
+
+    Args:
+        handle: Handle named in the preview
+        offset: First character to read
+        length: Characters to read
+
+    Returns:
+        Dict with the page, its position and the total size
+    """
+    page = get_tool_output_store().read(handle, offset, length)
+    if page is None:
+        return standard_error(
+            f"Unknown or expired handle '{handle}'. Run the original tool again."
+        )
+
+    content, total = page
+    start = min(max(0, offset), total)
+    end = start + len(content)
+    logger.debug(f"📦 Read {handle} [{start}:{end}] of {total} chars")
+    return {
+        "success": True,
+        "handle": handle,
+        "offset": start,
+        "content": content,
+        "total_chars": total,
+        "next_offset": end if end < total else None,
+    }
+
+
+__all__ = [
+    "READ_TOOL_OUTPUT_DEFINITION",
+    "execute_read_tool_output",
+]
@@ -157,7 +157,7 @@ def _parse_rg_json_output(output: str) -> List[Dict[str, Any]]:
 # =============================================================================
 
 
-@ToolRegistry.register("code_search", CODE_SEARCH_DEFINITION)
+@ToolRegistry.register("code_search", CODE_SEARCH_DEFINITION, read_only=True)
 def execute_code_search(
     pattern: str,
     path: str = ".",
@@ -71,7 +71,7 @@ SEARCH_WEB_DEFINITION = {
 # =============================================================================
 
 
-@ToolRegistry.register("search_web", SEARCH_WEB_DEFINITION)
+@ToolRegistry.register("search_web", SEARCH_WEB_DEFINITION, read_only=True)
 def execute_web_search(
     query: str, max_results: int = WEB_SEARCH_DEFAULT_MAX_RESULTS
 ) -> Dict[str, Any]:
@@ -49,16 +49,53 @@ AI tools to be registered with decorators and dispatched by name.
 """
 
 import asyncio
+import copy
 import json
 import logging
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple
 
 from src.tools.base import is_async_function
 
 logger = logging.getLogger(__name__)
 
 
+class FrozenDict(dict):
+    """
+    Read-only dict used for shared tool definition snapshots.
+
+    Still a dict (so LangChain's bind_tools and json.dumps accept it), but
+    every mutating method raises TypeError. Copies and pickles are plain
+    dicts, so deep-copying a bound model (config copies, tracing) works.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Tool definition snapshots are read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+    __ior__ = _readonly  # type: ignore[assignment]
+
+    def __copy__(self) -> Dict[Any, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[Any, Any]:
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (dict, (dict(self),))
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively copy a JSON-like value into FrozenDicts and tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 def _get_config():
     """Lazily get config to avoid circular imports."""
     try:
@@ -86,19 +123,34 @@ class ToolRegistry:
 
         # Get definitions for LLM binding
         definitions = ToolRegistry.get_definitions()
+
+    Tools registered with read_only=True have no side effects, so the chat
+    loop may run several calls to them concurrently.
+
+    Every change to the registered tools bumps version(), which lets callers
+    cache anything derived from the definitions (see
+    get_definitions_snapshot).
     """
 
     _tools: Dict[str, Callable] = {}
     _definitions: Dict[str, Dict] = {}
+    _read_only: Set[str] = set()
+    _version: int = 0
+    _snapshot: Tuple[int, Tuple[FrozenDict, ...]] = (-1, ())
+    _lock = threading.Lock()
 
     @classmethod
-    def register(cls, name: str, definition: Optional[Dict] = None) -> Callable:
+    def register(
+        cls, name: str, definition: Optional[Dict] = None, read_only: bool = False
+    ) -> Callable:
         """
         Decorator to register a tool executor.
 
         Args:
             name: Tool name (matches function name in LLM tool call)
             definition: OpenAI function definition for LLM binding
+            read_only: Tool never modifies files, the knowledge base or other
+                state, so calls to it may run in parallel
 
         Returns:
             Decorator function
@@ -113,6 +165,11 @@ class ToolRegistry:
             cls._tools[name] = func
             if definition:
                 cls._definitions[name] = definition
+            if read_only:
+                cls._read_only.add(name)
+            else:
+                cls._read_only.discard(name)
+            cls._bump_version()
             cfg = _get_config()
             if cfg and cfg.show_tool_details:
                 logger.debug(f"🔧 Registered tool: {name}")
@@ -121,7 +178,9 @@ class ToolRegistry:
         return decorator
 
     @classmethod
-    def register_dynamic(cls, name: str, definition: Dict, executor: Callable) -> None:
+    def register_dynamic(
+        cls, name: str, definition: Dict, executor: Callable, read_only: bool = False
+    ) -> None:
         """
         Register a tool dynamically at runtime.
 
@@ -129,21 +188,61 @@ class ToolRegistry:
             name: Tool name
             definition: OpenAI function definition
             executor: Callable to execute the tool
+            read_only: Calls to the tool may run in parallel (see register)
         """
         cls._tools[name] = executor
         cls._definitions[name] = definition
+        if read_only:
+            cls._read_only.add(name)
+        else:
+            cls._read_only.discard(name)
+        cls._bump_version()
         cfg = _get_config()
         if cfg and cfg.show_tool_details:
             logger.debug(f"🔧 Registered dynamic tool: {name}")
 
     @classmethod
-    def execute(cls, name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    def acquire_rate_limit(cls, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Count one call of a tool against its rate limit.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            None if the call may run, else the rate limit error result
+        """
+        from src.security.rate_limiter import RateLimitManager
+        from src.security.exceptions import RateLimitError
+
+        try:
+            RateLimitManager.check_limit(name)
+        except RateLimitError as e:
+            # Audit log rate limit violation attempted
+            try:
+                from src.security.audit_logger import get_audit_logger
+
+                rate_status = RateLimitManager.get_status(name) or {}
+                count = rate_status.get("calls_in_period", 0)
+                limit = rate_status.get("max_calls", 0)
+                get_audit_logger().log_rate_limit(name, count, limit)
+            except Exception:
+                pass  # Non-critical - audit logging failure shouldn't block execution
+            return {"error": f"Rate limit exceeded: {e}"}
+        return None
+
+    @classmethod
+    def execute(
+        cls, name: str, args: Dict[str, Any], rate_limit: bool = True
+    ) -> Dict[str, Any]:
         """
         Execute a registered tool with approval checking.
 
         Args:
             name: Tool name
             args: Tool arguments as dictionary
+            rate_limit: Count the call against the tool's rate limit; callers
+                that pass False must call acquire_rate_limit() themselves
 
         Returns:
             Tool result dictionary
@@ -154,10 +253,6 @@ class ToolRegistry:
             return {"error": f"Unknown tool: {name}"}
         executor = cls._tools[name]
 
-        # Check rate limit
-        from src.security.rate_limiter import RateLimitManager
-        from src.security.exceptions import RateLimitError
-
         # Check approval
         try:
             from src.tools.approval import ToolApprovalManager
@@ -171,7 +266,10 @@ class ToolRegistry:
                 }
 
             # Check rate limit
-            RateLimitManager.check_limit(name)
+            if rate_limit:
+                limited = cls.acquire_rate_limit(name)
+                if limited:
+                    return limited
 
             if mode == "ask":
                 # Special return value to signal the UI/CLI to ask for confirmation
@@ -181,19 +279,6 @@ class ToolRegistry:
                     "tool_args": args,
                 }
 
-        except RateLimitError as e:
-            # Audit log rate limit violation attempted
-            try:
-                from src.security.audit_logger import get_audit_logger
-
-                rate_status = RateLimitManager.get_status(name) or {}
-                count = rate_status.get("calls_in_period", 0)
-                limit = rate_status.get("max_calls", 0)
-                get_audit_logger().log_rate_limit(name, count, limit)
-            except Exception:
-                pass  # Non-critical - audit logging failure shouldn't block execution
-                pass
-            return {"error": f"Rate limit exceeded: {e}"}
         except Exception as e:
             logger.error(f"Approval check failed for tool '{name}': {e}")
             # Safe default: if approval/rate check fails (generic error), don't execute
@@ -308,6 +393,83 @@ class ToolRegistry:
 
         return [copy.deepcopy(definition) for definition in cls._definitions.values()]
 
+    @classmethod
+    def get_definitions_snapshot(cls) -> Tuple[FrozenDict, ...]:
+        """
+        Get an immutable snapshot of all tool definitions.
+
+        Unlike get_definitions(), the snapshot is built once per version()
+        and shared between callers, so it is cheap to call on every LLM
+        request. Nested dicts are FrozenDicts and lists are tuples.
+
+        Returns:
+            Tuple of read-only OpenAI function definitions
+        """
+        with cls._lock:
+            version, snapshot = cls._snapshot
+            if version != cls._version:
+                snapshot = tuple(_freeze(d) for d in cls._definitions.values())
+                cls._snapshot = (cls._version, snapshot)
+            return snapshot
+
+    @classmethod
+    def get_manifest(
+        cls, mode: str = "compact", tool_names: Optional[Collection[str]] = None
+    ) -> str:
+        """
+        Describe the registered tools for the system prompt.
+
+        The schemas themselves reach the model through native tool binding,
+        so the prompt only needs a reminder of what exists.
+
+        Args:
+            mode: "compact" (one line per tool), "full" (the pretty-printed
+                JSON schemas) or "none"
+            tool_names: Only describe these tools (default: every tool)
+
+        Returns:
+            The manifest text ("" for mode "none" or an empty registry)
+        """
+        from src.core.constants import TOOL_MANIFEST_DESCRIPTION_LENGTH
+
+        snapshot = cls.get_definitions_snapshot()
+        if tool_names is not None:
+            snapshot = tuple(
+                d for d in snapshot if d.get("function", d).get("name") in tool_names
+            )
+        if mode == "none" or not snapshot:
+            return ""
+        if mode == "full":
+            return json.dumps(snapshot, indent=2)
+
+        lines = []
+        for definition in snapshot:
+            function = definition.get("function", definition)
+            parameters = function.get("parameters") or {}
+            required = set(parameters.get("required") or ())
+            args = ", ".join(
+                name if name in required else f"{name}?"
+                for name in parameters.get("properties") or {}
+            )
+            description = " ".join((function.get("description") or "").split())
+            description = description.split(". ")[0].rstrip(".")
+            if len(description) > TOOL_MANIFEST_DESCRIPTION_LENGTH:
+                description = (
+                    description[: TOOL_MANIFEST_DESCRIPTION_LENGTH - 3].rstrip() + "..."
+                )
+            lines.append(f"- {function.get('name')}({args}): {description}")
+        return "\n".join(lines)
+
+    @classmethod
+    def version(cls) -> int:
+        """Counter bumped whenever a tool is registered or the registry is cleared."""
+        return cls._version
+
+    @classmethod
+    def _bump_version(cls) -> None:
+        with cls._lock:
+            cls._version += 1
+
     @classmethod
     def get_tool_names(cls) -> List[str]:
         """Get list of registered tool names."""
@@ -318,14 +480,37 @@ class ToolRegistry:
         """Check if a tool is registered."""
         return name in cls._tools
 
+    @classmethod
+    def is_read_only(cls, name: str) -> bool:
+        """Check if a tool was registered as read-only (safe to run in parallel)."""
+        return name in cls._read_only
+
+    @classmethod
+    def concurrency_limit(cls, name: str) -> int:
+        """
+        Get how many calls to a tool may run at once.
+
+        Read-only tools are capped by TOOL_CONCURRENCY_LIMITS (default
+        TOOL_PARALLEL_WORKERS); every other tool runs alone.
+        """
+        from src.core.constants import TOOL_CONCURRENCY_LIMITS, TOOL_PARALLEL_WORKERS
+
+        if name not in cls._read_only:
+            return 1
+        return max(1, TOOL_CONCURRENCY_LIMITS.get(name, TOOL_PARALLEL_WORKERS))
+
     @classmethod
     def clear(cls) -> None:
         """Clear all registered tools. Useful for testing."""
         cls._tools.clear()
         cls._definitions.clear()
+        cls._read_only.clear()
+        cls._bump_version()
 
 
-def register_tool(name: str, definition: Optional[Dict] = None) -> Callable:
+def register_tool(
+    name: str, definition: Optional[Dict] = None, read_only: bool = False
+) -> Callable:
     """
     Convenience function for registering tools.
 
@@ -337,4 +522,4 @@ def register_tool(name: str, definition: Optional[Dict] = None) -> Callable:
         def execute_read_file(file_path: str) -> dict:
             ...
     """
-    return ToolRegistry.register(name, definition)
+    return ToolRegistry.register(name, definition, read_only=read_only)
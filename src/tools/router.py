@@ -0,0 +1,177 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Embedding-based tool router.
+
+With several MCP servers connected, binding every tool schema on each LLM
+call slows prompt processing on local models and makes tool selection less
+accurate. The router embeds each tool's name and description once (refreshed
+when ToolRegistry.version() changes) and picks the TOOL_ROUTER_TOP_N tools
+most similar to the user's input and recent conversation, plus the
+TOOL_ROUTER_CORE_TOOLS that are always bound.
+
+When routing is active the model also gets the request_all_tools tool; if
+none of the bound tools fits, calling it makes ChatLoop bind the full catalog
+for the rest of the turn.
+
+Enable with TOOL_ROUTER=true. Catalogs smaller than TOOL_ROUTER_MIN_TOOLS are
+always bound in full.
+"""
+
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from src.core.constants import (
+    TOOL_ROUTER_CORE_TOOLS,
+    TOOL_ROUTER_MIN_TOOLS,
+    TOOL_ROUTER_TOP_N,
+)
+from src.core.utils import cosine_similarity
+from src.tools.registry import ToolRegistry
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-tool the model calls to get the full catalog (handled by ChatLoop)
+REQUEST_ALL_TOOLS = "request_all_tools"
+
+REQUEST_ALL_TOOLS_DEFINITION = {
+    "type": "function",
+    "function": {
+        "name": REQUEST_ALL_TOOLS,
+        "description": (
+            "Only a selection of tools is available right now. Call this if none "
+            "of them fits the task to get every tool for the rest of the turn."
+        ),
+        "parameters": {"type": "object", "properties": {}},
+    },
+}
+
+
+def _tool_text(definition: Dict) -> str:
+    """Text embedded for a tool: its name, description and parameter names."""
+    function = definition.get("function", definition)
+    parameters = (function.get("parameters") or {}).get("properties") or {}
+    text = f"{function.get('name')}: {function.get('description') or ''}"
+    if parameters:
+        text += f" (parameters: {', '.join(parameters)})"
+    return text
+
+
+class ToolRouter:
+    """Select the tools to bind for a turn by embedding similarity."""
+
+    def __init__(
+        self,
+        top_n: int = TOOL_ROUTER_TOP_N,
+        core_tools: Sequence[str] = TOOL_ROUTER_CORE_TOOLS,
+        min_tools: int = TOOL_ROUTER_MIN_TOOLS,
+    ):
+        self.top_n = top_n
+        self.core_tools = tuple(core_tools)
+        self.min_tools = min_tools
+        self._version = -1
+        self._vectors: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> bool:
+        """
+        Embed the registered tools if the registry changed since last time.
+
+        Returns:
+            False if embeddings are unavailable
+        """
+        from src.core.context_utils import _generate_embeddings_batch
+
+        version = ToolRegistry.version()
+        if version == self._version:
+            return bool(self._vectors)
+
+        definitions = ToolRegistry.get_definitions_snapshot()
+        names = [d.get("function", d).get("name") for d in definitions]
+        vectors = _generate_embeddings_batch([_tool_text(d) for d in definitions])
+        if vectors is None or len(vectors) != len(names):
+            logger.warning("Tool router could not embed the tool catalog")
+            return False
+
+        self._vectors = dict(zip(names, vectors))
+        self._version = version
+        logger.debug(f"🧭 Tool router embedded {len(names)} tools")
+        return True
+
+    def select(self, query: str) -> Optional[List[str]]:
+        """
+        Pick the tools to bind for a query.
+
+        Args:
+            query: The user's input, optionally with recent conversation
+
+        Returns:
+            Tool names in registry order, or None to bind every tool (small
+            catalog, empty query or embeddings unavailable)
+        """
+        from src.core.context_utils import _generate_query_embedding
+
+        if len(ToolRegistry.get_tool_names()) < self.min_tools or not query.strip():
+            return None
+
+        with self._lock:
+            if not self._refresh():
+                return None
+            vectors = self._vectors
+
+        query_vector = _generate_query_embedding(query)
+        if query_vector is None:
+            return None
+
+        ranked = sorted(
+            vectors,
+            key=lambda name: cosine_similarity(query_vector, vectors[name]),
+            reverse=True,
+        )
+        selected = set(ranked[: self.top_n])
+        selected.update(name for name in self.core_tools if name in vectors)
+        logger.info(
+            f"🧭 Routed {len(selected)}/{len(vectors)} tools: {', '.join(sorted(selected))}"
+        )
+        return [name for name in vectors if name in selected]
+
+
+_router: Optional[ToolRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_tool_router() -> ToolRouter:
+    """Get the process-wide ToolRouter."""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ToolRouter()
+        return _router
+
+
+__all__ = [
+    "REQUEST_ALL_TOOLS",
+    "REQUEST_ALL_TOOLS_DEFINITION",
+    "ToolRouter",
+    "get_tool_router",
+]
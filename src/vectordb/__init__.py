@@ -57,6 +57,7 @@ from src.vectordb.spaces import (
     list_spaces,
     delete_space,
     switch_space,
+    space_change_blocker,
     save_current_space,
     load_current_space,
 )
@@ -71,6 +72,7 @@ __all__ = [
     "list_spaces",
     "delete_space",
     "switch_space",
+    "space_change_blocker",
     "save_current_space",
     "load_current_space",
 ]
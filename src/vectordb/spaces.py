@@ -54,6 +54,7 @@ import logging
 from typing import List
 
 from src.core.context import get_context, set_current_space
+from src.core.near_duplicates import forget_space_signatures
 from src.vectordb.client import get_chromadb_client
 
 logger = logging.getLogger(__name__)
@@ -147,13 +148,43 @@ def delete_space(space_name: str) -> bool:
     try:
         client = get_chromadb_client()
         collection_name = get_space_collection_name(space_name)
-        return client.delete_collection(collection_name)
+        if not client.delete_collection(collection_name):
+            return False
+        forget_space_signatures(space_name)
+
+        # Cached validators would make a re-crawl skip the deleted pages
+        from src.learning.web_crawler import forget_space_pages
+
+        forget_space_pages(space_name)
+        return True
 
     except Exception as e:
         logger.error(f"Failed to delete space {space_name}: {e}")
         return False
 
 
+def space_change_blocker() -> str:
+    """
+    Explain why the current space cannot change right now.
+
+    Background jobs ingest into the current space for their whole run, so it
+    stays fixed while any job is queued or running.
+
+    Returns:
+        Message naming the active jobs, or "" if the space may change
+    """
+    from src.core.jobs import get_job_manager
+
+    active = get_job_manager().active()
+    if not active:
+        return ""
+    ids = ", ".join(f"#{job.id}" for job in active)
+    return (
+        f"Cannot change spaces while background jobs are running ({ids}). "
+        "Wait for them or use `/jobs cancel <id>`."
+    )
+
+
 def switch_space(space_name: str) -> bool:
     """
     Switch to a different space.
@@ -162,8 +193,13 @@ def switch_space(space_name: str) -> bool:
         space_name: Space to switch to
 
     Returns:
-        True if switch was successful
+        True if switch was successful; False if the collection could not be
+        created or background jobs are running (see space_change_blocker)
     """
+    blocker = space_change_blocker()
+    if blocker:
+        logger.warning(blocker)
+        return False
     if not ensure_space_collection(space_name):
         return False
 
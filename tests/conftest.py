@@ -33,11 +33,14 @@ Fixtures:
 - mock_vectorstore: Mocked ChromaDB vector store
 - mock_llm: Mocked language model for AI interactions
 - mock_embeddings: Mocked text embeddings for vectorization
+- memory_db: In-memory SQLite database with the current schema in the context
 """
 
 import pytest
 from unittest.mock import MagicMock
 import os
+import sqlite3
+import threading
 
 # Load environment variables from .env file for tests
 try:
@@ -95,6 +98,29 @@ def mock_embeddings():
     return mock_emb
 
 
+@pytest.fixture
+def memory_db():
+    """Fresh in-memory database with the current schema in the context.
+
+    The application context is reset before and after the test.
+
+    Yields:
+        sqlite3.Connection: The database connection
+    """
+    from src.core.context import get_context, reset_context
+    from src.storage.database import _run_migrations
+
+    reset_context()
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    _run_migrations(conn.cursor(), 0)
+    ctx = get_context()
+    ctx.db_conn = conn
+    ctx.db_lock = threading.Lock()
+    yield conn
+    conn.close()
+    reset_context()
+
+
 @pytest.fixture
 def sample_md_content():
     """Sample markdown content for testing."""
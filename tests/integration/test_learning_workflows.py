@@ -34,6 +34,7 @@ from unittest.mock import MagicMock, patch
 from src.core.context import get_context, reset_context
 from src.core.context_utils import get_relevant_context
 from src.commands.handlers.learning_commands import handle_learn, handle_web
+from src.learning.converter_pool import ConvertedDocument
 
 
 class TestLearningWorkflows:
@@ -100,9 +101,9 @@ class TestLearningWorkflows:
     @patch("src.core.context_utils.get_config")
     @patch("src.commands.handlers.learning_commands.is_content_duplicate", return_value=False)
     @patch("src.commands.handlers.learning_commands.register_content_hash")
-    @patch("docling.document_converter.DocumentConverter")
+    @patch("src.learning.converter_pool.convert_document")
     def test_web_learning_workflow(
-        self, mock_converter_class, mock_register, mock_dup, mock_config
+        self, mock_convert, mock_register, mock_dup, mock_config
     ):
         """Test learning from a web URL by mocking Docling and the vectorstore."""
         # 1. Setup mocks
@@ -116,20 +117,18 @@ class TestLearningWorkflows:
         mock_conf.chroma_port = self.port
         mock_config.return_value = mock_conf
 
-        # Mock Docling conversion
-        mock_converter = mock_converter_class.return_value
-        mock_result = MagicMock()
-        mock_result.document.export_to_markdown.return_value = (
-            "# Web Content\nRetrieved from URL."
+        # Mock the pooled Docling conversion
+        mock_convert.return_value = ConvertedDocument(
+            "https://example.com",
+            "# Web Content\nRetrieved from URL.",
+            title="Test Web Page",
         )
-        mock_result.document.title = "Test Web Page"
-        mock_converter.convert.return_value = mock_result
 
         # 2. Execute /web command
         handle_web(["https://example.com"])
 
         # 3. Verify interactions
-        mock_converter.convert.assert_called_with("https://example.com")
+        mock_convert.assert_called_with("https://example.com")
         assert ctx.vectorstore.add_documents.called
         args, _ = ctx.vectorstore.add_documents.call_args
         doc = args[0][0]
@@ -33,6 +33,8 @@ This suite ensures that memory usage is optimal and
 can detect memory leaks or inefficiencies.
 """
 
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
 from src.storage.memory import trim_history
 from src.core.chat_loop import ChatLoop
 
@@ -49,6 +51,11 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
 
+def _message(index: int, text: str):
+    """Alternate user and assistant messages so history forms exchanges."""
+    return HumanMessage(content=text) if index % 2 == 0 else AIMessage(content=text)
+
+
 class MemoryLeakTestCase(unittest.TestCase):
     """Test case for detecting memory leaks."""
 
@@ -100,23 +107,21 @@ class TestIncrementalMemoryManagement(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 10  # Small for testing
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
-        # Test threshold calculation
-        max_safe_size = mock_config.max_history_pairs * 2 + 5  # 25 for our test config
-        threshold = max_safe_size * 1.5  # 37.5
-
-        # Add messages up to threshold - should NOT trigger trimming
-        for i in range(int(threshold)):
-            mock_ctx.conversation_history.append(f"message_{i}")
+        # System prompt + max_history_pairs exchanges - should NOT trigger trimming
+        mock_ctx.conversation_history.append(SystemMessage(content="system"))
+        for i in range(mock_config.max_history_pairs * 2):
+            mock_ctx.conversation_history.append(_message(i, f"message_{i}"))
 
         self.assertFalse(
             chat_loop._should_trim_memory(), "Should not trim at threshold"
         )
 
-        # Add one more message - should trigger trimming
-        mock_ctx.conversation_history.append("threshold_message")
+        # Start one more exchange - should trigger trimming
+        mock_ctx.conversation_history.append(_message(0, "threshold_message"))
 
         self.assertTrue(chat_loop._should_trim_memory(), "Should trim over threshold")
 
@@ -128,13 +133,14 @@ class TestIncrementalMemoryManagement(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 20
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
         # Add many messages to trigger trimming
         for i in range(100):
             mock_ctx.conversation_history.append(
-                f"test_message_{i}" * 10
+                _message(i, f"test_message_{i}" * 10)
             )  # Longer messages
 
         original_length = len(mock_ctx.conversation_history)
@@ -162,12 +168,13 @@ class TestIncrementalMemoryManagement(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 15
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
         # Fill conversation history
         for i in range(80):
-            mock_ctx.conversation_history.append(f"tool_test_message_{i}")
+            mock_ctx.conversation_history.append(_message(i, f"tool_test_message_{i}"))
 
         original_length = len(mock_ctx.conversation_history)
 
@@ -196,6 +203,7 @@ class TestIncrementalMemoryManagement(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 10
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
@@ -204,7 +212,7 @@ class TestIncrementalMemoryManagement(MemoryLeakTestCase):
             # Add messages to trigger management
             for i in range(60):
                 mock_ctx.conversation_history.append(
-                    f"iteration_{iteration}_message_{i}"
+                    _message(i, f"iteration_{iteration}_message_{i}")
                 )
 
             # Trigger memory management
@@ -230,19 +238,22 @@ class TestConversationHistoryManagement(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 5  # Small for testing
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
         # Create conversation with important messages
         important_messages = [
-            "User: What's the weather?",
-            "AI: It's sunny today.",
-            "User: That's great!",
-            "AI: Yes, perfect for a walk.",
+            HumanMessage(content="What's the weather?"),
+            AIMessage(content="It's sunny today."),
+            HumanMessage(content="That's great!"),
+            AIMessage(content="Yes, perfect for a walk."),
         ]
 
         # Add many filler messages
-        filler_messages = [f"Filler message {i}" for i in range(50)]
+        filler_messages = [SystemMessage(content="system")] + [
+            _message(i, f"Filler message {i}") for i in range(50)
+        ]
 
         mock_ctx.conversation_history.extend(filler_messages)
         mock_ctx.conversation_history.extend(important_messages)
@@ -268,6 +279,7 @@ class TestConversationHistoryManagement(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 100
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
@@ -278,7 +290,7 @@ class TestConversationHistoryManagement(MemoryLeakTestCase):
                 f"Message {i}: "
                 + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 10
             )
-            large_messages.append(message)
+            large_messages.append(_message(i, message))
 
         mock_ctx.conversation_history.extend(large_messages)
 
@@ -313,6 +325,7 @@ class TestConversationHistoryManagement(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 20
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
@@ -320,7 +333,7 @@ class TestConversationHistoryManagement(MemoryLeakTestCase):
 
         # Simulate conversation growth
         for i in range(100):
-            mock_ctx.conversation_history.append(f"Message {i}")
+            mock_ctx.conversation_history.append(_message(i, f"Message {i}"))
 
             # Record growth pattern every 10 messages
             if i % 10 == 9:
@@ -357,6 +370,7 @@ class TestMemoryOptimization(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 15
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
@@ -369,7 +383,9 @@ class TestMemoryOptimization(MemoryLeakTestCase):
             "Special chars: !@#$%^&*()",  # Special characters
         ] * 20  # Repeat to trigger memory management
 
-        mock_ctx.conversation_history.extend(mixed_content)
+        mock_ctx.conversation_history.extend(
+            _message(i, text) for i, text in enumerate(mixed_content)
+        )
 
         # Track memory before optimization
         memory_before = self._get_memory_usage()
@@ -404,6 +420,7 @@ class TestMemoryOptimization(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 25
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
@@ -411,7 +428,9 @@ class TestMemoryOptimization(MemoryLeakTestCase):
         for batch in range(5):
             # Add batch of messages
             for i in range(30):
-                mock_ctx.conversation_history.append(f"Batch {batch} Message {i}")
+                mock_ctx.conversation_history.append(
+                    _message(i, f"Batch {batch} Message {i}")
+                )
 
             # Perform memory management
             trimmed = chat_loop._trim_conversation_history_incremental()
@@ -447,6 +466,7 @@ class TestMemoryLeaksDetection(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 20
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
@@ -455,7 +475,7 @@ class TestMemoryLeaksDetection(MemoryLeakTestCase):
             # Add messages
             for i in range(40):
                 mock_ctx.conversation_history.append(
-                    f"Operation {operation} Message {i}"
+                    _message(i, f"Operation {operation} Message {i}")
                 )
 
             # Perform memory management
@@ -477,13 +497,14 @@ class TestMemoryLeaksDetection(MemoryLeakTestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 10
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
         # Create and track objects
         test_objects = []
         for i in range(100):
-            obj = f"Test object {i}"
+            obj = _message(i, f"Test object {i}")
             test_objects.append(obj)
             mock_ctx.conversation_history.append(obj)
 
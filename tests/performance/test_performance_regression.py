@@ -33,6 +33,8 @@ This suite ensures that performance improvements are maintained
 and can detect regressions in future changes.
 """
 
+from langchain_core.messages import AIMessage, HumanMessage
+
 from src.core.chat_loop import ChatLoop
 
 import unittest
@@ -48,6 +50,11 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
 
+def _message(index: int, text: str):
+    """Alternate user and assistant messages so history forms exchanges."""
+    return HumanMessage(content=text) if index % 2 == 0 else AIMessage(content=text)
+
+
 class PerformanceRegressionTestCase(unittest.TestCase):
     """Base class for performance regression tests with common setup."""
 
@@ -61,6 +68,7 @@ class PerformanceRegressionTestCase(unittest.TestCase):
         # Mock config with reasonable values
         self.mock_config = MagicMock()
         self.mock_config.max_history_pairs = 50  # Higher for testing
+        self.mock_config.context_token_budget = 100000
         self.chat_loop.config = self.mock_config
         self.chat_loop.ctx = self.mock_ctx
 
@@ -209,11 +217,11 @@ class TestMemoryManagementPerformance(PerformanceRegressionTestCase):
 
     def test_memory_trimming_performance(self):
         """Test that memory trimming operations meet performance baseline."""
-        # Add many messages to trigger trimming
-        threshold = (self.chat_loop.config.max_history_pairs * 2 + 5) * 1.5
+        # Add many exchanges to trigger trimming
+        threshold = self.chat_loop.config.max_history_pairs * 2
 
-        for i in range(int(threshold) + 50):
-            self.mock_ctx.conversation_history.append(f"memory_test_message_{i}")
+        for i in range(threshold + 50):
+            self.mock_ctx.conversation_history.append(_message(i, f"memory_test_message_{i}"))
 
         def trim_memory():
             self.chat_loop._trim_conversation_history_incremental()
@@ -231,11 +239,11 @@ class TestMemoryManagementPerformance(PerformanceRegressionTestCase):
 
     def test_memory_threshold_detection_performance(self):
         """Test that memory threshold detection is efficient."""
-        threshold = (self.chat_loop.config.max_history_pairs * 2 + 5) * 1.5
+        threshold = self.chat_loop.config.max_history_pairs * 2
 
-        # Add messages up to threshold
-        for i in range(int(threshold) + 20):
-            self.mock_ctx.conversation_history.append(f"threshold_test_{i}")
+        # Add exchanges past the threshold
+        for i in range(threshold + 20):
+            self.mock_ctx.conversation_history.append(_message(i, f"threshold_test_{i}"))
 
         def check_threshold():
             return self.chat_loop._should_trim_memory()
@@ -254,10 +262,10 @@ class TestMemoryManagementPerformance(PerformanceRegressionTestCase):
     def test_memory_efficiency_during_tool_execution(self):
         """Test that tool execution with memory management is memory efficient."""
         # Add many messages to trigger memory management
-        threshold = (self.chat_loop.config.max_history_pairs * 2 + 5) * 1.5
+        threshold = self.chat_loop.config.max_history_pairs * 2
 
-        for i in range(int(threshold) + 30):
-            self.mock_ctx.conversation_history.append(f"tool_test_{i}")
+        for i in range(threshold + 30):
+            self.mock_ctx.conversation_history.append(_message(i, f"tool_test_{i}"))
 
         with patch("src.core.chat_loop.ToolRegistry") as mock_registry_class:
             mock_registry_instance = mock_registry_class.return_value
@@ -283,7 +291,7 @@ class TestMemoryManagementPerformance(PerformanceRegressionTestCase):
     def test_conversation_history_persistence_performance(self):
         """Test that conversation history operations are efficient."""
         # Add test messages
-        test_messages = [f"persistence_test_{i}" for i in range(100)]
+        test_messages = [_message(i, f"persistence_test_{i}") for i in range(100)]
         self.mock_ctx.conversation_history.extend(test_messages)
 
         def test_history_operations():
@@ -296,7 +304,7 @@ class TestMemoryManagementPerformance(PerformanceRegressionTestCase):
             trimmed = trim_history(self.mock_ctx.conversation_history, 50)
 
             # Test history append
-            self.mock_ctx.conversation_history.append("new_message")
+            self.mock_ctx.conversation_history.append(_message(0, "new_message"))
 
             return length, len(trimmed)
 
@@ -486,6 +494,7 @@ class TestPerformanceRegressionMonitoring(unittest.TestCase):
         mock_ctx.context_mode = "off"
         mock_config = MagicMock()
         mock_config.max_history_pairs = 50
+        mock_config.context_token_budget = 100000
         chat_loop.config = mock_config
         chat_loop.ctx = mock_ctx
 
@@ -503,7 +512,7 @@ class TestPerformanceRegressionMonitoring(unittest.TestCase):
 
         # Memory management baseline
         for i in range(200):
-            mock_ctx.conversation_history.append(f"baseline_test_{i}")
+            mock_ctx.conversation_history.append(_message(i, f"baseline_test_{i}"))
 
         start_time = time.time()
         for _ in range(10):
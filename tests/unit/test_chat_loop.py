@@ -35,9 +35,18 @@ Tests cover:
 - Verbose logging
 """
 
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
-from langchain_core.messages import AIMessage, HumanMessage, ToolMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from src.core import chat_loop
 from src.core.chat_loop import ChatLoop
 
 
@@ -179,6 +188,7 @@ class TestChatLoopMultiTool(unittest.TestCase):
         mock_ctx.llm = mock_llm
 
         mock_registry.execute.side_effect = [{"result": 1}, {"result": 2}]
+        mock_registry.is_read_only.return_value = False
 
         loop = ChatLoop()
         response = loop.run_iteration("Run both")
@@ -191,6 +201,418 @@ class TestChatLoopMultiTool(unittest.TestCase):
         self.assertEqual(len(tool_messages), 2)
 
 
+class TestChatLoopParallelTools(unittest.TestCase):
+    """Test concurrent execution of read-only tool calls."""
+
+    def setUp(self):
+        self.lock = threading.Lock()
+        self.events = []
+        self.running = 0
+        self.max_running = 0
+
+        ctx_patcher = patch("src.core.chat_loop.get_context")
+        ctx_patcher.start().return_value = MagicMock(conversation_history=[])
+        self.addCleanup(ctx_patcher.stop)
+        registry_patcher = patch("src.core.chat_loop.ToolRegistry")
+        self.registry = registry_patcher.start()
+        self.addCleanup(registry_patcher.stop)
+        self.registry.is_read_only.side_effect = lambda name: name != "write_file"
+        self.registry.concurrency_limit.return_value = 4
+        self.registry.execute.side_effect = self._execute
+        self.registry.acquire_rate_limit.return_value = None
+
+    def _execute(self, name, args, rate_limit=True):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.events.append(("start", args["id"]))
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+            self.events.append(("end", args["id"]))
+        return {"success": True, "id": args["id"]}
+
+    def _calls(self, *names):
+        return [
+            {"name": name, "args": {"id": i}, "id": str(i)}
+            for i, name in enumerate(names)
+        ]
+
+    def test_read_only_tools_run_concurrently_in_order(self):
+        calls = self._calls("read_file_content", "code_search", "git_diff")
+        results = ChatLoop()._execute_parallel_tools_if_safe(calls)
+
+        self.assertEqual([r["id"] for r in results], [0, 1, 2])
+        self.assertEqual(self.max_running, 3)
+
+    def test_write_tool_is_a_barrier(self):
+        calls = self._calls(
+            "read_file_content", "read_file_content", "write_file", "git_diff"
+        )
+        results = ChatLoop()._execute_parallel_tools_if_safe(calls)
+
+        self.assertEqual([r["id"] for r in results], [0, 1, 2, 3])
+        write_start = self.events.index(("start", 2))
+        self.assertIn(("end", 0), self.events[:write_start])
+        self.assertIn(("end", 1), self.events[:write_start])
+        self.assertLess(self.events.index(("end", 2)), self.events.index(("start", 3)))
+
+    def test_per_tool_concurrency_limit(self):
+        self.registry.concurrency_limit.return_value = 1
+        calls = self._calls("search_web", "search_web", "search_web")
+        ChatLoop()._execute_parallel_tools_if_safe(calls)
+
+        self.assertEqual(self.max_running, 1)
+
+    def test_confirmation_still_applies(self):
+        self.registry.execute.side_effect = lambda name, args, rate_limit=True: (
+            {"requires_confirmation": True}
+            if args["id"] == 1
+            else {"success": True, "id": args["id"]}
+        )
+        self.registry._tools = {"git_log": lambda id: {"success": True, "id": id}}
+        confirm = MagicMock(return_value=False)
+        calls = self._calls("git_log", "git_log")
+        results = ChatLoop(
+            confirmation_callback=confirm
+        )._execute_parallel_tools_if_safe(calls)
+
+        confirm.assert_called_once_with("git_log", {"id": 1})
+        self.assertEqual(results[0]["id"], 0)
+        self.assertEqual(results[1], {"error": "User denied execution."})
+
+    def test_pool_shared_between_loops(self):
+        calls = self._calls("read_file_content", "code_search")
+        ChatLoop()._execute_parallel_tools_if_safe(calls)
+        pool = chat_loop._tool_pool
+        ChatLoop()._execute_parallel_tools_if_safe(calls)
+
+        self.assertIsNotNone(pool)
+        self.assertIs(chat_loop._tool_pool, pool)
+
+    def test_empty_batch_is_skipped(self):
+        loop = ChatLoop()
+        with patch.object(loop, "_monitor_performance") as monitor:
+            results = loop._execute_parallel_tools_if_safe(self._calls("write_file"))
+
+        self.assertEqual(results[0]["id"], 0)
+        monitor.assert_not_called()
+
+    def test_mismatched_early_call_is_cancelled_and_rerun(self):
+        loop = ChatLoop()
+        stale = MagicMock()
+        loop._early_calls = {"0": ("read_file_content", {"id": 9}, stale)}
+
+        results = loop._execute_parallel_tools_if_safe(self._calls("read_file_content"))
+
+        stale.cancel.assert_called_once()
+        self.assertEqual(results[0]["id"], 0)
+        self.assertEqual(loop._early_calls, {})
+        self.registry.acquire_rate_limit.assert_not_called()
+
+    def test_claimed_early_call_takes_rate_limit_slot(self):
+        loop = ChatLoop()
+        early = loop._submit_read_only(self._calls("read_file_content")[0], early=True)
+        loop._early_calls = {"0": ("read_file_content", {"id": 0}, early)}
+        calls = self._calls("read_file_content", "code_search")
+
+        results = loop._execute_parallel_tools_if_safe(calls)
+
+        self.assertEqual([r["id"] for r in results], [0, 1])
+        self.registry.execute.assert_any_call(
+            "read_file_content", {"id": 0}, rate_limit=False
+        )
+        self.registry.acquire_rate_limit.assert_called_once_with("read_file_content")
+
+    def test_rate_limited_early_call_is_cancelled(self):
+        self.registry.acquire_rate_limit.return_value = {"error": "Rate limit exceeded"}
+        loop = ChatLoop()
+        early = MagicMock()
+        loop._early_calls = {"0": ("read_file_content", {"id": 0}, early)}
+        calls = self._calls("read_file_content", "code_search")
+
+        results = loop._execute_parallel_tools_if_safe(calls)
+
+        early.cancel.assert_called_once()
+        self.assertEqual(results[0], {"error": "Rate limit exceeded"})
+        self.assertEqual(results[1]["id"], 1)
+
+
+class TestChatLoopStreaming(unittest.TestCase):
+    """Test token streaming through on_token."""
+
+    def _loop(self, *streams):
+        mock_ctx = MagicMock()
+        mock_ctx.conversation_history = []
+        mock_ctx.context_mode = "off"
+        mock_llm = MagicMock()
+        mock_llm.bind_tools.return_value = mock_llm
+        mock_llm.stream.side_effect = [iter(chunks) for chunks in streams]
+        mock_ctx.llm = mock_llm
+        self.tokens = []
+        with patch("src.core.chat_loop.get_context", return_value=mock_ctx):
+            loop = ChatLoop(on_token=self.tokens.append)
+        return loop, mock_ctx, mock_llm
+
+    @patch("src.core.chat_loop.save_memory")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_text_tokens_forwarded(self, mock_registry, mock_save):
+        loop, ctx, llm = self._loop(
+            [AIMessageChunk(content="Hel"), AIMessageChunk(content="lo!")]
+        )
+
+        response = loop.run_iteration("Hi")
+
+        self.assertEqual(response, "Hello!")
+        self.assertEqual(self.tokens, ["Hel", "lo!"])
+        self.assertTrue(loop.last_response_streamed)
+        llm.invoke.assert_not_called()
+        self.assertIsInstance(ctx.conversation_history[-1], AIMessage)
+        self.assertNotIsInstance(ctx.conversation_history[-1], AIMessageChunk)
+
+    @patch("src.core.chat_loop.save_memory")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_tool_call_deltas_assembled(self, mock_registry, mock_save):
+        tool_stream = [
+            AIMessageChunk(content="Reading. "),
+            AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {
+                        "name": "read_file_content",
+                        "args": '{"file_pa',
+                        "id": "call_1",
+                        "index": 0,
+                    }
+                ],
+            ),
+            AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {"name": None, "args": 'th": "a.txt"}', "id": None, "index": 0}
+                ],
+            ),
+        ]
+        loop, ctx, _ = self._loop(tool_stream, [AIMessageChunk(content="Done")])
+        mock_registry.is_read_only.return_value = False
+        mock_registry.execute.return_value = {"success": True}
+
+        response = loop.run_iteration("Read a.txt")
+
+        self.assertEqual(response, "Done")
+        mock_registry.execute.assert_called_once_with(
+            "read_file_content", {"file_path": "a.txt"}
+        )
+        self.assertEqual(self.tokens, ["Reading. ", "\n\n", "Done"])
+        tool_message = ctx.conversation_history[2]
+        self.assertIsInstance(tool_message, ToolMessage)
+        self.assertEqual(tool_message.tool_call_id, "call_1")
+
+    @staticmethod
+    def _tool_chunk(index, args, name=None, call_id=None):
+        return AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                {"name": name, "args": args, "id": call_id, "index": index}
+            ],
+        )
+
+    @patch("src.core.chat_loop.save_memory")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_read_only_call_starts_while_streaming(self, mock_registry, mock_save):
+        started = threading.Event()
+        seen = {}
+
+        def stream():
+            yield self._tool_chunk(
+                0, '{"file_path": "a.py"}', "read_file_content", "c0"
+            )
+            yield self._tool_chunk(1, '{"file_pa', "read_file_content", "c1")
+            # The first call runs while the second is still being generated
+            seen["before_end"] = started.wait(5)
+            yield self._tool_chunk(1, 'th": "b.py"}')
+
+        def execute(name, args, rate_limit=True):
+            if args["file_path"] == "a.py":
+                started.set()
+            return {"success": True, "path": args["file_path"]}
+
+        loop, ctx, _ = self._loop(stream(), [AIMessageChunk(content="Done")])
+        mock_registry.is_read_only.return_value = True
+        mock_registry.concurrency_limit.return_value = 4
+        mock_registry.execute.side_effect = execute
+        mock_registry.acquire_rate_limit.return_value = None
+
+        self.assertEqual(loop.run_iteration("Read both"), "Done")
+
+        self.assertTrue(seen["before_end"])
+        self.assertEqual(mock_registry.execute.call_count, 2)
+        # Early calls count against the rate limit only once claimed
+        self.assertEqual(mock_registry.acquire_rate_limit.call_count, 2)
+        tool_messages = [
+            m for m in ctx.conversation_history if isinstance(m, ToolMessage)
+        ]
+        self.assertEqual([m.tool_call_id for m in tool_messages], ["c0", "c1"])
+        self.assertIn("a.py", tool_messages[0].content)
+        self.assertIn("b.py", tool_messages[1].content)
+
+    @patch("src.core.chat_loop.save_memory")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_barrier_tool_blocks_early_dispatch(self, mock_registry, mock_save):
+        stream = [
+            self._tool_chunk(0, '{"file_path": "a.py"}', "write_file", "c0"),
+            self._tool_chunk(1, '{"file_path": "a.py"}', "read_file_content", "c1"),
+        ]
+        loop, _, _ = self._loop(stream, [AIMessageChunk(content="Done")])
+        mock_registry.is_read_only.side_effect = lambda name: name != "write_file"
+        mock_registry.execute.return_value = {"success": True}
+
+        loop.run_iteration("Write then read")
+
+        names = [c.args[0] for c in mock_registry.execute.call_args_list]
+        self.assertEqual(names, ["write_file", "read_file_content"])
+
+    @patch("src.core.chat_loop.save_memory")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_unclaimed_early_call_discarded_at_turn_end(self, mock_registry, mock_save):
+        # The streamed call never makes it into the final tool calls
+        stream = [self._tool_chunk(0, '{"file_path": "a.py"}', "read_file_content")]
+        loop, _, _ = self._loop(stream)
+        mock_registry.is_read_only.return_value = True
+        leftover = MagicMock()
+
+        def dispatch(chunks):
+            loop._early_calls["c0"] = ("read_file_content", {}, leftover)
+
+        with patch.object(loop, "_dispatch_streamed_tool_calls", side_effect=dispatch):
+            loop.run_iteration("Read a.py")
+
+        leftover.cancel.assert_called_once()
+        self.assertEqual(loop._early_calls, {})
+        mock_registry.acquire_rate_limit.assert_not_called()
+
+    @patch("src.core.chat_loop.save_memory")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_error_response_not_marked_streamed(self, mock_registry, mock_save):
+        loop, _, _ = self._loop([])
+
+        response = loop.run_iteration("Hi")
+
+        self.assertTrue(response.startswith("❌"))
+        self.assertFalse(loop.last_response_streamed)
+
+
+class TestChatLoopToolBinding(unittest.TestCase):
+    """Test caching of the LLM with tools bound."""
+
+    def setUp(self):
+        chat_loop._bound_llm = None
+        self.addCleanup(setattr, chat_loop, "_bound_llm", None)
+
+    @patch("src.core.chat_loop.get_context")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_bound_llm_cached_per_version_and_llm(self, mock_registry, mock_get_ctx):
+        llm, other_llm = MagicMock(), MagicMock()
+        mock_registry.get_definitions_snapshot.return_value = ({"name": "t"},)
+        mock_registry.version.return_value = 1
+        loop = ChatLoop()
+
+        bound = loop._bind_tools(llm)
+        self.assertIs(ChatLoop()._bind_tools(llm), bound)
+        llm.bind_tools.assert_called_once_with([{"name": "t"}])
+
+        mock_registry.version.return_value = 2
+        loop._bind_tools(llm)
+        self.assertEqual(llm.bind_tools.call_count, 2)
+
+        loop._bind_tools(other_llm)
+        other_llm.bind_tools.assert_called_once()
+
+    @patch("src.core.chat_loop.get_context")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_routed_selection_bound_with_escape_hatch(
+        self, mock_registry, mock_get_ctx
+    ):
+        llm = MagicMock()
+        read = {"type": "function", "function": {"name": "read_file_content"}}
+        git = {"type": "function", "function": {"name": "git_log"}}
+        mock_registry.get_definitions_snapshot.return_value = (read, git)
+        mock_registry.version.return_value = 1
+        loop = ChatLoop()
+
+        loop._bind_tools(llm, ["git_log"])
+        llm.bind_tools.assert_called_once_with(
+            [git, chat_loop.REQUEST_ALL_TOOLS_DEFINITION]
+        )
+
+        # Each selection is cached separately from the full catalog
+        loop._bind_tools(llm, ["git_log"])
+        loop._bind_tools(llm)
+        self.assertEqual(llm.bind_tools.call_count, 2)
+        llm.bind_tools.assert_called_with([read, git])
+
+    @patch("src.core.chat_loop.get_context")
+    @patch("src.core.chat_loop.ToolRegistry")
+    def test_request_all_tools_unroutes_turn(self, mock_registry, mock_get_ctx):
+        mock_registry.get_tool_names.return_value = ["a", "b", "c"]
+        loop = ChatLoop()
+        loop._turn_tools = ["a"]
+
+        result = loop._handle_tool_execution(chat_loop.REQUEST_ALL_TOOLS, {})
+
+        self.assertTrue(result["success"])
+        self.assertIn("All 3 tools", result["message"])
+        self.assertIsNone(loop._turn_tools)
+        mock_registry.execute.assert_not_called()
+
+    @patch("src.core.chat_loop.get_tool_router")
+    @patch("src.core.chat_loop.get_context")
+    def test_route_tools_query(self, mock_get_ctx, mock_router):
+        mock_get_ctx.return_value.conversation_history = [
+            HumanMessage(content="old question"),
+            AIMessage(content="old answer"),
+            HumanMessage(content="earlier"),
+            AIMessage(content="sure"),
+            HumanMessage(
+                content="show the git log\n\nContext from knowledge base:\nnoise"
+            ),
+        ]
+        mock_router.return_value.select.return_value = ["git_log"]
+        loop = ChatLoop()
+
+        with patch.object(loop.config, "tool_router", False):
+            self.assertIsNone(loop._route_tools())
+        mock_router.assert_not_called()
+
+        with patch.object(loop.config, "tool_router", True):
+            self.assertEqual(loop._route_tools(), ["git_log"])
+        mock_router.return_value.select.assert_called_once_with(
+            "earlier\nsure\nshow the git log"
+        )
+
+    @patch("src.core.chat_loop.get_context")
+    @patch("src.core.chat_loop.build_system_prompt")
+    def test_routed_turn_lists_only_bound_tools(self, mock_prompt, mock_get_ctx):
+        mock_prompt.side_effect = lambda tool_names=None: (
+            "Prompt: all tools" if tool_names is None else f"Prompt: {tool_names}"
+        )
+        history = [
+            SystemMessage(content="Prompt: all tools\n\nSummary"),
+            HumanMessage(content="Hi"),
+        ]
+        loop = ChatLoop()
+
+        self.assertIs(loop._with_routed_manifest(history), history)
+
+        loop._turn_tools = ["git_log"]
+        messages = loop._with_routed_manifest(history)
+        self.assertEqual(messages[0].content, "Prompt: ['git_log']\n\nSummary")
+        self.assertIs(messages[1], history[1])
+
+        custom = [SystemMessage(content="Lets get some coding done..")]
+        self.assertIs(loop._with_routed_manifest(custom), custom)
+
+
 class TestChatLoopToolApproval(unittest.TestCase):
     """Test tool approval and rejection."""
 
@@ -354,6 +776,37 @@ class TestChatLoopContext(unittest.TestCase):
         # With context_mode off, context should not be injected
         self.assertEqual(response, "Answer without context")
 
+    @patch("src.core.chat_loop.get_context")
+    @patch("src.core.context_utils.get_relevant_context", return_value="")
+    def test_auto_mode_skips_small_talk(self, mock_rag, mock_get_ctx):
+        """Test that auto mode does not retrieve for conversational turns."""
+        mock_get_ctx.return_value.context_mode = "auto"
+        loop = ChatLoop()
+
+        with self.assertLogs("src.core.chat_loop", level="INFO") as logs:
+            self.assertEqual(loop._inject_context("thanks!"), "thanks!")
+
+        mock_rag.assert_not_called()
+        self.assertIn("Context skipped (conversational", logs.output[0])
+
+    @patch("src.core.chat_loop.get_context")
+    @patch(
+        "src.core.context_utils.get_relevant_context",
+        return_value="Relevant context: spaces",
+    )
+    def test_auto_mode_retrieves_with_threshold(self, mock_rag, mock_get_ctx):
+        """Test that auto mode retrieves questions with the relevance threshold."""
+        mock_get_ctx.return_value.context_mode = "auto"
+        loop = ChatLoop()
+
+        enhanced = loop._inject_context("How do spaces work?")
+
+        mock_rag.assert_called_once_with(
+            "How do spaces work?",
+            min_similarity=chat_loop.CONTEXT_AUTO_MIN_SIMILARITY,
+        )
+        self.assertIn("Context from knowledge base:", enhanced)
+
 
 class TestChatLoopMemory(unittest.TestCase):
     """Test conversation memory management."""
@@ -424,6 +877,40 @@ class TestChatLoopMemory(unittest.TestCase):
         # History should grow
         self.assertGreater(second_length, first_length)
 
+    @patch("src.core.chat_loop.get_context")
+    def test_large_tool_result_triggers_trim(self, mock_get_ctx):
+        """Test that trimming follows the token budget, not the message count."""
+        history = [SystemMessage(content="S"), HumanMessage(content="Read it")]
+        mock_get_ctx.return_value.conversation_history = history
+        loop = ChatLoop()
+
+        with patch.object(loop.config, "context_token_budget", 1000):
+            self.assertFalse(loop._should_trim_memory())
+            history.append(ToolMessage(content="x" * 8000, tool_call_id="c1"))
+            self.assertTrue(loop._should_trim_memory())
+
+    @patch("src.core.chat_loop.get_summarizer")
+    @patch("src.core.chat_loop.get_context")
+    def test_trimmed_turns_are_summarized(self, mock_get_ctx, mock_get_summarizer):
+        """Test that exchanges dropped by the trim go to the rolling summary."""
+        history = [
+            SystemMessage(content="S"),
+            HumanMessage(content="H1"),
+            AIMessage(content="A1"),
+            HumanMessage(content="H2"),
+            AIMessage(content="A2"),
+        ]
+        mock_get_ctx.return_value.conversation_history = history
+        loop = ChatLoop()
+
+        with patch.object(loop.config, "max_history_pairs", 1):
+            loop._trim_conversation_history()
+
+        self.assertEqual(
+            mock_get_ctx.return_value.conversation_history, [history[0]] + history[3:]
+        )
+        mock_get_summarizer.return_value.submit.assert_called_once_with(history[1:3])
+
 
 class TestChatLoopVerboseLogging(unittest.TestCase):
     """Test verbose logging functionality."""
@@ -22,7 +22,7 @@
 
 import unittest
 from unittest.mock import MagicMock, patch
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from src.core.chat_loop import ChatLoop
 
 
@@ -83,6 +83,44 @@ class TestChatLoopInjection(unittest.TestCase):
         self.assertIn("SECRET_CONTENT_123", injected_msg.content)
         self.assertIn("Output of reading file", injected_msg.content)
 
+        # The file content is sent once, not also in the tool result
+        tool_msg = mock_ctx.conversation_history[2]
+        self.assertNotIn("SECRET_CONTENT_123", tool_msg.content)
+        self.assertIn("test.txt", tool_msg.content)
+
+    @patch("src.core.chat_loop.get_context")
+    @patch("src.core.chat_loop.ToolRegistry")
+    @patch("src.core.chat_loop.save_memory")
+    @patch("src.core.context_utils.get_relevant_context", return_value="")
+    def test_large_tool_output_is_previewed(
+        self, mock_rag, mock_save, mock_registry, mock_get_ctx
+    ):
+        """Test that large tool output is stored and the history gets a preview."""
+        mock_ctx = MagicMock()
+        mock_ctx.conversation_history = []
+        mock_ctx.context_mode = "off"
+        mock_llm = MagicMock()
+        mock_llm.bind_tools.return_value = mock_llm
+        mock_ctx.llm = mock_llm
+        mock_get_ctx.return_value = mock_ctx
+
+        tool_call = {"name": "git_diff", "args": {}, "id": "call_1"}
+        mock_llm.invoke.side_effect = [
+            AIMessage(content="", tool_calls=[tool_call]),
+            AIMessage(content="The diff renames a function"),
+        ]
+        diff = "".join(f"+line {i}\n" for i in range(5000))
+        mock_registry.execute.return_value = {"success": True, "diff": diff}
+
+        loop = ChatLoop()
+        loop.run_iteration("show the diff")
+
+        tool_msg = mock_ctx.conversation_history[2]
+        self.assertIsInstance(tool_msg, ToolMessage)
+        self.assertLess(len(tool_msg.content), 3000)
+        self.assertIn("read_tool_output", tool_msg.content)
+        self.assertIn("+line 4999", tool_msg.content)
+
 
 if __name__ == "__main__":
     unittest.main()
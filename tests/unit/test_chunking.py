@@ -0,0 +1,224 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for the structure-aware chunking engine (src/core/chunking.py).
+
+Tests cover:
+- Python def/class boundaries and oversized class splitting
+- Markdown heading sections (including fenced code)
+- Size-capped fallback with line ranges
+- Duplicate boilerplate removal
+- Content-defined boundaries staying stable across local edits
+"""
+
+import pytest
+
+from src.core.chunking import Chunk, chunk_document, chunk_id, detect_language
+
+
+def _function(name: str, body_lines: int) -> str:
+    body = "".join(f"    value_{i} = {i}\n" for i in range(body_lines))
+    return f"def {name}():\n{body}    return None\n"
+
+
+class TestPythonStrategy:
+    """Tests for ast-based chunking."""
+
+    def test_functions_are_not_split(self):
+        """Each function stays within one chunk and line ranges match."""
+        source = "\n\n".join(_function(f"f{i}", 40) for i in range(4))
+        chunks = chunk_document(source, file_path="mod.py", chunk_size=1000)
+        lines = source.splitlines()
+
+        assert len(chunks) == 4
+        for i, chunk in enumerate(chunks):
+            assert chunk.kind == "function"
+            assert chunk.name == f"f{i}"
+            assert chunk.text.startswith(f"def f{i}():")
+            assert lines[chunk.start_line - 1] == f"def f{i}():"
+            assert lines[chunk.end_line - 1] == "    return None"
+
+    def test_small_definitions_are_packed(self):
+        """Small neighbours are merged into one chunk."""
+        source = "import os\n\n\ndef a():\n    pass\n\n\ndef b():\n    pass\n"
+        chunks = chunk_document(source, file_path="mod.py")
+
+        assert len(chunks) == 1
+        assert chunks[0].kind == "mixed"
+        assert chunks[0].name == "a, b"
+        assert (chunks[0].start_line, chunks[0].end_line) == (1, 9)
+
+    def test_leading_comments_stay_with_definition(self):
+        source = "x = 1\n" * 60 + "# Helper comment\n@decorator\n" + _function("g", 5)
+        chunks = chunk_document(source, file_path="mod.py", chunk_size=300)
+
+        last = chunks[-1]
+        assert "# Helper comment\n@decorator\ndef g():" in last.text
+        assert last.name == "g"
+
+    def test_license_header_is_its_own_chunk(self):
+        header = "".join(
+            f"# License line {i} with several words in it\n" for i in range(8)
+        )
+        source = header + '"""Module docstring."""\n\nimport os\n'
+        chunks = chunk_document(source, file_path="mod.py")
+
+        assert [c.kind for c in chunks] == ["header", "module"]
+        assert chunks[0].end_line == 8
+        assert chunks[1].text.startswith('"""Module docstring."""')
+
+    def test_short_leading_comment_stays_with_code(self):
+        source = "# -*- coding: utf-8 -*-\nimport os\n"
+        chunks = chunk_document(source, file_path="mod.py")
+
+        assert len(chunks) == 1
+        assert chunks[0].kind == "module"
+
+    def test_oversized_class_split_per_method(self):
+        methods = "\n".join(
+            "    " + _function(f"m{i}", 30).replace("\n", "\n    ").rstrip() + "\n"
+            for i in range(3)
+        )
+        source = f"class Big:\n    '''Doc.'''\n\n{methods}"
+        chunks = chunk_document(source, file_path="mod.py", chunk_size=800)
+
+        names = [c.name for c in chunks]
+        assert any("Big.m0" in (n or "") for n in names)
+        assert any("Big.m2" in (n or "") for n in names)
+        assert all(len(c.text) <= 800 for c in chunks)
+
+    def test_oversized_function_falls_back_to_splitter(self):
+        source = _function("huge", 400)
+        chunks = chunk_document(source, file_path="mod.py", chunk_size=500)
+
+        assert len(chunks) > 1
+        assert all(c.name == "huge" for c in chunks)
+        assert chunks[0].start_line == 1
+        assert chunks[-1].end_line == len(source.splitlines())
+
+    def test_syntax_error_uses_text_splitter(self):
+        chunks = chunk_document("def broken(:\n    pass\n", file_path="bad.py")
+        assert len(chunks) == 1
+        assert chunks[0].kind == "text"
+
+
+class TestMarkdownStrategy:
+    """Tests for heading-based chunking."""
+
+    def test_sections_with_heading_path(self):
+        text = (
+            "# Title\n\nIntro.\n\n## Install\n\n"
+            + "Install text. " * 60
+            + "\n\n## Usage\n\n```bash\n# not a heading\n```\n"
+            + "Usage text. " * 60
+            + "\n"
+        )
+        chunks = chunk_document(text, file_path="README.md", chunk_size=1100)
+
+        # The short intro is packed with the first subsection
+        assert [c.name for c in chunks] == ["Title", "Title > Usage"]
+        assert "## Install" in chunks[0].text
+        assert all(c.kind == "section" for c in chunks)
+        assert "# not a heading" in chunks[1].text
+        assert chunks[1].to_metadata()["section"] == "Title > Usage"
+
+
+class TestFallback:
+    """Tests for the size-capped fallback."""
+
+    def test_empty(self):
+        assert chunk_document("") == []
+        assert chunk_document("   \n\n") == []
+
+    def test_line_ranges(self):
+        text = "\n".join(f"line {i} " + "x" * 60 for i in range(100))
+        chunks = chunk_document(text, chunk_size=500)
+        lines = text.splitlines()
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.text.splitlines()[0] == lines[chunk.start_line - 1]
+            assert chunk.text.splitlines()[-1] == lines[chunk.end_line - 1]
+
+    def test_duplicate_boilerplate_dropped(self):
+        block = "Copyright notice. All rights reserved. " * 10
+        text = "\n\n".join([block, "Unique content here.", block])
+        chunks = chunk_document(text, chunk_size=400)
+
+        assert sum(1 for c in chunks if "Copyright" in c.text) == 1
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [("a.py", "python"), ("B.MD", "markdown"), ("c.txt", None), (None, None)],
+)
+def test_detect_language(path, expected):
+    assert detect_language(path) == expected
+
+
+def test_chunk_metadata():
+    chunk = Chunk("def f(): pass", 3, 3, "function", "f")
+    assert chunk.to_metadata() == {
+        "start_line": 3,
+        "end_line": 3,
+        "chunk_kind": "function",
+        "chunk_hash": chunk.chunk_hash,
+        "symbol": "f",
+    }
+    assert len(chunk.chunk_hash) == 16
+
+
+class TestContentDefinedBoundaries:
+    """Local edits must leave distant chunks (and their hashes) untouched."""
+
+    @pytest.mark.parametrize("path", ["doc.txt", "doc.md", "mod.py"])
+    def test_local_edit_changes_few_chunks(self, path):
+        if path.endswith(".py"):
+            blocks = [_function(f"fn_{i}", 8 + i % 5) for i in range(60)]
+            original = "\n\n".join(blocks)
+        elif path.endswith(".md"):
+            original = "".join(
+                f"## Part {i}\n\n"
+                + f"Sentence {i} about topic {i * 7}. " * (5 + i % 9)
+                + "\n\n"
+                for i in range(60)
+            )
+        else:
+            original = "".join(
+                f"Line {i}: value {i * 31 % 97} and some filler text.\n"
+                for i in range(600)
+            )
+        lines = original.splitlines(keepends=True)
+        lines.insert(len(lines) // 3, "# a freshly inserted line\n")
+        edited = "".join(lines)
+
+        before = {c.chunk_hash for c in chunk_document(original, file_path=path)}
+        after = chunk_document(edited, file_path=path)
+        changed = [c for c in after if c.chunk_hash not in before]
+
+        assert len(after) > 8
+        assert 1 <= len(changed) <= 3
+
+    def test_chunk_id_is_deterministic(self):
+        assert chunk_id("a.py", "abc") == chunk_id("a.py", "abc")
+        assert chunk_id("a.py", "abc") != chunk_id("b.py", "abc")
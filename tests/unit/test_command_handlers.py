@@ -32,7 +32,11 @@ Tests cover:
 
 from unittest.mock import patch, MagicMock
 from src.commands.handlers.config_commands import handle_context, handle_learning
-from src.commands.handlers.help_commands import handle_help, handle_model_info
+from src.commands.handlers.help_commands import (
+    handle_help,
+    handle_model_info,
+    handle_tokens,
+)
 from src.commands.handlers.space_commands import handle_space
 from src.commands.handlers.database_commands import handle_vectordb
 from src.commands.handlers.learning_commands import handle_learn
@@ -120,6 +124,30 @@ class TestHelpHandlers:
         assert "Current Model: test-model" in output
         assert "Temperature: 0.7" in output
 
+    @patch("builtins.print")
+    @patch("src.commands.handlers.help_commands.get_config")
+    def test_handle_tokens(self, mock_get_config, mock_print):
+        """Test the per-request token report."""
+        mock_get_config.return_value = MagicMock(tool_manifest="compact")
+        reset_context()
+        get_context().conversation_history = [HumanMessage(content="x" * 40)]
+
+        with patch(
+            "src.storage.memory.build_system_prompt",
+            side_effect=lambda mode: {"full": "p" * 400, "compact": "p" * 80}.get(
+                mode, "p" * 40
+            ),
+        ):
+            handle_tokens([])
+        reset_context()
+
+        output = "\n".join(
+            " ".join(map(str, call[0])) for call in mock_print.call_args_list
+        )
+        assert "Conversation history (1 messages): 10" in output
+        assert "saves 80 vs full ← current" in output
+        assert "saves 90 vs full" in output
+
 
 class TestSpaceHandlers:
     """Test space management command handlers."""
@@ -280,19 +308,41 @@ class TestMemoryHandlers:
         assert "Conversation History (1 messages)" in output
         assert "Hello world" in output
 
+    @patch("builtins.print")
+    def test_handle_memory_shows_summary(self, mock_print):
+        """Test that /memory shows the summary of trimmed turns."""
+        ctx = get_context()
+        ctx.conversation_history = [HumanMessage(content="Hello world")]
+        ctx.conversation_summary = "Earlier we discussed the parser."
+
+        try:
+            handle_memory([])
+        finally:
+            ctx.conversation_summary = ""
+        output = "\n".join(
+            " ".join(map(str, call[0])) for call in mock_print.call_args_list
+        )
+        assert "Summary of earlier turns" in output
+        assert "Earlier we discussed the parser." in output
+
     @patch("builtins.print")
     @patch("builtins.input", return_value="yes")
+    @patch("src.core.summarizer.save_summary")
     @patch("src.commands.handlers.memory_commands.save_memory")
-    def test_handle_clear(self, mock_save, mock_input, mock_print):
+    def test_handle_clear(self, mock_save, mock_save_summary, mock_input, mock_print):
         """Test clearing memory."""
         ctx = get_context()
         ctx.conversation_history = [HumanMessage(content="Bye")]
+        ctx.conversation_summary = "Earlier we discussed the parser."
 
         handle_clear([])
 
         assert len(ctx.conversation_history) == 1
         assert "coding" in ctx.conversation_history[0].content  # New system message
         assert mock_save.called
+        # The rolling summary goes too
+        assert ctx.conversation_summary == ""
+        mock_save_summary.assert_called_once_with("")
 
 
 class TestFileHandlers:
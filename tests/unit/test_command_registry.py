@@ -33,7 +33,9 @@ Tests cover:
 - Registry introspection methods
 """
 
+import threading
 from unittest.mock import Mock, patch
+
 from src.commands.registry import CommandRegistry, register_command
 
 
@@ -167,6 +169,66 @@ class TestCommandDispatch:
         assert called == [[]]
 
 
+class TestBackgroundCommands:
+    """Test commands registered to run as background jobs."""
+
+    def setup_method(self):
+        CommandRegistry.clear()
+
+    def teardown_method(self):
+        CommandRegistry.clear()
+
+    def test_background_command_runs_as_job(self, capsys):
+        from src.core.jobs import JobManager
+
+        called = threading.Event()
+        received = []
+
+        @CommandRegistry.register("slow", background=True, aliases=["s"])
+        def handle_slow(args):
+            received.append(args)
+            print("slow output")
+            called.set()
+
+        manager = JobManager(max_workers=1)
+        try:
+            with patch("src.core.jobs.get_job_manager", return_value=manager):
+                assert CommandRegistry.dispatch("s", ["a", "b"]) is True
+            assert called.wait(5)
+        finally:
+            manager.shutdown(wait=True)
+
+        assert CommandRegistry.is_background("slow")
+        assert CommandRegistry.is_background("s")
+        assert received == [["a", "b"]]
+        job = manager.jobs()[0]
+        assert job.command == "/s a b"
+        assert job.output_lines() == ["slow output"]
+        assert "Started job #1: /s a b" in capsys.readouterr().out
+
+    def test_background_command_inside_job_runs_inline(self):
+        from src.core.jobs import Job, bind_job
+
+        calls = []
+
+        @CommandRegistry.register("slow", background=True)
+        def handle_slow(args):
+            calls.append(args)
+
+        with patch("src.core.jobs.get_job_manager") as get_manager:
+            with bind_job(Job(1, "/outer")):
+                CommandRegistry.dispatch("slow", [])
+        get_manager.assert_not_called()
+        assert calls == [[]]
+
+    def test_foreground_by_default(self):
+        @CommandRegistry.register("quick")
+        def handle_quick(args):
+            pass
+
+        assert not CommandRegistry.is_background("quick")
+
+
 class TestRegistryIntrospection:
     """Test registry query and introspection methods."""
 
@@ -198,3 +198,21 @@ class TestContentHash:
         finally:
             # Clean up
             temp_path.unlink()
+
+    def test_edit_past_first_kilobyte_changes_hash(self):
+        """Test that same-size edits anywhere in the file change the hash."""
+        content = "a" * 5000
+        with tempfile.NamedTemporaryFile(mode="w", delete=False) as temp_file:
+            temp_file.write(content)
+            temp_path = Path(temp_file.name)
+
+        try:
+            original = compute_content_hash(temp_path)
+            temp_path.write_text(content[:4000] + "b" + content[4001:])
+            edited = compute_content_hash(temp_path)
+
+            assert original != edited
+
+        finally:
+            # Clean up
+            temp_path.unlink()
@@ -0,0 +1,85 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Test suite for adaptive context gating (src/core/context_gate.py).
+
+Tests cover:
+- Skipping retrieval for conversational turns and short tool commands
+- Retrieving for questions and longer requests
+- Retrieval timing used for "time saved" logs
+"""
+
+import pytest
+
+from src.core.context_gate import ContextGate, classify_context_need
+
+
+@pytest.mark.parametrize(
+    "text,reason",
+    [
+        ("thanks", "conversational"),
+        ("Thank you so much!", "conversational"),
+        ("ok, sounds good.", "conversational"),
+        ("   ", "empty"),
+        ("run the tests", "tool command"),
+        ("read requirements.txt", "tool command"),
+        ("git status", "tool command"),
+        ("list the files in src/core", "tool command"),
+    ],
+)
+def test_skips_retrieval(text, reason):
+    decision = classify_context_need(text)
+
+    assert decision.retrieve is False
+    assert decision.reason == reason
+
+
+@pytest.mark.parametrize(
+    "text,reason",
+    [
+        ("What have you learned about spaces?", "question"),
+        ("ok, but why?", "question"),
+        ("run tests?", "question"),
+        ("explain how the embedding cache works", "request"),
+        (
+            "read the design notes and summarize what they say about chunk sizes",
+            "request",
+        ),
+    ],
+)
+def test_retrieves(text, reason):
+    decision = classify_context_need(text)
+
+    assert decision.retrieve is True
+    assert decision.reason == reason
+
+
+def test_expected_retrieval_time():
+    gate = ContextGate(samples=2)
+    assert gate.expected_retrieval_time() is None
+
+    gate.record_retrieval(0.3)
+    gate.record_retrieval(0.1)
+    gate.record_retrieval(0.2)
+
+    # Only the most recent samples count
+    assert gate.expected_retrieval_time() == pytest.approx(0.15)
@@ -32,7 +32,19 @@ Tests cover:
 
 import responses
 from unittest.mock import patch, MagicMock
-from src.core.context_utils import get_relevant_context, add_to_knowledge_base
+import json
+
+from langchain_core.documents import Document
+from src.core.chunking import chunk_id, content_chunk_hash
+from src.core.context_utils import (
+    get_relevant_context,
+    add_to_knowledge_base,
+    add_documents_to_knowledge_base,
+    sync_documents_to_knowledge_base,
+    ChunkSyncPlan,
+    _plan_chunk_delta,
+    write_chunk_sync_plan,
+)
 from src.core.context import get_context, reset_context
 
 
@@ -164,6 +176,169 @@ class TestKnowledgeBaseFunctions:
             assert success is True
             assert ctx.vectorstore.add_documents.called
 
+    @responses.activate
+    def test_add_documents_batch_single_request(self):
+        """Test that a document batch uses one embedding call and one add call."""
+        ctx = get_context()
+        ctx.current_space = "default"
+        ctx.vectorstore = MagicMock()
+        ctx.embedding_cache["cached chunk"] = [0.9, 0.9]
+
+        mock_embeddings = MagicMock()
+        mock_embeddings.embed_documents.return_value = [[0.1, 0.2], [0.3, 0.4]]
+        ctx.embeddings = mock_embeddings
+
+        mock_config = MagicMock()
+        mock_config.chroma_host = self.host
+        mock_config.chroma_port = self.port
+
+        documents = [
+            Document(page_content="chunk one", metadata={"chunk_index": 0}),
+            Document(page_content="cached chunk", metadata={"chunk_index": 1}),
+            Document(page_content="chunk three", metadata={"chunk_index": 2}),
+        ]
+
+        with patch("src.core.context_utils.get_config", return_value=mock_config):
+            responses.add(
+                responses.GET,
+                self.coll_url,
+                json=[{"id": "kb-id", "name": "knowledge_base"}],
+                status=200,
+            )
+            add_url = f"{self.coll_url}/kb-id/add"
+            responses.add(responses.POST, add_url, status=201)
+
+            added = add_documents_to_knowledge_base(documents)
+
+        assert added == 3
+        # Only cache misses are embedded, in a single request
+        mock_embeddings.embed_documents.assert_called_once_with(
+            ["chunk one", "chunk three"]
+        )
+        add_calls = [c for c in responses.calls if c.request.url == add_url]
+        assert len(add_calls) == 1
+        payload = json.loads(add_calls[0].request.body)
+        assert payload["documents"] == ["chunk one", "cached chunk", "chunk three"]
+        assert payload["embeddings"][1] == [0.9, 0.9]
+        assert len(set(payload["ids"])) == 3
+
+    def test_add_documents_batch_without_embeddings(self):
+        """Test that batch ingestion fails cleanly without embeddings."""
+        ctx = get_context()
+        ctx.embeddings = None
+
+        assert add_documents_to_knowledge_base([Document(page_content="x")]) == 0
+
+    @responses.activate
+    def test_sync_documents_embeds_only_changed_chunks(self):
+        """Test delta sync: new chunks embedded, moved updated, stale deleted."""
+        ctx = get_context()
+        ctx.current_space = "default"
+        ctx.vectorstore = MagicMock()
+        ctx.embedding_cache.clear()
+
+        mock_embeddings = MagicMock()
+        mock_embeddings.embed_documents.return_value = [[0.5, 0.5]]
+        ctx.embeddings = mock_embeddings
+
+        mock_config = MagicMock()
+        mock_config.chroma_host = self.host
+        mock_config.chroma_port = self.port
+
+        source = "/repo/app.py"
+        kept = Document(
+            page_content="unchanged chunk",
+            metadata={"source": source, "start_line": 5},
+        )
+        fresh = Document(
+            page_content="edited chunk", metadata={"source": source, "start_line": 9}
+        )
+        kept_id = chunk_id(source, content_chunk_hash("unchanged chunk"))
+        fresh_id = chunk_id(source, content_chunk_hash("edited chunk"))
+
+        with patch("src.core.context_utils.get_config", return_value=mock_config):
+            responses.add(
+                responses.GET,
+                self.coll_url,
+                json=[{"id": "kb-id", "name": "knowledge_base"}],
+                status=200,
+            )
+            responses.add(
+                responses.POST,
+                f"{self.coll_url}/kb-id/get",
+                json={
+                    "ids": [kept_id, "chunk_old"],
+                    "metadatas": [
+                        {"source": source, "start_line": 1},
+                        {"source": source, "start_line": 20},
+                    ],
+                },
+                status=200,
+            )
+            upsert_url = f"{self.coll_url}/kb-id/upsert"
+            update_url = f"{self.coll_url}/kb-id/update"
+            delete_url = f"{self.coll_url}/kb-id/delete"
+            responses.add(responses.POST, upsert_url, json={}, status=200)
+            responses.add(responses.POST, update_url, json={}, status=200)
+            responses.add(responses.POST, delete_url, json={}, status=200)
+
+            result = sync_documents_to_knowledge_base([kept, fresh])
+
+        assert (result.added, result.unchanged, result.deleted) == (1, 1, 1)
+        mock_embeddings.embed_documents.assert_called_once_with(["edited chunk"])
+
+        bodies = {
+            c.request.url: json.loads(c.request.body)
+            for c in responses.calls
+            if c.request.method == "POST"
+        }
+        assert bodies[upsert_url]["ids"] == [fresh_id]
+        assert bodies[update_url]["ids"] == [kept_id]
+        assert bodies[update_url]["metadatas"][0]["start_line"] == 5
+        assert bodies[delete_url]["ids"] == ["chunk_old"]
+        get_body = bodies[f"{self.coll_url}/kb-id/get"]
+        assert get_body["where"] == {"source": {"$in": [source]}}
+
+    def test_partial_write_keeps_stale_chunks(self):
+        """Test that stale chunks survive when some new chunks fail to store."""
+        docs = [
+            Document(page_content=f"chunk {i}", metadata={"source": "a.py"})
+            for i in range(2)
+        ]
+        plan = ChunkSyncPlan(
+            "kb-id",
+            "default",
+            new_docs=docs,
+            new_ids=["new-0", "new-1"],
+            stale_ids=["old"],
+            vectors=[[0.1], [0.2]],
+        )
+
+        with patch("src.core.context_utils.EMBED_BATCH_SIZE", 1), patch(
+            "src.core.context_utils._store_documents_batch_in_chromadb",
+            side_effect=[True, False],
+        ), patch("src.core.context_utils._delete_chunks") as mock_delete:
+            result = write_chunk_sync_plan(plan)
+
+        assert (result.added, result.deleted) == (1, 0)
+        mock_delete.assert_not_called()
+
+    def test_added_at_alone_does_not_move_chunk(self):
+        """Test that a re-ingest with a new added_at leaves metadata alone."""
+        stored = {"source": "a.py", "added_at": "2025-01-01T00:00:00"}
+        doc = Document(
+            page_content="chunk",
+            metadata={"source": "a.py", "added_at": "2025-06-01T00:00:00"},
+        )
+
+        plan = _plan_chunk_delta("kb-id", [doc], ["id-0"], {"id-0": stored}, "default")
+        assert plan.unchanged == 1
+        assert plan.moved_ids == []
+
+        doc.metadata["source"] = "b.py"
+        plan = _plan_chunk_delta("kb-id", [doc], ["id-0"], {"id-0": stored}, "default")
+        assert plan.moved_ids == ["id-0"]
+
     def test_get_relevant_context_no_vectorstore(self):
         """Test behavior when vectorstore is not initialized."""
         ctx = get_context()
@@ -287,6 +462,48 @@ class TestKnowledgeBaseFunctions:
             result = get_relevant_context("query")
             assert result == ""
 
+    @responses.activate
+    def test_get_relevant_context_min_similarity(self):
+        """Test that chunks below the relevance threshold are dropped."""
+        ctx = get_context()
+        ctx.current_space = "default"
+        ctx.vectorstore = MagicMock()
+        mock_embeddings = MagicMock()
+        mock_embeddings.embed_query.return_value = [1.0, 0.0]
+        ctx.embeddings = mock_embeddings
+
+        mock_config = MagicMock()
+        mock_config.chroma_host = self.host
+        mock_config.chroma_port = self.port
+
+        with patch("src.core.context_utils.get_config", return_value=mock_config):
+            responses.add(
+                responses.GET,
+                self.coll_url,
+                json=[{"id": "kb-id", "name": "knowledge_base"}],
+                status=200,
+            )
+            query_url = f"{self.coll_url}/kb-id/query"
+            responses.add(
+                responses.POST,
+                query_url,
+                json={
+                    "documents": [["on topic", "off topic"]],
+                    "embeddings": [[[0.9, 0.1], [0.1, 0.9]]],
+                },
+                status=200,
+            )
+
+            result = get_relevant_context("query", min_similarity=0.5)
+
+            assert "on topic" in result
+            assert "off topic" not in result
+            payload = json.loads(responses.calls[1].request.body)
+            assert payload["include"] == ["documents", "embeddings"]
+            # Thresholded results are cached apart from plain lookups
+            assert ctx.query_cache["default:query:3:0.5"] == ["on topic"]
+            assert "default:query:3" not in ctx.query_cache
+
     @responses.activate
     def test_add_to_knowledge_base_empty_content(self):
         """Test behavior when empty content is provided."""
@@ -0,0 +1,427 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for the Docling converter pool (src/learning/converter_pool.py).
+
+Tests cover:
+- Converters are built once and reused (in-process and in worker processes)
+- Extraction tiers and the auto escalation policy
+- Conversion errors and missing Docling
+- Page ranges and windowed conversion of long documents
+- The conversion cache (keys, compression, LRU eviction)
+"""
+
+import os
+import zlib
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.core.context import reset_context
+from src.learning.converter_pool import (
+    ConverterPool,
+    converter_version,
+    load_cached_conversion,
+    parse_page_range,
+    source_content_hash,
+)
+from src.learning.fast_extract import ExtractedText
+
+_builds = 0
+
+
+class FakeConverter:
+    """Stands in for DocumentConverter; reports which build converted."""
+
+    def __init__(self, tier):
+        global _builds
+        _builds += 1
+        self.build = _builds
+        self.tier = tier
+
+    def convert(self, source, page_range=None):
+        if "broken" in source:
+            raise ValueError(f"cannot parse {source}")
+        markdown = (
+            f"# {source}\n\ntier={self.tier} pid={os.getpid()} build={self.build}"
+        )
+        pages = []
+        if page_range:
+            markdown += f" pages={page_range[0]}-{page_range[1]}"
+            pages = list(range(page_range[0], page_range[1] + 1))
+        return SimpleNamespace(
+            document=SimpleNamespace(
+                export_to_markdown=lambda: markdown,
+                title=f"Title of {source}",
+                pages=pages,
+            )
+        )
+
+
+def fake_factory(tier):
+    return FakeConverter(tier)
+
+
+@pytest.fixture(autouse=True)
+def fresh_converter():
+    """Reset the in-process converter between tests."""
+    with patch.dict("src.learning.converter_pool._converters", clear=True):
+        yield
+
+
+class TestConverterPool:
+    """Test conversions through the pool."""
+
+    def test_in_process_converter_is_reused(self):
+        pool = ConverterPool(workers=0, factory=fake_factory)
+        first = pool.convert("a.pdf", "accurate")
+        second = pool.convert("b.pdf", "accurate")
+
+        assert first.title == "Title of a.pdf"
+        assert first.markdown.startswith("# a.pdf")
+        assert first.markdown.split("build=")[1] == second.markdown.split("build=")[1]
+
+    def test_worker_process_keeps_converter_warm(self):
+        pool = ConverterPool(workers=1, factory=fake_factory)
+        try:
+            first = pool.convert("a.pdf")
+            second = pool.convert("b.pdf")
+            # Docling/torch are not fork-safe
+            assert pool._get_executor()._mp_context.get_start_method() == "spawn"
+        finally:
+            pool.shutdown()
+
+        assert f"pid={os.getpid()}" not in first.markdown
+        assert first.markdown.split("pid=")[1] == second.markdown.split("pid=")[1]
+        assert first.elapsed >= 0
+
+    def test_parallel_conversions(self):
+        pool = ConverterPool(workers=2, factory=fake_factory)
+        try:
+            futures = [pool.submit(f"doc{i}.pdf") for i in range(6)]
+            results = [future.result() for future in futures]
+        finally:
+            pool.shutdown()
+        assert [r.source for r in results] == [f"doc{i}.pdf" for i in range(6)]
+
+    def test_conversion_error_propagates(self):
+        pool = ConverterPool(workers=0, factory=fake_factory)
+        with pytest.raises(ValueError, match="cannot parse"):
+            pool.convert("broken.pdf")
+        # The pool keeps working afterwards
+        assert pool.convert("ok.pdf").markdown
+
+    def test_resize_restarts_workers(self):
+        pool = ConverterPool(workers=1, factory=fake_factory)
+        try:
+            pool.convert("a.pdf")
+            pool.resize(2)
+            assert pool.workers == 2
+            assert pool.convert("b.pdf").markdown
+        finally:
+            pool.shutdown()
+
+    def test_missing_docling_raises_import_error(self):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def mock_import(name, *args, **kwargs):
+            if name == "docling.document_converter":
+                raise ImportError("No module named 'docling'")
+            return real_import(name, *args, **kwargs)
+
+        pool = ConverterPool(workers=0)
+        with patch("builtins.__import__", side_effect=mock_import):
+            with pytest.raises(ImportError):
+                pool.convert("a.pdf")
+
+
+class TestExtractionTiers:
+    """Test mode selection and escalation."""
+
+    @pytest.fixture(autouse=True)
+    def no_database(self):
+        """Keep conversions of identical test files out of any cache."""
+        reset_context()
+        yield
+        reset_context()
+
+    @pytest.fixture
+    def pdf(self, tmp_path):
+        path = tmp_path / "paper.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        return str(path)
+
+    @pytest.fixture
+    def pool(self):
+        return ConverterPool(workers=0, factory=fake_factory)
+
+    def _extracted(self, chars_per_page):
+        text = "word " * (chars_per_page // 4)
+        return ExtractedText(text, pages=1, page_offsets=[0])
+
+    def test_auto_uses_fast_tier_for_dense_text(self, pool, pdf):
+        with patch(
+            "src.learning.converter_pool.extract_text",
+            return_value=self._extracted(1000),
+        ):
+            document = pool.convert(pdf, "auto")
+
+        assert document.tier == "fast"
+        assert list(document.timings) == ["fast"]
+        assert document.pages == 1
+        assert "tier=" not in document.markdown
+
+    def test_auto_escalates_for_sparse_text(self, pool, pdf):
+        with patch(
+            "src.learning.converter_pool.extract_text",
+            return_value=self._extracted(20),
+        ):
+            document = pool.convert(pdf, "auto")
+
+        assert document.tier == "accurate"
+        assert "tier=accurate" in document.markdown
+        assert set(document.timings) == {"fast", "accurate"}
+        assert document.elapsed == pytest.approx(sum(document.timings.values()))
+
+    def test_auto_without_text_layer_uses_balanced(self, pool, pdf):
+        with patch("src.learning.converter_pool.extract_text", return_value=None):
+            assert pool.convert(pdf, "auto").tier == "balanced"
+
+    def test_auto_routes_by_format(self, pool, tmp_path):
+        image = tmp_path / "scan.png"
+        image.write_bytes(b"png")
+        page = tmp_path / "page.html"
+        page.write_text("<p>hi</p>")
+
+        assert pool.convert(str(image), "auto").tier == "accurate"
+        assert pool.convert(str(page), "auto").tier == "balanced"
+
+    def test_fast_keeps_sparse_text(self, pool, pdf):
+        with patch(
+            "src.learning.converter_pool.extract_text",
+            return_value=self._extracted(20),
+        ):
+            assert pool.convert(pdf, "fast").tier == "fast"
+
+    def test_fast_falls_back_for_unsupported_format(self, pool, tmp_path):
+        page = tmp_path / "page.html"
+        page.write_text("<p>hi</p>")
+        assert pool.convert(str(page), "fast").tier == "balanced"
+
+    def test_explicit_docling_tiers(self, pool, pdf):
+        assert "tier=balanced" in pool.convert(pdf, "balanced").markdown
+        assert "tier=accurate" in pool.convert(pdf, "accurate").markdown
+
+    def test_unknown_mode(self, pool, pdf):
+        with pytest.raises(ValueError, match="Unknown extraction mode"):
+            pool.convert(pdf, "turbo")
+
+    def test_fast_mode_does_not_require_docling(self):
+        with patch.dict("sys.modules", {"docling.document_converter": None}):
+            ConverterPool(workers=0).ensure_available("fast")
+            with pytest.raises(ImportError):
+                ConverterPool(workers=0).ensure_available("auto")
+
+
+class TestPageRanges:
+    """Test page range parsing and windowed conversion."""
+
+    @pytest.mark.parametrize(
+        "spec, expected",
+        [("10-20", (10, 20)), ("7", (7, 7)), ("5-", (5, 40)), ("30-99", (30, 40))],
+    )
+    def test_parse_page_range(self, spec, expected):
+        assert parse_page_range(spec, total=40) == expected
+
+    @pytest.mark.parametrize("spec", ["abc", "0-3", "9-2", "50-60"])
+    def test_parse_invalid_page_range(self, spec):
+        with pytest.raises(ValueError):
+            parse_page_range(spec, total=40)
+
+    def test_open_range_needs_page_count(self):
+        with pytest.raises(ValueError):
+            parse_page_range("5-")
+        assert parse_page_range("5-9") == (5, 9)
+
+    def test_page_range_conversion(self, tmp_path):
+        pool = ConverterPool(workers=0, factory=fake_factory)
+        document = pool.convert(str(tmp_path), "accurate", (3, 4))
+
+        assert "pages=3-4" in document.markdown
+        assert document.first_page == 3
+        assert document.pages == 2
+
+    def test_iter_pages_converts_in_ordered_windows(self, tmp_path):
+        path = tmp_path / "long.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        pool = ConverterPool(workers=2, factory=fake_factory)
+        try:
+            with patch("src.learning.converter_pool.count_pages", return_value=25):
+                windows = list(pool.iter_pages(str(path), "accurate", window=10))
+        finally:
+            pool.shutdown()
+
+        assert [(w.first_page, w.pages) for w in windows] == [
+            (1, 10),
+            (11, 10),
+            (21, 5),
+        ]
+        assert "pages=21-25" in windows[-1].markdown
+
+    def test_iter_pages_bounds_windows_in_flight(self, tmp_path):
+        path = tmp_path / "long.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        pool = ConverterPool(workers=0, factory=fake_factory)
+        submitted = []
+        real_submit = pool.submit
+
+        def record_submit(source, mode, page_range=None):
+            submitted.append(page_range)
+            return real_submit(source, mode, page_range)
+
+        with patch.object(pool, "submit", side_effect=record_submit), patch(
+            "src.learning.converter_pool.count_pages", return_value=50
+        ):
+            for received, _ in enumerate(pool.iter_pages(str(path), "accurate", 10), 1):
+                assert len(submitted) - received <= 0
+        assert len(submitted) == 5
+
+    def test_iter_pages_short_document_is_one_conversion(self, tmp_path):
+        path = tmp_path / "short.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        pool = ConverterPool(workers=0, factory=fake_factory)
+        with patch("src.learning.converter_pool.count_pages", return_value=3):
+            windows = list(pool.iter_pages(str(path), "accurate"))
+        assert len(windows) == 1
+        assert "pages=" not in windows[0].markdown
+
+
+class TestConversionCache:
+    """Test the persistent conversion cache."""
+
+    @pytest.fixture
+    def pdf(self, tmp_path):
+        path = tmp_path / "paper.pdf"
+        path.write_bytes(b"%PDF-1.4 cached")
+        return str(path)
+
+    @pytest.fixture
+    def pool(self):
+        return ConverterPool(workers=0, factory=fake_factory)
+
+    def test_second_conversion_is_served_from_cache(self, memory_db, pool, pdf):
+        first = pool.convert(pdf, "accurate")
+        with patch.object(
+            FakeConverter, "convert", side_effect=AssertionError("converted again")
+        ):
+            second = pool.convert(pdf, "accurate")
+
+        assert first.cached is False
+        assert second.cached is True
+        assert second.markdown == first.markdown
+        assert second.tier == "accurate"
+        assert second.title == first.title
+
+    def test_markdown_is_stored_compressed(self, memory_db, pool, pdf):
+        document = pool.convert(pdf, "accurate")
+        stored, size = memory_db.execute(
+            "SELECT markdown, size FROM conversion_cache"
+        ).fetchone()
+        assert zlib.decompress(stored).decode("utf-8") == document.markdown
+        assert size == len(stored)
+
+    def test_page_offsets_roundtrip(self, memory_db, pool, pdf):
+        extracted = ExtractedText("a" * 500 + "b" * 500, pages=2, page_offsets=[0, 500])
+        with patch("src.learning.converter_pool.extract_text", return_value=extracted):
+            pool.convert(pdf, "fast")
+        cached = pool.convert(pdf, "fast")
+        assert cached.cached is True
+        assert cached.page_offsets == [0, 500]
+        assert cached.pages == 2
+
+    def test_key_includes_mode_range_and_version(self, memory_db, pool, pdf):
+        pool.convert(pdf, "accurate")
+        assert pool.convert(pdf, "balanced").cached is False
+        assert pool.convert(pdf, "accurate", (1, 2)).cached is False
+        assert pool.convert(pdf, "accurate", (1, 2)).cached is True
+
+        converter_version.cache_clear()
+        try:
+            with patch(
+                "src.learning.converter_pool.metadata.version", return_value="99.0"
+            ):
+                assert pool.convert(pdf, "accurate").cached is False
+        finally:
+            converter_version.cache_clear()
+
+    def test_changed_file_is_converted_again(self, memory_db, pool, pdf):
+        pool.convert(pdf, "accurate")
+        with open(pdf, "ab") as f:
+            f.write(b" edited")
+        assert pool.convert(pdf, "accurate").cached is False
+
+    def test_least_recently_used_entries_are_evicted(self, memory_db, pool, tmp_path):
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"doc{i}.pdf"
+            path.write_bytes(f"%PDF {i}".encode())
+            paths.append(str(path))
+
+        pool.convert(paths[0], "accurate")
+        size = memory_db.execute("SELECT size FROM conversion_cache").fetchone()[0]
+        # Compressed sizes differ by a few bytes; budget in half-entry steps
+        slack = size // 2
+        with patch(
+            "src.learning.converter_pool.DOC_CACHE_MAX_BYTES", size * 3 + slack
+        ), patch(
+            "src.learning.converter_pool.DOC_CACHE_TARGET_BYTES", size * 2 + slack
+        ):
+            for path in paths[1:3]:
+                pool.convert(path, "accurate")
+            # Touch the oldest entry so the second document is evicted instead
+            assert pool.convert(paths[0], "accurate").cached is True
+            pool.convert(paths[3], "accurate")
+
+        assert pool.convert(paths[0], "accurate").cached is True
+        assert (
+            memory_db.execute("SELECT COUNT(*) FROM conversion_cache").fetchone()[0]
+            <= 3
+        )
+        assert pool.convert(paths[1], "accurate").cached is False
+
+    def test_cache_disabled(self, memory_db, pdf):
+        pool = ConverterPool(workers=0, factory=fake_factory, cache=False)
+        pool.convert(pdf, "accurate")
+        assert pool.convert(pdf, "accurate").cached is False
+
+    def test_without_database(self, pool, pdf):
+        reset_context()
+        assert pool.convert(pdf, "accurate").cached is False
+        assert pool.convert(pdf, "accurate").cached is False
+        assert load_cached_conversion(pdf, "abc", "accurate") is None
+
+    def test_urls_are_not_cached(self, memory_db, pool):
+        assert source_content_hash("https://example.com/paper.pdf") is None
@@ -34,7 +34,9 @@ import unittest
 import tempfile
 import os
 from src.core.utils import (
+    cosine_similarity,
     chunk_text,
+    estimate_tokens,
     validate_file_path,
     get_file_size_info,
     truncate_content,
@@ -196,6 +198,26 @@ class TestGetFileSizeInfo(unittest.TestCase):
         self.assertGreater(size, 1024 * 1024)
 
 
+class TestEstimateTokens(unittest.TestCase):
+    """Test the character-based token estimate."""
+
+    def test_estimate_rounds_up(self):
+        self.assertEqual(estimate_tokens(""), 0)
+        self.assertEqual(estimate_tokens("abc"), 1)
+        self.assertEqual(estimate_tokens("abcd"), 1)
+        self.assertEqual(estimate_tokens("abcde"), 2)
+
+
+class TestCosineSimilarity(unittest.TestCase):
+    """Test embedding vector similarity."""
+
+    def test_cosine_similarity(self):
+        self.assertAlmostEqual(cosine_similarity([1.0, 0.0], [2.0, 0.0]), 1.0)
+        self.assertAlmostEqual(cosine_similarity([1.0, 0.0], [0.0, 3.0]), 0.0)
+        self.assertAlmostEqual(cosine_similarity([1.0, 1.0], [-1.0, -1.0]), -1.0)
+        self.assertEqual(cosine_similarity([0.0, 0.0], [1.0, 0.0]), 0.0)
+
+
 class TestTruncateContent(unittest.TestCase):
     """Test content truncation for display."""
 
@@ -157,3 +157,103 @@ class TestDatabaseOperations:
             ]
             for col in expected_columns:
                 assert col in columns
+
+    def test_migration_adds_learned_files_table(self):
+        """Verify a v1 database gains the learned_files ledger table."""
+        from src.storage.database import (
+            SCHEMA_VERSION,
+            _get_schema_version,
+            _run_migrations,
+        )
+
+        conn = sqlite3.connect(self.temp_db.name)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "CREATE TABLE schema_version (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "version INTEGER NOT NULL, applied_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+            )
+            cursor.execute("INSERT INTO schema_version (version) VALUES (1)")
+
+            _run_migrations(cursor, _get_schema_version(cursor))
+
+            cursor.execute("PRAGMA table_info(learned_files)")
+            columns = [info[1] for info in cursor.fetchall()]
+            for col in ["space", "path", "mtime", "size", "content_hash", "chunk_ids"]:
+                assert col in columns
+            assert _get_schema_version(cursor) == SCHEMA_VERSION
+        finally:
+            conn.close()
+
+    def test_migration_adds_ingest_checkpoints_table(self):
+        """Verify migrations create the ingestion checkpoint table."""
+        from src.storage.database import _get_schema_version, _run_migrations
+
+        conn = sqlite3.connect(self.temp_db.name)
+        try:
+            cursor = conn.cursor()
+            _run_migrations(cursor, _get_schema_version(cursor))
+
+            cursor.execute("PRAGMA table_info(ingest_checkpoints)")
+            columns = [info[1] for info in cursor.fetchall()]
+            for col in ["run_id", "unit_key", "fingerprint", "completed_at"]:
+                assert col in columns
+            assert _get_schema_version(cursor) >= 3
+        finally:
+            conn.close()
+
+    def test_migration_adds_web_pages_table(self):
+        """Verify migrations create the web crawl page cache table."""
+        from src.storage.database import _get_schema_version, _run_migrations
+
+        conn = sqlite3.connect(self.temp_db.name)
+        try:
+            cursor = conn.cursor()
+            _run_migrations(cursor, _get_schema_version(cursor))
+
+            cursor.execute("PRAGMA table_info(web_pages)")
+            columns = [info[1] for info in cursor.fetchall()]
+            for col in ["space", "url", "etag", "last_modified", "content_hash", "links"]:
+                assert col in columns
+            assert _get_schema_version(cursor) >= 5
+        finally:
+            conn.close()
+
+    def test_migration_replaces_converted_documents_with_conversion_cache(self):
+        """Verify migrations create the conversion cache and drop its v6 table."""
+        from src.storage.database import _get_schema_version, _run_migrations
+
+        conn = sqlite3.connect(self.temp_db.name)
+        try:
+            cursor = conn.cursor()
+            _run_migrations(cursor, _get_schema_version(cursor))
+
+            cursor.execute("PRAGMA table_info(conversion_cache)")
+            columns = [info[1] for info in cursor.fetchall()]
+            for col in ["cache_key", "content_hash", "tier", "markdown", "size"]:
+                assert col in columns
+            assert "last_used" in columns
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'converted_documents'"
+            )
+            assert cursor.fetchone() is None
+            assert _get_schema_version(cursor) >= 7
+        finally:
+            conn.close()
+
+    def test_migration_adds_conversation_summary_table(self):
+        """Verify migrations create the rolling conversation summary table."""
+        from src.storage.database import _get_schema_version, _run_migrations
+
+        conn = sqlite3.connect(self.temp_db.name)
+        try:
+            cursor = conn.cursor()
+            _run_migrations(cursor, _get_schema_version(cursor))
+
+            cursor.execute("PRAGMA table_info(conversation_summary)")
+            columns = [info[1] for info in cursor.fetchall()]
+            for col in ["session_id", "summary", "updated_at"]:
+                assert col in columns
+            assert _get_schema_version(cursor) >= 8
+        finally:
+            conn.close()
@@ -0,0 +1,172 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for fast-path text extraction (src/learning/fast_extract.py).
+
+Tests cover:
+- Format detection and page bookkeeping
+- Graceful fallback when an extractor library is missing or fails
+- DOCX extraction (when python-docx is installed)
+"""
+
+import importlib.util
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.learning import fast_extract
+from src.learning.fast_extract import (
+    ExtractedText,
+    _join_pages,
+    count_pages,
+    document_outline,
+    extract_text,
+    has_fast_extractor,
+    has_pages,
+    markdown_outline,
+)
+
+
+class TestFastExtract:
+    """Test the extraction helpers."""
+
+    def test_has_fast_extractor(self):
+        assert has_fast_extractor("paper.PDF")
+        assert has_fast_extractor("deck.pptx")
+        assert not has_fast_extractor("scan.png")
+        assert not has_fast_extractor("notes.md")
+
+    def test_join_pages_records_offsets(self):
+        extracted = _join_pages(["first page", "second"])
+        assert extracted.pages == 2
+        assert extracted.page_offsets == [0, 12]
+        assert extracted.markdown[12:] == "second"
+
+    def test_chars_per_page_ignores_whitespace(self):
+        assert ExtractedText("ab  cd\n\nef", pages=2).chars_per_page == 3
+
+    def test_unsupported_format(self, tmp_path):
+        assert extract_text(str(tmp_path / "scan.png")) is None
+
+    def test_missing_library_returns_none(self, tmp_path):
+        def missing(path, page_range):
+            raise ImportError("No module named 'pypdfium2'")
+
+        with patch.dict(fast_extract._EXTRACTORS, {".pdf": missing}):
+            assert extract_text(str(tmp_path / "paper.pdf")) is None
+
+    def test_parse_failure_returns_none(self, tmp_path):
+        def broken(path, page_range):
+            raise ValueError("not a PDF")
+
+        with patch.dict(fast_extract._EXTRACTORS, {".pdf": broken}):
+            assert extract_text(str(tmp_path / "paper.pdf")) is None
+
+    def test_page_range_is_passed_to_extractor(self, tmp_path):
+        calls = []
+
+        def record(path, page_range):
+            calls.append(page_range)
+            return _join_pages(["page"])
+
+        with patch.dict(fast_extract._EXTRACTORS, {".pdf": record}):
+            extract_text(str(tmp_path / "paper.pdf"), (3, 5))
+        assert calls == [(3, 5)]
+
+    def test_slide_range_selects_slides(self, tmp_path):
+        def slide(text):
+            frame = SimpleNamespace(text=text)
+            return SimpleNamespace(
+                shapes=[SimpleNamespace(has_text_frame=True, text_frame=frame)]
+            )
+
+        deck = SimpleNamespace(slides=[slide(f"Text {n}") for n in range(1, 6)])
+        fake_pptx = SimpleNamespace(Presentation=lambda path: deck)
+        with patch.dict(sys.modules, {"pptx": fake_pptx}):
+            extracted = extract_text(str(tmp_path / "deck.pptx"), (2, 3))
+
+        assert extracted.pages == 2
+        assert extracted.markdown.startswith("## Slide 2\n\nText 2")
+        assert "Slide 1" not in extracted.markdown
+        assert "Slide 4" not in extracted.markdown
+
+    def test_has_pages(self):
+        assert has_pages("paper.pdf")
+        assert has_pages("deck.PPTX")
+        assert has_pages("sheet.xlsx")
+        assert not has_pages("report.docx")
+
+    def test_count_pages_only_for_pdfs(self, tmp_path):
+        assert count_pages(str(tmp_path / "doc.docx")) is None
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("docx") is None, reason="python-docx not installed"
+    )
+    def test_docx_headings_and_tables(self, tmp_path):
+        import docx
+
+        document = docx.Document()
+        document.add_heading("Overview", level=1)
+        document.add_paragraph("Proof of stake secures the chain.")
+        table = document.add_table(rows=1, cols=2)
+        table.rows[0].cells[0].text = "reward"
+        table.rows[0].cells[1].text = "1.5"
+        path = tmp_path / "doc.docx"
+        document.save(path)
+
+        extracted = extract_text(str(path))
+        assert "# Overview" in extracted.markdown
+        assert "Proof of stake secures the chain." in extracted.markdown
+        assert "| reward | 1.5 |" in extracted.markdown
+
+
+class TestOutline:
+    """Test document outlines."""
+
+    def test_markdown_outline_with_pages(self):
+        markdown = "# Intro\ntext\n## Setup\nmore\n#hashtag\n# Usage\nend"
+        offsets = [0, markdown.index("## Setup"), markdown.index("# Usage")]
+        entries = markdown_outline(markdown, offsets)
+
+        assert [(e.level, e.title, e.page) for e in entries] == [
+            (1, "Intro", 1),
+            (2, "Setup", 2),
+            (1, "Usage", 3),
+        ]
+
+    def test_outline_falls_back_to_text_layer_headings(self, tmp_path):
+        extracted = _join_pages(["# Title\nbody", "## Part two\nbody"])
+        with patch.object(
+            fast_extract, "_pdf_bookmarks", return_value=[]
+        ), patch.object(fast_extract, "extract_text", return_value=extracted):
+            entries = document_outline(str(tmp_path / "paper.pdf"))
+
+        assert [entry.to_dict() for entry in entries] == [
+            {"level": 1, "title": "Title", "page": 1},
+            {"level": 2, "title": "Part two", "page": 2},
+        ]
+
+    def test_outline_unsupported_format(self, tmp_path):
+        assert document_outline(str(tmp_path / "scan.png")) is None
@@ -190,12 +190,10 @@ class TestFileDiscovery:
             with open(test_file, "w") as f:
                 f.write("# Test content")
 
-            def mock_getsize(path):
-                if "test.md" in path:
-                    raise PermissionError("Permission denied")
-                return 100
-
-            with patch("os.path.getsize", side_effect=mock_getsize):
+            with patch(
+                "src.core.file_walker.WalkEntry.stat",
+                side_effect=PermissionError("Permission denied"),
+            ):
                 found_files = discover_markdown_files(tmpdir)
 
                 assert len(found_files) == 0
@@ -0,0 +1,205 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for the shared repository walker (src/core/file_walker.py).
+
+Tests cover:
+- Built-in skip rules (node_modules, build output, virtualenvs, egg-info)
+- .gitignore / .ignore semantics (negation, anchoring, dir-only, **)
+- Nested ignore files and .git/info/exclude
+- Single-level directory scans
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from src.core.file_walker import (
+    IgnoreMatcher,
+    IgnoreRules,
+    scan_directory,
+    walk_files,
+)
+
+
+def _write(root: str, rel_path: str, content: str = "x\n") -> None:
+    path = os.path.join(root, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+@pytest.fixture
+def repo():
+    """Create a small git-like repository tree."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.makedirs(os.path.join(tmpdir, ".git", "info"))
+        for rel_path in [
+            "main.py",
+            "notes.log",
+            "keep.log",
+            "src/app.py",
+            "src/generated/out.py",
+            "src/deep/a/b/cache.tmp",
+            "node_modules/lib/index.js",
+            "build/out.py",
+            "demo.egg-info/PKG-INFO",
+            "myenv/lib/site.py",
+            "docs/guide.md",
+            "docs/private/secret.md",
+            ".hidden/file.py",
+        ]:
+            _write(tmpdir, rel_path)
+        _write(tmpdir, "myenv/pyvenv.cfg", "home = /usr/bin\n")
+        _write(tmpdir, ".gitignore", "*.log\n!keep.log\n/src/generated/\n**/*.tmp\n")
+        _write(tmpdir, "docs/.ignore", "private/\n")
+        yield tmpdir
+
+
+def _rel_paths(root: str, **kwargs) -> list:
+    return [e.rel_path for e in walk_files(root, **kwargs)]
+
+
+class TestWalkFiles:
+    """Tests for walk_files."""
+
+    def test_default_skips_and_gitignore(self, repo):
+        """Ignored paths never show up; files precede subdirectories."""
+        assert _rel_paths(repo) == [
+            "keep.log",
+            "main.py",
+            "docs/guide.md",
+            "src/app.py",
+        ]
+
+    def test_without_ignore_files_keeps_defaults(self, repo):
+        """Built-in defaults apply even when ignore files are disabled."""
+        paths = _rel_paths(repo, respect_ignore_files=False)
+        assert "notes.log" in paths
+        assert "src/generated/out.py" in paths
+        assert "docs/private/secret.md" in paths
+        assert not any(p.startswith(("node_modules", "build", "myenv")) for p in paths)
+        assert not any(p.startswith("demo.egg-info") for p in paths)
+
+    def test_include_hidden(self, repo):
+        """Hidden entries are opt-in; .git is always skipped."""
+        paths = _rel_paths(repo, include_hidden=True)
+        assert ".hidden/file.py" in paths
+        assert ".gitignore" in paths
+        assert not any(p.startswith(".git/") for p in paths)
+
+    def test_max_depth_and_extensions(self, repo):
+        """Depth and extension filters limit the walk."""
+        assert _rel_paths(repo, max_depth=0) == ["keep.log", "main.py"]
+        assert _rel_paths(repo, extensions=[".MD"]) == ["docs/guide.md"]
+
+    def test_subdirectory_walk_uses_parent_rules(self, repo):
+        """Rules from the repository root apply when walking a subdirectory."""
+        paths = _rel_paths(os.path.join(repo, "src"))
+        assert paths == ["app.py"]
+
+    def test_info_exclude(self, repo):
+        """.git/info/exclude is honored."""
+        _write(repo, ".git/info/exclude", "main.py\n")
+        assert "main.py" not in _rel_paths(repo)
+
+    def test_entry_metadata(self, repo):
+        """Entries expose size and absolute path."""
+        entry = next(e for e in walk_files(repo) if e.rel_path == "main.py")
+        assert entry.size == 2
+        assert entry.path == os.path.join(os.path.abspath(repo), "main.py")
+        assert not entry.is_dir
+
+    def test_missing_root(self):
+        """A missing root yields nothing."""
+        assert list(walk_files("/nonexistent/path/for/walker")) == []
+
+
+class TestIgnoreRules:
+    """Tests for gitignore pattern semantics."""
+
+    def test_patterns(self):
+        rules = IgnoreRules(
+            "/repo",
+            ["# comment", "", "*.pyc", "/top.txt", "logs/", "a/**/z", "!important.pyc"],
+        )
+        assert rules.match("/repo/x/y.pyc", False) is True
+        assert rules.match("/repo/important.pyc", False) is False
+        assert rules.match("/repo/top.txt", False) is True
+        assert rules.match("/repo/sub/top.txt", False) is None
+        assert rules.match("/repo/logs", True) is True
+        assert rules.match("/repo/logs", False) is None
+        assert rules.match("/repo/a/z", False) is True
+        assert rules.match("/repo/a/b/c/z", False) is True
+        assert rules.match("/other/file.pyc", False) is None
+
+
+class TestScanDirectory:
+    """Tests for single-level scans."""
+
+    def test_scan_filters_and_counts(self, repo):
+        entries, ignored = scan_directory(repo)
+        names = [e.name for e in entries]
+        assert names == [".gitignore", ".hidden", "docs", "keep.log", "main.py", "src"]
+        # .git, build, demo.egg-info, myenv, node_modules, notes.log
+        assert ignored == 6
+
+    def test_scan_show_all(self, repo):
+        entries, ignored = scan_directory(
+            repo, respect_ignore_files=False, apply_default_rules=False
+        )
+        names = [e.name for e in entries]
+        assert "node_modules" in names
+        assert "myenv" in names
+        assert ignored == 0
+
+
+class TestIgnoreMatcher:
+    """Tests for per-path ignore checks."""
+
+    def test_agrees_with_walk(self, repo):
+        """Every walked file is kept and every other file is ignored."""
+        matcher = IgnoreMatcher(repo)
+        walked = {e.path for e in walk_files(repo)}
+        for dirpath, _, filenames in os.walk(repo):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                assert matcher.is_ignored(path) == (path not in walked), path
+
+    def test_deleted_and_outside_paths(self, repo):
+        """Paths need not exist; paths outside the root are ignored."""
+        matcher = IgnoreMatcher(repo)
+        assert not matcher.is_ignored(os.path.join(repo, "src", "gone.py"))
+        assert matcher.is_ignored(os.path.join(repo, "gone.log"))
+        assert matcher.is_ignored("/elsewhere/file.py")
+
+    def test_invalidate_reloads_rules(self, repo):
+        """Edited ignore files take effect after invalidate()."""
+        matcher = IgnoreMatcher(repo)
+        path = os.path.join(repo, "main.py")
+        assert not matcher.is_ignored(path)
+
+        _write(repo, ".gitignore", "main.py\n")
+        matcher.invalidate()
+        assert matcher.is_ignored(path)
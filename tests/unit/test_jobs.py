@@ -0,0 +1,223 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for background jobs (src/core/jobs.py).
+
+Tests cover:
+- Jobs running on worker threads with their output captured
+- Failures, cooperative cancellation and queued-job cancellation
+- Completion notifications and listeners
+- Per-thread output routing and job propagation to child threads
+"""
+
+import io
+import sys
+import threading
+
+import pytest
+
+from src.core.jobs import (
+    JobManager,
+    bind_job,
+    capture_output,
+    current_job,
+    propagate_job,
+)
+
+TIMEOUT = 5
+
+
+@pytest.fixture
+def manager():
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown(wait=True)
+
+
+def _wait(manager, job):
+    """Block until a job is finished."""
+    finished = threading.Event()
+    manager.add_listener(lambda done: done is job and finished.set())
+    if not job.finished:
+        finished.wait(TIMEOUT)
+    assert job.finished
+
+
+class TestJobManager:
+    """Test running jobs in the background."""
+
+    def test_job_runs_in_background_and_captures_output(self, manager):
+        release = threading.Event()
+
+        def work():
+            print("📁 Processing: a.py")
+            release.wait(TIMEOUT)
+            print("✅ Done: 2 files")
+
+        job = manager.submit("/populate .", work)
+        assert job.id == 1
+        assert not job.finished
+        release.set()
+        _wait(manager, job)
+
+        assert job.status == "done"
+        assert job.output_lines() == ["📁 Processing: a.py", "✅ Done: 2 files"]
+        assert job.summary() == "✅ Done: 2 files"
+        assert "Job #1 done" in job.notification()
+        assert job.describe().endswith("/populate .  [default]")
+
+    def test_failed_job_records_error(self, manager):
+        def work():
+            raise RuntimeError("disk full")
+
+        job = manager.submit("/web crawl x", work)
+        _wait(manager, job)
+
+        assert job.status == "failed"
+        assert job.error == "disk full"
+        assert "disk full" in job.notification()
+
+    def test_running_job_cancels_cooperatively(self, manager):
+        started = threading.Event()
+
+        def work():
+            started.set()
+            while not current_job().cancel_requested:
+                threading.Event().wait(0.01)
+
+        job = manager.submit("/populate big", work)
+        assert started.wait(TIMEOUT)
+        assert manager.cancel(job.id)
+        _wait(manager, job)
+
+        assert job.status == "cancelled"
+        assert not manager.cancel(job.id)
+
+    def test_queued_job_is_cancelled_before_it_starts(self, manager):
+        release = threading.Event()
+        ran = []
+        blocker = manager.submit("/populate a", lambda: release.wait(TIMEOUT))
+        queued = manager.submit("/populate b", lambda: ran.append(True))
+
+        assert queued.status == "queued"
+        assert manager.cancel(queued.id)
+        release.set()
+        _wait(manager, blocker)
+        _wait(manager, queued)
+
+        assert queued.status == "cancelled"
+        assert ran == []
+        assert queued.started_at is None
+
+    def test_notifications_and_listeners(self, manager):
+        heard = []
+        manager.add_listener(heard.append)
+        job = manager.submit("/web https://example.com", lambda: None)
+        _wait(manager, job)
+
+        assert heard == [job]
+        assert manager.pop_notifications() == [job]
+        assert manager.pop_notifications() == []
+
+    def test_listing_and_lookup(self, manager):
+        release = threading.Event()
+        first = manager.submit("/populate a", lambda: release.wait(TIMEOUT))
+        second = manager.submit("/populate b", lambda: None)
+
+        assert [job.id for job in manager.jobs()] == [first.id, second.id]
+        assert manager.active() == [first, second]
+        assert manager.get(second.id) is second
+        assert manager.get(99) is None
+        release.set()
+        _wait(manager, second)
+        assert manager.active() == []
+
+    def test_shutdown_cancels_unfinished_jobs(self):
+        manager = JobManager(max_workers=1)
+        started = threading.Event()
+
+        def work():
+            started.set()
+            while not current_job().cancel_requested:
+                threading.Event().wait(0.01)
+
+        job = manager.submit("/populate big", work)
+        assert started.wait(TIMEOUT)
+        manager.shutdown(wait=True)
+        assert job.status == "cancelled"
+
+
+class TestOutputRouting:
+    """Test per-thread output and job binding."""
+
+    def test_carriage_returns_keep_final_state(self):
+        from src.core.jobs import Job
+
+        job = Job(1, "/populate .")
+        job.write("10%\r50%\r100%\nnext")
+        assert job.output_lines() == ["100%", "next"]
+
+    def test_capture_output_only_captures_calling_thread(self, manager, capsys):
+        release = threading.Event()
+
+        def work():
+            release.wait(TIMEOUT)
+            print("from the job")
+
+        job = manager.submit("/populate .", work)
+        buffer = io.StringIO()
+        with capture_output(buffer):
+            print("from the command")
+            release.set()
+            _wait(manager, job)
+
+        assert buffer.getvalue() == "from the command\n"
+        assert job.output_lines() == ["from the job"]
+
+    def test_stdout_routed_only_while_needed(self, manager):
+        original = sys.stdout
+        with capture_output(io.StringIO()):
+            assert sys.stdout is not original
+        assert sys.stdout is original
+
+        release = threading.Event()
+        job = manager.submit("/populate .", lambda: release.wait(TIMEOUT))
+        assert sys.stdout is not original
+        release.set()
+        _wait(manager, job)
+        assert sys.stdout is original
+
+    def test_propagate_job_binds_child_threads(self):
+        from src.core.jobs import Job
+
+        job = Job(7, "/populate .")
+        seen = []
+        with bind_job(job):
+            target = propagate_job(lambda: seen.append(current_job()))
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+        assert seen == [job]
+        assert current_job() is None
+        assert propagate_job(len) is len
@@ -0,0 +1,250 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for /learn-docs document ingestion (src/learning/learn_docs.py).
+
+Tests cover:
+- Discovery of convertible documents
+- Conversion through the converter pool and chunk metadata
+- Reuse of cached markdown for unchanged documents
+- The /learn-docs command
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.core.context import get_context
+from src.core.context_utils import ChunkSyncPlan, ChunkSyncResult
+from src.learning.converter_pool import ConverterPool
+from src.learning.learn_docs import (
+    DocumentIngestPipeline,
+    chunk_window,
+    is_document,
+)
+
+
+class FakeConverter:
+    def __init__(self, tier):
+        self.tier = tier
+
+    def convert(self, source, page_range=None):
+        if source.endswith("broken.pdf"):
+            raise ValueError("corrupt PDF")
+        markdown = f"# Report\n\nText of {source}.\n\n## Details\n\nMore text."
+        pages = []
+        if page_range:
+            first, last = page_range
+            markdown = f"# Pages {first}-{last}\n\nText of pages {first} to {last}."
+            pages = list(range(first, last + 1))
+        return SimpleNamespace(
+            document=SimpleNamespace(
+                export_to_markdown=lambda: markdown, title="Report", pages=pages
+            )
+        )
+
+
+def fake_factory(tier):
+    return FakeConverter(tier)
+
+
+@pytest.fixture
+def docs(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"%PDF-1.4 first")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.docx").write_bytes(b"PK second")
+    (tmp_path / "notes.py").write_text("print('not a document')\n")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def env(memory_db):
+    """In-memory database and a stubbed store."""
+    stored = []
+
+    def fake_plan(documents, sources):
+        stored.extend(documents)
+        return ChunkSyncPlan("collection", "default", new_docs=list(documents))
+
+    with patch.dict("src.learning.converter_pool._converters", clear=True), patch(
+        "src.learning.pipeline.plan_chunk_sync", side_effect=fake_plan
+    ), patch("src.learning.pipeline.embed_chunk_sync_plan", return_value=True), patch(
+        "src.learning.pipeline.write_chunk_sync_plan",
+        side_effect=lambda plan: ChunkSyncResult(added=len(plan.new_docs)),
+    ):
+        yield stored
+
+
+def _run(path, **kwargs):
+    pool = ConverterPool(workers=0, factory=fake_factory)
+    return DocumentIngestPipeline(str(path), pool=pool, resume=False, **kwargs).run()
+
+
+class TestLearnDocs:
+    """Test the document ingestion pipeline."""
+
+    def test_is_document(self):
+        assert is_document("x/report.PDF")
+        assert is_document("slides.pptx")
+        assert not is_document("main.py")
+
+    def test_converts_and_chunks_documents(self, docs, env):
+        stats = _run(docs)
+
+        assert stats.documents_processed == 2
+        assert stats.documents_converted == 2
+        assert stats.documents_cached == 0
+        # No text layer extractor available here, so Docling's balanced tier ran
+        assert stats.tiers == {"balanced": 2}
+        assert stats.chunks_added == len(env) > 0
+        sources = {doc.metadata["source"] for doc in env}
+        assert sources == {str(docs / "a.pdf"), str(docs / "sub" / "b.docx")}
+        meta = env[0].metadata
+        assert meta["type"] == "document"
+        assert meta["title"] == "Report"
+        assert meta["relative_path"] in ("a.pdf", "sub/b.docx")
+        assert meta["content_hash"]
+
+    def test_unchanged_documents_use_cached_markdown(self, docs, env):
+        _run(docs)
+        with patch.object(
+            FakeConverter, "convert", side_effect=AssertionError("converted again")
+        ):
+            stats = _run(docs)
+
+        assert stats.documents_cached == 2
+        assert stats.documents_converted == 0
+        assert stats.errors == 0
+
+    def test_other_space_and_copies_are_ingested(self, docs, env):
+        _run(docs)
+        (docs / "copy.pdf").write_bytes((docs / "a.pdf").read_bytes())
+        get_context().current_space = "work"
+        env.clear()
+
+        stats = _run(docs)
+
+        assert stats.documents_processed == 3
+        sources = {doc.metadata["source"] for doc in env}
+        assert str(docs / "copy.pdf") in sources
+        assert str(docs / "a.pdf") in sources
+
+    def test_long_documents_are_chunked_per_page_window(self, docs, env):
+        def pages(path):
+            return 25 if path.endswith("a.pdf") else None
+
+        with patch("src.learning.converter_pool.count_pages", side_effect=pages):
+            stats = _run(docs, mode="accurate")
+
+        assert stats.documents_converted == 2
+        assert stats.tiers == {"accurate": 2}
+        spans = sorted(
+            (doc.metadata["page_start"], doc.metadata["page_end"])
+            for doc in env
+            if doc.metadata["source"].endswith("a.pdf")
+        )
+        assert spans == [(1, 10), (11, 20), (21, 25)]
+        indexes = [
+            doc.metadata["chunk_index"]
+            for doc in env
+            if doc.metadata["source"].endswith("a.pdf")
+        ]
+        assert sorted(indexes) == [0, 1, 2]
+
+    def test_windows_are_chunked_as_they_arrive(self, docs, env):
+        events = []
+        iter_pages = ConverterPool.iter_pages
+
+        def record_windows(self, *args, **kwargs):
+            for document in iter_pages(self, *args, **kwargs):
+                events.append(("window", document.first_page))
+                yield document
+
+        def record_chunks(file_path, markdown, first_page=None, last_page=None):
+            events.append(("chunk", first_page))
+            return chunk_window(file_path, markdown, first_page, last_page)
+
+        (docs / "sub" / "b.docx").unlink()
+        with patch(
+            "src.learning.converter_pool.count_pages", return_value=25
+        ), patch.object(ConverterPool, "iter_pages", record_windows), patch(
+            "src.learning.learn_docs.chunk_window", side_effect=record_chunks
+        ):
+            _run(docs, mode="accurate")
+
+        assert events == [
+            ("window", 1),
+            ("chunk", 1),
+            ("window", 11),
+            ("chunk", 11),
+            ("window", 21),
+            ("chunk", 21),
+        ]
+
+    def test_conversion_errors_are_counted(self, docs):
+        (docs / "broken.pdf").write_bytes(b"%PDF garbage")
+        stats = _run(docs)
+        assert stats.errors == 1
+        assert stats.documents_processed == 2
+
+
+class TestLearnDocsCommand:
+    """Test the /learn-docs command."""
+
+    def test_missing_directory(self, capsys):
+        from src.commands.handlers.learning_commands import handle_learn_docs
+
+        handle_learn_docs(["/nonexistent/dir"])
+        assert "is not a directory" in capsys.readouterr().out
+
+    def test_reports_statistics(self, docs, capsys):
+        from src.commands.handlers.learning_commands import handle_learn_docs
+        from src.learning.learn_docs import LearnDocsStats
+
+        get_context().vectorstore = object()
+        stats = LearnDocsStats(
+            documents_processed=2, documents_converted=2, chunks_added=4
+        )
+        with patch("src.learning.learn_docs.run_learn_docs", return_value=stats) as run:
+            handle_learn_docs([str(docs), "--workers", "3", "--mode=fast"])
+
+        assert run.call_args.kwargs["workers"] == 3
+        assert run.call_args.kwargs["mode"] == "fast"
+        out = capsys.readouterr().out
+        assert "Documents processed: 2" in out
+        assert "Chunks added: 4" in out
+
+    def test_invalid_mode(self, docs, capsys):
+        from src.commands.handlers.learning_commands import handle_learn_docs
+
+        handle_learn_docs([str(docs), "--mode", "turbo"])
+        assert "--mode must be one of" in capsys.readouterr().out
+
+    def test_docling_missing(self, docs, capsys):
+        from src.commands.handlers.learning_commands import handle_learn_docs
+
+        get_context().vectorstore = object()
+        with patch("src.learning.learn_docs.run_learn_docs", side_effect=ImportError):
+            handle_learn_docs([str(docs)])
+        assert "docling library not installed" in capsys.readouterr().out
@@ -0,0 +1,216 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for the learned file ledger (src/learning/ledger.py).
+
+Tests cover:
+- Recording, loading, refreshing and forgetting entries
+- Space isolation
+- No-op behavior without a database
+- Auto-learn startup skipping unchanged files and pruning deleted ones
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.context import reset_context
+from src.core.context_utils import ChunkSyncPlan, ChunkSyncResult
+from src.learning.ledger import (
+    LedgerEntry,
+    forget_learned_file,
+    get_ledger_entry,
+    load_ledger,
+    record_learned_file,
+    touch_learned_file,
+)
+
+
+class TestLedgerStorage:
+    """Test ledger persistence."""
+
+    def test_record_and_load(self, memory_db):
+        entry = LedgerEntry("/docs/a.md", 10.5, 120, "abc", ["chunk_1"])
+        assert record_learned_file("default", entry) is True
+
+        ledger = load_ledger("default")
+        assert ledger == {"/docs/a.md": entry}
+        assert get_ledger_entry("default", "/docs/a.md") == entry
+
+    def test_record_replaces_entry(self, memory_db):
+        record_learned_file("default", LedgerEntry("/a.md", 1.0, 1, "old"))
+        record_learned_file("default", LedgerEntry("/a.md", 2.0, 2, "new", ["c"]))
+
+        entry = get_ledger_entry("default", "/a.md")
+        assert entry.content_hash == "new"
+        assert entry.chunk_ids == ["c"]
+
+    def test_spaces_are_isolated(self, memory_db):
+        record_learned_file("work", LedgerEntry("/a.md", 1.0, 1, "h"))
+
+        assert load_ledger("default") == {}
+        assert get_ledger_entry("default", "/a.md") is None
+        assert "/a.md" in load_ledger("work")
+
+    def test_touch_updates_stat(self, memory_db):
+        record_learned_file("default", LedgerEntry("/a.md", 1.0, 1, "h", ["c"]))
+        touch_learned_file("default", "/a.md", 5.0, 9)
+
+        entry = get_ledger_entry("default", "/a.md")
+        assert entry.matches_stat(5.0, 9)
+        assert entry.content_hash == "h"
+        assert entry.chunk_ids == ["c"]
+
+    def test_forget(self, memory_db):
+        record_learned_file("default", LedgerEntry("/a.md", 1.0, 1, "h"))
+        forget_learned_file("default", "/a.md")
+
+        assert load_ledger("default") == {}
+
+    def test_no_database_is_noop(self):
+        reset_context()
+        entry = LedgerEntry("/a.md", 1.0, 1, "h")
+
+        assert record_learned_file("default", entry) is False
+        assert load_ledger("default") == {}
+        assert get_ledger_entry("default", "/a.md") is None
+        touch_learned_file("default", "/a.md", 2.0, 2)
+        forget_learned_file("default", "/a.md")
+
+
+class TestAutoLearnWithLedger:
+    """Test auto-learn startup against the ledger."""
+
+    @pytest.fixture
+    def manager(self):
+        from src.learning.auto_learn import AutoLearnManager
+
+        return AutoLearnManager()
+
+    @pytest.fixture
+    def docs(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "a.md").write_text("# A\n\nFirst document.\n")
+        (tmp_path / "b.md").write_text("# B\n\nSecond document.\n")
+        return tmp_path
+
+    @pytest.fixture
+    def synced(self):
+        """Patch the pipeline's knowledge base calls; records synced sources."""
+        sources_synced = []
+
+        def fake_plan(documents, sources):
+            sources_synced.append(list(sources))
+            return ChunkSyncPlan("collection", "default", new_docs=list(documents))
+
+        with patch(
+            "src.learning.pipeline.plan_chunk_sync", side_effect=fake_plan
+        ), patch(
+            "src.learning.pipeline.embed_chunk_sync_plan", return_value=True
+        ), patch(
+            "src.learning.pipeline.write_chunk_sync_plan",
+            side_effect=lambda plan: ChunkSyncResult(added=len(plan.new_docs)),
+        ):
+            yield sources_synced
+
+    def _run(self, manager, files):
+        with patch(
+            "src.learning.auto_learn.discover_markdown_files", return_value=files
+        ):
+            manager._running = True
+            manager._auto_learn_background_task()
+
+    def test_second_start_is_noop(self, manager, docs, memory_db, synced):
+        files = [docs / "a.md", docs / "b.md"]
+
+        self._run(manager, files)
+        assert [s for sources in synced for s in sources] == [str(f) for f in files]
+        assert set(load_ledger("default")) == {str(f) for f in files}
+
+        synced.clear()
+        with patch("src.learning.auto_learn.compute_content_hash") as mock_hash:
+            self._run(manager, files)
+            mock_hash.assert_not_called()
+        assert synced == []
+        assert manager.get_stats()["unchanged_count"] == 2
+
+    def test_changed_file_is_relearned(self, manager, docs, memory_db, synced):
+        path = docs / "a.md"
+        self._run(manager, [path])
+        old_hash = get_ledger_entry("default", str(path)).content_hash
+
+        path.write_text("# A\n\nFirst document, edited.\n")
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        synced.clear()
+        self._run(manager, [path])
+
+        assert synced == [[str(path)]]
+        assert get_ledger_entry("default", str(path)).content_hash != old_hash
+
+    def test_touched_file_is_not_reembedded(self, manager, docs, memory_db, synced):
+        path = docs / "a.md"
+        self._run(manager, [path])
+
+        stat = path.stat()
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        synced.clear()
+        self._run(manager, [path])
+
+        assert synced == []
+        assert get_ledger_entry("default", str(path)).mtime == stat.st_mtime + 10
+
+    @patch("src.learning.auto_learn.delete_chunks_from_knowledge_base")
+    def test_deleted_file_is_forgotten(
+        self, mock_delete, manager, docs, memory_db, synced
+    ):
+        mock_delete.return_value = True
+        files = [docs / "a.md", docs / "b.md"]
+        self._run(manager, files)
+        chunk_ids = get_ledger_entry("default", str(files[1])).chunk_ids
+
+        files[1].unlink()
+        self._run(manager, files[:1])
+
+        mock_delete.assert_called_once_with(chunk_ids)
+        assert set(load_ledger("default")) == {str(files[0])}
+
+    @patch("src.learning.auto_learn.delete_chunks_from_knowledge_base")
+    def test_entries_outside_start_dir_are_kept(
+        self, mock_delete, manager, docs, memory_db
+    ):
+        record_learned_file("default", LedgerEntry("/elsewhere/gone.md", 1.0, 1, "h"))
+
+        self._run(manager, [])
+
+        mock_delete.assert_not_called()
+        assert "/elsewhere/gone.md" in load_ledger("default")
+
+
+def test_entry_matches_stat():
+    entry = LedgerEntry(str(Path("a.md")), 1.5, 10, "h")
+    assert entry.matches_stat(1.5, 10)
+    assert not entry.matches_stat(1.5, 11)
+    assert not entry.matches_stat(2.0, 10)
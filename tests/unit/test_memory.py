@@ -31,8 +31,20 @@ Tests cover:
 """
 
 from unittest.mock import patch, MagicMock
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-from src.storage.memory import load_memory, save_memory, trim_history
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
+from src.storage.memory import (
+    HistoryTokenCounter,
+    build_system_prompt,
+    load_memory,
+    message_tokens,
+    partition_history,
+    save_memory,
+    save_summary,
+    split_exchanges,
+    trim_history,
+    with_summary,
+)
+from src.core.constants import SYSTEM_PROMPT
 from src.core.context import get_context, reset_context
 
 
@@ -141,6 +153,96 @@ class TestConversationPersistence:
             assert ctx.db_conn.commit.called
 
 
+class TestSystemPrompt:
+    """Test the tool manifest modes of the system prompt."""
+
+    @patch("src.tools.registry.ToolRegistry.get_manifest")
+    def test_compact_manifest(self, mock_manifest):
+        mock_manifest.return_value = "- read_file_content(file_path): Read a file"
+
+        prompt = build_system_prompt("compact")
+
+        mock_manifest.assert_called_once_with("compact", None)
+        assert "AVAILABLE TOOLS (call them with native tool calls" in prompt
+        assert "- read_file_content(file_path): Read a file" in prompt
+
+    @patch("src.tools.registry.ToolRegistry.get_manifest")
+    def test_full_manifest(self, mock_manifest):
+        mock_manifest.return_value = '[{"type": "function"}]'
+
+        prompt = build_system_prompt("full")
+
+        assert prompt.endswith('AVAILABLE TOOLS:\n[{"type": "function"}]\n')
+
+    @patch("src.tools.registry.ToolRegistry.get_manifest", return_value="")
+    def test_no_manifest(self, mock_manifest):
+        assert build_system_prompt("none") == SYSTEM_PROMPT
+
+    @patch("src.tools.registry.ToolRegistry.get_manifest", return_value="- t(): x")
+    def test_unknown_mode_falls_back_to_compact(self, mock_manifest):
+        build_system_prompt("verbose")
+        mock_manifest.assert_called_once_with("compact", None)
+
+
+class TestConversationSummary:
+    """Test persisting and injecting the rolling conversation summary."""
+
+    def setup_method(self):
+        reset_context()
+
+    def teardown_method(self):
+        reset_context()
+
+    def test_load_memory_restores_summary(self):
+        """Test that the stored summary is loaded with the history."""
+        ctx = get_context()
+        ctx.db_conn = MagicMock()
+        ctx.db_lock = MagicMock()
+        mock_cursor = ctx.db_conn.cursor.return_value
+        mock_cursor.fetchall.return_value = [("SystemMessage", "Sys prompt")]
+        mock_cursor.fetchone.return_value = ("User is fixing the parser.",)
+
+        load_memory()
+
+        assert ctx.conversation_summary == "User is fixing the parser."
+
+    def test_save_summary_upserts(self):
+        """Test that the summary replaces the stored one."""
+        ctx = get_context()
+        ctx.db_conn = MagicMock()
+        ctx.db_lock = MagicMock()
+        mock_cursor = ctx.db_conn.cursor.return_value
+
+        save_summary("User is fixing the parser.")
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "ON CONFLICT(session_id)" in sql
+        assert params == ("User is fixing the parser.",)
+        assert ctx.db_conn.commit.called
+
+    def test_save_summary_failure_is_logged(self):
+        """Test that a database error does not reach the summarizer thread."""
+        ctx = get_context()
+        ctx.db_conn = MagicMock()
+        ctx.db_lock = MagicMock()
+        ctx.db_conn.cursor.return_value.execute.side_effect = Exception("locked")
+
+        save_summary("summary")  # Does not raise
+
+    def test_with_summary_extends_system_prompt(self):
+        """Test that the summary is merged into the leading system message."""
+        history = [SystemMessage(content="Sys"), HumanMessage(content="Hi")]
+
+        messages = with_summary(history, "User is fixing the parser.")
+
+        assert len(messages) == 2
+        assert messages[0].content.startswith("Sys\n\n")
+        assert "User is fixing the parser." in messages[0].content
+        assert messages[1] is history[1]
+        assert history[0].content == "Sys"  # History itself is unchanged
+        assert with_summary(history, "") == history
+
+
 class TestHistoryTrimming:
     """Test the logic for trimming conversation history."""
 
@@ -179,15 +281,136 @@ class TestHistoryTrimming:
         assert trimmed[2].content == "A3"
 
     def test_trim_history_uses_config_default(self):
-        """Test that trim_history uses the default limit from config."""
-        history = [SystemMessage(content="S")] + [HumanMessage(content="H")] * 20
+        """Test that trim_history uses the default limits from config."""
+        history = [SystemMessage(content="S")] + [
+            HumanMessage(content="H"),
+            AIMessage(content="A"),
+        ] * 20
 
         with patch("src.storage.memory.get_config") as mock_get_config:
             mock_config = MagicMock()
             mock_config.max_history_pairs = 5
+            mock_config.context_token_budget = 100000
             mock_get_config.return_value = mock_config
 
             trimmed = trim_history(history)
             # 1 (sys) + 5*2 (pairs) = 11
             assert len(trimmed) == 11
             assert trimmed[0].content == "S"
+
+    def test_trim_history_token_budget(self):
+        """Test that the oldest exchanges are dropped to fit the token budget."""
+        big = "x" * 4000  # ~1000 tokens
+        history = [
+            SystemMessage(content="S"),
+            HumanMessage(content="H1"),
+            AIMessage(content=big),
+            HumanMessage(content="H2"),
+            AIMessage(content=big),
+            HumanMessage(content="H3"),
+            AIMessage(content="A3"),
+        ]
+
+        trimmed = trim_history(history, max_pairs=10, token_budget=1500)
+
+        assert [m.content for m in trimmed] == ["S", "H2", big, "H3", "A3"]
+
+    def test_trim_history_keeps_latest_exchange_over_budget(self):
+        """Test that the exchange in progress is never dropped."""
+        history = [
+            SystemMessage(content="S"),
+            HumanMessage(content="H1"),
+            AIMessage(content="A1"),
+            HumanMessage(content="x" * 40000),
+        ]
+
+        trimmed = trim_history(history, max_pairs=10, token_budget=100)
+
+        assert trimmed == [history[0], history[3]]
+
+    def test_trim_history_keeps_tool_calls_with_results(self):
+        """Test that tool results and file injections stay with their exchange."""
+        history = [
+            SystemMessage(content="S"),
+            HumanMessage(content="H1"),
+            AIMessage(content="A1"),
+            HumanMessage(content="Read setup.py"),
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "read_file_content", "args": {}, "id": "c1"}],
+            ),
+            ToolMessage(content="{}", tool_call_id="c1"),
+            HumanMessage(content="Output of reading file setup.py"),
+            AIMessage(content="It defines the package."),
+        ]
+
+        trimmed = trim_history(history, max_pairs=1, token_budget=100000)
+
+        assert trimmed == [history[0]] + history[3:]
+
+    def test_partition_history_returns_evicted_messages(self):
+        """Test that trimmed exchanges are returned for the rolling summary."""
+        history = [
+            SystemMessage(content="S"),
+            HumanMessage(content="H1"),
+            AIMessage(content="A1"),
+            HumanMessage(content="H2"),
+            AIMessage(content="A2"),
+        ]
+
+        kept, evicted = partition_history(history, max_pairs=1, token_budget=100000)
+
+        assert kept == [history[0]] + history[3:]
+        assert evicted == history[1:3]
+        assert partition_history(history, max_pairs=5, token_budget=100000)[1] == []
+
+
+class TestHistoryTokenCounting:
+    """Test token estimates and exchange grouping."""
+
+    def test_message_tokens_counts_tool_calls(self):
+        plain = AIMessage(content="abcd")
+        calling = AIMessage(
+            content="abcd",
+            tool_calls=[{"name": "git_log", "args": {"limit": 5}, "id": "c1"}],
+        )
+
+        assert message_tokens(calling) > message_tokens(plain)
+
+    def test_split_exchanges(self):
+        messages = [
+            AIMessage(content="orphan"),
+            HumanMessage(content="H1"),
+            AIMessage(content="", tool_calls=[{"name": "t", "args": {}, "id": "c"}]),
+            ToolMessage(content="{}", tool_call_id="c"),
+            AIMessage(content="A1"),
+            HumanMessage(content="H2"),
+        ]
+
+        exchanges = split_exchanges(messages)
+
+        assert [len(e) for e in exchanges] == [1, 4, 1]
+
+    def test_counter_is_incremental(self):
+        history = [SystemMessage(content="S"), HumanMessage(content="H1")]
+        counter = HistoryTokenCounter()
+
+        counter.update(history)
+        assert counter.exchanges == 1
+        tokens = counter.tokens
+
+        history.append(AIMessage(content="A1"))
+        history.append(HumanMessage(content="H2"))
+        with patch(
+            "src.storage.memory.message_tokens", wraps=message_tokens
+        ) as measured:
+            counter.update(history)
+
+        # Only the two new messages were measured
+        assert measured.call_count == 2
+        assert counter.exchanges == 2
+        assert counter.tokens > tokens
+
+        # A new (trimmed) list is recounted
+        counter.update(history[:1] + history[3:])
+        assert counter.exchanges == 1
@@ -0,0 +1,350 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for near-duplicate chunk suppression (src/core/near_duplicates.py).
+
+Tests cover:
+- MinHash signatures and similarity estimates
+- LSH index lookups, source exclusion and removal
+- Per-space persistence of signatures
+- Suppression of duplicate chunks while planning a knowledge base sync
+"""
+
+from unittest.mock import patch
+
+import pytest
+from langchain_core.documents import Document
+
+from src.core.context import get_context, reset_context
+from src.core.context_utils import (
+    ChunkSyncPlan,
+    _suppress_near_duplicates,
+    release_chunk_sync_plan,
+    write_chunk_sync_plan,
+)
+from src.core.near_duplicates import (
+    NearDuplicateIndex,
+    SuppressedChunk,
+    estimate_similarity,
+    forget_space_signatures,
+    get_near_duplicate_index,
+    minhash_signature,
+    pack_signature,
+    unpack_signature,
+)
+
+LICENSE = """
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+"""
+
+OTHER = """
+def parse_config(path):
+    with open(path) as handle:
+        data = json.load(handle)
+    if "version" not in data:
+        raise ValueError("missing version field in configuration file")
+    return Config(**data)
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_context():
+    reset_context()
+    yield
+    reset_context()
+
+
+class TestSignatures:
+    """Test MinHash signatures."""
+
+    def test_identical_text_matches(self):
+        assert estimate_similarity(
+            minhash_signature(LICENSE), minhash_signature(LICENSE)
+        ) == pytest.approx(1.0)
+
+    def test_comment_markers_are_ignored(self):
+        js_license = LICENSE.replace("# ", "// ")
+        assert minhash_signature(js_license) == minhash_signature(LICENSE)
+
+    def test_small_edit_stays_similar(self):
+        edited = LICENSE.replace("free of charge", "without charge")
+        score = estimate_similarity(
+            minhash_signature(LICENSE), minhash_signature(edited)
+        )
+        assert score >= 0.7
+
+    def test_unrelated_text_differs(self):
+        score = estimate_similarity(
+            minhash_signature(LICENSE), minhash_signature(OTHER)
+        )
+        assert score < 0.2
+
+    def test_short_text_has_no_signature(self):
+        assert minhash_signature("return None") is None
+
+    def test_pack_roundtrip(self):
+        signature = minhash_signature(LICENSE)
+        assert unpack_signature(pack_signature(signature)) == signature
+
+
+class TestNearDuplicateIndex:
+    """Test LSH lookups."""
+
+    def test_find_duplicate_from_other_source(self):
+        index = NearDuplicateIndex()
+        index.add([("lic-a", "a.py", minhash_signature(LICENSE))])
+
+        assert index.find(minhash_signature(LICENSE), exclude_source="b.py") == "lic-a"
+        assert index.find(minhash_signature(OTHER), exclude_source="b.py") is None
+
+    def test_same_source_is_not_a_duplicate(self):
+        index = NearDuplicateIndex()
+        index.add([("lic-a", "a.py", minhash_signature(LICENSE))])
+
+        assert index.find(minhash_signature(LICENSE), exclude_source="a.py") is None
+
+    def test_excluded_and_removed_ids(self):
+        index = NearDuplicateIndex()
+        signature = minhash_signature(LICENSE)
+        index.add([("lic-a", "a.py", signature)])
+
+        assert index.find(signature, exclude_ids=["lic-a"]) is None
+        index.remove(["lic-a"])
+        assert index.find(signature) is None
+        assert len(index) == 0
+
+    def test_removing_canonical_returns_its_copies(self):
+        index = NearDuplicateIndex()
+        index.add([("lic-a", "a.py", minhash_signature(LICENSE))])
+        copy = SuppressedChunk("lic-b", "b.py", "lic-a", LICENSE, {})
+        other = SuppressedChunk("lic-c", "c.py", "lic-x", LICENSE, {})
+        index.suppress([copy, other])
+
+        assert index.remove(["lic-a"]) == [copy]
+        assert index.suppressed() == [other]
+
+    def test_suppress_replaces_records_of_synced_sources(self):
+        index = NearDuplicateIndex()
+        index.suppress([SuppressedChunk("old", "b.py", "lic-a", LICENSE, {})])
+        new = SuppressedChunk("new", "b.py", "lic-a", LICENSE, {})
+        index.suppress([new], sources=["b.py"])
+
+        assert index.suppressed() == [new]
+        # Deleting a source's chunks drops its records too
+        assert index.remove(["new"]) == []
+        assert index.suppressed() == []
+
+    def test_reservations(self):
+        index = NearDuplicateIndex()
+        signature = minhash_signature(LICENSE)
+
+        index.reserve([("lic-a", "a.py", signature)])
+        assert index.find(signature) == "lic-a"
+        assert index.is_reserved("lic-a")
+
+        index.add([("lic-a", "a.py", signature)])
+        assert not index.is_reserved("lic-a")
+        index.release(["lic-a"])  # Stored chunks are not released
+        assert index.find(signature) == "lic-a"
+
+        index.reserve([("lic-b", "b.py", signature)])
+        index.release(["lic-b"])
+        assert index.find(signature, exclude_source="a.py") is None
+
+
+class TestPersistence:
+    """Test per-space signature storage."""
+
+    def test_signatures_survive_reload(self, memory_db):
+        get_near_duplicate_index("default").add(
+            [("lic-a", "a.py", minhash_signature(LICENSE))]
+        )
+        get_context().near_duplicate_indexes.clear()
+
+        index = get_near_duplicate_index("default")
+        assert index.find(minhash_signature(LICENSE)) == "lic-a"
+        assert len(get_near_duplicate_index("other")) == 0
+
+    def test_remove_and_forget_space(self, memory_db):
+        index = get_near_duplicate_index("default")
+        index.add(
+            [
+                ("lic-a", "a.py", minhash_signature(LICENSE)),
+                ("other", "a.py", minhash_signature(OTHER)),
+            ]
+        )
+        index.remove(["lic-a"])
+        count = "SELECT COUNT(*) FROM chunk_signatures WHERE space = 'default'"
+        assert memory_db.execute(count).fetchone()[0] == 1
+
+        forget_space_signatures("default")
+        assert memory_db.execute(count).fetchone()[0] == 0
+        assert "default" not in get_context().near_duplicate_indexes
+
+    def test_suppressed_chunks_survive_reload(self, memory_db):
+        copy = SuppressedChunk("lic-b", "b.py", "lic-a", LICENSE, {"source": "b.py"})
+        get_near_duplicate_index("default").suppress([copy])
+        get_context().near_duplicate_indexes.clear()
+
+        assert get_near_duplicate_index("default").suppressed() == [copy]
+        forget_space_signatures("default")
+        count = "SELECT COUNT(*) FROM suppressed_chunks WHERE space = 'default'"
+        assert memory_db.execute(count).fetchone()[0] == 0
+
+
+def _plan(*docs):
+    plan = ChunkSyncPlan("kb-id", "default")
+    for doc_id, source, text in docs:
+        plan.new_docs.append(Document(page_content=text, metadata={"source": source}))
+        plan.new_ids.append(doc_id)
+    return plan
+
+
+class TestSyncSuppression:
+    """Test duplicate chunks being skipped while planning a sync."""
+
+    def test_duplicates_within_plan(self):
+        plan = _plan(
+            ("lic-a", "a.py", LICENSE),
+            ("lic-b", "b.py", LICENSE),
+            ("code-b", "b.py", OTHER),
+        )
+        _suppress_near_duplicates(plan)
+
+        assert plan.new_ids == ["lic-a", "code-b"]
+        assert plan.suppressed == {"lic-b": "lic-a"}
+        assert set(plan.signatures) == {"lic-a", "code-b"}
+
+    def test_duplicate_of_stored_chunk(self):
+        get_near_duplicate_index("default").add(
+            [("lic-a", "a.py", minhash_signature(LICENSE))]
+        )
+        plan = _plan(("lic-b", "b.py", LICENSE))
+
+        with patch(
+            "src.core.context_utils._get_existing_chunk_ids", return_value={"lic-a"}
+        ):
+            _suppress_near_duplicates(plan)
+
+        assert plan.new_ids == []
+        assert plan.suppressed == {"lic-b": "lic-a"}
+
+    def test_vanished_canonical_is_dropped(self):
+        index = get_near_duplicate_index("default")
+        index.add([("lic-a", "a.py", minhash_signature(LICENSE))])
+        plan = _plan(("lic-b", "b.py", LICENSE))
+
+        with patch(
+            "src.core.context_utils._get_existing_chunk_ids", return_value=set()
+        ):
+            _suppress_near_duplicates(plan)
+
+        assert plan.new_ids == ["lic-b"]
+        assert plan.suppressed == {}
+        # Only the kept chunk remains, reserved until it is written
+        assert len(index) == 1
+        assert index.is_reserved("lic-b")
+
+    def test_concurrent_plans_see_reserved_chunks(self):
+        """A batch planned before the previous one is written still matches it."""
+        first = _plan(("lic-a", "a.py", LICENSE))
+        second = _plan(("lic-b", "b.py", LICENSE))
+
+        with patch("src.core.context_utils._get_existing_chunk_ids") as lookup:
+            _suppress_near_duplicates(first)
+            _suppress_near_duplicates(second)
+
+        assert second.new_ids == []
+        assert second.suppressed == {"lic-b": "lic-a"}
+        lookup.assert_not_called()  # Reserved canonicals are not looked up
+
+    def test_unwritten_plan_releases_reservations(self):
+        plan = _plan(("lic-a", "a.py", LICENSE))
+        _suppress_near_duplicates(plan)
+
+        release_chunk_sync_plan(plan)
+
+        index = get_near_duplicate_index("default")
+        assert index.find(minhash_signature(LICENSE)) is None
+
+    def test_failed_write_releases_reservations(self):
+        plan = _plan(("lic-a", "a.py", LICENSE))
+        _suppress_near_duplicates(plan)
+        plan.vectors = [[0.1]]
+
+        with patch(
+            "src.core.context_utils._store_documents_batch_in_chromadb",
+            return_value=False,
+        ):
+            result = write_chunk_sync_plan(plan)
+
+        assert result.added == 0
+        assert len(get_near_duplicate_index("default")) == 0
+
+    def test_write_indexes_stored_chunks(self):
+        plan = _plan(("lic-a", "a.py", LICENSE), ("lic-b", "b.py", LICENSE))
+        plan.stale_ids = ["old"]
+        _suppress_near_duplicates(plan)
+        plan.vectors = [[0.1]]
+
+        with patch(
+            "src.core.context_utils._store_documents_batch_in_chromadb",
+            return_value=True,
+        ), patch("src.core.context_utils._delete_chunks", return_value=True):
+            result = write_chunk_sync_plan(plan)
+
+        assert (result.added, result.suppressed, result.deleted) == (1, 1, 1)
+        index = get_near_duplicate_index("default")
+        assert index.find(minhash_signature(LICENSE)) == "lic-a"
+        assert [c.chunk_id for c in index.suppressed()] == ["lic-b"]
+
+    def test_copy_is_stored_when_canonical_is_deleted(self):
+        first = _plan(("lic-a", "a.py", LICENSE), ("lic-b", "b.py", LICENSE))
+        _suppress_near_duplicates(first)
+        first.vectors = [[0.1]]
+        second = ChunkSyncPlan("kb-id", "default", stale_ids=["lic-a"])
+        second.sources = ["a.py"]
+        _suppress_near_duplicates(second)
+
+        with patch(
+            "src.core.context_utils._store_documents_batch_in_chromadb",
+            return_value=True,
+        ) as store, patch(
+            "src.core.context_utils._delete_chunks", return_value=True
+        ), patch(
+            "src.core.context_utils._generate_embeddings_batch",
+            return_value=[[0.2]],
+        ):
+            write_chunk_sync_plan(first)
+            result = write_chunk_sync_plan(second)
+
+        assert result.deleted == 1
+        assert store.call_args.kwargs["ids"] == ["lic-b"]
+        index = get_near_duplicate_index("default")
+        assert index.find(minhash_signature(LICENSE)) == "lic-b"
+        assert index.suppressed() == []
@@ -0,0 +1,321 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for the staged ingestion pipeline (src/learning/pipeline.py).
+
+Tests cover:
+- Units flowing through read/chunk/embed/write in order
+- Skipped, failed and emptied units
+- Checkpoints: resuming an interrupted run and clearing a finished one
+- Throughput metrics, ETA and progress reporting
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+
+from src.core.context import reset_context
+from src.core.context_utils import ChunkSyncPlan, ChunkSyncResult
+from src.learning.pipeline import (
+    CheckpointStore,
+    IngestPipeline,
+    IngestUnit,
+    PipelineConfig,
+    PipelineMetrics,
+    StageMetrics,
+    _Stage,
+)
+
+
+@pytest.fixture
+def store():
+    """Patch the knowledge base calls; records every synced batch."""
+    batches = []
+
+    def fake_plan(documents, sources):
+        batches.append((list(documents), list(sources)))
+        return ChunkSyncPlan("collection", "default", new_docs=list(documents))
+
+    with patch("src.learning.pipeline.plan_chunk_sync", side_effect=fake_plan), patch(
+        "src.learning.pipeline.embed_chunk_sync_plan", return_value=True
+    ) as embed, patch(
+        "src.learning.pipeline.write_chunk_sync_plan",
+        side_effect=lambda plan: ChunkSyncResult(added=len(plan.new_docs)),
+    ):
+        yield batches, embed
+
+
+def _read(unit: IngestUnit) -> IngestUnit:
+    unit.data = f"text of {unit.key}"
+    return unit
+
+
+def _chunk(unit: IngestUnit) -> IngestUnit:
+    unit.documents = [
+        Document(page_content=f"{unit.data} #{i}", metadata={"source": unit.key})
+        for i in range(2)
+    ]
+    return unit
+
+
+def _units(*keys: str, fingerprint: str = "1"):
+    return [IngestUnit(key=key, fingerprint=fingerprint) for key in keys]
+
+
+def _run(units, **kwargs) -> tuple:
+    done = []
+    kwargs.setdefault("read", _read)
+    kwargs.setdefault("chunk", _chunk)
+    pipeline = IngestPipeline("test", units, on_unit_done=done.append, **kwargs)
+    return pipeline.run(), done
+
+
+class TestIngestPipeline:
+    """Test units flowing through the stages."""
+
+    def test_units_written_in_order(self, store):
+        batches, _ = store
+        metrics, done = _run(
+            _units("a", "b", "c", "d"),
+            config=PipelineConfig(read_workers=3, embed_workers=2, batch_size=3),
+        )
+
+        assert [u.key for u in done] == ["a", "b", "c", "d"]
+        assert all(u.status == "ok" for u in done)
+        stored = [doc.page_content for docs, _ in batches for doc in docs]
+        assert stored == [f"text of {k} #{i}" for k in "abcd" for i in range(2)]
+        assert metrics.units_written == 4
+        assert metrics.chunks_added == 8
+        assert metrics.discovery_complete is True
+        assert metrics.interrupted is False
+
+    def test_chunk_processes_are_spawned(self):
+        """Worker processes are spawned, never forked from this threaded process."""
+        stage = _Stage(
+            StageMetrics("chunk", 2), len, lambda result: None, 4, processes=True
+        )
+        executor = stage._create_executor()
+        try:
+            assert executor._mp_context.get_start_method() == "spawn"
+            assert executor.submit(len, "abc").result(timeout=60) == 3
+        finally:
+            executor.shutdown()
+
+    def test_batches_hold_whole_units(self, store):
+        batches, _ = store
+        _run(_units("a", "b", "c"), config=PipelineConfig(batch_size=1))
+
+        for documents, sources in batches:
+            assert {doc.metadata["source"] for doc in documents} == set(sources)
+
+    def test_read_skip_and_error(self, store):
+        def read(unit):
+            if unit.key == "skip":
+                unit.status = "unchanged"
+                return unit
+            if unit.key == "bad":
+                raise IOError("unreadable")
+            return _read(unit)
+
+        metrics, done = _run(_units("skip", "bad", "good"), read=read)
+
+        statuses = {u.key: (u.status, u.error) for u in done}
+        assert statuses["skip"] == ("unchanged", "")
+        assert statuses["bad"] == ("error", "unreadable")
+        assert statuses["good"][0] == "ok"
+        assert (metrics.units_skipped, metrics.units_failed) == (1, 1)
+        assert metrics.units_written == 1
+
+    def test_empty_unit_is_synced(self, store):
+        batches, _ = store
+
+        def chunk(unit):
+            unit.documents = []
+            return unit
+
+        metrics, done = _run(_units("emptied"), chunk=chunk)
+
+        assert done[0].status == "empty"
+        assert batches == [([], ["emptied"])]
+        assert metrics.units_written == 1
+
+    def test_on_chunked_filter(self, store):
+        metrics, done = _run(_units("a", "b"), on_chunked=lambda unit: unit.key != "b")
+
+        # Skipped units leave at once; written ones after their batch
+        assert {u.key: u.status for u in done} == {"a": "ok", "b": "skipped"}
+        assert metrics.units_skipped == 1
+
+    def test_embedding_failure_fails_units(self, store):
+        _, embed = store
+        embed.return_value = False
+
+        metrics, done = _run(_units("a", "b"))
+
+        assert all(u.status == "error" for u in done)
+        assert metrics.units_failed == 2
+        assert metrics.chunks_added == 0
+
+    def test_partial_write_fails_units(self, store):
+        """A batch stored only in part is not checkpointed, so it is retried."""
+        with patch(
+            "src.learning.pipeline.write_chunk_sync_plan",
+            side_effect=lambda plan: ChunkSyncResult(added=len(plan.new_docs) - 1),
+        ):
+            metrics, done = _run(_units("a"))
+
+        assert [u.status for u in done] == ["error"]
+        assert metrics.units_failed == 1
+
+    def test_fallback_without_api(self):
+        with patch("src.learning.pipeline.plan_chunk_sync", return_value=None), patch(
+            "src.learning.pipeline.add_documents_with_fallback",
+            return_value=ChunkSyncResult(added=2),
+        ) as fallback:
+            metrics, done = _run(_units("a"))
+
+        assert fallback.call_count == 1
+        assert done[0].status == "ok"
+        assert metrics.chunks_added == 2
+
+
+class TestCheckpoints:
+    """Test resuming interrupted runs."""
+
+    def test_mark_load_clear(self, memory_db):
+        checkpoints = CheckpointStore("run")
+        checkpoints.mark(_units("a", "b"))
+
+        assert checkpoints.load() == {"a": "1", "b": "1"}
+        assert CheckpointStore("other").load() == {}
+        checkpoints.clear()
+        assert checkpoints.load() == {}
+
+    def test_no_database_is_noop(self):
+        reset_context()
+        checkpoints = CheckpointStore("run")
+        checkpoints.mark(_units("a"))
+        assert checkpoints.load() == {}
+
+    def test_resume_skips_completed_units(self, memory_db, store):
+        batches, _ = store
+        CheckpointStore("run").mark(_units("a"))
+        CheckpointStore("run").mark(_units("b", fingerprint="old"))
+        read = MagicMock(side_effect=_read)
+
+        metrics, done = _run(_units("a", "b", "c"), read=read, run_id="run")
+
+        assert sorted(call[0][0].key for call in read.call_args_list) == ["b", "c"]
+        assert {u.key: u.status for u in done}["a"] == "resumed"
+        assert metrics.units_resumed == 1
+        assert metrics.units_written == 2
+        # A finished run forgets its checkpoints
+        assert CheckpointStore("run").load() == {}
+
+    def test_interrupted_run_keeps_checkpoints(self, memory_db, store):
+        pipeline = None
+
+        def stop_after_first(unit):
+            pipeline.stop()
+
+        pipeline = IngestPipeline(
+            "test",
+            _units("a", "b", "c"),
+            read=_read,
+            chunk=_chunk,
+            config=PipelineConfig(batch_size=1),
+            run_id="run",
+            on_unit_done=stop_after_first,
+        )
+        metrics = pipeline.run()
+
+        assert metrics.interrupted is True
+        assert "a" in CheckpointStore("run").load()
+
+
+class TestMetrics:
+    """Test throughput metrics, ETA and progress reporting."""
+
+    def test_eta_and_summary(self):
+        metrics = PipelineMetrics(
+            "test",
+            stages=[
+                StageMetrics("read", 2, processed=10),
+                StageMetrics("embed", 1, chunks=40),
+            ],
+            units_discovered=20,
+            units_written=10,
+            discovery_complete=True,
+            elapsed=10.0,
+        )
+
+        assert metrics.eta_seconds == pytest.approx(10.0)
+        summary = metrics.summary()
+        assert "read 1.0/s (q0)" in summary
+        assert "embed 4.0 chunks/s" in summary
+        assert "10/20 units, ETA 10s" in summary
+
+    def test_no_eta_before_first_unit(self):
+        metrics = PipelineMetrics("test", units_discovered=5, elapsed=1.0)
+        assert metrics.eta_seconds is None
+        assert "0/5+ units" in metrics.summary()
+
+    def test_progress_receives_final_metrics(self, store):
+        progress = MagicMock()
+        metrics, _ = _run(_units("a"), progress=progress)
+
+        progress.report_stage_metrics.assert_called_with(metrics)
+
+    def test_callable_progress_receives_summary(self, store):
+        lines = []
+        _run(_units("a"), progress=lines.append)
+
+        assert lines and "1/1 units" in lines[-1]
+
+
+class TestBackgroundJobs:
+    """Test pipelines running inside a /jobs background job."""
+
+    def test_cancelled_job_stops_pipeline(self, store):
+        from src.core.jobs import Job, bind_job
+
+        def slow_read(unit):
+            time.sleep(0.02)
+            return _read(unit)
+
+        job = Job(1, "/populate .")
+        job._cancel.set()
+        with patch("src.learning.pipeline.PIPELINE_PROGRESS_INTERVAL", 0.01), bind_job(
+            job
+        ):
+            metrics, done = _run(
+                _units(*[str(i) for i in range(100)]),
+                read=slow_read,
+                config=PipelineConfig(read_workers=1, batch_size=1),
+            )
+
+        assert metrics.interrupted is True
+        assert len(done) < 100
+        assert "units" in job.progress
@@ -0,0 +1,259 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for the parallel /populate pipeline (src/learning/populate.py).
+
+Tests cover:
+- Walk stage filtering (binary, hidden, skipped directories)
+- Read and chunk stages
+- Serial and parallel runs producing identical documents
+- Argument parsing for --workers
+"""
+
+import os
+import tempfile
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import pytest
+
+from src.learning.pipeline import IngestUnit
+from src.learning.populate import (
+    PopulatePipeline,
+    chunk_unit,
+    iter_candidate_files,
+    read_unit,
+)
+from src.commands.handlers.learning_commands import _parse_populate_args
+from src.core.context_utils import ChunkSyncPlan, ChunkSyncResult
+
+
+def _make_tree(root: str) -> None:
+    """Create a small project tree for populate tests."""
+    files = {
+        "main.py": "def main():\n    return 1\n" * 40,
+        "README.md": "# Project\n\nSome documentation.\n",
+        "Makefile": "all:\n\techo build\n",
+        "empty.txt": "   \n",
+        "image.png": "not really a png",
+        ".hidden.py": "secret = 1\n",
+        "pkg/module.py": "x = 1\n" * 500,
+        "pkg/data.csv2": "a,b\n",
+        "node_modules/lib/index.js": "module.exports = 1;\n",
+        "build/out.py": "generated = True\n",
+        "demo.egg-info/PKG-INFO": "Name: demo\n",
+    }
+    for rel_path, content in files.items():
+        full_path = os.path.join(root, rel_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+class TestWalkStage:
+    """Tests for candidate file discovery."""
+
+    def test_skips_binary_hidden_and_excluded_dirs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _make_tree(tmpdir)
+            results = {
+                os.path.relpath(path, tmpdir): reason
+                for path, reason in iter_candidate_files(tmpdir)
+            }
+
+            assert results["main.py"] is None
+            assert results["Makefile"] is None
+            assert results["image.png"] == "binary"
+            assert results[os.path.join("pkg", "data.csv2")] == "unsupported"
+            assert ".hidden.py" not in results
+            assert not any(p.startswith("node_modules") for p in results)
+            assert not any(p.startswith("build") for p in results)
+            assert not any(p.startswith("demo.egg-info") for p in results)
+
+
+class TestReadAndChunkStages:
+    """Tests for the read and chunk stages, shared with the watcher."""
+
+    def test_chunks_text_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "a.py")
+            with open(path, "w") as f:
+                f.write("".join(f"print('hello {i}')\n" for i in range(300)))
+
+            unit = read_unit(IngestUnit(path))
+            assert unit.status == "ok"
+            unit = chunk_unit(unit, tmpdir)
+
+            assert len(unit.data) == 16
+            assert len(unit.documents) > 1
+            assert unit.documents[0].metadata["start_line"] == 1
+            assert unit.documents[-1].metadata["end_line"] == 300
+            assert unit.documents[0].metadata["relative_path"] == "a.py"
+
+    def test_empty_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "empty.txt")
+            with open(path, "w") as f:
+                f.write("\n\n")
+
+            assert read_unit(IngestUnit(path)).status == "empty"
+
+    def test_missing_file_raises(self):
+        # The pipeline records stage exceptions as status "error"
+        with pytest.raises(OSError):
+            read_unit(IngestUnit("/nonexistent/file.py"))
+
+
+def _patch_store(calls=None, unchanged=0, deleted=0):
+    """Patch the pipeline's embed/write stages; record (documents, sources)."""
+
+    def fake_plan(documents, sources):
+        if calls is not None:
+            calls.append((list(documents), list(sources)))
+        return ChunkSyncPlan("collection", "default", new_docs=list(documents))
+
+    def fake_write(plan):
+        return ChunkSyncResult(
+            added=len(plan.new_docs), unchanged=unchanged, deleted=deleted
+        )
+
+    stack = ExitStack()
+    stack.enter_context(
+        patch("src.learning.pipeline.plan_chunk_sync", side_effect=fake_plan)
+    )
+    stack.enter_context(
+        patch("src.learning.pipeline.embed_chunk_sync_plan", return_value=True)
+    )
+    stack.enter_context(
+        patch("src.learning.pipeline.write_chunk_sync_plan", side_effect=fake_write)
+    )
+    return stack
+
+
+class TestPopulatePipeline:
+    """Tests for the full walk → read → chunk → embed → write pipeline."""
+
+    def _run(self, root: str, workers: int):
+        calls = []
+        with _patch_store(calls), patch(
+            "src.learning.auto_learn.register_content_hash"
+        ):
+            stats = PopulatePipeline(
+                root, workers=workers, batch_size=3, resume=False
+            ).run()
+        stored = [
+            (d.metadata["source"], d.page_content) for docs, _ in calls for d in docs
+        ]
+        return stats, stored
+
+    def test_serial_run(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _make_tree(tmpdir)
+            stats, stored = self._run(tmpdir, workers=1)
+
+            assert stats.files_processed == 4
+            assert stats.chunks_added == len(stored)
+            assert stats.files_skipped == 2  # image.png, data.csv2
+            assert stats.errors == 0
+            assert stats.elapsed > 0
+            assert stats.files_per_second > 0
+
+    @pytest.mark.slow
+    def test_parallel_matches_serial(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _make_tree(tmpdir)
+            serial_stats, serial_docs = self._run(tmpdir, workers=1)
+            parallel_stats, parallel_docs = self._run(tmpdir, workers=3)
+
+            assert parallel_docs == serial_docs
+            assert parallel_stats.files_processed == serial_stats.files_processed
+            assert parallel_stats.chunks_added == serial_stats.chunks_added
+
+    def test_duplicate_files_are_synced(self):
+        """Every copy is synced, so chunks stored for either stay current."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("a.py", "b.py"):
+                with open(os.path.join(tmpdir, name), "w") as f:
+                    f.write("def same():\n    return 1\n")
+            calls = []
+            with _patch_store(calls), patch(
+                "src.learning.auto_learn.register_content_hash"
+            ):
+                stats = PopulatePipeline(tmpdir, workers=1, resume=False).run()
+
+            synced = {os.path.basename(s) for _, sources in calls for s in sources}
+            assert synced == {"a.py", "b.py"}
+            assert stats.files_processed == 2
+
+    def test_walk_failure_is_raised(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _make_tree(tmpdir)
+            with _patch_store(), patch(
+                "src.learning.populate.iter_candidate_files",
+                side_effect=RuntimeError("walk failed"),
+            ):
+                with pytest.raises(RuntimeError, match="walk failed"):
+                    PopulatePipeline(tmpdir, workers=1, resume=False).run()
+
+    def test_batches_hold_whole_files(self):
+        """Every synced batch carries each file's complete chunk set."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _make_tree(tmpdir)
+            calls = []
+
+            with _patch_store(calls, unchanged=1, deleted=2), patch(
+                "src.learning.auto_learn.register_content_hash"
+            ):
+                stats = PopulatePipeline(
+                    tmpdir, workers=1, batch_size=1, resume=False
+                ).run()
+
+            for documents, sources in calls:
+                for doc in documents:
+                    assert doc.metadata["source"] in sources
+                    assert doc.metadata["total_chunks"] == sum(
+                        1
+                        for d in documents
+                        if d.metadata["source"] == doc.metadata["source"]
+                    )
+            # The emptied file is synced too, so its old chunks get deleted
+            assert any(s.endswith("empty.txt") for _, sources in calls for s in sources)
+            assert stats.chunks_unchanged == len(calls)
+            assert stats.chunks_deleted == 2 * len(calls)
+
+
+class TestPopulateArgs:
+    """Tests for /populate argument parsing."""
+
+    def test_defaults(self):
+        assert _parse_populate_args([]) == (".", None)
+
+    def test_workers_flag(self):
+        assert _parse_populate_args(["src", "--workers", "4"]) == ("src", 4)
+        assert _parse_populate_args(["--workers=2", "my", "dir"]) == ("my dir", 2)
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            _parse_populate_args(["--workers", "zero"])
+        with pytest.raises(ValueError):
+            _parse_populate_args(["--workers"])
@@ -90,6 +90,24 @@ class TestCLIProgress:
             progress.report_error("File not found")
             mock_print.assert_called()
 
+    def test_cli_progress_stage_metrics(self):
+        """Test CLIProgress prints the pipeline summary line."""
+        progress = CLIProgress(verbose=True)
+        metrics = Mock()
+        metrics.summary.return_value = "read 3.0/s | 4/10 units, ETA 2s"
+
+        with patch("builtins.print") as mock_print:
+            progress.report_stage_metrics(metrics)
+            assert "ETA 2s" in mock_print.call_args[0][0]
+
+    def test_cli_progress_stage_metrics_quiet(self):
+        """Test CLIProgress stays silent for metrics when not verbose."""
+        progress = CLIProgress(verbose=False)
+
+        with patch("builtins.print") as mock_print:
+            progress.report_stage_metrics(Mock())
+            mock_print.assert_not_called()
+
     def test_cli_progress_complete(self):
         """Test CLIProgress outputs completion message."""
         progress = CLIProgress(verbose=True)
@@ -213,6 +231,7 @@ class TestProgressIntegration:
             "report_progress",
             "report_error",
             "report_complete",
+            "report_stage_metrics",
         ]
 
         for cls in [CLIProgress, GUIProgress, NoOpProgress]:
@@ -226,6 +226,23 @@ class TestSpaceSwitch(unittest.TestCase):
 
         self.assertIn("Error switching space", captured.getvalue())
 
+    @patch("src.core.jobs.get_job_manager")
+    @patch("src.commands.handlers.space_commands.get_context")
+    def test_switch_space_refused_while_jobs_run(self, mock_get_ctx, mock_get_jobs):
+        """Test switching space is refused while background jobs run."""
+        mock_ctx = MagicMock()
+        mock_ctx.current_space = "default"
+        mock_get_ctx.return_value = mock_ctx
+        mock_get_jobs.return_value.active.return_value = [MagicMock(id=3)]
+
+        captured = StringIO()
+        sys.stdout = captured
+        handle_space(["switch", "project-x"])
+        sys.stdout = sys.__stdout__
+
+        self.assertIn("background jobs are running (#3)", captured.getvalue())
+        self.assertEqual(mock_ctx.current_space, "default")
+
 
 class TestSpaceDelete(unittest.TestCase):
     """Test deleting spaces."""
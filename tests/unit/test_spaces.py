@@ -38,6 +38,7 @@ from src.vectordb.spaces import (
     list_spaces,
     delete_space,
     switch_space,
+    space_change_blocker,
     save_current_space,
     load_current_space,
 )
@@ -122,6 +123,18 @@ class TestSpaceSwitching:
         assert ctx.current_space == "new_project"
         assert os.path.exists("space_settings.json")
 
+    @patch("src.core.jobs.get_job_manager")
+    def test_switch_space_refused_while_jobs_run(self, mock_get_jobs):
+        """Test that switch_space keeps the space while background jobs run."""
+        ctx = get_context()
+        ctx.vectorstore = MagicMock()
+        mock_get_jobs.return_value.active.return_value = [MagicMock(id=2)]
+
+        assert "(#2)" in space_change_blocker()
+        assert switch_space("new_project") is False
+        assert ctx.current_space == "default"
+        assert not os.path.exists("space_settings.json")
+
     def test_save_current_space(self):
         """Test persistence of space settings."""
         ctx = get_context()
@@ -0,0 +1,186 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Test suite for the rolling conversation summary (src/core/summarizer.py).
+
+Tests cover:
+- Folding trimmed turns into the summary on the worker thread
+- Keeping the previous summary when the model fails
+- Discarding updates in flight when the summary is reset
+- Transcript formatting for the summary prompt
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from src.core.context import get_context
+from src.core.summarizer import ConversationSummarizer, format_transcript
+
+
+@pytest.fixture
+def config():
+    """Summaries enabled, reusing the chat model."""
+    with patch("src.core.summarizer.get_config") as mock_config:
+        mock_config.return_value.rolling_summary = True
+        mock_config.return_value.summary_model = "qwen3-coder-30b"
+        mock_config.return_value.model_name = "qwen3-coder-30b"
+        yield mock_config.return_value
+
+
+@pytest.fixture
+def ctx(config):
+    """Application context with a mock chat model and no stored summary."""
+    context = get_context()
+    original_llm = context.llm
+    context.llm = MagicMock()
+    context.llm.invoke.return_value = AIMessage(content="User is fixing the parser.")
+    context.conversation_summary = ""
+    yield context
+    context.llm = original_llm
+    context.conversation_summary = ""
+
+
+@pytest.fixture
+def save_summary():
+    with patch("src.core.summarizer.save_summary") as mock_save:
+        yield mock_save
+
+
+@pytest.fixture
+def summarizer():
+    instance = ConversationSummarizer()
+    yield instance
+    instance.shutdown(wait=True)
+
+
+def _turns():
+    return [
+        HumanMessage(content="The parser breaks on empty files"),
+        AIMessage(content="Let me check src/parser.py"),
+    ]
+
+
+class TestConversationSummarizer:
+    def test_submit_updates_summary(self, ctx, save_summary, summarizer):
+        future = summarizer.submit(_turns())
+        future.result(timeout=5)
+
+        assert ctx.conversation_summary == "User is fixing the parser."
+        save_summary.assert_called_once_with("User is fixing the parser.")
+        prompt = ctx.llm.invoke.call_args[0][0]
+        assert "The parser breaks on empty files" in prompt[1].content
+        assert "(none)" in prompt[1].content
+
+    def test_update_builds_on_previous_summary(self, ctx, save_summary, summarizer):
+        ctx.conversation_summary = "User works on DevAssist."
+
+        summarizer.submit(_turns()).result(timeout=5)
+
+        prompt = ctx.llm.invoke.call_args[0][0]
+        assert "User works on DevAssist." in prompt[1].content
+
+    def test_submit_disabled_or_empty(self, ctx, config, save_summary, summarizer):
+        assert summarizer.submit([]) is None
+
+        config.rolling_summary = False
+        assert summarizer.submit(_turns()) is None
+
+        # Without a summary model the chat model is left to the user
+        config.rolling_summary = True
+        config.summary_model = ""
+        assert summarizer.submit(_turns()) is None
+
+        ctx.llm.invoke.assert_not_called()
+
+    def test_failure_keeps_previous_summary(self, ctx, save_summary, summarizer):
+        ctx.conversation_summary = "User works on DevAssist."
+        ctx.llm.invoke.side_effect = RuntimeError("model unloaded")
+
+        summarizer.submit(_turns()).result(timeout=5)
+
+        assert ctx.conversation_summary == "User works on DevAssist."
+        save_summary.assert_not_called()
+
+    def test_reset_discards_update_in_flight(self, ctx, save_summary, summarizer):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_invoke(prompt):
+            started.set()
+            release.wait(timeout=5)
+            return AIMessage(content="Stale summary")
+
+        ctx.llm.invoke.side_effect = slow_invoke
+        future = summarizer.submit(_turns())
+        assert started.wait(timeout=5)
+
+        summarizer.reset()
+        release.set()
+        future.result(timeout=5)
+
+        assert ctx.conversation_summary == ""
+        save_summary.assert_called_once_with("")
+
+    def test_summary_model_uses_dedicated_client(self, ctx, config, save_summary):
+        summarizer = ConversationSummarizer()
+        assert summarizer._get_llm() is ctx.llm
+
+        config.summary_model = "qwen2.5-0.5b-instruct"
+        with patch("langchain_openai.ChatOpenAI") as mock_client:
+            llm = summarizer._get_llm()
+
+        assert llm is mock_client.return_value
+        assert mock_client.call_args.kwargs["model"] == "qwen2.5-0.5b-instruct"
+
+
+class TestFormatTranscript:
+    def test_roles_and_tool_calls(self):
+        messages = [
+            HumanMessage(content="Read setup.py"),
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "read_file_content",
+                        "args": {"file_path": "setup.py"},
+                        "id": "1",
+                    }
+                ],
+            ),
+            ToolMessage(content="from setuptools import setup", tool_call_id="1"),
+        ]
+
+        transcript = format_transcript(messages)
+
+        assert "User: Read setup.py" in transcript
+        assert "Assistant called read_file_content(" in transcript
+        assert "Tool result: from setuptools import setup" in transcript
+
+    def test_long_messages_are_cut(self):
+        transcript = format_transcript(
+            [ToolMessage(content="x" * 5000, tool_call_id="1")]
+        )
+
+        assert len(transcript) < 1100
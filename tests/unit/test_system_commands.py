@@ -32,7 +32,12 @@ Tests cover:
 
 from unittest.mock import patch
 
-from src.commands.handlers.system_commands import handle_search, handle_shell
+from src.commands.handlers.system_commands import (
+    handle_jobs,
+    handle_search,
+    handle_shell,
+)
+from src.core.jobs import JobManager
 
 
 class TestSearchCommand:
@@ -317,6 +322,77 @@ class TestShellCommand:
         assert "disabled" in output.lower() or "GUI" in output
 
 
+class TestJobsCommand:
+    """Test /jobs command."""
+
+    def setup_method(self):
+        self.manager = JobManager(max_workers=1)
+        self.patcher = patch("src.core.jobs.get_job_manager", return_value=self.manager)
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+        self.manager.shutdown(wait=True)
+
+    def _finished_job(self):
+        job = self.manager.submit("/populate src", lambda: print("Indexed 3 files"))
+        self.manager.shutdown(wait=True)
+        return job
+
+    def test_jobs_empty(self, capsys):
+        handle_jobs([])
+        assert "No background jobs" in capsys.readouterr().out
+
+    def test_jobs_list(self, capsys):
+        job = self._finished_job()
+        handle_jobs([])
+        output = capsys.readouterr().out
+        assert "Background jobs (0 active)" in output
+        assert f"#{job.id}" in output
+        assert "/populate src" in output
+
+    def test_jobs_detail_shows_output(self, capsys):
+        job = self._finished_job()
+        handle_jobs([str(job.id)])
+        output = capsys.readouterr().out
+        assert "/populate src" in output
+        assert "Indexed 3 files" in output
+
+    def test_jobs_detail_unknown(self, capsys):
+        handle_jobs(["42"])
+        assert "No such job 42" in capsys.readouterr().out
+
+    def test_jobs_cancel_unknown(self, capsys):
+        handle_jobs(["cancel", "42"])
+        assert "No running or queued job #42" in capsys.readouterr().out
+
+    def test_jobs_cancel_running(self, capsys):
+        import threading
+        import time
+
+        from src.core.jobs import current_job
+
+        started = threading.Event()
+
+        def crawl():
+            started.set()
+            while not current_job().cancel_requested:
+                time.sleep(0.01)
+
+        job = self.manager.submit("/web crawl x", crawl)
+        assert started.wait(5)
+        handle_jobs(["cancel", f"#{job.id}"])
+        self.manager.shutdown(wait=True)
+        assert "Cancelling job" in capsys.readouterr().out
+        assert job.status == "cancelled"
+
+    def test_jobs_bad_usage(self, capsys):
+        handle_jobs(["cancel"])
+        assert "Usage: /jobs cancel <id>" in capsys.readouterr().out
+        handle_jobs(["bogus"])
+        assert "Usage: /jobs" in capsys.readouterr().out
+
+
 class TestSystemCommandAliases:
     """Test command aliases."""
 
@@ -0,0 +1,145 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Test suite for large tool output storage (src/storage/tool_outputs.py)
+and the read_tool_output tool.
+
+Tests cover:
+- Replacing large result fields with a head/tail preview and a handle
+- Paging through stored outputs
+- Size-bounded eviction and unknown handles
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.storage.tool_outputs import (
+    ToolOutputStore,
+    compact_tool_result,
+    get_tool_output_store,
+    preview,
+)
+from src.tools.executors.output_tools import execute_read_tool_output
+
+
+@pytest.fixture(autouse=True)
+def store():
+    """Start each test with an empty session store."""
+    get_tool_output_store().clear()
+    yield get_tool_output_store()
+    get_tool_output_store().clear()
+
+
+def _handle(preview_text: str) -> str:
+    return preview_text.split("handle='")[1].split("'")[0]
+
+
+class TestCompactToolResult:
+    def test_large_field_is_stored_and_previewed(self, store):
+        diff = "".join(f"line {i}\n" for i in range(2000))
+        result = {"success": True, "diff": diff, "files": 3}
+
+        compacted = compact_tool_result("git_diff", result)
+
+        assert compacted["files"] == 3
+        assert len(compacted["diff"]) < 2500
+        assert compacted["diff"].startswith("line 0\n")
+        assert compacted["diff"].endswith("line 1999\n")
+        assert "read_tool_output" in compacted["diff"]
+        assert result["diff"] == diff  # Original result is not modified
+        assert store.read(_handle(compacted["diff"]), 0, len(diff))[1] == len(diff)
+
+    def test_preview_fits_small_inline_limit(self, store):
+        output = "#" * 1700
+        with patch("src.storage.tool_outputs.get_config") as mock_config:
+            mock_config.return_value.tool_output_inline_chars = 400
+            compacted = compact_tool_result("shell_execute", {"stdout": output})
+
+        text = compacted["stdout"]
+        assert "[... 1300 of 1700 characters omitted." in text
+        assert text.count("#") == 400
+
+    def test_preview_of_short_text_does_not_overlap(self):
+        text = preview("abcdef", "h-1")
+        assert text.startswith("abcdef\n\n[... 0 of 6 characters omitted.")
+        assert text.count("abcdef") == 1
+
+    def test_small_results_are_unchanged(self):
+        result = {"success": True, "stdout": "ok"}
+
+        assert compact_tool_result("shell_execute", result) is result
+        assert compact_tool_result("shell_execute", "not a dict") == "not a dict"
+
+    def test_disabled_or_paging_tool(self):
+        result = {"success": True, "content": "x" * 10000}
+
+        assert compact_tool_result("read_tool_output", result) is result
+        with patch("src.storage.tool_outputs.get_config") as mock_config:
+            mock_config.return_value.tool_output_inline_chars = 0
+            assert compact_tool_result("read_file_content", result) is result
+
+
+class TestToolOutputStore:
+    def test_oldest_outputs_are_evicted(self):
+        store = ToolOutputStore(max_chars=100)
+        first = store.put("a" * 60)
+        second = store.put("b" * 60)
+
+        assert store.read(first) is None
+        assert store.read(second) == ("b" * 60, 60)
+        assert store.stats() == {"outputs": 1, "chars": 60}
+
+    def test_output_larger_than_store_is_kept(self):
+        store = ToolOutputStore(max_chars=10)
+        handle = store.put("x" * 50, "shell_execute")
+
+        assert handle.startswith("shell_execute-")
+        assert store.read(handle, 40, 100) == ("x" * 10, 50)
+
+
+class TestReadToolOutput:
+    def test_pages_through_output(self, store):
+        handle = store.put("0123456789" * 3)
+
+        first = execute_read_tool_output(handle, 0, 25)
+        rest = execute_read_tool_output(handle, first["next_offset"], 25)
+
+        assert first["success"] is True
+        assert first["content"] == ("0123456789" * 3)[:25]
+        assert first["next_offset"] == 25
+        assert rest["content"] == "56789"
+        assert rest["next_offset"] is None
+        assert rest["total_chars"] == 30
+
+    def test_page_length_is_capped(self, store):
+        handle = store.put("x" * 20000)
+
+        page = execute_read_tool_output(handle, 0, 100000)
+
+        assert len(page["content"]) == 8000
+
+    def test_unknown_handle(self):
+        result = execute_read_tool_output("git_diff-999")
+
+        assert "error" in result
+        assert "Run the original tool again" in result["error"]
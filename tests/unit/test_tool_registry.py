@@ -33,7 +33,12 @@ Tests cover:
 - Registry introspection methods
 """
 
+import copy
+import json
+import pickle
 from unittest.mock import patch, Mock
+
+import pytest
 from src.tools.registry import ToolRegistry, register_tool
 
 
@@ -109,6 +114,146 @@ class TestToolRegistration:
         assert len(ToolRegistry.get_tool_names()) == 2
 
 
+class TestReadOnlyTools:
+    """Test read-only flags and concurrency limits."""
+
+    def setup_method(self):
+        ToolRegistry.clear()
+
+    def teardown_method(self):
+        ToolRegistry.clear()
+
+    def test_read_only_flag(self):
+        @ToolRegistry.register("reader", read_only=True)
+        def execute_reader() -> dict:
+            return {}
+
+        @ToolRegistry.register("writer")
+        def execute_writer() -> dict:
+            return {}
+
+        assert ToolRegistry.is_read_only("reader")
+        assert not ToolRegistry.is_read_only("writer")
+        assert not ToolRegistry.is_read_only("unknown")
+
+    def test_reregister_without_flag_clears_it(self):
+        ToolRegistry.register_dynamic("tool", {}, lambda: {}, read_only=True)
+        assert ToolRegistry.is_read_only("tool")
+        ToolRegistry.register_dynamic("tool", {}, lambda: {})
+        assert not ToolRegistry.is_read_only("tool")
+
+    def test_concurrency_limit(self):
+        ToolRegistry.register("reader", read_only=True)(lambda: {})
+        ToolRegistry.register("search_web", read_only=True)(lambda: {})
+        ToolRegistry.register("writer")(lambda: {})
+
+        with patch.dict(
+            "src.core.constants.TOOL_CONCURRENCY_LIMITS", {"search_web": 2}, clear=True
+        ), patch("src.core.constants.TOOL_PARALLEL_WORKERS", 4):
+            assert ToolRegistry.concurrency_limit("reader") == 4
+            assert ToolRegistry.concurrency_limit("search_web") == 2
+            assert ToolRegistry.concurrency_limit("writer") == 1
+
+
+class TestDefinitionSnapshot:
+    """Test the version counter and cached definition snapshots."""
+
+    def setup_method(self):
+        ToolRegistry.clear()
+
+    def teardown_method(self):
+        ToolRegistry.clear()
+
+    def test_version_bumped_on_changes(self):
+        version = ToolRegistry.version()
+        ToolRegistry.register("test_tool", SAMPLE_TOOL_DEFINITION)(lambda arg1: {})
+        assert ToolRegistry.version() == version + 1
+        ToolRegistry.register_dynamic("dyn", SAMPLE_TOOL_DEFINITION, lambda: {})
+        assert ToolRegistry.version() == version + 2
+        ToolRegistry.clear()
+        assert ToolRegistry.version() == version + 3
+
+    def test_snapshot_cached_per_version(self):
+        ToolRegistry.register("test_tool", SAMPLE_TOOL_DEFINITION)(lambda arg1: {})
+        first = ToolRegistry.get_definitions_snapshot()
+        assert ToolRegistry.get_definitions_snapshot() is first
+        assert first[0]["function"]["name"] == "test_tool"
+        assert first[0]["function"]["parameters"]["required"] == ("arg1",)
+
+        ToolRegistry.register_dynamic("dyn", SAMPLE_TOOL_DEFINITION, lambda: {})
+        second = ToolRegistry.get_definitions_snapshot()
+        assert second is not first
+        assert len(second) == 2
+
+    def test_snapshot_is_immutable(self):
+        ToolRegistry.register("test_tool", SAMPLE_TOOL_DEFINITION)(lambda arg1: {})
+        snapshot = ToolRegistry.get_definitions_snapshot()
+
+        with pytest.raises(TypeError):
+            snapshot[0]["type"] = "other"
+        with pytest.raises(TypeError):
+            snapshot[0]["function"].update(name="other")
+        assert SAMPLE_TOOL_DEFINITION["function"]["name"] == "test_tool"
+
+    def test_snapshot_copies_are_plain_dicts(self):
+        ToolRegistry.register("test_tool", SAMPLE_TOOL_DEFINITION)(lambda arg1: {})
+        definition = ToolRegistry.get_definitions_snapshot()[0]
+
+        for clone in (
+            copy.copy(definition),
+            copy.deepcopy(definition),
+            pickle.loads(pickle.dumps(definition)),
+        ):
+            assert clone == definition
+            clone["type"] = "other"  # Copies are mutable
+        assert copy.deepcopy(definition)["function"]["name"] == "test_tool"
+        assert definition["type"] == "function"
+
+
+class TestManifest:
+    """Test the system prompt tool manifest."""
+
+    def setup_method(self):
+        ToolRegistry.clear()
+        ToolRegistry.register("test_tool", SAMPLE_TOOL_DEFINITION)(lambda arg1: {})
+        definition = {
+            "type": "function",
+            "function": {
+                "name": "other_tool",
+                "description": "Does a thing.  Second sentence here.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {"path": {}, "limit": {}},
+                    "required": ["path"],
+                },
+            },
+        }
+        ToolRegistry.register("other_tool", definition)(lambda path, limit=0: {})
+
+    def teardown_method(self):
+        ToolRegistry.clear()
+
+    def test_compact_manifest(self):
+        manifest = ToolRegistry.get_manifest("compact")
+        assert manifest.splitlines() == [
+            "- test_tool(arg1): A test tool",
+            "- other_tool(path, limit?): Does a thing",
+        ]
+
+    def test_manifest_of_selected_tools(self):
+        manifest = ToolRegistry.get_manifest("compact", ["other_tool", "missing"])
+        assert manifest == "- other_tool(path, limit?): Does a thing"
+
+    def test_full_manifest_is_json(self):
+        manifest = ToolRegistry.get_manifest("full")
+        assert json.loads(manifest)[0] == SAMPLE_TOOL_DEFINITION
+
+    def test_no_manifest(self):
+        assert ToolRegistry.get_manifest("none") == ""
+        ToolRegistry.clear()
+        assert ToolRegistry.get_manifest("compact") == ""
+
+
 class TestToolExecution:
     """Test tool execution and dispatch."""
 
@@ -176,6 +321,29 @@ class TestToolExecution:
 
         assert "error" in result
 
+    def test_execute_without_rate_limit(self):
+        """Test that rate_limit=False leaves the slot to acquire_rate_limit()."""
+        from src.security.rate_limiter import RateLimitManager, RateLimiter
+
+        @ToolRegistry.register("limited_tool")
+        def execute_limited() -> dict:
+            return {"success": True}
+
+        RateLimitManager.reset_all()
+        manager = RateLimitManager()
+        with manager.lock:
+            manager.limiters["limited_tool"] = RateLimiter(max_calls=1, period_seconds=60)
+        try:
+            assert ToolRegistry.execute("limited_tool", {}, rate_limit=False) == {
+                "success": True
+            }
+            assert ToolRegistry.acquire_rate_limit("limited_tool") is None
+            result = ToolRegistry.acquire_rate_limit("limited_tool")
+            assert "Rate limit exceeded" in result["error"]
+            assert "Rate limit exceeded" in ToolRegistry.execute("limited_tool", {})["error"]
+        finally:
+            RateLimitManager.reset_all()
+
 
 class TestToolCallExecution:
     """Test LLM tool call handling."""
@@ -0,0 +1,126 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Test suite for the embedding tool router (src/tools/router.py).
+
+Tests cover:
+- Top-N selection by similarity plus the always-bound core tools
+- Catalog embeddings cached until the registry version changes
+- Falling back to the full catalog (small catalog, no embeddings)
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.tools.registry import ToolRegistry
+from src.tools.router import ToolRouter
+
+# One embedding axis per topic keeps the similarities easy to reason about
+TOOL_VECTORS = {
+    "git_log": [1.0, 0.0, 0.0],
+    "git_diff": [0.9, 0.1, 0.0],
+    "search_web": [0.0, 1.0, 0.0],
+    "read_file_content": [0.0, 0.0, 1.0],
+    "jira_create": [0.0, 0.7, 0.7],
+}
+
+
+def _definition(name: str) -> dict:
+    return {
+        "type": "function",
+        "function": {"name": name, "description": f"The {name} tool"},
+    }
+
+
+@pytest.fixture
+def registry():
+    """Registry holding the TOOL_VECTORS tools."""
+    ToolRegistry.clear()
+    for name in TOOL_VECTORS:
+        ToolRegistry.register_dynamic(name, _definition(name), lambda: {})
+    yield
+    ToolRegistry.clear()
+
+
+@pytest.fixture
+def embeddings():
+    """Patch the embedding helpers; the tool text starts with its name."""
+
+    def embed_batch(texts):
+        return [TOOL_VECTORS[text.split(":")[0]] for text in texts]
+
+    with patch(
+        "src.core.context_utils._generate_embeddings_batch", side_effect=embed_batch
+    ) as batch, patch(
+        "src.core.context_utils._generate_query_embedding",
+        return_value=[1.0, 0.05, 0.0],
+    ) as query:
+        yield batch, query
+
+
+class TestToolRouter:
+    """Test tool selection."""
+
+    def test_selects_top_n_and_core_tools(self, registry, embeddings):
+        router = ToolRouter(top_n=2, core_tools=["read_file_content"], min_tools=1)
+
+        selected = router.select("show me the last commits")
+
+        # Registry order, not similarity order
+        assert selected == ["git_log", "git_diff", "read_file_content"]
+
+    def test_catalog_embedded_once_per_version(self, registry, embeddings):
+        batch, _ = embeddings
+        router = ToolRouter(top_n=1, core_tools=[], min_tools=1)
+
+        router.select("commits")
+        router.select("more commits")
+        assert batch.call_count == 1
+
+        ToolRegistry.register_dynamic(
+            "git_log", _definition("git_log"), lambda: {}, read_only=True
+        )
+        router.select("commits")
+        assert batch.call_count == 2
+
+    def test_small_catalog_binds_everything(self, registry, embeddings):
+        batch, _ = embeddings
+        router = ToolRouter(min_tools=len(TOOL_VECTORS) + 1)
+
+        assert router.select("commits") is None
+        batch.assert_not_called()
+
+    def test_embeddings_unavailable(self, registry, embeddings):
+        batch, query = embeddings
+        router = ToolRouter(min_tools=1)
+
+        batch.side_effect = None
+        batch.return_value = None
+        assert router.select("commits") is None
+
+        batch.side_effect = lambda texts: [TOOL_VECTORS[t.split(":")[0]] for t in texts]
+        query.return_value = None
+        assert router.select("commits") is None
+
+    def test_empty_query_binds_everything(self, registry, embeddings):
+        assert ToolRouter(min_tools=1).select("   ") is None
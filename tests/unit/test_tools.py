@@ -49,6 +49,8 @@ from src.tools.executors.file_tools import (
     execute_list_directory,
     execute_get_current_directory,
 )
+from src.learning.converter_pool import ConvertedDocument
+from src.core.constants import DOC_PARSE_MAX_PAGES
 from src.tools.executors.document_tools import execute_parse_document
 from src.tools.executors.knowledge_tools import (
     execute_learn_information,
@@ -181,15 +183,21 @@ class TestFileSystemTools:
         # Mock directory entries
         mock_entry1 = MagicMock()
         mock_entry1.name = "file1.txt"
+        mock_entry1.path = "/tmp/test_dir/file1.txt"
         mock_entry1.is_file.return_value = True
+        mock_entry1.is_dir.return_value = False
 
         mock_entry2 = MagicMock()
         mock_entry2.name = "file2.py"
+        mock_entry2.path = "/tmp/test_dir/file2.py"
         mock_entry2.is_file.return_value = True
+        mock_entry2.is_dir.return_value = False
 
         mock_entry3 = MagicMock()
         mock_entry3.name = "subdir"
+        mock_entry3.path = "/tmp/test_dir/subdir"
         mock_entry3.is_file.return_value = False
+        mock_entry3.is_dir.return_value = True
 
         mock_scandir.return_value = [mock_entry1, mock_entry2, mock_entry3]
 
@@ -345,10 +353,10 @@ class TestFileSystemTools:
     @patch("src.tools.executors.file_tools.validate_path")
     @patch("os.path.exists")
     @patch("os.path.isdir")
-    @patch("os.listdir", side_effect=Exception("Permission denied"))
+    @patch("os.scandir", side_effect=PermissionError("Permission denied"))
     def test_list_directory_exception(
         self,
-        mock_listdir,
+        mock_scandir,
         mock_isdir,
         mock_exists,
         mock_validate_path,
@@ -380,32 +388,156 @@ class TestDocumentProcessingTools:
     @patch("os.path.abspath")
     @patch("os.getcwd")
     @patch("os.path.exists")
-    @patch("docling.document_converter.DocumentConverter")
+    @patch("src.tools.executors.document_tools.convert_document")
     def test_parse_document_success(
-        self, mock_converter, mock_exists, mock_getcwd, mock_abspath
+        self, mock_convert, mock_exists, mock_getcwd, mock_abspath
     ):
         """Test successful document parsing."""
         mock_getcwd.return_value = "/tmp"
         mock_abspath.return_value = "/tmp/test.pdf"
         mock_exists.return_value = True
 
-        # Mock the Docling converter
-        mock_instance = MagicMock()
-        mock_instance.convert.return_value = MagicMock()
-        mock_instance.convert.return_value.document.export_to_markdown.return_value = (
-            "# Test Document\nContent"
+        # Mock the pooled Docling conversion
+        mock_convert.return_value = ConvertedDocument(
+            "/tmp/test.pdf", "# Test Document\nContent"
         )
-        mock_converter.return_value = mock_instance
 
         result = execute_parse_document("test.pdf", "text")
 
         assert result["success"] is True
         assert "Test Document" in result["content"]
+        mock_convert.assert_called_once_with("/tmp/test.pdf", "auto", None)
+        assert result["tier"] == "accurate"
+        assert "elapsed_seconds" in result
+        assert result["from_cache"] is False
+
+    @patch("os.path.abspath", return_value="/tmp/test.pdf")
+    @patch("os.getcwd", return_value="/tmp")
+    @patch("os.path.exists", return_value=True)
+    @patch("src.tools.executors.document_tools.convert_document")
+    def test_parse_document_reports_cache_hit(self, mock_convert, *_):
+        """Test that conversions served from the cache are reported as such."""
+        mock_convert.return_value = ConvertedDocument(
+            "/tmp/test.pdf", "# Cached", elapsed=0.002, cached=True, tier="fast"
+        )
+
+        result = execute_parse_document("test.pdf")
+
+        assert result["from_cache"] is True
+        assert result["tier"] == "fast"
+
+    @patch("os.path.abspath", return_value="/tmp/big.pdf")
+    @patch("os.getcwd", return_value="/tmp")
+    @patch("os.path.exists", return_value=True)
+    @patch("src.tools.executors.document_tools.count_pages", return_value=120)
+    @patch("src.tools.executors.document_tools.convert_document")
+    def test_parse_document_page_range(self, mock_convert, *_):
+        """Test that only the requested pages are converted."""
+        mock_convert.return_value = ConvertedDocument(
+            "/tmp/big.pdf", "page ten", pages=11, first_page=10
+        )
+
+        result = execute_parse_document("big.pdf", pages="10-20")
+
+        assert result["success"] is True
+        mock_convert.assert_called_once_with("/tmp/big.pdf", "auto", (10, 20))
+        assert result["page_range"] == "10-20"
+        assert result["total_pages"] == 120
+        assert "truncated" not in result
+
+    @patch("os.path.abspath", return_value="/tmp/deck.pptx")
+    @patch("os.getcwd", return_value="/tmp")
+    @patch("os.path.exists", return_value=True)
+    @patch("src.tools.executors.document_tools.convert_document")
+    def test_parse_document_slide_range_reports_converted_slides(
+        self, mock_convert, *_
+    ):
+        """Test that a slide range past the last slide reports the slides found."""
+        mock_convert.return_value = ConvertedDocument(
+            "/tmp/deck.pptx", "## Slide 3", pages=2, first_page=3
+        )
+
+        result = execute_parse_document("deck.pptx", pages="3-10")
+
+        mock_convert.assert_called_once_with("/tmp/deck.pptx", "auto", (3, 10))
+        assert result["page_range"] == "3-4"
+
+    @patch("os.path.abspath", return_value="/tmp/report.docx")
+    @patch("os.getcwd", return_value="/tmp")
+    @patch("os.path.exists", return_value=True)
+    @patch("src.tools.executors.document_tools.convert_document")
+    def test_parse_document_pages_need_paged_format(self, mock_convert, *_):
+        """Test that a page range is refused for formats without pages."""
+        result = execute_parse_document("report.docx", pages="2-3")
+
+        assert "error" in result
+        assert "not supported for .docx files" in result["error"]
+        mock_convert.assert_not_called()
+
+    @patch("os.path.abspath", return_value="/tmp/big.pdf")
+    @patch("os.getcwd", return_value="/tmp")
+    @patch("os.path.exists", return_value=True)
+    @patch("src.tools.executors.document_tools.count_pages", return_value=120)
+    @patch("src.tools.executors.document_tools.convert_document")
+    def test_parse_document_invalid_page_range(self, mock_convert, *_):
+        """Test that a malformed or out-of-range page range is an error."""
+        result = execute_parse_document("big.pdf", pages="200-210")
+
+        assert "error" in result
+        assert "beyond the last page" in result["error"]
+        mock_convert.assert_not_called()
+
+    @patch("os.path.abspath", return_value="/tmp/big.pdf")
+    @patch("os.getcwd", return_value="/tmp")
+    @patch("os.path.exists", return_value=True)
+    @patch("src.tools.executors.document_tools.count_pages", return_value=120)
+    @patch("src.tools.executors.document_tools.document_outline")
+    @patch("src.tools.executors.document_tools.convert_document")
+    def test_parse_document_large_pdf_truncated(
+        self, mock_convert, mock_outline, *_
+    ):
+        """Test that large PDFs return their first pages plus the outline."""
+        from src.learning.fast_extract import OutlineEntry
+
+        mock_convert.return_value = ConvertedDocument("/tmp/big.pdf", "intro")
+        mock_outline.return_value = [OutlineEntry(1, "Intro", 1)]
+
+        result = execute_parse_document("big.pdf")
+
+        mock_convert.assert_called_once_with(
+            "/tmp/big.pdf", "auto", (1, DOC_PARSE_MAX_PAGES)
+        )
+        assert result["truncated"] is True
+        assert result["outline"] == [{"level": 1, "title": "Intro", "page": 1}]
+        assert f"1-{DOC_PARSE_MAX_PAGES} of 120" in result["note"]
+
+    @patch("os.path.abspath", return_value="/tmp/big.pdf")
+    @patch("os.getcwd", return_value="/tmp")
+    @patch("os.path.exists", return_value=True)
+    @patch("src.tools.executors.document_tools.count_pages", return_value=120)
+    @patch("src.tools.executors.document_tools.document_outline")
+    @patch("src.tools.executors.document_tools.convert_document")
+    def test_parse_document_outline_only(self, mock_convert, mock_outline, *_):
+        """Test that outline=True returns headings without converting."""
+        from src.learning.fast_extract import OutlineEntry
+
+        mock_outline.return_value = [
+            OutlineEntry(1, "Intro", 1),
+            OutlineEntry(2, "Setup", 14),
+        ]
+
+        result = execute_parse_document("big.pdf", outline=True)
+
+        assert result["success"] is True
+        assert result["total_pages"] == 120
+        assert [entry["page"] for entry in result["outline"]] == [1, 14]
+        assert "content" not in result
+        mock_convert.assert_not_called()
 
-    @patch("docling.document_converter.DocumentConverter")
-    def test_parse_document_failure(self, mock_converter):
+    @patch("src.tools.executors.document_tools.convert_document")
+    def test_parse_document_failure(self, mock_convert):
         """Test document parsing failure."""
-        mock_converter.side_effect = Exception("Parse error")
+        mock_convert.side_effect = Exception("Parse error")
 
         result = execute_parse_document("corrupt.pdf", "text")
 
@@ -470,19 +602,17 @@ class TestDocumentProcessingTools:
     @patch("os.getcwd")
     @patch("os.path.abspath")
     @patch("os.path.exists")
-    @patch("docling.document_converter.DocumentConverter")
+    @patch("src.tools.executors.document_tools.convert_document")
     def test_parse_document_docling_processing_error(
-        self, mock_converter, mock_exists, mock_abspath, mock_getcwd
+        self, mock_convert, mock_exists, mock_abspath, mock_getcwd
     ):
         """Test Exception during docling processing."""
         mock_getcwd.return_value = "/tmp"
         mock_abspath.return_value = "/tmp/bad.pdf"
         mock_exists.return_value = True
 
-        # Mock converter to raise exception during processing
-        mock_instance = MagicMock()
-        mock_instance.convert.side_effect = Exception("Corrupted document")
-        mock_converter.return_value = mock_instance
+        # Mock conversion to raise exception during processing
+        mock_convert.side_effect = Exception("Corrupted document")
 
         result = execute_parse_document("bad.pdf")
 
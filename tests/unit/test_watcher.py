@@ -0,0 +1,234 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for the filesystem watcher (src/learning/watcher.py).
+
+Tests cover:
+- Snapshot diffing for the polling backend
+- Ignore filtering and per-path debouncing
+- Incremental ingestion of changed and deleted files
+- Holding changes while another space is active
+- The /watch command
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.core.context import get_context, reset_context
+from src.core.context_utils import ChunkSyncResult
+from src.learning.watcher import WatchService, diff_snapshots, snapshot_tree
+
+FAR_FUTURE = 1_000.0
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Small project with an ignored directory."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("def main():\n    return 1\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "lib.js").write_text("x = 1\n")
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    reset_context()
+    yield tmp_path
+    reset_context()
+
+
+@pytest.fixture
+def service():
+    """Watcher that never dispatches on its own (long debounce/poll)."""
+    svc = WatchService(debounce=100.0, poll_interval=100.0, max_workers=1)
+    yield svc
+    svc.stop()
+
+
+def _drain(svc: WatchService, timeout: float = 5.0) -> None:
+    deadline = time.time() + timeout
+    while svc.status().in_progress and time.time() < deadline:
+        time.sleep(0.01)
+
+
+class TestSnapshots:
+    """Tests for the polling backend's change detection."""
+
+    def test_snapshot_skips_ignored(self, tree):
+        snapshot = snapshot_tree(str(tree))
+        assert set(snapshot) == {str(tree / "src" / "app.py")}
+
+    def test_diff_detects_add_modify_delete(self):
+        old = {"a": (1, 1), "b": (1, 1), "c": (1, 1)}
+        new = {"a": (1, 1), "b": (2, 1), "d": (1, 1)}
+        assert diff_snapshots(old, new) == {"b", "c", "d"}
+
+
+class TestWatchService:
+    """Tests for event handling and ingestion."""
+
+    def test_start_requires_directory(self, service):
+        assert service.start(["/nonexistent/watch/dir"]) is False
+        assert not service.is_running()
+
+    def test_notify_filters_ignored_paths(self, service, tree):
+        assert service.start([str(tree)], backend="polling")
+
+        accepted = service.notify(
+            [
+                str(tree / "src" / "app.py"),
+                str(tree / "node_modules" / "lib.js"),
+                str(tree / "debug.log"),
+                "/outside/file.py",
+            ]
+        )
+
+        assert accepted == 1
+        assert service.status().pending == 1
+
+    def test_debounce_coalesces_events(self, service, tree):
+        service.start([str(tree)], backend="polling")
+        path = str(tree / "src" / "app.py")
+        for _ in range(5):
+            service.notify([path])
+
+        assert service.status().pending == 1
+        assert service.dispatch_ready() == []
+
+    @patch("src.core.context_utils.sync_documents_to_knowledge_base")
+    def test_changed_file_is_synced(self, mock_sync, service, tree):
+        mock_sync.return_value = ChunkSyncResult(added=1)
+        service.start([str(tree)], backend="polling")
+        path = str(tree / "src" / "app.py")
+        service.notify([path])
+
+        assert service.dispatch_ready(now=time.monotonic() + FAR_FUTURE) == [path]
+        _drain(service)
+
+        (documents,) = mock_sync.call_args[0]
+        assert mock_sync.call_args[1]["sources"] == [path]
+        assert documents[0].metadata["relative_path"] == os.path.join("src", "app.py")
+        status = service.status()
+        assert status.files_synced == 1
+        assert status.chunks_added == 1
+        assert status.pending == 0
+
+    @patch("src.core.context_utils.sync_documents_to_knowledge_base")
+    def test_deleted_file_removes_chunks(self, mock_sync, service, tree):
+        mock_sync.return_value = ChunkSyncResult(deleted=2)
+        service.start([str(tree)], backend="polling")
+        path = tree / "src" / "app.py"
+        path.unlink()
+        service.notify([str(path)])
+
+        service.dispatch_ready(now=time.monotonic() + FAR_FUTURE)
+        _drain(service)
+
+        mock_sync.assert_called_once_with([], sources=[str(path)])
+        assert service.status().files_removed == 1
+        assert service.status().chunks_deleted == 2
+
+    def test_other_space_holds_changes(self, service, tree):
+        service.start([str(tree)], space="work", backend="polling")
+        service.notify([str(tree / "src" / "app.py")])
+
+        assert service.status().paused
+        assert service.dispatch_ready(now=time.monotonic() + FAR_FUTURE) == []
+        assert service.status().pending == 1
+
+    @patch("src.core.context_utils.sync_documents_to_knowledge_base")
+    def test_space_switch_after_dispatch_requeues(self, mock_sync, service, tree):
+        service.start([str(tree)], backend="polling")
+        path = str(tree / "src" / "app.py")
+        get_context().current_space = "other"
+
+        service._ingest_path(path)
+
+        mock_sync.assert_not_called()
+        status = service.status()
+        assert status.pending == 1
+        assert status.in_progress == 0
+        assert status.files_synced == 0
+
+    @patch("src.core.context_utils.sync_documents_to_knowledge_base")
+    def test_polling_backend_end_to_end(self, mock_sync, tree):
+        mock_sync.return_value = ChunkSyncResult(added=1)
+        svc = WatchService(debounce=0.05, poll_interval=0.05, max_workers=1)
+        try:
+            svc.start([str(tree)], backend="polling")
+            time.sleep(0.1)
+            (tree / "src" / "new.py").write_text("x = 2\n")
+
+            deadline = time.time() + 5
+            while not svc.status().files_synced and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            svc.stop()
+
+        assert svc.status().files_synced == 1
+        assert mock_sync.call_args[1]["sources"] == [str(tree / "src" / "new.py")]
+        assert not svc.is_running()
+
+
+class TestWatchCommand:
+    """Tests for the /watch command."""
+
+    @pytest.fixture
+    def mock_service(self):
+        with patch("src.learning.watcher.get_watch_service") as mock_get:
+            yield mock_get.return_value
+
+    def test_status_not_running(self, mock_service, capsys):
+        from src.commands.handlers.learning_commands import handle_watch
+
+        mock_service.status.return_value.running = False
+        handle_watch(["status"])
+        assert "not running" in capsys.readouterr().out
+
+    def test_start_missing_directory(self, mock_service, capsys):
+        from src.commands.handlers.learning_commands import handle_watch
+
+        mock_service.is_running.return_value = False
+        handle_watch(["start", "/nonexistent/watch/dir"])
+        assert "Not a directory" in capsys.readouterr().out
+        mock_service.start.assert_not_called()
+
+    def test_start_and_stop(self, mock_service, tree, capsys):
+        from src.commands.handlers.learning_commands import handle_watch
+
+        get_context().embeddings = object()
+        mock_service.is_running.return_value = False
+        mock_service.status.return_value.roots = [str(tree)]
+        handle_watch(["start", str(tree)])
+        mock_service.start.assert_called_once_with([str(tree)])
+        assert "Watching" in capsys.readouterr().out
+
+        mock_service.is_running.return_value = True
+        handle_watch(["stop"])
+        mock_service.stop.assert_called_once()
+
+    def test_usage(self, mock_service, capsys):
+        from src.commands.handlers.learning_commands import handle_watch
+
+        handle_watch(["bogus"])
+        assert "Usage: /watch" in capsys.readouterr().out
@@ -0,0 +1,308 @@
+# MIT License
+#
+# Copyright (c) 2025 BlackcoinDev
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Test suite for web crawl ingestion (src/learning/web_crawler.py).
+
+Tests cover:
+- HTML to markdown conversion and link normalisation
+- Same-origin, robots.txt and sitemap scoping against a local HTTP server
+- Conditional GETs: unchanged pages are not re-ingested on a re-crawl
+- Removal of pages that disappeared
+- /web crawl argument parsing
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src.core.context import get_context
+from src.core.context_utils import ChunkSyncPlan, ChunkSyncResult
+from src.learning.web_crawler import (
+    WebCrawler,
+    html_to_text,
+    load_page_cache,
+    normalize_url,
+)
+
+# Every test gets an in-memory database (page cache, checkpoints)
+pytestmark = pytest.mark.usefixtures("memory_db")
+
+
+def _page(title: str, body: str, links=()) -> str:
+    anchors = "".join(f'<a href="{link}">{link}</a>' for link in links)
+    return (
+        f"<html><head><title>{title}</title></head>"
+        f"<body><h1>{title}</h1><p>{body}</p>{anchors}</body></html>"
+    )
+
+
+class Site:
+    """Pages served by the local test server, keyed by path."""
+
+    def __init__(self):
+        self.pages = {
+            "/": _page(
+                "Home", "Welcome.", ["/guide", "/private/x", "https://other.example/"]
+            ),
+            "/guide": _page("Guide", "How to use it.", ["/guide/deep"]),
+            "/guide/deep": _page("Deep", "Two hops away."),
+            "/private/x": _page("Private", "Hidden."),
+            "/orphan": _page("Orphan", "Only in the sitemap."),
+        }
+        self.robots = "User-agent: *\nDisallow: /private/\n"
+        self.robots_status = 200
+        self.sitemap = ""
+        self.requests = []
+        self.not_modified = []
+
+    def etag(self, path: str) -> str:
+        return f'"{hash(self.pages[path]) & 0xFFFFFFFF:x}"'
+
+
+@pytest.fixture
+def site():
+    """Serve a Site on a local port for the duration of a test."""
+    state = Site()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body=b"", content_type="text/html", headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            state.requests.append(self.path)
+            if self.path == "/robots.txt":
+                self._send(state.robots_status, state.robots.encode(), "text/plain")
+            elif self.path == "/sitemap.xml":
+                if state.sitemap:
+                    self._send(200, state.sitemap.encode(), "application/xml")
+                else:
+                    self._send(404)
+            elif self.path in state.pages:
+                etag = state.etag(self.path)
+                if self.headers.get("If-None-Match") == etag:
+                    state.not_modified.append(self.path)
+                    self._send(304)
+                else:
+                    body = state.pages[self.path].encode()
+                    self._send(200, body, "text/html; charset=utf-8", {"ETag": etag})
+            else:
+                self._send(404)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.base = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def store():
+    """Patch the knowledge base calls; records the sources of every synced batch."""
+    synced = []
+
+    def fake_plan(documents, sources):
+        synced.extend(sources)
+        return ChunkSyncPlan(
+            "collection",
+            "default",
+            new_docs=list(documents),
+            stale_ids=[] if documents else ["stale"],
+        )
+
+    with patch("src.learning.pipeline.plan_chunk_sync", side_effect=fake_plan), patch(
+        "src.learning.pipeline.embed_chunk_sync_plan", return_value=True
+    ), patch(
+        "src.learning.pipeline.write_chunk_sync_plan",
+        side_effect=lambda plan: ChunkSyncResult(
+            added=len(plan.new_docs), deleted=len(plan.stale_ids)
+        ),
+    ):
+        yield synced
+
+
+def _paths(site: Site, urls) -> set:
+    return {url[len(site.base) :] for url in urls}  # noqa: E203
+
+
+class TestHtmlToText:
+    """Test the HTML converter."""
+
+    def test_headings_lists_and_code(self):
+        title, text, links = html_to_text(
+            "<html><head><title>T</title><style>p{}</style></head><body>"
+            "<h2>Setup</h2><p>Run <code>make</code>\n now.</p>"
+            "<ul><li>one</li><li><a href='/two'>two</a></li></ul>"
+            "<pre>x = 1\n    y = 2</pre><script>alert(1)</script></body></html>"
+        )
+        assert title == "T"
+        assert "## Setup" in text
+        assert "Run make now." in text
+        assert "- one" in text
+        assert "    y = 2" in text
+        assert "alert" not in text and "p{}" not in text
+        assert links == ["/two"]
+
+    def test_normalize_url(self):
+        assert normalize_url("/a#frag", "http://x.test/b/") == "http://x.test/a"
+        assert normalize_url("c", "http://x.test/b/") == "http://x.test/b/c"
+        assert normalize_url("http://x.test") == "http://x.test/"
+        assert normalize_url("mailto:me@x.test") is None
+
+
+class TestWebCrawler:
+    """Test crawling a local site."""
+
+    def test_rejects_non_http_url(self):
+        with pytest.raises(ValueError):
+            WebCrawler("ftp://example.com/")
+
+    def test_depth_origin_and_robots(self, site, store):
+        stats = WebCrawler(site.base + "/", depth=1, use_sitemap=False).run()
+
+        assert _paths(site, store) == {"/", "/guide"}
+        assert stats.pages_ingested == 2
+        assert stats.blocked_by_robots == 1
+        assert "/private/x" not in site.requests
+        assert "/guide/deep" not in site.requests
+
+    @pytest.mark.parametrize("status, ingested", [(403, 0), (401, 0), (404, 3)])
+    def test_robots_status(self, site, store, status, ingested):
+        site.robots_status = status
+        stats = WebCrawler(site.base + "/", depth=1, use_sitemap=False).run()
+
+        assert stats.pages_ingested == ingested
+        if ingested:
+            assert "/private/x" in site.requests
+        else:
+            assert site.requests == ["/robots.txt"]
+
+    def test_deeper_crawl_and_max_pages(self, site, store):
+        WebCrawler(site.base + "/", depth=2, max_pages=2, use_sitemap=False).run()
+        assert len(store) == 2
+
+    def test_sitemap_urls_are_crawled(self, site, store):
+        site.sitemap = (
+            '<?xml version="1.0"?>'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            f"<url><loc>{site.base}/orphan</loc></url>"
+            "<url><loc>https://other.example/page</loc></url>"
+            "</urlset>"
+        )
+        WebCrawler(site.base + "/", depth=1).run()
+        assert "/orphan" in _paths(site, store)
+        assert len([u for u in store if "other.example" in u]) == 0
+
+    def test_recrawl_uses_conditional_get(self, site, store):
+        WebCrawler(site.base + "/", depth=2, use_sitemap=False).run()
+        cache = load_page_cache(get_context().current_space)
+        assert set(cache) == {site.base + p for p in ("/", "/guide", "/guide/deep")}
+        store.clear()
+
+        site.pages["/guide"] = _page("Guide", "Updated text.", ["/guide/deep"])
+        stats = WebCrawler(site.base + "/", depth=2, use_sitemap=False).run()
+
+        assert _paths(site, store) == {"/guide"}
+        assert stats.pages_ingested == 1
+        assert stats.pages_unchanged == 2
+        # Links of the 304 home page came from the cache
+        assert set(site.not_modified) == {"/", "/guide/deep"}
+
+    def test_removed_page_is_deleted(self, site, store):
+        WebCrawler(site.base + "/", depth=2, use_sitemap=False).run()
+        store.clear()
+
+        del site.pages["/guide/deep"]
+        stats = WebCrawler(site.base + "/", depth=2, use_sitemap=False).run()
+
+        assert _paths(site, store) == {"/guide/deep"}
+        assert stats.pages_removed == 1
+        assert stats.chunks_deleted == 1
+        cache = load_page_cache(get_context().current_space)
+        assert site.base + "/guide/deep" not in cache
+
+    def test_fetch_errors_are_counted(self, site, store):
+        site.pages["/"] = _page("Home", "Broken link.", ["/missing"])
+        stats = WebCrawler(site.base + "/", depth=1, use_sitemap=False).run()
+        assert stats.pages_ingested == 1
+        assert stats.pages_skipped == 1
+
+    def test_forget_space_pages(self, site, store):
+        from src.learning.web_crawler import forget_space_pages
+
+        WebCrawler(site.base + "/", depth=0).run()
+        space = get_context().current_space
+        assert load_page_cache(space)
+        forget_space_pages(space)
+        assert load_page_cache(space) == {}
+
+
+class TestWebCrawlCommand:
+    """Test /web crawl argument handling."""
+
+    def test_parse_arguments(self):
+        from src.commands.handlers.learning_commands import _parse_crawl_args
+
+        assert _parse_crawl_args(
+            ["http://x.test", "--depth", "3", "--max-pages", "9"]
+        ) == (
+            "http://x.test",
+            3,
+            9,
+        )
+        with pytest.raises(ValueError):
+            _parse_crawl_args(["http://x.test", "--depth"])
+        with pytest.raises(ValueError):
+            _parse_crawl_args(["http://x.test", "--max-pages", "0"])
+
+    def test_usage(self, capsys):
+        from src.commands.handlers.learning_commands import handle_web
+
+        handle_web(["crawl"])
+        assert "Usage: /web crawl" in capsys.readouterr().out
+
+    def test_runs_crawler(self, capsys):
+        from src.commands.handlers.learning_commands import handle_web
+        from src.learning.web_crawler import CrawlStats
+
+        get_context().vectorstore = object()
+        with patch(
+            "src.learning.web_crawler.WebCrawler.run",
+            return_value=CrawlStats(pages_fetched=3, pages_ingested=3),
+        ):
+            handle_web(["crawl", "http://x.test/", "--depth", "2"])
+        out = capsys.readouterr().out
+        assert "depth 2" in out
+        assert "Crawled 3 pages" in out
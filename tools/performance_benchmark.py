@@ -320,6 +320,74 @@ class PerformanceBenchmark:
         )
         return result
 
+    def run_chunking_benchmark(self) -> BenchmarkResult:
+        """Benchmark chunking engine throughput in chars/s."""
+        print("✂️ Running chunking benchmark...")
+
+        from src.core.chunking import chunk_document
+
+        python_source = "".join(
+            f"def function_{i}(value):\n"
+            f'    """Docstring for function {i}."""\n'
+            f"    total = value * {i}\n"
+            f"    for step in range({i % 7 + 1}):\n"
+            f"        total += step\n"
+            f"    return total\n\n\n"
+            for i in range(200)
+        )
+        markdown_source = "".join(
+            f"## Section {i}\n\n" + "Some documentation text. " * 20 + "\n\n"
+            for i in range(200)
+        )
+        plain_source = "Plain paragraph text without structure. " * 2000
+        corpus = [
+            (python_source, "bench.py"),
+            (markdown_source, "bench.md"),
+            (plain_source, "bench.txt"),
+        ]
+        iterations = max(1, self.config["test_parameters"]["iterations"] // 10)
+
+        start_time = time.time()
+        start_memory = psutil.Process().memory_info().rss / 1024 / 1024
+
+        total_chars = 0
+        chunk_counts: Dict[str, int] = {}
+        for _ in range(iterations):
+            for content, file_path in corpus:
+                chunks = chunk_document(content, file_path=file_path)
+                chunk_counts[file_path] = len(chunks)
+                total_chars += len(content)
+
+        end_time = time.time()
+        end_memory = psutil.Process().memory_info().rss / 1024 / 1024
+
+        duration = end_time - start_time
+        memory_growth = end_memory - start_memory
+        chars_per_second = total_chars / duration if duration > 0 else 0.0
+
+        success = (
+            duration < self.config["thresholds"]["max_response_time"]
+            and memory_growth < self.config["thresholds"]["max_memory_growth"]
+        )
+
+        result = BenchmarkResult(
+            name="chunking",
+            duration=duration,
+            memory_usage=memory_growth,
+            operations_per_second=chars_per_second,
+            success=success,
+            metadata={
+                "iterations": iterations,
+                "total_chars": total_chars,
+                "chunks_per_document": chunk_counts,
+            },
+        )
+
+        print(
+            f"✅ Chunking: {chars_per_second:,.0f} chars/sec, {memory_growth:.2f}MB growth"
+        )
+        return result
+
     def run_complete_iteration_benchmark(self) -> BenchmarkResult:
         """Benchmark complete chat iteration."""
         print("🔄 Running complete iteration benchmark...")
@@ -405,6 +473,7 @@ class PerformanceBenchmark:
             self.run_memory_management_benchmark,
             self.run_tool_execution_benchmark,
             self.run_performance_monitoring_benchmark,
+            self.run_chunking_benchmark,
             self.run_complete_iteration_benchmark,
         ]
 